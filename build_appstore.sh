@@ -157,6 +157,7 @@ pyinstaller \
     --add-data "utils:utils" \
     --add-data "sql:sql" \
     --add-data "i18n_strings:i18n_strings" \
+    --collect-submodules "i18n_strings" \
     --add-data "${APPSTORE_PLUGINS_DIR}:plugins" \
     --add-data "i18n.py:." \
     --hidden-import "PySide6.QtCore" \
@@ -64,6 +64,7 @@ pyinstaller --onefile --windowed \
     --add-data "utils:utils" \
     --add-data "sql:sql" \
     --add-data "i18n_strings:i18n_strings" \
+    --collect-submodules "i18n_strings" \
     --add-data "Info.plist:." \
     --hidden-import "PySide6.QtCore" \
     --hidden-import "PySide6.QtGui" \
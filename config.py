@@ -135,6 +135,13 @@ class AppSettings:
     cloud_last_sync_id: int = 0
     cloud_api_url: str = "https://www.jlike.com"
     cloud_user_email: str = ""
+    # 局域网对等同步：组播发现同网段设备，配对密钥（secure_store）相同的才互相同步
+    lan_sync_enabled: bool = False
+    lan_sync_port: int = 0  # 0 = 系统分配
+    # 监听地址；空 = 通往局域网的那块网卡（不监听 0.0.0.0）
+    lan_sync_bind: str = ""
+    # 组播不通的网络里手动指定对端 "host:port"
+    lan_sync_peers: Tuple[str, ...] = ()
 
     # UI
     dock_edge: str = "right"
@@ -142,6 +149,8 @@ class AppSettings:
     is_floating: bool = False
     floating_position: Optional[Tuple[int, int]] = None
     language: str = "zh_CN"
+    # 窗口收起后在后台把首屏（行、行高、缩略图、来源图标）准备好，热键唤起只剩绘制
+    prewarm_window: bool = True
 
     # 过滤/存储
     save_text: bool = True
@@ -150,6 +159,8 @@ class AppSettings:
     max_image_size_kb: int = 0
     max_items: int = 10000
     retention_days: int = 0
+    # 超过该天数的非收藏条目后台搬进压缩归档库（0 = 不归档），仅 SQLite
+    archive_after_days: int = 0
     poll_interval_ms: int = 500
 
     # Profile
@@ -220,17 +231,23 @@ def _snapshot_from_dict(data: dict) -> Tuple[AppSettings, dict]:
         cloud_last_sync_id=int(data.get("cloud_last_sync_id", 0)),
         cloud_api_url=_normalize_cloud_api_url(data.get("cloud_api_url", "https://www.jlike.com")),
         cloud_user_email=data.get("cloud_user_email", ""),
+        lan_sync_enabled=bool(data.get("lan_sync_enabled", False)),
+        lan_sync_port=int(data.get("lan_sync_port", 0)),
+        lan_sync_bind=str(data.get("lan_sync_bind", "")),
+        lan_sync_peers=tuple(data.get("lan_sync_peers", [])),
         dock_edge=data.get("dock_edge", "right"),
         hotkey=data.get("hotkey", ""),
         is_floating=bool(data.get("is_floating", False)),
         floating_position=floating_pos,
         language=data.get("language", "zh_CN"),
+        prewarm_window=bool(data.get("prewarm_window", True)),
         save_text=bool(data.get("save_text", True)),
         save_images=bool(data.get("save_images", True)),
         max_text_length=int(data.get("max_text_length", 0)),
         max_image_size_kb=int(data.get("max_image_size_kb", 0)),
         max_items=int(data.get("max_items", 10000)),
         retention_days=int(data.get("retention_days", 0)),
+        archive_after_days=int(data.get("archive_after_days", 0)),
         poll_interval_ms=int(data.get("poll_interval_ms", 500)),
         active_profile=data.get("active_profile", "Default"),
         db_profiles=dict(data.get("db_profiles", {})),
@@ -260,17 +277,23 @@ def _snapshot_to_dict(s: AppSettings, extras: dict) -> dict:
         "cloud_last_sync_id": s.cloud_last_sync_id,
         "cloud_api_url": s.cloud_api_url,
         "cloud_user_email": s.cloud_user_email,
+        "lan_sync_enabled": s.lan_sync_enabled,
+        "lan_sync_port": s.lan_sync_port,
+        "lan_sync_bind": s.lan_sync_bind,
+        "lan_sync_peers": list(s.lan_sync_peers),
         "dock_edge": s.dock_edge,
         "hotkey": s.hotkey,
         "is_floating": s.is_floating,
         "floating_position": list(s.floating_position) if s.floating_position else None,
         "language": s.language,
+        "prewarm_window": s.prewarm_window,
         "save_text": s.save_text,
         "save_images": s.save_images,
         "max_text_length": s.max_text_length,
         "max_image_size_kb": s.max_image_size_kb,
         "max_items": s.max_items,
         "retention_days": s.retention_days,
+        "archive_after_days": s.archive_after_days,
         "poll_interval_ms": s.poll_interval_ms,
         "active_profile": s.active_profile,
         "db_profiles": dict(s.db_profiles),
@@ -307,6 +330,25 @@ def get_user_plugins_dir() -> Path:
     return p
 
 
+def get_thumbnail_cache_dir() -> Path:
+    """预缩放缩略图瓦片的磁盘缓存目录；不存在即创建。"""
+    p = get_config_dir() / "thumbs"
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def get_app_icon_cache_dir() -> Path:
+    """来源 App 图标 PNG 的磁盘缓存目录；不存在即创建。"""
+    p = get_config_dir() / "app_icons"
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def get_startup_history_path() -> Path:
+    """逐次启动各阶段耗时的滚动记录（JSON Lines）。"""
+    return get_config_dir() / "startup_history.jsonl"
+
+
 def get_files_local_dir() -> Path:
     """云端文件的本地沙盒容器路径；不存在即创建。"""
     p = get_config_dir() / "files"
@@ -655,6 +697,26 @@ def set_mysql_password(password: str) -> None:
     store_credential("mysql_password", password)
 
 
+def get_lan_sync_key() -> str:
+    return _retrieve_credential_safe("lan_sync_key")
+
+
+def set_lan_sync_key(key: str) -> None:
+    """只接受 generate_lan_sync_key() 生成的随机密钥（从另一台设备复制过来），手填口令抛 ValueError。"""
+    from core.lan_sync import parse_pairing_key
+    from utils.secure_store import store_credential
+    parse_pairing_key(key)
+    store_credential("lan_sync_key", key.strip())
+
+
+def generate_lan_sync_key() -> str:
+    """生成并保存新的配对密钥，返回给设置界面展示 / 复制到其他设备。"""
+    from core.lan_sync import generate_pairing_key
+    key = generate_pairing_key()
+    set_lan_sync_key(key)
+    return key
+
+
 # ============ 校验 ============
 
 def validate_cloud_api_url(url: str) -> None:
@@ -35,12 +35,14 @@ class AppContext:
         self.cloud_api = None
         self.cloud_sync_service = None
         self.file_sync_service = None
+        self.lan_sync_service = None
         self.file_repository = None
         self.entitlement_service = None
         self.space_service = None
         self.tag_service = None
         self.share_service = None
         self.plugin_manager = None
+        self.archive_service = None
         self.extension_points = None  # filled in Phase 7
         self._cloud_sync_error: Optional[str] = None
         self._lock = threading.Lock()
@@ -71,6 +73,8 @@ class AppContext:
         ctx.repository = ClipboardRepository(ctx.db)
         ctx.clipboard_monitor = ClipboardMonitor(ctx.repository)
         ctx.sync_service = SyncService(ctx.repository)
+        ctx._init_archive()
+        ctx._init_lan_sync()
 
         # ---------- 云端业务服务（仅登录后装配；保持与 main.py 历史行为一致） ----------
         if get_cloud_access_token():
@@ -117,6 +121,62 @@ class AppContext:
         logger.info("AppContext bootstrapped")
         return ctx
 
+    def _init_archive(self) -> None:
+        """挂载冷数据归档层（仅 SQLite）。
+
+        归档文件已存在时即使阈值被改回 0 也要挂载，保证已归档的数据仍可搜索；
+        搬迁服务只在阈值 > 0 时装配，由 main.py 在 UI 稳定后 start()。
+
+        Why shared: 用户指定路径的共享 SQLite 上不装配搬迁服务——搬迁在主表上是 DELETE，
+        会经 change_log 触发器变成删除事件，其他设备排空后把条目从列表里删掉，
+        而它们并没有挂本机的归档文件。已有的归档文件照样挂载，只读 / 搬回不受影响。
+        """
+        if getattr(self.db, "is_mysql", False):
+            return
+        try:
+            from pathlib import Path
+            from config import settings
+            from core.archive_service import ArchiveService
+            from core.db.archive_dao import default_archive_path
+
+            s = settings()
+            days = s.archive_after_days
+            archive_path = default_archive_path(self.db.db_path)
+            if days <= 0 and not Path(archive_path).exists():
+                return
+            archive = self.repository.enable_archive(archive_path)
+            if days > 0 and s.database_path:
+                logger.info("数据库为共享路径，不启用冷数据搬迁（避免向其他设备广播删除）")
+            elif days > 0:
+                self.archive_service = ArchiveService(archive, days)
+        except Exception as e:
+            logger.warning(f"归档层初始化失败（仅搜索热数据）: {e}", exc_info=True)
+
+    def _init_lan_sync(self) -> None:
+        """装配局域网对等同步（设置里开启且已配置配对密钥时）；start 由 main.py 触发。"""
+        try:
+            from config import get_lan_sync_key, settings
+
+            s = settings()
+            if not s.lan_sync_enabled:
+                return
+            key = get_lan_sync_key()
+            if not key:
+                logger.warning("局域网同步已开启但未配置配对密钥，跳过")
+                return
+            from core.lan_sync import LanSyncService
+
+            self.lan_sync_service = LanSyncService(
+                self.repository, key, s.device_id, s.device_name,
+                host=s.lan_sync_bind, port=s.lan_sync_port, static_peers=s.lan_sync_peers,
+            )
+        except ValueError as e:
+            logger.warning(f"局域网同步配对密钥无效，需重新生成: {e}")
+            self.lan_sync_service = None
+        except Exception as e:
+            logger.warning(f"局域网同步初始化失败: {e}", exc_info=True)
+            self.lan_sync_service = None
+
     @classmethod
     def current(cls) -> "AppContext":
         if cls._instance is None:
@@ -126,13 +186,18 @@ class AppContext:
     def shutdown(self) -> None:
         with self._lock:
             try:
-                # 顺序：monitor → 3 个 sync service → plugin manager → cloud client reset → db
+                # 顺序：monitor → archive → 4 个 sync service → plugin manager → cloud client reset → db
                 # 异常隔离：每个 stop 单独 try，确保后续 teardown 不被前一个失败阻塞。
                 if self.clipboard_monitor:
                     try:
                         self.clipboard_monitor.stop()
                     except Exception:
                         logger.exception("clipboard_monitor.stop() 异常")
+                if self.archive_service:
+                    try:
+                        self.archive_service.stop()
+                    except Exception:
+                        logger.exception("archive_service.stop() 异常")
                 if self.sync_service:
                     try:
                         self.sync_service.stop()
@@ -148,6 +213,11 @@ class AppContext:
                         self.file_sync_service.stop()
                     except Exception:
                         logger.exception("file_sync_service.stop() 异常")
+                if self.lan_sync_service:
+                    try:
+                        self.lan_sync_service.stop()
+                    except Exception:
+                        logger.exception("lan_sync_service.stop() 异常")
                 if self.plugin_manager:
                     try:
                         # PluginManager 用 unload_all() 释放插件，没有 shutdown()
@@ -0,0 +1,90 @@
+"""冷数据归档服务：后台把超龄条目从热层搬进归档库。
+
+不依赖 Qt（纯 threading），方便单元测试；由 AppContext 装配、main.py 在 UI
+稳定后启动。每轮按批搬迁直到没有超龄条目，批之间让出写锁，
+剪贴板监听的写入不会被一次大搬迁长时间挡住。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from .db.archive_dao import ArchiveDAO
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveService:
+    """周期性执行 hot -> cold 搬迁的后台线程。"""
+
+    # 两轮之间的间隔；归档是按"天"计的粗粒度策略，不需要频繁扫描
+    _INTERVAL_S = 3600.0
+    # 首轮延迟：避开启动期的 UI 渲染与首次同步
+    _INITIAL_DELAY_S = 60.0
+    _BATCH_SIZE = 200
+    # 批与批之间的让步，给其他线程的写事务留出窗口
+    _BATCH_PAUSE_S = 0.05
+
+    def __init__(self, archive: ArchiveDAO, archive_after_days: int):
+        self._archive = archive
+        self._archive_after_days = archive_after_days
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def archive_after_days(self) -> int:
+        return self._archive_after_days
+
+    def set_archive_after_days(self, days: int) -> None:
+        """运行时修改阈值；0 表示暂停归档（已归档的数据仍可搜索）。"""
+        self._archive_after_days = max(0, int(days))
+
+    def start(self, initial_delay_s: Optional[float] = None) -> None:
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop_event.clear()
+            delay = self._INITIAL_DELAY_S if initial_delay_s is None else initial_delay_s
+            self._thread = threading.Thread(
+                target=self._run, args=(delay,), name="ArchiveService", daemon=True,
+            )
+            self._thread.start()
+        logger.info("归档服务已启动")
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop_event.set()
+        with self._lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def run_once(self) -> int:
+        """同步执行一轮搬迁，返回本轮搬迁的条数。阈值为 0 时什么都不做。"""
+        days = self._archive_after_days
+        if days <= 0:
+            return 0
+        cutoff_ms = int((time.time() - days * 86400) * 1000)
+        total = 0
+        while not self._stop_event.is_set():
+            moved = self._archive.archive_older_than(cutoff_ms, self._BATCH_SIZE)
+            total += moved
+            if moved < self._BATCH_SIZE:
+                break
+            self._stop_event.wait(self._BATCH_PAUSE_S)
+        return total
+
+    def _run(self, initial_delay_s: float) -> None:
+        if self._stop_event.wait(initial_delay_s):
+            return
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.warning(f"归档搬迁失败，下一轮重试: {e}", exc_info=True)
+            if self._stop_event.wait(self._INTERVAL_S):
+                return
@@ -2,7 +2,11 @@
 
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, Callable, Optional, Tuple
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+
+class QueryCancelled(Exception):
+    """cancellable() 包裹的读操作被调用方取消（例如搜索词已被新输入取代）。"""
 
 
 class AbstractDatabaseManager(ABC):
@@ -58,6 +62,27 @@ class AbstractDatabaseManager(ABC):
         """读所有行。"""
         ...
 
+    @abstractmethod
+    def fetch_rows(self, conn, sql: str, params: tuple = ()) -> Tuple[tuple, list]:
+        """读所有行为 positional tuple，返回 (列名元组, 行列表)。
+
+        列表/搜索热路径专用：配合 models.row_decoder 按列布局一次性解析下标，
+        省掉 sqlite3.Row / dict 行对象的逐行构造开销。
+        """
+        ...
+
+    def iter_rows(
+        self, conn, sql: str, params: tuple = (), batch_size: int = 500
+    ) -> Iterator[Tuple[tuple, list]]:
+        """fetch_rows 的流式版本：逐批 yield (列名元组, 至多 batch_size 行)。
+
+        批量读取（迁移、全表扫描）用它把内存占用压到一批行的大小。
+        须在 conn 的使用范围内迭代完毕（或显式 close 生成器）；MySQL 的非缓冲游标
+        在迭代期间独占连接，同一连接上不能穿插其他查询。
+        默认实现退化为一次性 fetch_rows，由子类覆盖为真正的流式读取。
+        """
+        yield self.fetch_rows(conn, sql, params)
+
     def fetch_scalar(self, conn, sql: str, params: tuple = (), default=0):
         """读单一标量值（默认取第一列）。"""
         row = self.fetch_one(conn, sql, params)
@@ -67,6 +92,19 @@ class AbstractDatabaseManager(ABC):
             return next(iter(row.values()))
         return row[0]
 
-    def execute_many(self, conn, sql: str, data: list):
-        """批量执行（方言透明）。默认实现由子类覆盖。"""
+    def execute_many(self, conn, sql: str, data: list) -> int:
+        """批量执行（方言透明），返回受影响行数（INSERT IGNORE 跳过的行不计）。默认实现由子类覆盖。"""
         raise NotImplementedError
+
+    @contextmanager
+    def cancellable(self, should_cancel: Callable[[], bool]):
+        """在当前线程上执行可取消的读操作；should_cancel() 为真时抛 QueryCancelled。
+
+        默认实现只能在操作前后检查（语句执行中途无法打断）；
+        SQLite 覆盖为 progress handler，在 VM 指令间隙中断正在跑的语句。
+        """
+        if should_cancel():
+            raise QueryCancelled()
+        yield
+        if should_cancel():
+            raise QueryCancelled()
@@ -10,15 +10,16 @@ import logging
 import os
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-
 from core.cloud.http import CloudAPIError
+from utils.lazy_import import lazy_module
 
 if TYPE_CHECKING:  # pragma: no cover
     from core.cloud_api import CloudAPIClient
 
 logger = logging.getLogger(__name__)
 
+httpx = lazy_module("httpx")
+
 
 class FilesClient:
     """文件同步底层 HTTP（与 file_sync_service 配合）。"""
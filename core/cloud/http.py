@@ -28,8 +28,6 @@ from pathlib import Path
 from typing import Optional
 from urllib.parse import urlparse
 
-import httpx
-
 from config import (
     IS_APPSTORE_BUILD,
     IS_MACOS,
@@ -37,11 +35,15 @@ from config import (
     set_cloud_refresh_token,
     update_settings,
 )
+from utils.lazy_import import lazy_module
 
 logger = logging.getLogger(__name__)
 
+# httpx 约 50ms 的导入推迟到第一次真正发请求（登录态启动只构造客户端、不联网）
+httpx = lazy_module("httpx")
+
 # 连接 8s / 读取 15s / 写入 15s / 连接池 15s —— 避免默认 30s 导致登录卡太久
-_DEFAULT_TIMEOUT = httpx.Timeout(connect=8.0, read=15.0, write=15.0, pool=15.0)
+_DEFAULT_TIMEOUT = dict(connect=8.0, read=15.0, write=15.0, pool=15.0)
 
 
 class CloudAPIError(Exception):
@@ -143,7 +145,27 @@ class HttpClient:
         # 共用本 HttpClient，access token 到期时会集体撞 401 并发刷新。无锁时第二个
         # 线程拿已被消费的旧 token 撞 401 会误清登录态 → 用户"自动掉线"。
         self._refresh_lock = threading.Lock()
-        self._client = httpx.Client(base_url=self._base_url, timeout=_DEFAULT_TIMEOUT, verify=True)
+        self._http_client = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def _client(self):
+        """httpx.Client 在第一次请求时才创建（连同 httpx 的导入）。"""
+        client = self._http_client
+        if client is None:
+            with self._client_lock:
+                if self._http_client is None:
+                    self._http_client = httpx.Client(
+                        base_url=self._base_url,
+                        timeout=httpx.Timeout(**_DEFAULT_TIMEOUT),
+                        verify=True,
+                    )
+                client = self._http_client
+        return client
+
+    @_client.setter
+    def _client(self, value) -> None:
+        self._http_client = value
 
     @property
     def base_url(self) -> str:
@@ -491,7 +513,9 @@ class HttpClient:
 
     def close(self):
         """关闭 HTTP 客户端"""
+        if self._http_client is None:
+            return
         try:
-            self._client.close()
+            self._http_client.close()
         except Exception:
             pass
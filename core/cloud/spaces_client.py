@@ -9,15 +9,16 @@ from __future__ import annotations
 import logging
 from typing import Optional, TYPE_CHECKING
 
-import httpx
-
 from core.cloud.http import CloudAPIError, requires_plugin_permission
+from utils.lazy_import import lazy_module
 
 if TYPE_CHECKING:  # pragma: no cover
     from core.cloud_api import CloudAPIClient
 
 logger = logging.getLogger(__name__)
 
+httpx = lazy_module("httpx")
+
 
 class SpacesClient:
     """团队空间 + 分享链接。"""
@@ -12,6 +12,7 @@ from PySide6.QtCore import QObject, Signal, QTimer, QThread, Slot, QMetaObject,
 
 from .models import ClipboardItem, TextClipboardItem, ImageClipboardItem, ContentType
 from .repository import ClipboardRepository
+from .sync_merge import RemoteEntry, merge_remote_items
 from .cloud_api import CloudAPIClient, CloudAPIError
 from config import settings, SYNC_INTERVAL_MS
 
@@ -89,55 +90,19 @@ class _SyncWorker(QObject):
                 tag_names = [str(t) for t in raw_tags if t]
                 parsed_items.append((server_id, item, tag_names))
 
-            # 批量查询已存在的 hash（替代逐条 get_by_hash，减少 N 次查询为 1 次）
-            all_hashes = [item.content_hash for _, item, _ in parsed_items]
-            existing_map = self.repository.get_existing_hashes(all_hashes)
-
-            new_items = []
-            cloud_id_pairs = []
-            max_server_id = last_sync_id
-
-            for server_id, item, tag_names in parsed_items:
-                # 记录来源 space：服务端会在 item 中回填 space_id（None=个人）。
-                # 以服务端值为准；fallback 到当前同步的 space_key 保持一致性。
-                existing = existing_map.get(item.content_hash)
-                local_item_id: Optional[int] = None
-                if existing is None:
-                    item_id = self.repository.add_item(item)
-                    item.id = item_id
-                    new_items.append(item)
-                    if server_id and item_id:
-                        cloud_id_pairs.append((item_id, server_id))
-                    local_item_id = item_id
-                elif existing.id:
-                    remote_starred = bool(item.is_starred)
-                    needs_cloud_id = bool(server_id and existing.cloud_id != server_id)
-                    needs_star_merge = bool(existing.is_starred != remote_starred)
-                    if needs_cloud_id or needs_star_merge:
-                        self.repository.update_cloud_sync_metadata(
-                            existing.id,
-                            cloud_id=server_id if needs_cloud_id else None,
-                            is_starred=remote_starred if needs_star_merge else None,
-                        )
-                    local_item_id = existing.id
-
-                # v3.5：合并云端标签到本地（add-only 语义，删除不同步以避免误删）。
-                # apply_tag_names 内部 INSERT OR IGNORE，幂等。本地缺失的 tag_definitions
-                # 会在 (space_id, name) 上自动 create。
-                if tag_names and local_item_id:
-                    try:
-                        space_for_tag = item.space_id or ""
-                        self.repository.tag_service.apply_tag_names(
-                            local_item_id, space_for_tag, tag_names
-                        )
-                    except Exception as exc:
-                        logger.warning(
-                            "为 item %s 写入云端标签 %s 失败: %s",
-                            local_item_id, tag_names, exc,
-                        )
-
-                if server_id > max_server_id:
-                    max_server_id = server_id
+            # 按 content_hash 去重、合并收藏与标签（与局域网同步共用 sync_merge）
+            merged = merge_remote_items(
+                self.repository,
+                (
+                    RemoteEntry(item=item, tag_names=tag_names, server_id=server_id)
+                    for server_id, item, tag_names in parsed_items
+                ),
+            )
+            new_items = merged.new_items
+            cloud_id_pairs = merged.cloud_id_pairs
+            max_server_id = max(
+                [last_sync_id] + [server_id for server_id, _, _ in parsed_items]
+            )
 
             # 若存在跳过的条目，游标只能推进到最小跳过 id - 1（避免越过重试目标）
             # 但若该条目已被标记为“永久放弃”（超过重试次数），则允许越过
@@ -199,13 +164,10 @@ class _SyncWorker(QObject):
                 if src_title:
                     item_dict["source_title"] = src_title
                 # v3.5：标签云同步。以 name 列表传输，服务端按 (space_id, name) upsert tag_definitions。
-                # 没有 item.id（未落库）的条目不带 tags；空列表不发，减小 payload。
-                if item.id:
-                    try:
-                        tag_names = self.repository.tag_service.list_names_for_item(item.id)
-                    except Exception as exc:
-                        logger.debug("读取 item %s 标签失败，跳过 tags 同步: %s", item.id, exc)
-                        tag_names = []
+                # tag_ids 由源查询（get_unsynced_items / get_item_by_id）一并带回，
+                # 名字走 TagService 的定义缓存，不再每条一次 JOIN；空列表不发，减小 payload。
+                if item.tag_ids:
+                    tag_names = self.repository.tag_service.names_for(item.tag_ids)
                     if tag_names:
                         item_dict["tags"] = tag_names
                 upload_items.append(item_dict)
@@ -5,16 +5,16 @@ import logging
 import threading
 import weakref
 from pathlib import Path
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Iterator, Tuple
 from contextlib import contextmanager
 
-from .base_database import AbstractDatabaseManager
+from .base_database import AbstractDatabaseManager, QueryCancelled
 
 logger = logging.getLogger(__name__)
 
 
 class DatabaseManager(AbstractDatabaseManager):
-    SCHEMA_VERSION = 4
+    SCHEMA_VERSION = 5
 
     CREATE_TABLE_SQL = """
     CREATE TABLE IF NOT EXISTS clipboard_items (
@@ -75,6 +75,17 @@ class DatabaseManager(AbstractDatabaseManager):
     );
     """
 
+    # 只在正文列变化时重建 FTS 行；收藏 / 置顶 / cloud_id 等元数据更新不碰索引
+    FTS_UPDATE_TRIGGER_SQL = """
+    CREATE TRIGGER IF NOT EXISTS clipboard_au
+    AFTER UPDATE OF text_content, preview ON clipboard_items BEGIN
+        INSERT INTO clipboard_fts(clipboard_fts, rowid, text_content, preview)
+        VALUES ('delete', old.id, old.text_content, old.preview);
+        INSERT INTO clipboard_fts(rowid, text_content, preview)
+        VALUES (new.id, new.text_content, new.preview);
+    END;
+    """
+
     CREATE_FTS_SQL = """
     CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_fts USING fts5(
         text_content,
@@ -92,14 +103,7 @@ class DatabaseManager(AbstractDatabaseManager):
         INSERT INTO clipboard_fts(clipboard_fts, rowid, text_content, preview)
         VALUES ('delete', old.id, old.text_content, old.preview);
     END;
-
-    CREATE TRIGGER IF NOT EXISTS clipboard_au AFTER UPDATE ON clipboard_items BEGIN
-        INSERT INTO clipboard_fts(clipboard_fts, rowid, text_content, preview)
-        VALUES ('delete', old.id, old.text_content, old.preview);
-        INSERT INTO clipboard_fts(rowid, text_content, preview)
-        VALUES (new.id, new.text_content, new.preview);
-    END;
-    """
+    """ + FTS_UPDATE_TRIGGER_SQL
 
     def __init__(self, db_path: str):
         self.db_path = db_path
@@ -111,6 +115,9 @@ class DatabaseManager(AbstractDatabaseManager):
         self._tls = threading.local()
         self._all_conns: list[sqlite3.Connection] = []
         self._conns_lock = threading.Lock()
+        # 连接级初始化钩子（ATTACH 归档库、注册 SQL 函数等）。每线程 connection
+        # 记住自己已执行到第几个钩子，新注册的钩子在该线程下次取连接时补跑。
+        self._conn_initializers: list[Callable[[sqlite3.Connection], None]] = []
         self._ensure_db_directory()
         self._init_database()
 
@@ -237,6 +244,38 @@ class DatabaseManager(AbstractDatabaseManager):
             conn.commit()
             logger.info("数据库 Schema 已迁移到 v4")
 
+        if current_version < 5:
+            # v4 → v5: 冗余 payload_bytes 列 + (payload_bytes, created_at) 索引。
+            # Why: size: 过滤原来是 LENGTH(text_content) / LENGTH(image_data)，
+            # 要把每行的多 MB 图片 BLOB 从磁盘读出来；改为查冗余列走索引。
+            try:
+                conn.execute("ALTER TABLE clipboard_items ADD COLUMN payload_bytes INTEGER")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" not in str(e):
+                    raise
+            # 旧库的 FTS 更新触发器对任意列生效，下面的回填会把整张 FTS 重建一遍；
+            # 先换成只盯正文列的版本（新库在 _init_database 里直接建新版）
+            has_au = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='trigger' AND name='clipboard_au'"
+            ).fetchone()
+            if has_au:
+                conn.execute("DROP TRIGGER clipboard_au")
+                conn.executescript(self.FTS_UPDATE_TRIGGER_SQL)
+            conn.execute(
+                "UPDATE clipboard_items SET payload_bytes = "
+                "COALESCE(LENGTH(CAST(text_content AS BLOB)), 0) + COALESCE(LENGTH(image_data), 0) "
+                "WHERE payload_bytes IS NULL"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_payload_created "
+                "ON clipboard_items(payload_bytes, created_at)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO app_meta (key, value) VALUES ('schema_version', '5')"
+            )
+            conn.commit()
+            logger.info("数据库 Schema 已迁移到 v5（新增 payload_bytes）")
+
     def _create_connection(self) -> sqlite3.Connection:
         """创建新连接并配置 PRAGMA"""
         # Why: UI 线程的 busy_timeout 必须短。C 层 sqlite3_step 拿不到写锁时会
@@ -279,17 +318,40 @@ class DatabaseManager(AbstractDatabaseManager):
         健康检查；操作失败由 execute_with_retry 处理 BUSY，连接级异常向上传播。"""
         conn = getattr(self._tls, "conn", None)
         if conn is not None:
+            if self._tls.init_applied != len(self._conn_initializers):
+                self._apply_initializers(conn)
             return conn
         new_conn = self._create_connection()
         self._tls.conn = new_conn
+        self._tls.init_applied = 0
         with self._conns_lock:
             self._all_conns.append(new_conn)
         # 线程结束时自动回收：避免短生命周期工作线程泄漏 sqlite 连接/TLS 文件句柄
         weakref.finalize(
             threading.current_thread(), self._finalize_thread_conn, new_conn
         )
+        self._apply_initializers(new_conn)
         return new_conn
 
+    def add_connection_initializer(
+        self, initializer: Callable[[sqlite3.Connection], None]
+    ) -> None:
+        """注册连接级初始化钩子，对已有和以后创建的每线程 connection 各执行一次。
+
+        Why: ATTACH / create_function 只对单个 connection 生效，而本类是每线程
+        一份 connection；钩子在各线程下次取连接时由该线程自己执行，避免跨线程
+        操作别人的 connection。
+        """
+        with self._conns_lock:
+            self._conn_initializers.append(initializer)
+
+    def _apply_initializers(self, conn: sqlite3.Connection) -> None:
+        """补跑当前线程 connection 尚未执行过的初始化钩子。"""
+        pending = self._conn_initializers[self._tls.init_applied:]
+        for initializer in pending:
+            initializer(conn)
+            self._tls.init_applied += 1
+
     def _finalize_thread_conn(self, conn: sqlite3.Connection) -> None:
         """线程终止时回收该线程 connection 并从全局列表摘除。"""
         with self._conns_lock:
@@ -373,5 +435,57 @@ class DatabaseManager(AbstractDatabaseManager):
     def fetch_all(self, conn, sql: str, params: tuple = ()) -> list:
         return conn.execute(sql, params).fetchall()
 
-    def execute_many(self, conn, sql: str, data: list):
-        conn.executemany(sql, data)
+    def fetch_rows(self, conn, sql: str, params: tuple = ()) -> Tuple[tuple, list]:
+        # 连接级 row_factory 是 sqlite3.Row；这里只在本游标上关掉，拿原生 tuple
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(sql, params)
+        columns = tuple(d[0] for d in cursor.description)
+        return columns, cursor.fetchall()
+
+    def iter_rows(
+        self, conn, sql: str, params: tuple = (), batch_size: int = 500
+    ) -> Iterator[Tuple[tuple, list]]:
+        # SQLite 游标本身就是按需单步执行的，fetchmany 只物化一批
+        cursor = conn.cursor()
+        cursor.row_factory = None
+        try:
+            cursor.execute(sql, params)
+            columns = tuple(d[0] for d in cursor.description)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield columns, rows
+        finally:
+            cursor.close()
+
+    # progress handler 回调间隔（VM 指令数）；约每几毫秒检查一次取消标志
+    _PROGRESS_STEPS = 2000
+
+    @contextmanager
+    def cancellable(self, should_cancel: Callable[[], bool]):
+        """当前线程 connection 上挂 progress handler，should_cancel() 为真即中断语句。
+
+        Why: 搜索词被新输入取代后，旧的 FTS / COUNT 查询继续跑完只是在浪费
+        读线程；handler 返回非 0 时 SQLite 以 "interrupted" 中止当前语句。
+        """
+        if should_cancel():
+            raise QueryCancelled()
+        conn = self._get_thread_conn()
+        conn.set_progress_handler(
+            lambda: 1 if should_cancel() else 0, self._PROGRESS_STEPS
+        )
+        try:
+            yield
+        except sqlite3.OperationalError as e:
+            if "interrupted" in str(e).lower() and should_cancel():
+                raise QueryCancelled() from e
+            raise
+        finally:
+            conn.set_progress_handler(None, 0)
+        if should_cancel():
+            raise QueryCancelled()
+
+    def execute_many(self, conn, sql: str, data: list) -> int:
+        return conn.executemany(sql, data).rowcount
@@ -0,0 +1,414 @@
+"""ArchiveDAO: 冷数据归档层（hot/cold 分层存储）。
+
+超过保留期的非收藏条目从 clipboard_items 挪到一个独立的 SQLite 文件，
+通过 ``ATTACH DATABASE ... AS archive`` 挂到每个线程的 connection 上：
+- 主表的索引 / FTS 段 / page cache 只为"热"数据付费；
+- 归档表的 text_content / image_data 以 zlib 压缩存储，读取时由注册到
+  connection 上的 ``sc_unzip`` / ``sc_unzip_text`` SQL 函数透明解压；
+- 每个 connection 上建一个 TEMP VIEW ``archive_items``，列与 _SELECT_FIELDS
+  完全一致，ClipboardQuery 的 filter 子句可以原样复用。
+
+条目 id 在两层之间保持不变（主表 AUTOINCREMENT 保证 id 不复用），因此
+clipboard_tags 关联不需要搬迁。仅 SQLite 后端支持（MySQL 没有 ATTACH）。
+"""
+
+import logging
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from ..base_database import AbstractDatabaseManager
+from ..models import ClipboardItem, payload_size, row_decoder
+from .clipboard_dao import tag_ids_column
+from .item_cache import ItemCache
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_SCHEMA = "archive"
+ARCHIVE_VIEW = "archive_items"
+# 归档库的 FTS5 子查询片段；与主库 clipboard_fts 用法一致（MATCH 一个表达式）
+ARCHIVE_FTS_SUBQUERY = (
+    f"SELECT rowid FROM {ARCHIVE_SCHEMA}.clipboard_fts WHERE clipboard_fts MATCH ?"
+)
+# 相关度排序用：同时带出 bm25 分数（contentless FTS5 也保留了词频统计）
+ARCHIVE_FTS_RANKED_SUBQUERY = (
+    f"SELECT rowid, bm25(clipboard_fts) AS fts_score "
+    f"FROM {ARCHIVE_SCHEMA}.clipboard_fts WHERE clipboard_fts MATCH ?"
+)
+
+_COMPRESS_LEVEL = 6
+
+
+def _zip(data) -> Optional[bytes]:
+    if data is None:
+        return None
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return zlib.compress(bytes(data), _COMPRESS_LEVEL)
+
+
+def _unzip(blob) -> Optional[bytes]:
+    if blob is None:
+        return None
+    return zlib.decompress(blob)
+
+
+def _unzip_text(blob) -> Optional[str]:
+    if blob is None:
+        return None
+    return zlib.decompress(blob).decode("utf-8")
+
+
+# 归档库 DDL。id 沿用主表 id（不自增）；archived_at 记录搬迁时间便于排查。
+_ARCHIVE_DDL = (
+    f"""CREATE TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.clipboard_items (
+        id INTEGER PRIMARY KEY,
+        content_type TEXT NOT NULL,
+        text_z BLOB,
+        image_z BLOB,
+        image_thumbnail BLOB,
+        content_hash TEXT NOT NULL,
+        preview TEXT,
+        device_id TEXT NOT NULL,
+        device_name TEXT,
+        created_at INTEGER NOT NULL,
+        is_starred INTEGER DEFAULT 0,
+        cloud_id INTEGER DEFAULT NULL,
+        space_id TEXT DEFAULT NULL,
+        source_app TEXT DEFAULT NULL,
+        source_title TEXT DEFAULT NULL,
+        archived_at INTEGER NOT NULL,
+        payload_bytes INTEGER
+    )""",
+    f"CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_archive_created_at "
+    f"ON clipboard_items(created_at DESC)",
+    f"CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_archive_content_hash "
+    f"ON clipboard_items(content_hash)",
+)
+
+# payload_bytes 在归档层首个版本之后才加入；老归档文件补列后再建索引
+_ARCHIVE_PAYLOAD_DDL = (
+    f"ALTER TABLE {ARCHIVE_SCHEMA}.clipboard_items ADD COLUMN payload_bytes INTEGER",
+    f"CREATE INDEX IF NOT EXISTS {ARCHIVE_SCHEMA}.idx_archive_payload_created "
+    f"ON clipboard_items(payload_bytes, created_at)",
+)
+
+# contentless FTS5：正文已压缩，无法作为 external content 表，
+# 删除时需要带原始列值发 'delete' 命令（见 _fts_delete）。
+_ARCHIVE_FTS_DDL = f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {ARCHIVE_SCHEMA}.clipboard_fts USING fts5(
+        text_content,
+        preview,
+        content=''
+    )
+"""
+
+_VIEW_DDL = f"""
+    CREATE TEMP VIEW IF NOT EXISTS {ARCHIVE_VIEW} AS
+    SELECT id, content_type,
+           sc_unzip_text(text_z) AS text_content,
+           sc_unzip(image_z) AS image_data,
+           image_thumbnail, content_hash, preview, device_id, device_name,
+           created_at, is_starred, cloud_id, space_id, source_app, source_title,
+           payload_bytes
+    FROM {ARCHIVE_SCHEMA}.clipboard_items
+"""
+
+# 迁移读取的列：与 ClipboardDAO._SELECT_FIELDS 一致（payload_bytes 由模型按载荷算出）
+_SELECT_FIELDS = (
+    "id, content_type, text_content, image_data, image_thumbnail, "
+    "content_hash, preview, device_id, device_name, "
+    "created_at, is_starred, cloud_id, "
+    "space_id, source_app, source_title"
+)
+
+# 从主表搬出时读取的原始列（含完整载荷）
+_HOT_FIELDS = (
+    "id, content_type, text_content, image_data, image_thumbnail, "
+    "content_hash, preview, device_id, device_name, "
+    "created_at, is_starred, cloud_id, "
+    "space_id, source_app, source_title, payload_bytes"
+)
+
+
+class ArchiveDAO:
+    """归档库（ATTACH 的独立 SQLite 文件）的搬迁与读取。"""
+
+    def __init__(
+        self,
+        db_manager: AbstractDatabaseManager,
+        archive_path: str,
+        with_tags: bool = True,
+        cache: Optional[ItemCache] = None,
+    ):
+        if db_manager.is_mysql:
+            raise ValueError("归档层仅支持 SQLite 后端")
+        self.db = db_manager
+        self.archive_path = str(archive_path)
+        self.has_fts = True
+        self._with_tags = with_tags
+        # 热层的条目缓存：搬走的条目要失效，否则按 id / hash 仍读到热层快照
+        self._cache = cache
+        # 标签关联留在主库 clipboard_tags；主库未迁移出该表时不带标签列
+        self._tag_column = tag_ids_column(ARCHIVE_VIEW, False) if with_tags else ""
+        Path(self.archive_path).parent.mkdir(parents=True, exist_ok=True)
+        db_manager.add_connection_initializer(self._init_connection)
+        # 立即在当前线程触发一次，保证归档表在首次查询前已建好
+        self.db.execute_read(lambda conn: None)
+
+    def _init_connection(self, conn) -> None:
+        """每个 connection 一次：注册解压函数、ATTACH 归档库、建表与 TEMP VIEW。"""
+        conn.create_function("sc_unzip", 1, _unzip, deterministic=True)
+        conn.create_function("sc_unzip_text", 1, _unzip_text, deterministic=True)
+        attached = {
+            row[1] for row in conn.execute("PRAGMA database_list").fetchall()
+        }
+        if ARCHIVE_SCHEMA not in attached:
+            conn.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (self.archive_path,))
+        conn.execute(f"PRAGMA {ARCHIVE_SCHEMA}.journal_mode=WAL")
+        for ddl in _ARCHIVE_DDL:
+            conn.execute(ddl)
+        try:
+            conn.execute(_ARCHIVE_PAYLOAD_DDL[0])
+        except sqlite3.OperationalError as e:
+            if "duplicate column name" not in str(e):
+                raise
+        conn.execute(_ARCHIVE_PAYLOAD_DDL[1])
+        try:
+            conn.execute(_ARCHIVE_FTS_DDL)
+        except sqlite3.OperationalError as e:
+            # 与主库一致：FTS5 不可用时归档搜索走 LIKE 回退
+            self.has_fts = False
+            logger.warning(f"归档库 FTS5 不可用，归档搜索将使用LIKE: {e}")
+        conn.execute(_VIEW_DDL)
+        conn.commit()
+
+    # ------------------------------------------------------------------
+    # 搬迁: hot -> cold
+    # ------------------------------------------------------------------
+
+    def archive_older_than(self, cutoff_ms: int, batch_size: int = 200) -> int:
+        """把一批 created_at < cutoff_ms 的非收藏条目搬进归档库，返回搬迁条数。
+
+        单批在一个事务内完成；调用方（ArchiveService）循环调用直到返回 0，
+        批与批之间释放写锁，避免长时间挡住剪贴板监听的写入。
+        先写归档再删主表：中途崩溃最多留下一份重复，下次 INSERT OR IGNORE 幂等收敛。
+        """
+        def operation(conn) -> List[int]:
+            rows = self.db.fetch_all(
+                conn,
+                f"SELECT {_HOT_FIELDS} FROM main.clipboard_items "
+                f"WHERE is_starred = 0 AND created_at < ? "
+                f"ORDER BY created_at ASC LIMIT ?",
+                (cutoff_ms, batch_size),
+            )
+            if not rows:
+                return []
+            now_ms = int(time.time() * 1000)
+            for row in rows:
+                rowcount, _ = self.db.execute_write(
+                    conn,
+                    f"INSERT OR IGNORE INTO {ARCHIVE_SCHEMA}.clipboard_items ("
+                    "id, content_type, text_z, image_z, image_thumbnail, "
+                    "content_hash, preview, device_id, device_name, "
+                    "created_at, is_starred, cloud_id, "
+                    "space_id, source_app, source_title, archived_at, payload_bytes"
+                    ") VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        row["id"], row["content_type"],
+                        _zip(row["text_content"]), _zip(row["image_data"]),
+                        row["image_thumbnail"], row["content_hash"], row["preview"],
+                        row["device_id"], row["device_name"], row["created_at"],
+                        row["is_starred"], row["cloud_id"], row["space_id"],
+                        row["source_app"], row["source_title"], now_ms,
+                        row["payload_bytes"]
+                        if row["payload_bytes"] is not None
+                        else payload_size(row["text_content"], row["image_data"]),
+                    ),
+                )
+                if rowcount > 0 and self.has_fts:
+                    self.db.execute_write(
+                        conn,
+                        f"INSERT INTO {ARCHIVE_SCHEMA}.clipboard_fts"
+                        "(rowid, text_content, preview) VALUES (?, ?, ?)",
+                        (row["id"], row["text_content"], row["preview"]),
+                    )
+            ids = [row["id"] for row in rows]
+            placeholders = ",".join("?" * len(ids))
+            self.db.execute_write(
+                conn,
+                f"DELETE FROM main.clipboard_items WHERE id IN ({placeholders})",
+                tuple(ids),
+            )
+            return ids
+
+        moved = self.db.execute_with_retry(operation)
+        # 提交之后再失效：提交前失效的话，并发读可能把还没删掉的热层行重新缓存进来
+        if self._cache is not None:
+            for item_id in moved:
+                self._cache.invalidate(item_id)
+        if moved:
+            logger.info(f"归档了 {len(moved)} 条冷数据")
+        return len(moved)
+
+    # ------------------------------------------------------------------
+    # 搬迁: cold -> hot
+    # ------------------------------------------------------------------
+
+    def restore(self, item_id: int) -> Optional[int]:
+        """把归档条目搬回主表（收藏 / 置顶等写操作前调用）。
+
+        返回条目在主表中的 id；归档里找不到返回 None。
+        若同 content_hash 的条目在此期间已被重新复制进主表，把归档副本的收藏和标签
+        并进那条热数据后丢弃副本，返回热数据的 id——写操作落到它上面，不会丢。
+        """
+        def operation(conn) -> Optional[int]:
+            row = self.db.fetch_one(
+                conn,
+                f"SELECT {_HOT_FIELDS} FROM {ARCHIVE_VIEW} WHERE id = ?",
+                (item_id,),
+            )
+            if row is None:
+                return None
+            hot = self.db.fetch_one(
+                conn,
+                "SELECT id FROM main.clipboard_items WHERE content_hash = ?",
+                (row["content_hash"],),
+            )
+            self._fts_delete(conn, row)
+            self.db.execute_write(
+                conn,
+                f"DELETE FROM {ARCHIVE_SCHEMA}.clipboard_items WHERE id = ?",
+                (item_id,),
+            )
+            if hot is not None:
+                self._merge_into(conn, item_id, hot["id"], row["is_starred"])
+                logger.debug(f"归档条目 id={item_id} 已有热数据副本 id={hot['id']}，合并后丢弃归档")
+                return hot["id"]
+            self.db.execute_write(
+                conn,
+                f"INSERT INTO main.clipboard_items ({_HOT_FIELDS}) "
+                f"VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                tuple(row[k] for k in row.keys()),
+            )
+            return item_id
+
+        return self.db.execute_with_retry(operation)
+
+    def _merge_into(self, conn, item_id: int, hot_id: int, is_starred) -> None:
+        """把归档副本的收藏与标签并进同内容的热数据（只增不减）。"""
+        if is_starred:
+            self.db.execute_write(
+                conn,
+                "UPDATE main.clipboard_items SET is_starred = 1 WHERE id = ?",
+                (hot_id,),
+            )
+        if not self._with_tags:
+            return
+        self.db.execute_write(
+            conn,
+            "INSERT OR IGNORE INTO main.clipboard_tags (item_id, tag_id, created_at) "
+            "SELECT ?, tag_id, created_at FROM main.clipboard_tags WHERE item_id = ?",
+            (hot_id, item_id),
+        )
+        self.db.execute_write(
+            conn, "DELETE FROM main.clipboard_tags WHERE item_id = ?", (item_id,)
+        )
+
+    # ------------------------------------------------------------------
+    # 读 / 删
+    # ------------------------------------------------------------------
+
+    def get_item_by_id(self, item_id: int) -> Optional[ClipboardItem]:
+        def operation(conn):
+            return self.db.fetch_one(
+                conn,
+                f"SELECT {_HOT_FIELDS}{self._tag_column} FROM {ARCHIVE_VIEW} WHERE id = ?",
+                (item_id,),
+            )
+
+        row = self.db.execute_read(operation)
+        return ClipboardItem.from_db_row(row) if row else None
+
+    def get_by_hash(self, content_hash: str) -> Optional[ClipboardItem]:
+        sql = (
+            f"SELECT id, content_type, text_content, NULL AS image_data, image_thumbnail, "
+            f"content_hash, preview, device_id, device_name, created_at, is_starred, "
+            f"cloud_id, space_id, source_app, source_title "
+            f"FROM {ARCHIVE_VIEW} WHERE content_hash = ? LIMIT 1"
+        )
+
+        def operation(conn):
+            return self.db.fetch_one(conn, sql, (content_hash,))
+
+        row = self.db.execute_read(operation)
+        return ClipboardItem.from_db_row(row) if row else None
+
+    def delete_item(self, item_id: int) -> bool:
+        def operation(conn) -> bool:
+            row = self.db.fetch_one(
+                conn,
+                f"SELECT id, text_content, preview FROM {ARCHIVE_VIEW} WHERE id = ?",
+                (item_id,),
+            )
+            if row is None:
+                return False
+            self._fts_delete(conn, row)
+            rowcount, _ = self.db.execute_write(
+                conn,
+                f"DELETE FROM {ARCHIVE_SCHEMA}.clipboard_items WHERE id = ?",
+                (item_id,),
+            )
+            return rowcount > 0
+
+        return self.db.execute_with_retry(operation)
+
+    def count(self, upto_id: Optional[int] = None) -> int:
+        """归档条数；给了 upto_id 时只数 id <= upto_id 的（迁移续传恢复进度用）。"""
+        def operation(conn) -> int:
+            if upto_id is None:
+                return self.db.fetch_scalar(
+                    conn, f"SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.clipboard_items"
+                )
+            return self.db.fetch_scalar(
+                conn,
+                f"SELECT COUNT(*) FROM {ARCHIVE_SCHEMA}.clipboard_items WHERE id <= ?",
+                (upto_id,),
+            )
+
+        return self.db.execute_read(operation)
+
+    def iter_items_full(
+        self, after_id: int = 0, batch_size: int = 100
+    ) -> Iterator[List[ClipboardItem]]:
+        """按 id 升序流式读取 id > after_id 的归档条目（已解压，含 tag_ids），逐批 yield。
+
+        与 ClipboardQuery.iter_items_full 同形，供迁移在热数据之后接着搬冷数据。
+        """
+        sql = (
+            f"SELECT {_SELECT_FIELDS}{self._tag_column} FROM {ARCHIVE_VIEW} "
+            f"WHERE id > ? ORDER BY id"
+        )
+        with self.db.get_connection() as conn:
+            for columns, rows in self.db.iter_rows(conn, sql, (after_id,), batch_size):
+                decode = row_decoder(columns)
+                yield [decode(row) for row in rows]
+
+    def _fts_delete(self, conn, row) -> None:
+        """contentless FTS5 删除必须带上原始列值。"""
+        if not self.has_fts:
+            return
+        self.db.execute_write(
+            conn,
+            f"INSERT INTO {ARCHIVE_SCHEMA}.clipboard_fts"
+            "(clipboard_fts, rowid, text_content, preview) VALUES ('delete', ?, ?, ?)",
+            (row["id"], row["text_content"], row["preview"]),
+        )
+
+
+def default_archive_path(db_path: str) -> str:
+    """主库旁的归档文件：clipboard.db -> clipboard.archive.db。"""
+    p = Path(db_path)
+    return str(p.with_name(p.stem + ".archive" + (p.suffix or ".db")))
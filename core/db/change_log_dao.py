@@ -0,0 +1,99 @@
+"""ChangeLogDAO: 触发器维护的 change_log 表（条目级增 / 改 / 删流水）。
+
+共享库（MySQL，或放在共享目录里的 SQLite）上的每次写都会由触发器追加一行
+(seq, item_id, op)，本地 SyncService 按 seq 顺序增量拉取，把别的设备的改动
+以事件形式应用到 UI，而不只是轮询"有没有新 id"。
+
+触发器：
+- clipboard_items AFTER INSERT → insert（带写入设备的 device_id，读端跳过自己写的）；
+- clipboard_items AFTER UPDATE（收藏、置顶重排、正文 / 空间 / 来源）→ update；
+- clipboard_items AFTER DELETE → delete（清理、归档搬迁也走这里）；
+- clipboard_tags AFTER INSERT / DELETE → 对应条目的 update。
+update / delete 无法得知是哪台设备改的，device_id 为空，读端一律应用（幂等）。
+
+SQLite 侧 DDL 在 sql/migrations/v3_6_0_change_log.sql；MySQL 侧在
+MySQLDatabaseManager 的 v9 迁移里。触发器建失败（例如 MySQL 账号没有 TRIGGER
+权限）时 available=False，SyncService 回退到旧的按 id 轮询。
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+from ..base_database import AbstractDatabaseManager
+
+logger = logging.getLogger(__name__)
+
+OP_INSERT = "insert"
+OP_UPDATE = "update"
+OP_DELETE = "delete"
+
+# 只检测这一个触发器：三个 clipboard_items 触发器在同一次迁移里一起建
+_PROBE_TRIGGER = "change_log_ai"
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    seq: int
+    item_id: int
+    op: str
+    device_id: Optional[str] = None
+
+
+class ChangeLogDAO:
+    """change_log 的读取与过期清理。"""
+
+    def __init__(self, db_manager: AbstractDatabaseManager):
+        self.db = db_manager
+        self._is_mysql = db_manager.is_mysql
+        self.available = self._detect()
+
+    def _detect(self) -> bool:
+        if self._is_mysql:
+            sql = (
+                "SELECT 1 FROM information_schema.TRIGGERS "
+                "WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = ?"
+            )
+        else:
+            sql = "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = ?"
+        try:
+            return self.db.execute_read(
+                lambda conn: self.db.fetch_one(conn, sql, (_PROBE_TRIGGER,)) is not None
+            )
+        except Exception as e:
+            logger.debug(f"change_log 检测失败: {e}")
+            return False
+
+    def latest_seq(self) -> int:
+        return self.db.execute_read(
+            lambda conn: self.db.fetch_scalar(conn, "SELECT MAX(seq) FROM change_log") or 0
+        )
+
+    def get_changes_since(self, seq: int, limit: int = 500) -> List[ChangeRecord]:
+        """seq 之后的至多 limit 条流水，按 seq 升序。"""
+        sql = (
+            "SELECT seq, item_id, op, device_id FROM change_log "
+            "WHERE seq > ? ORDER BY seq LIMIT ?"
+        )
+
+        def operation(conn) -> List[ChangeRecord]:
+            _, rows = self.db.fetch_rows(conn, sql, (seq, limit))
+            return [ChangeRecord(int(r[0]), int(r[1]), r[2], r[3]) for r in rows]
+
+        return self.db.execute_read(operation)
+
+    def prune(self, max_age_days: int = 7) -> int:
+        """删除早于 max_age_days 的流水，返回删除行数。
+
+        离线超过保留期的设备启动时会把游标对齐到库尾（整页重载），不依赖更老的流水。
+        """
+        cutoff_ms = int((time.time() - max_age_days * 86400) * 1000)
+
+        def operation(conn) -> int:
+            deleted, _ = self.db.execute_write(
+                conn, "DELETE FROM change_log WHERE changed_at < ?", (cutoff_ms,)
+            )
+            return deleted
+
+        return self.db.execute_with_retry(operation)
@@ -10,25 +10,50 @@
 
 import logging
 import sqlite3
+import sys
 import time
 from typing import List, Optional
 
 from ..base_database import AbstractDatabaseManager
-from ..models import ClipboardItem
+from ..models import ClipboardItem, parse_tag_ids, row_decoder
+from .item_cache import ItemCache
 
 logger = logging.getLogger(__name__)
 
-# pymysql 在纯 SQLite 部署中可能未安装，兜底为不存在的占位异常，避免 import 失败。
-try:
-    import pymysql  # type: ignore
 
-    _PyMySQLIntegrityError = pymysql.err.IntegrityError  # type: ignore[attr-defined]
-except ImportError:
-    class _PyMySQLIntegrityError(Exception):
-        pass
+def _integrity_errors() -> tuple:
+    """用于 except 元组：两个后端的 UNIQUE 冲突都会落在这里。
 
-# 用于 except 元组：两个后端的 UNIQUE 冲突都会落在这里。
-_INTEGRITY_ERRORS: tuple = (sqlite3.IntegrityError, _PyMySQLIntegrityError)
+    Why: 不在模块顶层 import pymysql——它连带 cryptography 约 70ms，SQLite 部署的冷启动不该付。
+    pymysql 没被 MySQL 后端加载过就不可能抛它的异常，所以只看 sys.modules。
+    """
+    pymysql = sys.modules.get("pymysql")
+    if pymysql is None:
+        return (sqlite3.IntegrityError,)
+    return (sqlite3.IntegrityError, pymysql.err.IntegrityError)
+
+
+# payload_bytes 的 SQL 侧算法（与 models.payload_size 口径一致），按 is_mysql 取：
+# 文本取 UTF-8 字节数。SQLite 的 LENGTH(TEXT) 是字符数，需要先 CAST 成 BLOB；
+# MySQL 的 LENGTH 本来就是字节数。
+TEXT_BYTES_SQL = {
+    False: "COALESCE(LENGTH(CAST(text_content AS BLOB)), 0)",
+    True: "COALESCE(LENGTH(text_content), 0)",
+}
+IMAGE_BYTES_SQL = "COALESCE(LENGTH(image_data), 0)"
+
+
+def tag_ids_column(table: str, is_mysql: bool) -> str:
+    """把条目的 tag_id 聚合成一列的相关子查询片段（含前导逗号，别名 tag_ids）。
+
+    拼在 SELECT 字段列表末尾，列表查询一条语句就带回标签，不再二次查 clipboard_tags。
+    解析见 models.parse_tag_ids。
+    """
+    agg = "JSON_ARRAYAGG(ct.tag_id)" if is_mysql else "group_concat(ct.tag_id)"
+    return (
+        f", (SELECT {agg} FROM clipboard_tags ct WHERE ct.item_id = {table}.id)"
+        f" AS tag_ids"
+    )
 
 
 class ClipboardDAO:
@@ -55,6 +80,12 @@ class ClipboardDAO:
         # 仅保留方言标识，SQL 执行全部委托给 db_manager
         self._is_mysql = db_manager.is_mysql
         self._has_fts = self._detect_fts()
+        self._has_tags = self._detect_tags()
+        # MySQL：v8 迁移建的 ngram FULLTEXT 索引；不存在时关键词搜索走 LIKE
+        self._has_fulltext = self._detect_fulltext()
+        # 单条读取的读穿缓存；写路径在提交后按 id 失效。
+        # MySQL 库由多台设备共享写入，本进程看不到别人的改动，不缓存。
+        self.cache = ItemCache(0 if self._is_mysql else ItemCache.DEFAULT_MAX_BYTES)
 
     def _detect_fts(self) -> bool:
         """检测 FTS5 表是否存在（仅 SQLite 适用）"""
@@ -72,6 +103,49 @@ class ClipboardDAO:
             logger.debug(f"FTS 检测失败: {e}")
             return False
 
+    def _detect_fulltext(self) -> bool:
+        """检测 MySQL 上 (text_content, preview) 的 FULLTEXT 索引（仅 MySQL 适用）。"""
+        if not self._is_mysql:
+            return False
+        index_name = getattr(self.db, "FULLTEXT_INDEX", "ft_text_preview")
+        try:
+            def operation(conn):
+                row = self.db.fetch_one(
+                    conn,
+                    "SELECT 1 FROM information_schema.STATISTICS "
+                    "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'clipboard_items' "
+                    "AND INDEX_NAME = ? LIMIT 1",
+                    (index_name,),
+                )
+                return row is not None
+            return self.db.execute_read(operation)
+        except Exception as e:
+            logger.debug(f"FULLTEXT 索引检测失败: {e}")
+            return False
+
+    def _detect_tags(self) -> bool:
+        """clipboard_tags 在 v3.4 之前不存在；迁移未执行时列表查询不带标签列。"""
+        if self._is_mysql:
+            # MySQL 的建表在 _init_database 里一次完成
+            return True
+        try:
+            def operation(conn):
+                row = self.db.fetch_one(
+                    conn,
+                    "SELECT name FROM sqlite_master WHERE type='table' AND name='clipboard_tags'",
+                )
+                return row is not None
+            return self.db.execute_read(operation)
+        except Exception as e:
+            logger.debug(f"clipboard_tags 检测失败: {e}")
+            return False
+
+    def _tag_column(self, table: str = "clipboard_items") -> str:
+        """SELECT 字段列表的标签聚合列；表不存在时为空串，条目 tag_ids 保持空。"""
+        if not self._has_tags:
+            return ""
+        return tag_ids_column(table, self._is_mysql)
+
     # 方言透明的短别名，保持方法体的可读性。
     # Query/SyncStateDAO 也通过 self._dao._fetchone 等访问这些 helper。
     def _execute_write(self, conn, sql: str, params: tuple = ()) -> tuple:
@@ -86,6 +160,18 @@ class ClipboardDAO:
     def _scalar(self, conn, sql: str, params: tuple = (), default=0):
         return self.db.fetch_scalar(conn, sql, params, default)
 
+    def _fetch_items(self, conn, sql: str, params: tuple = ()) -> List[ClipboardItem]:
+        """多行条目读取的热路径：tuple 行 + 按列布局缓存的解码器。
+
+        SQL 的列必须是 _SELECT_FIELDS / _SELECT_FIELDS_NO_IMAGE（或其超集）。
+        单行读取仍走 _fetchone + from_db_row，逐行开销在那里无关紧要。
+        """
+        columns, rows = self.db.fetch_rows(conn, sql, params)
+        if not rows:
+            return []
+        decode = row_decoder(columns)
+        return [decode(row) for row in rows]
+
     # ------------------------------------------------------------------
     # CRUD: clipboard_items
     # ------------------------------------------------------------------
@@ -93,21 +179,25 @@ class ClipboardDAO:
     def add_item(self, item: ClipboardItem) -> int:
         def operation(conn) -> int:
             # v3.4: 列数从 10 增加到 13（追加 space_id / source_app / source_title）
-            # 必须和 ClipboardItem.to_db_tuple() 的列顺序一一对应
+            # 必须和 ClipboardItem.to_db_tuple() 的列顺序一一对应；
+            # payload_bytes 是冗余列，不进 to_db_tuple，单独追加在末尾
             sql = """
                 INSERT INTO clipboard_items (
                     content_type, text_content, image_data, image_thumbnail,
                     content_hash, preview, device_id, device_name,
                     created_at, is_starred,
-                    space_id, source_app, source_title
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    space_id, source_app, source_title,
+                    payload_bytes
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
-            _, lastrowid = self._execute_write(conn, sql, item.to_db_tuple())
+            _, lastrowid = self._execute_write(
+                conn, sql, item.to_db_tuple() + (item.payload_bytes,)
+            )
             return lastrowid
 
         try:
             return self.db.execute_with_retry(operation)
-        except _INTEGRITY_ERRORS:
+        except _integrity_errors():
             # content_hash UNIQUE 冲突视为"已存在"，降噪为 debug 并返回现有 id。
             # Why: 剪贴板监控偶发重复写入（跨设备同步窗口期、连续轮询到同一内容），
             # IntegrityError 冒泡会污染日志且打断调用链。
@@ -121,6 +211,11 @@ class ClipboardDAO:
             raise
 
     def get_by_hash(self, content_hash: str) -> Optional[ClipboardItem]:
+        cached = self.cache.get_by_hash(content_hash)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+
         def operation(conn) -> Optional[ClipboardItem]:
             sql = f"""
                 SELECT {self._SELECT_FIELDS_NO_IMAGE}
@@ -132,38 +227,55 @@ class ClipboardDAO:
                 return ClipboardItem.from_db_row(row)
             return None
 
-        return self.db.execute_read(operation)
+        item = self.db.execute_read(operation)
+        if item is not None:
+            self.cache.put(item, generation, full=False)
+        return item
 
     def get_existing_hashes(self, hashes: list) -> dict:
         """批量查询已存在的 content_hash，返回 {hash: ClipboardItem}"""
         if not hashes:
             return {}
+        result = {}
+        pending = []
+        for h in hashes:
+            cached = self.cache.get_by_hash(h)
+            if cached is not None:
+                result[h] = cached
+            else:
+                pending.append(h)
+        if not pending:
+            return result
+        generation = self.cache.generation
 
         def operation(conn) -> dict:
-            result = {}
             # SQLite 参数上限 999，分批查询
             batch_size = 500
-            for i in range(0, len(hashes), batch_size):
-                batch = hashes[i:i + batch_size]
+            for i in range(0, len(pending), batch_size):
+                batch = pending[i:i + batch_size]
                 placeholders = ",".join("?" * len(batch))
                 sql = f"""
                     SELECT {self._SELECT_FIELDS_NO_IMAGE}
                     FROM clipboard_items
                     WHERE content_hash IN ({placeholders})
                 """
-                rows = self._fetchall(conn, sql, tuple(batch))
-                for row in rows:
-                    item = ClipboardItem.from_db_row(row)
+                for item in self._fetch_items(conn, sql, tuple(batch)):
                     result[item.content_hash] = item
+                    self.cache.put(item, generation, full=False)
             return result
 
         return self.db.execute_read(operation)
 
     def get_item_by_id(self, item_id: int) -> Optional[ClipboardItem]:
-        """按主键取条目。注意: 这里不回填 tag_ids；facade / query 层负责。"""
+        """按主键取条目（含 tag_ids）。"""
+        cached = self.cache.get_by_id(item_id)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation
+
         def operation(conn) -> Optional[ClipboardItem]:
             sql = f"""
-                SELECT {self._SELECT_FIELDS}
+                SELECT {self._SELECT_FIELDS}{self._tag_column()}
                 FROM clipboard_items
                 WHERE id = ?
             """
@@ -172,6 +284,70 @@ class ClipboardDAO:
                 return ClipboardItem.from_db_row(row)
             return None
 
+        item = self.db.execute_read(operation)
+        if item is not None:
+            self.cache.put(item, generation)
+        return item
+
+    def get_items_by_ids(self, item_ids: List[int]) -> List[ClipboardItem]:
+        """按主键批量取条目（不含原图，含 tag_ids），直接读库不走缓存；不存在的 id 跳过。"""
+        if not item_ids:
+            return []
+
+        def operation(conn) -> List[ClipboardItem]:
+            items: List[ClipboardItem] = []
+            # SQLite 参数上限 999，分批查询
+            for i in range(0, len(item_ids), 500):
+                batch = item_ids[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                sql = f"""
+                    SELECT {self._SELECT_FIELDS_NO_IMAGE}{self._tag_column()}
+                    FROM clipboard_items
+                    WHERE id IN ({placeholders})
+                """
+                items.extend(self._fetch_items(conn, sql, tuple(batch)))
+            return items
+
+        return self.db.execute_read(operation)
+
+    def get_items_by_hashes(self, hashes: List[str]) -> List[ClipboardItem]:
+        """按 content_hash 批量取完整条目（含原图与 tag_ids），直接读库不走缓存。"""
+        if not hashes:
+            return []
+
+        def operation(conn) -> List[ClipboardItem]:
+            items: List[ClipboardItem] = []
+            for i in range(0, len(hashes), 500):
+                batch = hashes[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                sql = f"""
+                    SELECT {self._SELECT_FIELDS}{self._tag_column()}
+                    FROM clipboard_items
+                    WHERE content_hash IN ({placeholders})
+                """
+                items.extend(self._fetch_items(conn, sql, tuple(batch)))
+            return items
+
+        return self.db.execute_read(operation)
+
+    def get_sync_manifest(self, limit: int) -> List[tuple]:
+        """最新 limit 条的 (content_hash, is_starred, space_id, tag_ids, created_at)，按 id 倒序。
+
+        只读索引可覆盖的短列，不碰正文 / 图片，供对等同步先交换 hash 再按需取载荷。
+        """
+        sql = (
+            f"SELECT content_hash, is_starred, space_id, created_at{self._tag_column()} "
+            "FROM clipboard_items ORDER BY id DESC LIMIT ?"
+        )
+
+        def operation(conn) -> List[tuple]:
+            _, rows = self.db.fetch_rows(conn, sql, (limit,))
+            out = []
+            for row in rows:
+                tag_ids = tuple(parse_tag_ids(row[4])) if len(row) > 4 else ()
+                out.append((row[0], bool(row[1]), row[2], tag_ids, int(row[3] or 0)))
+            return out
+
         return self.db.execute_read(operation)
 
     def delete_item(self, item_id: int) -> bool:
@@ -180,7 +356,10 @@ class ClipboardDAO:
             rowcount, _ = self._execute_write(conn, sql, (item_id,))
             return rowcount > 0
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.invalidate(item_id)
 
     def toggle_star(self, item_id: int) -> bool:
         def operation(conn) -> bool:
@@ -194,7 +373,10 @@ class ClipboardDAO:
             # 重新读一次更稳，但旧 repository 返回 bool(rowcount>0) 语义保持。
             return rowcount > 0
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.invalidate(item_id)
 
     def update_item_content(
         self, item_id: int, text_content: Optional[str] = None,
@@ -237,12 +419,28 @@ class ClipboardDAO:
                 params.append(compute_content_hash(hash_source))
             if not fields:
                 return False
+            # payload_bytes 按更新后的状态重算：给了新值用新值，被类型切换清空的
+            # 一侧记 0，没动的一侧沿用旧列（SET 里的列引用读到的是更新前的值）
+            if text_content is not None:
+                text_part = "?"
+                params.append(len(text_content.encode("utf-8")))
+            else:
+                text_part = "0" if content_type == "image" else TEXT_BYTES_SQL[self._is_mysql]
+            if image_data is not None:
+                image_part = "?"
+                params.append(len(image_data))
+            else:
+                image_part = "0" if content_type == "text" else IMAGE_BYTES_SQL
+            fields.append(f"payload_bytes = {text_part} + {image_part}")
             params.append(item_id)
             sql = f"UPDATE clipboard_items SET {', '.join(fields)} WHERE id = ?"
             rowcount, _ = self._execute_write(conn, sql, tuple(params))
             return rowcount > 0
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.invalidate(item_id)
 
     def touch_item(self, item_id: int, created_at: int) -> bool:
         """更新条目的 created_at 让其置顶（用于重复复制时刷新时间）。"""
@@ -251,7 +449,10 @@ class ClipboardDAO:
             rowcount, _ = self._execute_write(conn, sql, (created_at, item_id))
             return rowcount > 0
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.invalidate(item_id)
 
     def get_new_items_since(
         self, since_id: int, exclude_device_id: str
@@ -264,8 +465,7 @@ class ClipboardDAO:
                 ORDER BY id ASC
                 LIMIT 100
             """
-            rows = self._fetchall(conn, sql, (since_id, exclude_device_id))
-            return [ClipboardItem.from_db_row(row) for row in rows]
+            return self._fetch_items(conn, sql, (since_id, exclude_device_id))
 
         return self.db.execute_read(operation)
 
@@ -314,7 +514,10 @@ class ClipboardDAO:
             logger.info(f"清理了 {deleted} 条旧记录")
             return deleted
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.clear()
 
     def cleanup_expired_items(self, retention_days: int) -> int:
         """删除超过保留天数的非收藏记录"""
@@ -327,7 +530,10 @@ class ClipboardDAO:
                 logger.info(f"清理了 {deleted} 条过期记录 (超过 {retention_days} 天)")
             return deleted
 
-        return self.db.execute_with_retry(operation)
+        try:
+            return self.db.execute_with_retry(operation)
+        finally:
+            self.cache.clear()
 
     # ------------------------------------------------------------------
     # clipboard_tags 关联表
@@ -354,7 +560,10 @@ class ClipboardDAO:
             data = [(item_id, tid, now_ms) for tid in tag_ids]
             self.db.execute_many(conn, sql, data)
 
-        self.db.execute_with_retry(op)
+        try:
+            self.db.execute_with_retry(op)
+        finally:
+            self.cache.invalidate(item_id)
 
     def remove_tags_from_item(self, item_id: int, tag_ids: List[str]) -> None:
         """移除 item 上的指定 tag 绑定。"""
@@ -368,7 +577,10 @@ class ClipboardDAO:
         def op(conn):
             self._execute_write(conn, sql, (item_id, *tag_ids))
 
-        self.db.execute_with_retry(op)
+        try:
+            self.db.execute_with_retry(op)
+        finally:
+            self.cache.invalidate(item_id)
 
     def get_tags_for_item(self, item_id: int) -> List[str]:
         """返回该 item 上已绑定的 tag_id 列表。"""
@@ -6,12 +6,27 @@
 
 import logging
 import re
-from typing import Dict, List, Optional, Tuple
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from ..base_database import AbstractDatabaseManager
-from ..models import ClipboardItem
-from ..query_parser import Filter, Op, QuerySpec, parse as parse_query
+from ..models import ClipboardItem, row_decoder
+from ..query_parser import SORT_RELEVANCE, Filter, Op, QuerySpec, parse as parse_query
+from .archive_dao import (
+    ARCHIVE_FTS_RANKED_SUBQUERY,
+    ARCHIVE_FTS_SUBQUERY,
+    ARCHIVE_VIEW,
+    ArchiveDAO,
+)
 from .clipboard_dao import ClipboardDAO
+from .query_planner import (
+    STRATEGY_FILTER_FIRST,
+    STRATEGY_FTS_FIRST,
+    STRATEGY_SCAN,
+    QueryPlan,
+    QueryPlanner,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,14 +44,92 @@ def _negate_op(op: str) -> str:
     return mapping.get(op, op)
 
 
+# 主表的 FTS5 子查询片段（归档层对应 ARCHIVE_FTS_SUBQUERY）
+_HOT_FTS_SUBQUERY = "SELECT rowid FROM clipboard_fts WHERE clipboard_fts MATCH ?"
+# filter_first / scan 用：逐行按 rowid 探测 FTS（FTS5 对 MATCH + rowid= 做 doclist seek）
+_HOT_FTS_PROBE = (
+    "EXISTS (SELECT 1 FROM clipboard_fts WHERE clipboard_fts MATCH ? "
+    "AND rowid = clipboard_items.id)"
+)
+_HOT_FTS_RANKED_SUBQUERY = (
+    "SELECT rowid, bm25(clipboard_fts) AS fts_score FROM clipboard_fts "
+    "WHERE clipboard_fts MATCH ?"
+)
+
+# facets() 支持的分面；day 按 UTC 自然日分桶（毫秒时间戳，与 get_timeline 的 day 一致）
+FACET_KEYS = ("source_app", "tag", "content_type", "day")
+_DAY_MS = 86400000
+
+
+def facets_from_items(
+    items: Iterable[ClipboardItem],
+    keys: Sequence[str] = FACET_KEYS,
+    limit: int = 20,
+) -> Dict[str, List[Tuple[Any, int]]]:
+    """在已取到内存的完整结果集上直接计数，形状与 ClipboardQuery.facets() 相同。"""
+    counts: Dict[str, Counter] = {k: Counter() for k in keys}
+    for it in items:
+        if "source_app" in counts:
+            counts["source_app"][it.source_app or None] += 1
+        if "content_type" in counts:
+            counts["content_type"][it.content_type.value] += 1
+        if "day" in counts:
+            counts["day"][(it.created_at // _DAY_MS) * _DAY_MS] += 1
+        if "tag" in counts:
+            for tag_id in it.tag_ids:
+                counts["tag"][tag_id] += 1
+    return _order_facets(counts, limit)
+
+
+def _order_facets(
+    counts: Dict[str, Counter], limit: int
+) -> Dict[str, List[Tuple[Any, int]]]:
+    """day 按时间升序全量返回（供时间轴画柱）；其他分面按计数降序取前 limit 个。"""
+    out: Dict[str, List[Tuple[Any, int]]] = {}
+    for key, counter in counts.items():
+        if key == "day":
+            out[key] = sorted(counter.items())
+        else:
+            out[key] = sorted(counter.items(), key=lambda kv: (-kv[1], str(kv[0])))[:limit]
+    return out
+
+
+# 相关度排序（sort:relevance）的加权参数。
+# bm25() 越小越相关（负数），乘以 >1 的系数就是"提升"：
+#   score = bm25 * (1 + RECENCY_WEIGHT / (1 + 年龄天数 / RECENCY_HALF_DAYS))
+#                * (STARRED_BOOST if 收藏 else 1)
+# 刚复制的条目约 2 倍权重，RECENCY_HALF_DAYS 天前的约 1.5 倍，很久以前的趋近 1。
+RECENCY_WEIGHT = 1.0
+RECENCY_HALF_DAYS = 30.0
+STARRED_BOOST = 1.5
+_RANK_EXPR = (
+    "r.fts_score"
+    f" * (1.0 + {RECENCY_WEIGHT} / (1.0 + MAX(0, ? - created_at) / ({RECENCY_HALF_DAYS} * 86400000.0)))"
+    f" * (CASE WHEN is_starred = 1 THEN {STARRED_BOOST} ELSE 1.0 END)"
+)
+
+
 class ClipboardQuery:
     """clipboard_items 上的只读查询/搜索/聚合。"""
 
-    def __init__(self, db_manager: AbstractDatabaseManager, dao: ClipboardDAO):
+    def __init__(
+        self,
+        db_manager: AbstractDatabaseManager,
+        dao: ClipboardDAO,
+        archive: Optional[ArchiveDAO] = None,
+    ):
         self.db = db_manager
         self._dao = dao
         self._is_mysql = dao._is_mysql
         self._has_fts = dao._has_fts
+        # 冷数据归档层；None 表示未启用（MySQL 或用户未开启归档）
+        self._archive = archive
+        # 热层 SQLite 关键词搜索的执行顺序选择；MySQL / 无 FTS 时不需要
+        self.planner: Optional[QueryPlanner] = (
+            QueryPlanner(db_manager, has_tags=dao._has_tags)
+            if self._has_fts and not self._is_mysql
+            else None
+        )
 
     # ------------------------------------------------------------------
     # 分页列表
@@ -79,18 +172,60 @@ class ClipboardQuery:
 
             # 获取分页数据（不加载完整图片数据以提高性能）
             sql = f"""
-                SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}
+                SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column()}
                 FROM clipboard_items
                 {where_clause}
                 ORDER BY created_at DESC
                 LIMIT ? OFFSET ?
             """
-            rows = self._dao._fetchall(conn, sql, tuple(params_where) + (page_size, offset))
-            items = [ClipboardItem.from_db_row(row) for row in rows]
+            items = self._dao._fetch_items(
+                conn, sql, tuple(params_where) + (page_size, offset)
+            )
             return items, total
 
         return self.db.execute_read(operation)
 
+    def get_items_after(
+        self,
+        cursor: Optional[Tuple[int, int]],
+        limit: int,
+        starred_only: bool = False,
+        space_id: Optional[str] = None,
+        min_created_at: Optional[int] = None,
+    ) -> List[ClipboardItem]:
+        """keyset 翻页：(created_at, id) 倒序里 cursor 之后的 limit 条；cursor=None 从头开始。
+
+        过滤语义同 get_items。列表无限滚动每次只扫下一段，深处不像 OFFSET 那样越翻越慢，
+        也不需要 COUNT(*)。min_created_at 给出下界（含），时间线按天取条目时用。
+        """
+        clauses: List[str] = []
+        params: List = []
+        if cursor is not None:
+            created_at, item_id = cursor
+            clauses.append("(created_at < ? OR (created_at = ? AND id < ?))")
+            params.extend((created_at, created_at, item_id))
+        if min_created_at is not None:
+            clauses.append("created_at >= ?")
+            params.append(min_created_at)
+        if starred_only:
+            clauses.append("is_starred = 1")
+        if space_id is None:
+            clauses.append("space_id IS NULL")
+        elif space_id != "":
+            clauses.append("space_id = ?")
+            params.append(space_id)
+        where_clause = ("WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = f"""
+            SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column()}
+            FROM clipboard_items
+            {where_clause}
+            ORDER BY created_at DESC, id DESC
+            LIMIT ?
+        """
+        return self.db.execute_read(
+            lambda conn: self._dao._fetch_items(conn, sql, tuple(params) + (limit,))
+        )
+
     def get_items_full(
         self, page: int = 0, page_size: int = 100
     ) -> Tuple[List[ClipboardItem], int]:
@@ -106,12 +241,48 @@ class ClipboardQuery:
                 ORDER BY created_at ASC
                 LIMIT ? OFFSET ?
             """
-            rows = self._dao._fetchall(conn, sql, (page_size, offset))
-            items = [ClipboardItem.from_db_row(row) for row in rows]
+            items = self._dao._fetch_items(conn, sql, (page_size, offset))
             return items, total
 
         return self.db.execute_read(operation)
 
+    def iter_items_full(
+        self, after_id: int = 0, batch_size: int = 100
+    ) -> Iterator[List[ClipboardItem]]:
+        """按 id 升序流式读取 id > after_id 的完整条目（含原图和 tag_ids），逐批 yield。
+
+        Why: 迁移原先用 get_items_full 的 LIMIT/OFFSET 翻页，越往后 OFFSET 越大、整体 O(n²)，
+        且每页的原图 BLOB 一次性全在内存里。这里一条语句从头扫到尾，内存只占一批。
+        迭代期间占住当前线程的连接，不要在同一线程上穿插其他查询。
+        """
+        sql = f"""
+            SELECT {ClipboardDAO._SELECT_FIELDS}{self._dao._tag_column()}
+            FROM clipboard_items
+            WHERE id > ?
+            ORDER BY id
+        """
+        with self.db.get_connection() as conn:
+            try:
+                for columns, rows in self.db.iter_rows(conn, sql, (after_id,), batch_size):
+                    decode = row_decoder(columns)
+                    yield [decode(row) for row in rows]
+            finally:
+                if self._is_mysql:
+                    # 同 execute_read：结束只读事务，别把一致性快照留在池里的连接上
+                    conn.commit()
+
+    def count_items_upto(self, upto_id: Optional[int] = None) -> int:
+        """id <= upto_id 的条目数（None = 全部），用于迁移续传时恢复进度。"""
+        if upto_id is None:
+            return self.db.execute_read(
+                lambda conn: self._dao._scalar(conn, "SELECT COUNT(*) FROM clipboard_items")
+            )
+        return self.db.execute_read(
+            lambda conn: self._dao._scalar(
+                conn, "SELECT COUNT(*) FROM clipboard_items WHERE id <= ?", (upto_id,)
+            )
+        )
+
     # ------------------------------------------------------------------
     # 搜索
     # ------------------------------------------------------------------
@@ -154,6 +325,9 @@ class ClipboardQuery:
           - page/page_size: 1-based 分页
           - space_id: 显式 space 过滤；优先级高于 query_spec.filters 中的 space:
                      None 表示个人空间（WHERE space_id IS NULL）；传 "" 表示不过滤
+
+        query_spec.sort == "relevance" 且走 FTS5 时按 bm25 + 新近/收藏加权排序；
+        MySQL / LIKE 回退没有相关度分数，仍按 created_at DESC。
         """
         if query_spec is None:
             query_spec = QuerySpec()
@@ -166,16 +340,32 @@ class ClipboardQuery:
         has_regex = bool(query_spec.regex)
         fetch_limit = page_size * 3 if has_regex else page_size
 
-        rows = self._run_query(
+        items: List[ClipboardItem] = self._run_query(
             query_spec, fetch_limit, offset, space_id=space_id, for_count=False
         )
-        items: List[ClipboardItem] = [ClipboardItem.from_db_row(row) for row in rows]
+        if self._archive is not None and len(items) < fetch_limit:
+            # 热层凑不满一页才扇出到归档层。归档行在结果里排在全部热数据之后，
+            # 所以归档层的 offset = 全局 offset - 热层命中总数。
+            if items:
+                hot_total = offset + len(items)
+            elif offset:
+                hot_total = self._run_query(
+                    query_spec, None, 0, space_id=space_id, for_count=True
+                )
+            else:
+                hot_total = 0
+            items = items + self._run_query(
+                query_spec,
+                fetch_limit - len(items),
+                max(0, offset - hot_total),
+                space_id=space_id,
+                for_count=False,
+                archived=True,
+            )
 
         if has_regex:
             items = self._apply_regex_filter(items, query_spec.regex)
             items = items[:page_size]
-
-        self._fill_tag_ids(items)
         return items
 
     def _count_spec(
@@ -185,9 +375,15 @@ class ClipboardQuery:
     ) -> int:
         """配合旧 search 返回 total。正则后置过滤会让 total 不精确；
         这里给近似值（SQL 层过滤后的行数），足以驱动旧分页 UI。"""
-        return self._run_query(
+        total = self._run_query(
             query_spec, limit=None, offset=0, space_id=space_id, for_count=True
         )
+        if self._archive is not None:
+            total += self._run_query(
+                query_spec, limit=None, offset=0, space_id=space_id,
+                for_count=True, archived=True,
+            )
+        return total
 
     # ------------------------------------------------------------------
     # 查询构造
@@ -207,7 +403,6 @@ class ClipboardQuery:
         explicit_space_is_null = space_id is None  # None = 个人空间
 
         # 处理 query_spec.filters
-        content_type_pinned = False
         for f in query_spec.filters:
             key = f.key
             if key == "from":
@@ -234,18 +429,10 @@ class ClipboardQuery:
                 op_sql = f.op.value
                 if f.negate:
                     op_sql = _negate_op(op_sql)
-                if content_type_pinned:
-                    # 前面已固定 content_type，只查对应载荷列
-                    clauses.append(
-                        f"((content_type = 'text' AND LENGTH(text_content) {op_sql} ?)"
-                        f" OR (content_type = 'image' AND LENGTH(image_data) {op_sql} ?))"
-                    )
-                    params.extend([f.value, f.value])
-                else:
-                    clauses.append(
-                        f"(LENGTH(text_content) {op_sql} ? OR LENGTH(image_data) {op_sql} ?)"
-                    )
-                    params.extend([f.value, f.value])
+                # 冗余列 payload_bytes（v5 迁移回填）走 (payload_bytes, created_at) 索引，
+                # 不再逐行读取载荷 BLOB；content_type 由 is: 过滤单独约束
+                clauses.append(f"payload_bytes {op_sql} ?")
+                params.append(f.value)
             elif key == "before":
                 op_sql = "<=" if not f.negate else ">"
                 clauses.append(f"created_at {op_sql} ?")
@@ -262,12 +449,10 @@ class ClipboardQuery:
                     clauses.append(
                         "content_type != 'text'" if f.negate else "content_type = 'text'"
                     )
-                    content_type_pinned = True
                 elif v == "image":
                     clauses.append(
                         "content_type != 'image'" if f.negate else "content_type = 'image'"
                     )
-                    content_type_pinned = True
 
         # 显式 space_id
         if explicit_space:
@@ -278,6 +463,15 @@ class ClipboardQuery:
 
         return clauses, params
 
+    def _order_sql(self, query_spec: QuerySpec) -> str:
+        # size: 过滤时让 SQLite 走 idx_payload_created 范围扫描再排序匹配行；
+        # 否则无统计信息的 planner 会为了免排序去扫 idx_created_at，逐行读到表尾的
+        # payload_bytes（要穿过整条 BLOB 溢出页链）。`+created_at` 只是让排序列
+        # 不再匹配 idx_created_at，结果顺序不变。
+        if not self._is_mysql and any(f.key == "size" for f in query_spec.filters):
+            return "+created_at DESC"
+        return "created_at DESC"
+
     def _run_query(
         self,
         query_spec: QuerySpec,
@@ -285,47 +479,130 @@ class ClipboardQuery:
         offset: int,
         space_id: Optional[str],
         for_count: bool,
+        archived: bool = False,
     ):
-        """根据 has_fts + is_mysql 生成对应 SQL，返回 rows（或 for_count=True 时返回 int）。"""
+        """根据 has_fts + is_mysql 生成对应 SQL，返回 rows（或 for_count=True 时返回 int）。
+
+        archived=True 时改查归档层视图；同 content_hash 已回到热层的归档副本被排除，
+        避免重新复制过的旧内容在结果里出现两次。
+        """
         filter_clauses, filter_params = self._build_filter_clauses(query_spec, space_id)
+        if archived:
+            table = ARCHIVE_VIEW
+            fts_subquery = ARCHIVE_FTS_SUBQUERY
+            ranked_subquery = ARCHIVE_FTS_RANKED_SUBQUERY
+            has_fts = self._archive.has_fts
+            filter_clauses.append(
+                "content_hash NOT IN (SELECT content_hash FROM main.clipboard_items)"
+            )
+        else:
+            table = "clipboard_items"
+            fts_subquery = _HOT_FTS_SUBQUERY
+            ranked_subquery = _HOT_FTS_RANKED_SUBQUERY
+            has_fts = self._has_fts
 
         has_text = bool(query_spec.keywords or query_spec.exact_phrases)
+        order_sql = self._order_sql(query_spec)
 
         def op(conn):
-            # SQLite + FTS5 可用：关键词走 FTS5 子查询
-            if has_text and self._has_fts and not self._is_mysql:
+            # SQLite + FTS5 可用：关键词走 FTS5（由 planner 决定先 FTS 还是先 filter）
+            if has_text and has_fts and not self._is_mysql:
                 fts_expr = query_spec.fts_match_expression()
-                where_sql = "id IN (SELECT rowid FROM clipboard_fts WHERE clipboard_fts MATCH ?)"
-                params: List = [fts_expr]
-                if filter_clauses:
-                    where_sql += " AND " + " AND ".join(filter_clauses)
-                    params.extend(filter_params)
+                if query_spec.sort == SORT_RELEVANCE and not for_count:
+                    return self._do_ranked_select(
+                        conn, ranked_subquery, fts_expr,
+                        filter_clauses, filter_params, limit, offset, table,
+                    )
+                strategy = STRATEGY_FTS_FIRST
+                if not archived and self.planner is not None:
+                    plan = self.planner.plan(conn, query_spec, space_id, limit, offset)
+                    strategy = plan.strategy
+                    logger.debug(f"搜索计划: {plan.describe()}")
+                where_sql, params, index_hint, eff_order = self._fts_where(
+                    strategy, fts_subquery, fts_expr, filter_clauses, filter_params, order_sql
+                )
                 return self._do_select(
-                    conn, where_sql, params, limit, offset, for_count
+                    conn, where_sql, params, limit, offset, for_count, table,
+                    eff_order, index_hint,
                 )
 
-            # FTS 不可用或无关键词：LIKE 回退 + filter
-            like_clauses: List[str] = []
-            like_params: List = []
-            if has_text:
-                for kw in query_spec.keywords:
-                    like_clauses.append(
-                        "(text_content LIKE ? OR preview LIKE ?)"
-                    )
-                    like_params.extend([f"%{kw}%", f"%{kw}%"])
-                for phrase in query_spec.exact_phrases:
-                    like_clauses.append(
-                        "(text_content LIKE ? OR preview LIKE ?)"
-                    )
-                    like_params.extend([f"%{phrase}%", f"%{phrase}%"])
-
-            all_clauses = like_clauses + filter_clauses
-            where_sql = " AND ".join(all_clauses) if all_clauses else ""
-            params = like_params + filter_params
-            return self._do_select(conn, where_sql, params, limit, offset, for_count)
+            # FTS 不可用或无关键词：MySQL 全文索引 / LIKE 回退 + filter
+            where_sql, params = self._text_where(query_spec, filter_clauses, filter_params)
+            return self._do_select(
+                conn, where_sql, params, limit, offset, for_count, table, order_sql
+            )
 
         return self.db.execute_read(op)
 
+    def _text_where(
+        self,
+        query_spec: QuerySpec,
+        filter_clauses: List[str],
+        filter_params: List,
+    ) -> Tuple[str, List]:
+        """非 FTS5 路径的文本条件：MySQL 有 ngram 全文索引时用 MATCH，否则 LIKE。"""
+        if not (self._is_mysql and self._dao._has_fulltext):
+            return self._like_where(query_spec, filter_clauses, filter_params)
+        expr, leftovers = query_spec.boolean_mode_expression()
+        clauses: List[str] = []
+        params: List = []
+        if expr:
+            # 列清单必须与 FULLTEXT 索引定义完全一致，否则 MySQL 报 1191
+            clauses.append("MATCH(text_content, preview) AGAINST (? IN BOOLEAN MODE)")
+            params.append(expr)
+        # 单字符关键词拆不出 ngram，仍用 LIKE（已被 MATCH 收窄，不再全表扫）
+        short = QuerySpec(keywords=leftovers)
+        like_sql, like_params = self._like_where(short, clauses + filter_clauses, params + filter_params)
+        return like_sql, like_params
+
+    @staticmethod
+    def _like_where(
+        query_spec: QuerySpec,
+        filter_clauses: List[str],
+        filter_params: List,
+    ) -> Tuple[str, List]:
+        like_clauses: List[str] = []
+        like_params: List = []
+        for kw in query_spec.keywords:
+            like_clauses.append(
+                "(text_content LIKE ? OR preview LIKE ?)"
+            )
+            like_params.extend([f"%{kw}%", f"%{kw}%"])
+        for phrase in query_spec.exact_phrases:
+            like_clauses.append(
+                "(text_content LIKE ? OR preview LIKE ?)"
+            )
+            like_params.extend([f"%{phrase}%", f"%{phrase}%"])
+
+        all_clauses = like_clauses + filter_clauses
+        where_sql = " AND ".join(all_clauses) if all_clauses else ""
+        return where_sql, like_params + filter_params
+
+    @staticmethod
+    def _fts_where(
+        strategy: str,
+        fts_subquery: str,
+        fts_expr: str,
+        filter_clauses: List[str],
+        filter_params: List,
+        order_sql: str,
+    ) -> Tuple[str, List, str, str]:
+        """按策略拼 (where_sql, params, index_hint, order_sql)。
+
+        - fts_first：``id IN (FTS 子查询)`` 放最前，SQLite 以 FTS 命中驱动；
+        - filter_first：filter 在前、FTS 改为逐行 EXISTS 探测，排序列加 ``+``
+          让 planner 选 filter 的索引而不是为免排序去扫 idx_created_at；
+        - scan：INDEXED BY idx_created_at 倒序扫，命中凑满 LIMIT 即停。
+        """
+        if strategy == STRATEGY_FTS_FIRST:
+            clauses = [f"id IN ({fts_subquery})"] + filter_clauses
+            return " AND ".join(clauses), [fts_expr] + filter_params, "", order_sql
+        clauses = filter_clauses + [_HOT_FTS_PROBE]
+        params = filter_params + [fts_expr]
+        if strategy == STRATEGY_SCAN:
+            return " AND ".join(clauses), params, "INDEXED BY idx_created_at", "created_at DESC"
+        return " AND ".join(clauses), params, "", "+created_at DESC"
+
     def _do_select(
         self,
         conn,
@@ -334,21 +611,207 @@ class ClipboardQuery:
         limit: Optional[int],
         offset: int,
         for_count: bool,
+        table: str = "clipboard_items",
+        order_sql: str = "created_at DESC",
+        index_hint: str = "",
     ):
+        from_sql = f"{table} {index_hint}" if index_hint else table
         if for_count:
-            count_sql = "SELECT COUNT(*) FROM clipboard_items"
+            count_sql = f"SELECT COUNT(*) FROM {from_sql}"
             if where_sql:
                 count_sql += f" WHERE {where_sql}"
             return self._dao._scalar(conn, count_sql, tuple(params))
 
-        sql = f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE} FROM clipboard_items"
+        sql = (
+            f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column(table)} "
+            f"FROM {from_sql}"
+        )
         if where_sql:
             sql += f" WHERE {where_sql}"
-        sql += " ORDER BY created_at DESC"
+        sql += f" ORDER BY {order_sql}"
         if limit is not None:
             sql += " LIMIT ? OFFSET ?"
             params = params + [limit, offset]
-        return self._dao._fetchall(conn, sql, tuple(params))
+        return self._dao._fetch_items(conn, sql, tuple(params))
+
+    def explain(
+        self,
+        query_spec: QuerySpec,
+        page: int = 1,
+        page_size: int = 50,
+        *,
+        space_id: Optional[str] = None,
+    ) -> dict:
+        """调试用：返回 planner 的估算、三种策略的代价、选中的 SQL 及 SQLite 的 EXPLAIN QUERY PLAN。
+
+        不走 FTS 的查询（无关键词 / MySQL / 相关度排序）strategy 为 None。
+        """
+        offset = (max(page, 1) - 1) * page_size
+        has_text = bool(query_spec.keywords or query_spec.exact_phrases)
+        filter_clauses, filter_params = self._build_filter_clauses(query_spec, space_id)
+
+        def op(conn):
+            if (
+                self.planner is None
+                or not has_text
+                or query_spec.sort == SORT_RELEVANCE
+            ):
+                return {"strategy": None, "plan": None}
+            plan: QueryPlan = self.planner.plan(conn, query_spec, space_id, page_size, offset)
+            where_sql, params, index_hint, eff_order = self._fts_where(
+                plan.strategy, _HOT_FTS_SUBQUERY, query_spec.fts_match_expression(),
+                filter_clauses, filter_params, self._order_sql(query_spec),
+            )
+            from_sql = f"clipboard_items {index_hint}" if index_hint else "clipboard_items"
+            sql = (
+                f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column()} "
+                f"FROM {from_sql} WHERE {where_sql} "
+                f"ORDER BY {eff_order} LIMIT ? OFFSET ?"
+            )
+            params = params + [page_size, offset]
+            sqlite_plan = [
+                row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + sql, params)
+            ]
+            return {
+                "strategy": plan.strategy,
+                "plan": plan,
+                "description": plan.describe(),
+                "sql": sql,
+                "sqlite_plan": sqlite_plan,
+            }
+
+        return self.db.execute_read(op)
+
+    def _do_ranked_select(
+        self,
+        conn,
+        ranked_subquery: str,
+        fts_expr: str,
+        filter_clauses: List[str],
+        filter_params: List,
+        limit: Optional[int],
+        offset: int,
+        table: str = "clipboard_items",
+    ) -> List[ClipboardItem]:
+        """sort:relevance：JOIN FTS5 结果取 bm25，按加权分数排序。
+
+        Why: ORDER BY 表达式 + LIMIT 让 SQLite 在排序器里只保留 top-k，
+        不需要把全部命中行拉回 Python 再排；分数相同（例如空 MATCH 统计）时
+        仍按 created_at 倒序，保证分页稳定。
+        """
+        sql = (
+            f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column(table)} "
+            f"FROM {table} JOIN ({ranked_subquery}) AS r ON r.rowid = {table}.id"
+        )
+        params: List = [fts_expr] + list(filter_params)
+        if filter_clauses:
+            sql += " WHERE " + " AND ".join(filter_clauses)
+        sql += f" ORDER BY {_RANK_EXPR}, created_at DESC"
+        params.append(int(time.time() * 1000))
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params += [limit, offset]
+        return self._dao._fetch_items(conn, sql, tuple(params))
+
+    # ------------------------------------------------------------------
+    # 分面统计
+    # ------------------------------------------------------------------
+
+    def facets(
+        self,
+        query_spec: Optional[QuerySpec] = None,
+        keys: Sequence[str] = FACET_KEYS,
+        *,
+        space_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> Dict[str, List[Tuple[Any, int]]]:
+        """当前查询命中集合上的分面计数：{key: [(value, count), ...]}。
+
+        各层（热层 / 归档层）只跑一条 SQL：命中 id 集合物化成 CTE 后，
+        各分面的 GROUP BY 以 UNION ALL 共用它，FTS / filter 只求值一次。
+        space_id 语义同 search()；正则只在 Python 层后置过滤，这里不计入（同 _count_spec）。
+        tag 的值是 tag_id，source_app 为空时值为 None。
+        """
+        if query_spec is None:
+            query_spec = QuerySpec()
+        keys = tuple(dict.fromkeys(keys))
+        unknown = set(keys) - set(FACET_KEYS)
+        if unknown:
+            raise ValueError(f"不支持的分面：{sorted(unknown)}，可选：{list(FACET_KEYS)}")
+
+        counts: Dict[str, Counter] = {k: Counter() for k in keys}
+        tiers = [False] if self._archive is None else [False, True]
+        for archived in tiers:
+            for key, value, cnt in self._facet_rows(query_spec, keys, space_id, archived):
+                if key == "source_app" and not value:
+                    value = None  # 旧数据 NULL 与新数据 "" 合并为"未知来源"
+                elif key == "day":
+                    value = int(value)
+                counts[key][value] += int(cnt)
+        return _order_facets(counts, limit)
+
+    def _facet_rows(
+        self,
+        query_spec: QuerySpec,
+        keys: Sequence[str],
+        space_id: Optional[str],
+        archived: bool,
+    ) -> list:
+        filter_clauses, filter_params = self._build_filter_clauses(query_spec, space_id)
+        if archived:
+            table = ARCHIVE_VIEW
+            fts_subquery = ARCHIVE_FTS_SUBQUERY
+            has_fts = self._archive.has_fts
+            filter_clauses.append(
+                "content_hash NOT IN (SELECT content_hash FROM main.clipboard_items)"
+            )
+        else:
+            table = "clipboard_items"
+            fts_subquery = _HOT_FTS_SUBQUERY
+            has_fts = self._has_fts
+
+        has_text = bool(query_spec.keywords or query_spec.exact_phrases)
+        if has_text and has_fts and not self._is_mysql:
+            where_sql, params, _, _ = self._fts_where(
+                STRATEGY_FTS_FIRST, fts_subquery, query_spec.fts_match_expression(),
+                filter_clauses, filter_params, "",
+            )
+        else:
+            where_sql, params = self._text_where(query_spec, filter_clauses, filter_params)
+
+        day_expr = (
+            f"(created_at DIV {_DAY_MS}) * {_DAY_MS}"
+            if self._is_mysql
+            else f"(created_at / {_DAY_MS}) * {_DAY_MS}"
+        )
+        arms: List[str] = []
+        if "source_app" in keys:
+            arms.append("SELECT 'source_app', source_app, COUNT(*) FROM hits GROUP BY source_app")
+        if "content_type" in keys:
+            arms.append("SELECT 'content_type', content_type, COUNT(*) FROM hits GROUP BY content_type")
+        if "day" in keys:
+            arms.append(f"SELECT 'day', {day_expr}, COUNT(*) FROM hits GROUP BY {day_expr}")
+        if "tag" in keys and self._dao._has_tags:
+            arms.append(
+                "SELECT 'tag', ct.tag_id, COUNT(*) FROM hits "
+                "JOIN clipboard_tags ct ON ct.item_id = hits.id GROUP BY ct.tag_id"
+            )
+        if not arms:
+            return []
+
+        # SQLite 默认会把只引用一次的 CTE 内联；多个 UNION 分支引用时显式物化
+        materialized = "" if self._is_mysql else " MATERIALIZED"
+        where = f" WHERE {where_sql}" if where_sql else ""
+        sql = (
+            f"WITH hits AS{materialized} ("
+            f"SELECT id, source_app, content_type, created_at FROM {table}{where}) "
+            + " UNION ALL ".join(arms)
+        )
+
+        def op(conn):
+            return self.db.fetch_rows(conn, sql, tuple(params))[1]
+
+        return self.db.execute_read(op)
 
     @staticmethod
     def _apply_regex_filter(
@@ -372,60 +835,18 @@ class ClipboardQuery:
         return out
 
     # ------------------------------------------------------------------
-    # v3.4: tag 填充 & 时间轴 & 按 tag 列表
+    # v3.4: 时间轴 & 按 tag 列表
     # ------------------------------------------------------------------
 
-    def _fill_tag_ids(self, items: List[ClipboardItem]) -> None:
-        """给一批 item 回填 tag_ids 字段（批量查询 clipboard_tags）。
-
-        clipboard_tags 表在 v3.4 之前不存在，迁移未执行时要静默跳过，避免
-        在旧库上使 search 直接崩溃。
-        """
-        if not items:
-            return
-        ids = [it.id for it in items if it.id is not None]
-        if not ids:
-            return
-
-        mapping: Dict[int, List[str]] = {}
-        placeholders = ",".join("?" * len(ids))
-        sql = (
-            f"SELECT item_id, tag_id FROM clipboard_tags WHERE item_id IN ({placeholders})"
-        )
-
-        def op(conn):
-            try:
-                return self._dao._fetchall(conn, sql, tuple(ids))
-            except Exception as exc:
-                # 迁移未跑或表不存在：记 debug 后返回空
-                logger.debug("读 clipboard_tags 失败（可能未迁移）: %s", exc)
-                return []
-
-        try:
-            rows = self.db.execute_read(op)
-        except Exception:
-            return
-
-        for row in rows:
-            # 兼容 sqlite3.Row / dict
-            try:
-                item_id = row["item_id"]
-                tag_id = row["tag_id"]
-            except (KeyError, IndexError, TypeError):
-                item_id = row[0]
-                tag_id = row[1]
-            mapping.setdefault(item_id, []).append(tag_id)
-
-        for it in items:
-            if it.id in mapping:
-                it.tag_ids = mapping[it.id]
-
     def get_timeline(
         self,
         start_ts: int,
         end_ts: int,
         granularity: str = "day",
         space_id: Optional[str] = None,
+        *,
+        tz_offset_ms: Optional[int] = None,
+        starred_only: bool = False,
     ) -> List[dict]:
         """按时间桶聚合统计。
 
@@ -433,6 +854,9 @@ class ClipboardQuery:
           - start_ts / end_ts: 毫秒时间戳，闭区间 [start_ts, end_ts]
           - granularity: "hour" 或 "day"
           - space_id: None = 个人空间；空串 = 所有空间；其他值 = 特定空间
+          - tz_offset_ms: 给定时按"UTC + 偏移"的本地日 / 小时分桶（两种方言都用整数运算）；
+            None 保持原语义（SQLite 按 UTC，MySQL 按会话时区）
+          - starred_only: 只统计收藏条目
 
         返回 [{bucket_start_ts, count, first_item_id, last_item_id}, ...]，
         按 bucket_start_ts ASC 排序。
@@ -441,7 +865,12 @@ class ClipboardQuery:
             raise ValueError(f"granularity 必须是 hour|day，收到 {granularity!r}")
 
         # 各方言计算 bucket_start_ts（单位：毫秒）。均向下取整到桶边界。
-        if self._is_mysql:
+        if tz_offset_ms is not None:
+            span = 3_600_000 if granularity == "hour" else 86_400_000
+            off = int(tz_offset_ms)
+            div = "DIV" if self._is_mysql else "/"
+            bucket_expr = f"((created_at + {off}) {div} {span}) * {span} - {off}"
+        elif self._is_mysql:
             fmt = "%Y-%m-%d %H:00:00" if granularity == "hour" else "%Y-%m-%d 00:00:00"
             bucket_expr = (
                 f"UNIX_TIMESTAMP(DATE_FORMAT(FROM_UNIXTIME(created_at/1000), '{fmt}')) * 1000"
@@ -459,6 +888,8 @@ class ClipboardQuery:
         elif space_id != "":
             where.append("space_id = ?")
             params.append(space_id)
+        if starred_only:
+            where.append("is_starred = 1")
 
         sql = (
             f"SELECT {bucket_expr} AS bucket, COUNT(*) AS cnt, "
@@ -498,15 +929,31 @@ class ClipboardQuery:
         eff_page = max(page, 1)
         offset = (eff_page - 1) * page_size
         sql = (
-            f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE} FROM clipboard_items "
+            f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column()} "
+            f"FROM clipboard_items "
             f"WHERE id IN (SELECT item_id FROM clipboard_tags WHERE tag_id = ?) "
             f"ORDER BY created_at DESC LIMIT ? OFFSET ?"
         )
 
         def op(conn):
-            return self._dao._fetchall(conn, sql, (tag_id, page_size, offset))
+            return self._dao._fetch_items(conn, sql, (tag_id, page_size, offset))
 
-        rows = self.db.execute_read(op)
-        items = [ClipboardItem.from_db_row(row) for row in rows]
-        self._fill_tag_ids(items)
-        return items
+        return self.db.execute_read(op)
+
+    def get_largest_items(
+        self, limit: int = 50, min_bytes: int = 0
+    ) -> List[ClipboardItem]:
+        """按 payload_bytes 倒序列出最占空间的条目（清理视图用）。
+
+        ORDER BY payload_bytes DESC 直接倒序扫 idx_payload_created，不读载荷。
+        """
+        sql = (
+            f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE}{self._dao._tag_column()} "
+            f"FROM clipboard_items WHERE payload_bytes >= ? "
+            f"ORDER BY payload_bytes DESC LIMIT ?"
+        )
+
+        def op(conn):
+            return self._dao._fetch_items(conn, sql, (min_bytes, limit))
+
+        return self.db.execute_read(op)
@@ -0,0 +1,151 @@
+"""ItemCache: 按 id / content_hash 双键索引的条目读穿缓存（LRU，按字节加权淘汰）。
+
+同一批条目会被反复解码：监听器每次复制都 get_by_hash，UI 点击 / 保存走
+get_item_by_id，收藏切换后重读整条，云同步批量 get_existing_hashes。
+ClipboardDAO 持有一个实例，单条读取先查缓存，所有写路径按 id 失效（批量删除整体清空）。
+
+一致性：
+- 所有操作在一把锁内完成，UI / 监听 / 同步线程共享同一个实例；
+- 读穿时先取 generation，查库后再 put；期间若有任何失效发生（generation 变化），
+  放弃这次写入，避免把写之前读到的旧行塞回缓存；
+- get 返回浅拷贝，调用方改字段（例如 UI 乐观更新 is_starred）不会污染缓存。
+"""
+
+import copy
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from ..models import ClipboardItem
+
+# 每个条目的固定开销估算（dataclass 实例 + 字段对象 + 索引项）
+_ENTRY_OVERHEAD = 512
+
+
+def _weigh(item: ClipboardItem) -> int:
+    """粗略估算条目占用：图片原图 / 缩略图字节 + 文本长度 + 固定开销。"""
+    size = _ENTRY_OVERHEAD + len(item.preview or "")
+    text = getattr(item, "text_content", None)
+    if text:
+        size += len(text)
+    for attr in ("image_data", "image_thumbnail"):
+        blob = getattr(item, attr, None)
+        if blob:
+            size += len(blob)
+    return size
+
+
+class ItemCache:
+    """线程安全的条目 LRU；max_bytes=0 表示禁用（所有 get 都 miss，put 丢弃）。"""
+
+    # 默认预算：够放几千条文本或几十张原图
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self._max_bytes = max(0, int(max_bytes))
+        # 单条超过预算的 1/8 不缓存，避免一张大图把整个缓存冲掉
+        self._max_entry_bytes = self._max_bytes // 8
+        self._lock = threading.Lock()
+        # id -> (item, weight, full)；full 表示含 image_data（get_item_by_id 形状）
+        self._entries: "OrderedDict[int, Tuple[ClipboardItem, int, bool]]" = OrderedDict()
+        self._by_hash: Dict[str, int] = {}
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_bytes > 0
+
+    @property
+    def generation(self) -> int:
+        """读穿前取一次，put 时原样带回；期间有失效则 put 被丢弃。"""
+        return self._generation
+
+    # ------------------------------------------------------------------
+    # 读
+    # ------------------------------------------------------------------
+
+    def get_by_id(self, item_id: int, full: bool = True) -> Optional[ClipboardItem]:
+        """full=True 时只接受含 image_data 的条目（by-hash 读入的精简条目视为 miss）。"""
+        with self._lock:
+            entry = self._entries.get(item_id)
+            if entry is None or (full and not entry[2]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(item_id)
+            self.hits += 1
+            return copy.copy(entry[0])
+
+    def get_by_hash(self, content_hash: str) -> Optional[ClipboardItem]:
+        with self._lock:
+            item_id = self._by_hash.get(content_hash)
+            if item_id is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(item_id)
+            self.hits += 1
+            return copy.copy(self._entries[item_id][0])
+
+    # ------------------------------------------------------------------
+    # 写
+    # ------------------------------------------------------------------
+
+    def put(self, item: ClipboardItem, generation: int, full: bool = True) -> None:
+        if not self.enabled or item.id is None:
+            return
+        weight = _weigh(item)
+        if weight > self._max_entry_bytes:
+            return
+        with self._lock:
+            if generation != self._generation:
+                return
+            old = self._entries.get(item.id)
+            if old is not None:
+                if old[2] and not full:
+                    # 已有完整条目，不用精简版覆盖
+                    return
+                self._drop(item.id)
+            self._entries[item.id] = (copy.copy(item), weight, full)
+            if item.content_hash:
+                self._by_hash[item.content_hash] = item.id
+            self._bytes += weight
+            while self._bytes > self._max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self.evictions += 1
+
+    def invalidate(self, item_id: int) -> None:
+        with self._lock:
+            self._generation += 1
+            if item_id in self._entries:
+                self._drop(item_id)
+
+    def clear(self) -> None:
+        """批量删除 / 标签定义删除等影响面不确定的写操作后整体清空。"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._by_hash.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self._max_bytes,
+            }
+
+    def _drop(self, item_id: int) -> None:
+        item, weight, _ = self._entries.pop(item_id)
+        if self._by_hash.get(item.content_hash) == item_id:
+            del self._by_hash[item.content_hash]
+        self._bytes -= weight
@@ -0,0 +1,434 @@
+"""QueryPlanner: 按谓词选择率为 SQLite 关键词搜索挑选执行顺序。
+
+ClipboardQuery 原来固定写成 ``id IN (SELECT rowid FROM clipboard_fts ...)``：
+先把 FTS 命中全部拉出来，再逐行套 filter。关键词很常见、filter 很挑剔
+（``from:App after:yesterday`` + "the"）时，先走 filter 的索引再逐行探测 FTS
+要便宜得多；两边都不挑剔时，沿 idx_created_at 倒序扫到凑满一页即可停。
+
+三种策略：
+- fts_first：FTS 子查询驱动，按 rowid 回表再套 filter（原行为）；
+- filter_first：filter 索引驱动，每行用 ``rowid = id`` 探测一次 FTS；
+- scan：沿 idx_created_at 倒序扫，每行先套 filter 再探测 FTS，LIMIT 满即停。
+
+统计信息：
+- 总行数取 sqlite_stat1（ANALYZE 维护），缺失时 COUNT(*)；
+- 来源 / 标签 / 空间 / 收藏 / 类型计数与 created_at 范围，缓存 _STATS_TTL_S 秒；
+- 关键词文档数来自 fts5vocab（clipboard_fts_vocab），前缀词按词项区间求和（上界）。
+全表 GROUP BY、ANALYZE、建 fts5vocab 都只在 refresh() 里做，由应用的维护定时器
+（ClipboardRepository.refresh_search_stats）放到后台线程；按键路径上的 plan() 只读缓存，
+还没刷新过时只有行数，filter 选择率取默认值。
+只用于热层 SQLite；MySQL 与归档层仍按原写法。
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ..query_parser import QuerySpec, _needs_quoting
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_FTS_FIRST = "fts_first"
+STRATEGY_FILTER_FIRST = "filter_first"
+STRATEGY_SCAN = "scan"
+
+# 代价单位≈访问一行。FTS 命中行：读 doclist + 按 rowid 回表；
+# 探测：带 rowid 约束的 MATCH 要在每个词的 doclist 里 seek。
+_FTS_ROW_COST = 2.0
+_PROBE_COST = 4.0
+_ROW_COST = 1.0
+
+# 没有统计可用时的默认选择率
+_DEFAULT_RANGE_SELECTIVITY = 1.0 / 3
+_DEFAULT_EQ_SELECTIVITY = 0.05
+_DEFAULT_TERM_SELECTIVITY = 0.1
+
+# 有索引、可以驱动 filter_first 的 filter key
+_INDEXED_KEYS = {"from", "tag", "space", "size", "before", "after", "is:text", "is:image"}
+
+_VOCAB_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS clipboard_fts_vocab "
+    "USING fts5vocab(clipboard_fts, row)"
+)
+
+# unicode61 分词：连续的字母数字为一个词
+_TOKEN_RE = re.compile(r"[^\W_]+", re.UNICODE)
+
+
+@dataclass
+class TableStats:
+    total: int = 0
+    sources: Dict[str, int] = field(default_factory=dict)
+    tags: Dict[str, int] = field(default_factory=dict)
+    spaces: Dict[Optional[str], int] = field(default_factory=dict)
+    types: Dict[str, int] = field(default_factory=dict)
+    starred: int = 0
+    min_ts: int = 0
+    max_ts: int = 0
+    loaded_at: float = 0.0
+    # False = 只有行数的粗略统计（后台刷新尚未完成），filter 选择率用默认值
+    complete: bool = True
+
+
+@dataclass
+class QueryPlan:
+    strategy: str
+    total_rows: int
+    text_rows: float
+    filter_rows: float
+    driving_rows: float
+    costs: Dict[str, float]
+    # (谓词描述, 估算选择率)
+    predicates: List[Tuple[str, float]] = field(default_factory=list)
+
+    def describe(self) -> str:
+        preds = ", ".join(f"{name}≈{sel:.3g}" for name, sel in self.predicates)
+        costs = ", ".join(f"{k}={v:.0f}" for k, v in sorted(self.costs.items()))
+        return (
+            f"{self.strategy} (rows={self.total_rows}, text≈{self.text_rows:.0f}, "
+            f"filters≈{self.filter_rows:.0f}; cost {costs}; {preds})"
+        )
+
+
+class QueryPlanner:
+    """估算选择率并在 fts_first / filter_first / scan 之间选代价最低者。"""
+
+    _STATS_TTL_S = 300.0
+    # 行数超过该值仍没有 sqlite_stat1 时补跑一次（限采样的）ANALYZE
+    _ANALYZE_MIN_ROWS = 5000
+    _ANALYZE_LIMIT = 1000
+
+    def __init__(self, db_manager, has_tags: bool = True):
+        self.db = db_manager
+        self._has_tags = has_tags
+        self._lock = threading.Lock()
+        self._stats: Optional[TableStats] = None
+        # invalidate() 置位：下一轮维护刷新；刷新完成前沿用旧统计
+        self._expired = False
+        self._refresh_thread: Optional[threading.Thread] = None
+        # 关键词 -> 文档数；与 _stats 同步过期（边输入边搜索时同一前缀会被反复估算）
+        self._term_cache: Dict[str, Optional[int]] = {}
+        self._vocab_ready: Optional[bool] = None
+        self._analyzed = False
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._expired = True
+            self._term_cache = {}
+
+    # ------------------------------------------------------------------
+    # 统计信息
+    # ------------------------------------------------------------------
+
+    @property
+    def needs_refresh(self) -> bool:
+        with self._lock:
+            st = self._stats
+            return (
+                st is None
+                or not st.complete
+                or self._expired
+                or time.monotonic() - st.loaded_at >= self._STATS_TTL_S
+            )
+
+    def stats(self, conn) -> TableStats:
+        """只读缓存；还没刷新过时返回只含行数的粗略统计（同样缓存，不重复查）。"""
+        with self._lock:
+            cached = self._stats
+        if cached is not None:
+            return cached
+        cold = TableStats(total=self._cheap_total(conn), loaded_at=time.monotonic(), complete=False)
+        with self._lock:
+            if self._stats is None:
+                self._stats = cold
+            return self._stats
+
+    def refresh(self) -> TableStats:
+        """维护路径（后台线程 / 启动后调用）：建 fts5vocab、必要时 ANALYZE、重算全量统计。"""
+        self._ensure_vocab()
+        if not self._analyzed:
+            rows = self.db.execute_read(self._stat1_rows)
+            if rows is None:
+                count = self.db.execute_read(
+                    lambda conn: conn.execute("SELECT COUNT(*) FROM clipboard_items").fetchone()[0]
+                )
+                if count >= self._ANALYZE_MIN_ROWS:
+                    self.analyze()
+        fresh = self.db.execute_read(self._load_stats)
+        with self._lock:
+            self._stats = fresh
+            self._expired = False
+            self._term_cache = {}
+        return fresh
+
+    def refresh_async(self) -> None:
+        """后台线程跑一次 refresh()；已有刷新在跑时直接返回。"""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_worker, name="QueryPlannerStats", daemon=True
+            )
+            self._refresh_thread.start()
+
+    def wait_refresh(self, timeout: Optional[float] = None) -> None:
+        """等后台刷新结束。Why: 关库会关掉所有线程的连接，刷新线程还在用时会崩在 sqlite 里。"""
+        with self._lock:
+            thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh_worker(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.debug(f"刷新搜索统计失败，沿用旧统计: {e}")
+
+    def _cheap_total(self, conn) -> int:
+        """不扫表的行数估计：sqlite_stat1，缺失时取 MAX(id)（主键上界，O(log n)）。"""
+        total = self._stat1_rows(conn)
+        if total is None:
+            total = conn.execute("SELECT MAX(id) FROM clipboard_items").fetchone()[0] or 0
+        return total
+
+    def _load_stats(self, conn) -> TableStats:
+        st = TableStats(loaded_at=time.monotonic())
+        st.total = self._stat1_rows(conn)
+        if st.total is None:
+            st.total = conn.execute("SELECT COUNT(*) FROM clipboard_items").fetchone()[0]
+        for app, n in conn.execute(
+            "SELECT source_app, COUNT(*) FROM clipboard_items GROUP BY source_app"
+        ):
+            if app is not None:
+                st.sources[app] = n
+        for space, n in conn.execute(
+            "SELECT space_id, COUNT(*) FROM clipboard_items GROUP BY space_id"
+        ):
+            st.spaces[space] = n
+        for ctype, n in conn.execute(
+            "SELECT content_type, COUNT(*) FROM clipboard_items GROUP BY content_type"
+        ):
+            st.types[ctype] = n
+        if self._has_tags:
+            for name, n in conn.execute(
+                "SELECT td.name, COUNT(*) FROM clipboard_tags ct "
+                "JOIN tag_definitions td ON ct.tag_id = td.id GROUP BY td.name"
+            ):
+                st.tags[name] = n
+        row = conn.execute(
+            "SELECT SUM(is_starred = 1), MIN(created_at), MAX(created_at) FROM clipboard_items"
+        ).fetchone()
+        st.starred, st.min_ts, st.max_ts = row[0] or 0, row[1] or 0, row[2] or 0
+        return st
+
+    def analyze(self) -> None:
+        """刷新 sqlite_stat1（analysis_limit 限制每个索引的采样行数，大库也只要几毫秒）。"""
+        self._analyzed = True
+
+        def op(conn):
+            conn.execute(f"PRAGMA analysis_limit={self._ANALYZE_LIMIT}")
+            conn.execute("ANALYZE clipboard_items")
+
+        try:
+            self.db.execute_with_retry(op)
+        except Exception as e:
+            logger.debug(f"ANALYZE 失败，沿用 COUNT(*) 估算: {e}")
+
+    @staticmethod
+    def _stat1_rows(conn) -> Optional[int]:
+        """sqlite_stat1 的 stat 列首个整数就是表行数（任一索引行均可）。"""
+        try:
+            row = conn.execute(
+                "SELECT stat FROM sqlite_stat1 WHERE tbl = 'clipboard_items' LIMIT 1"
+            ).fetchone()
+        except Exception:
+            return None  # 从未 ANALYZE 过：sqlite_stat1 不存在
+        if row is None or not row[0]:
+            return None
+        try:
+            return int(str(row[0]).split()[0])
+        except ValueError:
+            return None
+
+    def _ensure_vocab(self) -> bool:
+        if self._vocab_ready is None:
+            try:
+                self.db.execute_with_retry(lambda conn: conn.execute(_VOCAB_DDL))
+                self._vocab_ready = True
+            except Exception as e:
+                logger.debug(f"fts5vocab 不可用，关键词选择率用默认值: {e}")
+                self._vocab_ready = False
+        return self._vocab_ready
+
+    def _term_docs(self, conn, keyword: str) -> Optional[int]:
+        with self._lock:
+            if keyword in self._term_cache:
+                return self._term_cache[keyword]
+        docs = self._read_term_docs(conn, keyword)
+        with self._lock:
+            self._term_cache[keyword] = docs
+        return docs
+
+    def _read_term_docs(self, conn, keyword: str) -> Optional[int]:
+        """估算关键词命中的文档数；前缀词为区间内各词项 doc 数之和（上界）。
+
+        fts5vocab 由 refresh() 创建；建好之前返回 None（取默认选择率），按键路径上不做 DDL。
+        """
+        if not self._vocab_ready:
+            return None
+        try:
+            if _needs_quoting(keyword):
+                # 引号包裹的是短语：取各分词中最少的那个
+                tokens = _TOKEN_RE.findall(keyword.lower())
+                if not tokens:
+                    return None
+                counts = [
+                    conn.execute(
+                        "SELECT COALESCE(SUM(doc), 0) FROM clipboard_fts_vocab WHERE term = ?",
+                        (tok,),
+                    ).fetchone()[0]
+                    for tok in tokens
+                ]
+                return min(counts)
+            prefix = keyword.rstrip("*").lower()
+            if not prefix:
+                return None
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            return conn.execute(
+                "SELECT COALESCE(SUM(doc), 0) FROM clipboard_fts_vocab "
+                "WHERE term >= ? AND term < ?",
+                (prefix, upper),
+            ).fetchone()[0]
+        except Exception as e:
+            logger.debug(f"读取 fts5vocab 失败: {e}")
+            return None
+
+    # ------------------------------------------------------------------
+    # 选择率
+    # ------------------------------------------------------------------
+
+    def _filter_selectivities(
+        self, st: TableStats, spec: QuerySpec, space_id: Optional[str]
+    ) -> List[Tuple[str, float, bool]]:
+        """返回 [(描述, 选择率, 是否有索引可驱动)]，与 _build_filter_clauses 的取舍一致。"""
+        total = max(st.total, 1)
+        out: List[Tuple[str, float, bool]] = []
+        explicit_space = space_id is not None and space_id != ""
+
+        def eq_sel(counts: dict, value) -> float:
+            # 粗略统计没有分布：等值条件一律取默认选择率
+            return counts.get(value, 0) / total if st.complete else _DEFAULT_EQ_SELECTIVITY
+
+        for f in spec.filters:
+            key = f.key
+            if key == "from":
+                sel = eq_sel(st.sources, f.value)
+            elif key == "tag":
+                sel = eq_sel(st.tags, f.value)
+            elif key == "space":
+                if space_id is None or explicit_space:
+                    continue  # 显式 space_id 接管
+                sel = eq_sel(st.spaces, f.value)
+            elif key in ("before", "after"):
+                span = st.max_ts - st.min_ts
+                if not st.complete or span <= 0:
+                    sel = _DEFAULT_RANGE_SELECTIVITY
+                elif key == "after":
+                    sel = (st.max_ts - f.value) / span
+                else:
+                    sel = (f.value - st.min_ts) / span
+                sel = min(max(sel, 0.0), 1.0)
+            elif key == "size":
+                sel = _DEFAULT_EQ_SELECTIVITY if f.op.value == "=" else _DEFAULT_RANGE_SELECTIVITY
+            elif key == "is":
+                if f.value == "starred":
+                    sel = st.starred / total if st.complete else _DEFAULT_EQ_SELECTIVITY
+                    key = "is:starred"
+                else:
+                    sel = eq_sel(st.types, f.value)
+                    key = f"is:{f.value}"
+            else:
+                continue
+            if f.negate:
+                sel = 1.0 - sel
+            # 取反的条件走不了索引的等值 / 区间查找
+            indexed = key in _INDEXED_KEYS and not f.negate
+            out.append((f"{'-' if f.negate else ''}{key}:{f.value}", sel, indexed))
+        if explicit_space:
+            out.append((f"space_id={space_id}", eq_sel(st.spaces, space_id), True))
+        elif space_id is None:
+            out.append(("space_id IS NULL", eq_sel(st.spaces, None), True))
+        return out
+
+    # ------------------------------------------------------------------
+    # 选计划
+    # ------------------------------------------------------------------
+
+    def plan(
+        self,
+        conn,
+        spec: QuerySpec,
+        space_id: Optional[str],
+        limit: Optional[int],
+        offset: int = 0,
+    ) -> QueryPlan:
+        st = self.stats(conn)
+        total = max(st.total, 1)
+
+        predicates: List[Tuple[str, float]] = []
+        text_sel = 1.0
+        for kw in list(spec.keywords) + [f'"{p}"' for p in spec.exact_phrases]:
+            docs = self._term_docs(conn, kw)
+            sel = _DEFAULT_TERM_SELECTIVITY if docs is None else min(docs / total, 1.0)
+            predicates.append((f"text:{kw}", sel))
+            text_sel *= sel
+
+        filter_sel = 1.0
+        driving_sel = 1.0
+        has_driver = False
+        for name, sel, indexed in self._filter_selectivities(st, spec, space_id):
+            predicates.append((name, sel))
+            filter_sel *= sel
+            if indexed:
+                has_driver = True
+                driving_sel = min(driving_sel, sel)
+
+        text_rows = total * text_sel
+        filter_rows = total * filter_sel
+        driving_rows = total * driving_sel if has_driver else float(total)
+
+        costs = {STRATEGY_FTS_FIRST: text_rows * _FTS_ROW_COST}
+        if has_driver:
+            # 索引取出 driving_rows 行，逐行套其余 filter，全部通过的才探测 FTS
+            costs[STRATEGY_FILTER_FIRST] = driving_rows * _ROW_COST + filter_rows * _PROBE_COST
+        # scan：倒序扫到凑满 limit+offset 条命中为止；无 limit（计数）则扫全表
+        want = (limit + offset) if limit is not None else None
+        hit_rate = max(text_sel * filter_sel, 1.0 / total)
+        visited = total if want is None else min(total, want / hit_rate)
+        costs[STRATEGY_SCAN] = visited * (_ROW_COST + _PROBE_COST * filter_sel)
+
+        strategy = min(costs, key=lambda k: (costs[k], k != STRATEGY_FTS_FIRST))
+        return QueryPlan(
+            strategy=strategy,
+            total_rows=st.total,
+            text_rows=text_rows,
+            filter_rows=filter_rows,
+            driving_rows=driving_rows,
+            costs=costs,
+            predicates=predicates,
+        )
+
+
+__all__ = [
+    "STRATEGY_FILTER_FIRST",
+    "STRATEGY_FTS_FIRST",
+    "STRATEGY_SCAN",
+    "QueryPlan",
+    "QueryPlanner",
+    "TableStats",
+]
@@ -8,8 +8,9 @@ import logging
 from typing import List, Optional
 
 from ..base_database import AbstractDatabaseManager
-from ..models import ClipboardItem
-from .clipboard_dao import ClipboardDAO
+from ..models import ClipboardItem, row_decoder
+from .clipboard_dao import ClipboardDAO, tag_ids_column
+from .item_cache import ItemCache
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +18,27 @@ logger = logging.getLogger(__name__)
 class SyncStateDAO:
     """clipboard_items.cloud_id 维度的状态管理。"""
 
-    def __init__(self, db_manager: AbstractDatabaseManager):
+    def __init__(
+        self,
+        db_manager: AbstractDatabaseManager,
+        cache: Optional[ItemCache] = None,
+        with_tags: bool = False,
+    ):
         self.db = db_manager
+        # 与 ClipboardDAO 共享的条目缓存；cloud_id / 收藏写入后按 id 失效
+        self._cache = cache if cache is not None else ItemCache(0)
+        # 上行推送的源查询带回 tag_ids，标签名由 TagService 的定义缓存解析，不再逐条查库
+        self._tag_column = (
+            tag_ids_column("clipboard_items", db_manager.is_mysql) if with_tags else ""
+        )
+
+    def _fetch_items(self, conn, sql: str, params: tuple = ()) -> List[ClipboardItem]:
+        # 与 ClipboardDAO._fetch_items 相同的 tuple 行 + 缓存解码器热路径
+        columns, rows = self.db.fetch_rows(conn, sql, params)
+        if not rows:
+            return []
+        decode = row_decoder(columns)
+        return [decode(row) for row in rows]
 
     # ------------------------------------------------------------------
     # 写：cloud_id 标记
@@ -30,7 +50,10 @@ class SyncStateDAO:
             sql = "UPDATE clipboard_items SET cloud_id = ? WHERE id = ?"
             self.db.execute_write(conn, sql, (cloud_id, item_id))
 
-        self.db.execute_with_retry(operation)
+        try:
+            self.db.execute_with_retry(operation)
+        finally:
+            self._cache.invalidate(item_id)
 
     def set_cloud_ids_bulk(self, pairs: list):
         """批量标记 cloud_id，pairs 为 [(item_id, cloud_id), ...]"""
@@ -42,7 +65,11 @@ class SyncStateDAO:
             data = [(cloud_id, item_id) for item_id, cloud_id in pairs]
             self.db.execute_many(conn, sql, data)
 
-        self.db.execute_with_retry(operation)
+        try:
+            self.db.execute_with_retry(operation)
+        finally:
+            for item_id, _ in pairs:
+                self._cache.invalidate(item_id)
 
     def clear_cloud_id(self, item_id: int):
         """清除云端标记（云端副本已删除）"""
@@ -50,7 +77,10 @@ class SyncStateDAO:
             sql = "UPDATE clipboard_items SET cloud_id = NULL WHERE id = ?"
             self.db.execute_write(conn, sql, (item_id,))
 
-        self.db.execute_with_retry(operation)
+        try:
+            self.db.execute_with_retry(operation)
+        finally:
+            self._cache.invalidate(item_id)
 
     def update_cloud_sync_metadata(
         self,
@@ -78,7 +108,10 @@ class SyncStateDAO:
             sql = f"UPDATE clipboard_items SET {', '.join(fields)} WHERE id = ?"
             self.db.execute_write(conn, sql, (*params, item_id))
 
-        self.db.execute_with_retry(operation)
+        try:
+            self.db.execute_with_retry(operation)
+        finally:
+            self._cache.invalidate(item_id)
 
     # ------------------------------------------------------------------
     # 读：基于 cloud_id 的检索
@@ -109,8 +142,7 @@ class SyncStateDAO:
                 ORDER BY created_at DESC
                 LIMIT ?
             """
-            rows = self.db.fetch_all(conn, sql, (limit,))
-            return [ClipboardItem.from_db_row(row) for row in rows]
+            return self._fetch_items(conn, sql, (limit,))
 
         return self.db.execute_read(operation)
 
@@ -118,14 +150,13 @@ class SyncStateDAO:
         """获取未同步到云端的条目（含完整图片数据），按最新排序，用于批量推送"""
         def operation(conn) -> List[ClipboardItem]:
             sql = f"""
-                SELECT {ClipboardDAO._SELECT_FIELDS}
+                SELECT {ClipboardDAO._SELECT_FIELDS}{self._tag_column}
                 FROM clipboard_items
                 WHERE cloud_id IS NULL
                 ORDER BY created_at DESC
                 LIMIT ?
             """
-            rows = self.db.fetch_all(conn, sql, (limit,))
-            return [ClipboardItem.from_db_row(row) for row in rows]
+            return self._fetch_items(conn, sql, (limit,))
         return self.db.execute_read(operation)
 
     def get_cloud_ids_for_ids(self, item_ids: List[int]) -> dict:
@@ -155,7 +186,6 @@ class SyncStateDAO:
                 ORDER BY created_at ASC
                 LIMIT ?
             """
-            rows = self.db.fetch_all(conn, sql, (limit,))
-            return [ClipboardItem.from_db_row(row) for row in rows]
+            return self._fetch_items(conn, sql, (limit,))
 
         return self.db.execute_read(operation)
@@ -0,0 +1,120 @@
+"""启动期 import 耗时追踪（SC_IMPORT_TRACE=1 时由 main.py 最先安装）。
+
+和 `python -X importtime` 口径一致：每个模块记累计耗时（含它触发的子模块）与自身耗时，
+但结果留在进程里，由 StartupMetrics 并入启动摘要，打包后的 app 也能用环境变量打开。
+
+实现：sys.meta_path 最前面插一个 finder，委托给后面的 finder 找到 spec 后把 loader
+包一层计时；只计 exec_module（模块代码执行），查找路径的耗时不计入。
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    name: str
+    cumulative_ms: float
+    self_ms: float
+    depth: int
+
+
+class _TimedLoader:
+    def __init__(self, loader, tracer: "ImportTracer", name: str):
+        self._loader = loader
+        self._tracer = tracer
+        self._name = name
+
+    def create_module(self, spec):
+        create = getattr(self._loader, "create_module", None)
+        return create(spec) if create is not None else None
+
+    def exec_module(self, module) -> None:
+        self._tracer._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._tracer._exit(self._name, started)
+
+    def __getattr__(self, attr):
+        # get_source / get_resource_reader / is_package 等照旧走原 loader
+        return getattr(self._loader, attr)
+
+
+class ImportTracer:
+    """安装后记录主线程上的每次模块导入；其他线程的导入直接放行不计。"""
+
+    def __init__(self) -> None:
+        self._records: List[ImportRecord] = []
+        # 每层一个"子模块累计耗时"，用于算 self 耗时
+        self._child_ms: List[float] = []
+        self._thread = threading.get_ident()
+        self._installed = False
+
+    def install(self) -> "ImportTracer":
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+        return self
+
+    def uninstall(self) -> List[ImportRecord]:
+        if self._installed:
+            try:
+                sys.meta_path.remove(self)
+            except ValueError:
+                pass
+            self._installed = False
+        return self.records()
+
+    def records(self) -> List[ImportRecord]:
+        return list(self._records)
+
+    # ----- meta path finder -----
+
+    def find_spec(self, fullname, path=None, target=None):
+        if threading.get_ident() != self._thread:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self, fullname)
+            return spec
+        return None
+
+    # ----- timing -----
+
+    def _enter(self) -> None:
+        self._child_ms.append(0.0)
+
+    def _exit(self, name: str, started: float) -> None:
+        cumulative = (time.perf_counter() - started) * 1000
+        children = self._child_ms.pop()
+        if self._child_ms:
+            self._child_ms[-1] += cumulative
+        self._records.append(ImportRecord(
+            name=name,
+            cumulative_ms=cumulative,
+            self_ms=max(0.0, cumulative - children),
+            depth=len(self._child_ms),
+        ))
+
+
+def top_imports(records: List[ImportRecord], limit: int = 10, by: str = "self_ms") -> List[ImportRecord]:
+    return sorted(records, key=lambda r: getattr(r, by), reverse=True)[:limit]
+
+
+def total_import_ms(records: List[ImportRecord], name: Optional[str] = None) -> float:
+    """顶层导入（depth 0）累计耗时之和；给 name 时返回该模块的累计耗时。"""
+    if name is not None:
+        return next((r.cumulative_ms for r in records if r.name == name), 0.0)
+    return sum(r.cumulative_ms for r in records if r.depth == 0)
@@ -0,0 +1,792 @@
+"""局域网对等同步：组播发现 + 带签名的本地 HTTP 对端服务，不经过 MySQL / 云端。
+
+每台设备既是服务端也是客户端，两端各自拉取即为双向同步：
+1. 发现：定时向 239.255.42.99:47700 发 UDP 信标（device_id / 端口 / 配对组标识），
+   同组信标登记到对端表；组播不通的网络可在设置里手动填 host:port；
+2. 清单：GET /lan/v1/manifest 取对端最新条目的 (hash, 收藏, 空间, 标签名, 时间)，
+   ETag 未变直接 304；
+3. 载荷：本地缺的 hash 再 POST /lan/v1/items 分批取完整条目（图片 base64）；
+4. 合并：sync_merge.merge_remote_items，与云端拉取同一套 hash 去重 / 收藏 / 标签语义。
+
+配对密钥由 generate_pairing_key() 生成（不接受手填口令），在一台设备上生成后复制到其他设备：
+前 8 字节是公开的随机组标识，只用于信标里区分配对组；后 32 字节是密钥本体，派生出
+签名密钥与加密密钥。
+
+鉴权：请求和响应都带 HMAC-SHA256 签名（时间戳 + 随机数 + 方法 + 路径 + 正文摘要），
+时间戳偏差超过 120s 或随机数重放直接拒绝。
+加密：非空正文一律 AES-GCM 加密后再签名，局域网里抓包看不到剪贴板内容。
+Why: 组标识与密钥无关，信标里没有任何能用来离线猜密钥的校验值；密钥本体 256 位随机，
+抓到带签名的请求也无从暴力破解。
+
+服务默认只监听通往局域网（组播路由）的那块网卡，而不是 0.0.0.0。
+同一台机器上的两个实例（不同配置目录）即可自测：HTTP 端口由系统分配，组播开启了环回。
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+import socket
+import struct
+import threading
+import time
+from dataclasses import dataclass, replace
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from .models import ClipboardItem, ContentType, ImageClipboardItem, TextClipboardItem
+from .repository import ClipboardRepository
+from .sync_merge import MergeResult, RemoteEntry, merge_remote_items
+
+logger = logging.getLogger(__name__)
+
+MULTICAST_GROUP = "239.255.42.99"
+DISCOVERY_PORT = 47700
+API_PREFIX = "/lan/v1"
+AUTH_HEADER = "X-Clipboard-Auth"
+PROTOCOL_VERSION = 2
+
+_MAX_CLOCK_SKEW_S = 120
+_MAX_REQUEST_BYTES = 1024 * 1024
+# 每次 POST /items 取的条目数；图片条目较大，取小一些
+_ITEMS_PER_REQUEST = 32
+# app_meta 中记录每个对端已同步到的 created_at（重启后不把本地删掉的旧条目拉回来）
+_WATERMARK_META_PREFIX = "lan_sync_watermark:"
+
+
+_GROUP_BYTES = 8
+_SECRET_BYTES = 32
+_GCM_NONCE_BYTES = 12
+
+
+class LanSyncError(Exception):
+    """对端请求失败（网络、签名不符、配对密钥不一致）。"""
+
+
+# ---------------------------------------------------------------------------
+# 配对密钥
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class PairingKey:
+    """解析后的配对密钥：group 公开（信标里广播），secret 只用于派生子密钥。"""
+
+    group: str
+    secret: bytes
+
+    @property
+    def mac_key(self) -> bytes:
+        return hmac.new(self.secret, b"lan-sync-mac", hashlib.sha256).digest()
+
+    @property
+    def enc_key(self) -> bytes:
+        return hmac.new(self.secret, b"lan-sync-enc", hashlib.sha256).digest()
+
+
+def generate_pairing_key() -> str:
+    """新的配对密钥文本（URL-safe base64，约 54 个字符）。"""
+    return base64.urlsafe_b64encode(
+        secrets.token_bytes(_GROUP_BYTES + _SECRET_BYTES)
+    ).decode("ascii").rstrip("=")
+
+
+def parse_pairing_key(text: str) -> PairingKey:
+    """手填口令 / 旧版密钥抛 ValueError：只接受 generate_pairing_key() 生成的随机密钥。"""
+    raw = (text or "").strip()
+    try:
+        data = base64.urlsafe_b64decode(raw + "=" * (-len(raw) % 4))
+    except (ValueError, TypeError):
+        data = b""
+    if len(data) != _GROUP_BYTES + _SECRET_BYTES:
+        raise ValueError("配对密钥格式无效：请在一台设备上生成后复制到其他设备")
+    return PairingKey(group=data[:_GROUP_BYTES].hex(), secret=data[_GROUP_BYTES:])
+
+
+# ---------------------------------------------------------------------------
+# 签名 / 加密
+# ---------------------------------------------------------------------------
+
+def seal(key: bytes, body: bytes, aad: str) -> bytes:
+    """AES-GCM 加密正文（随机 nonce 前置）；空正文原样返回。"""
+    if not body:
+        return b""
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    nonce = secrets.token_bytes(_GCM_NONCE_BYTES)
+    return nonce + AESGCM(key).encrypt(nonce, body, aad.encode("utf-8"))
+
+
+def unseal(key: bytes, data: bytes, aad: str) -> bytes:
+    if not data:
+        return b""
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    if len(data) <= _GCM_NONCE_BYTES:
+        raise LanSyncError("加密正文过短")
+    try:
+        return AESGCM(key).decrypt(
+            data[:_GCM_NONCE_BYTES], data[_GCM_NONCE_BYTES:], aad.encode("utf-8")
+        )
+    except InvalidTag as e:
+        raise LanSyncError("正文解密失败") from e
+
+
+def _request_aad(method: str, path: str) -> str:
+    return f"{method} {path}"
+
+
+def sign(key: bytes, method: str, path: str, body: bytes,
+         ts: Optional[int] = None, nonce: Optional[str] = None) -> str:
+    ts = int(time.time()) if ts is None else ts
+    nonce = nonce or secrets.token_hex(8)
+    message = f"{method}\n{path}\n{ts}\n{nonce}\n{hashlib.sha256(body).hexdigest()}"
+    mac = hmac.new(key, message.encode("utf-8"), hashlib.sha256).hexdigest()
+    return f"{ts}.{nonce}.{mac}"
+
+
+def verify(key: bytes, header: str, method: str, path: str, body: bytes) -> Optional[str]:
+    """校验签名，通过时返回其中的随机数，否则 None。"""
+    try:
+        ts_text, nonce, mac = header.split(".")
+        ts = int(ts_text)
+    except (AttributeError, ValueError):
+        return None
+    if abs(time.time() - ts) > _MAX_CLOCK_SKEW_S:
+        return None
+    expected = sign(key, method, path, body, ts, nonce).rsplit(".", 1)[1]
+    return nonce if hmac.compare_digest(mac, expected) else None
+
+
+def _response_path(status: int, nonce: str) -> str:
+    # 响应签名绑定到请求的随机数，防止把旧响应重放给新请求
+    return f"{status} {nonce}"
+
+
+# ---------------------------------------------------------------------------
+# 条目编解码
+# ---------------------------------------------------------------------------
+
+def _b64(data: Optional[bytes]) -> Optional[str]:
+    return base64.b64encode(data).decode("ascii") if data else None
+
+
+def _unb64(text: Optional[str]) -> Optional[bytes]:
+    return base64.b64decode(text) if text else None
+
+
+def item_to_wire(item: ClipboardItem, tag_names: Iterable[str] = ()) -> dict:
+    data = {
+        "content_type": item.content_type.value,
+        "content_hash": item.content_hash,
+        "preview": item.preview or "",
+        "device_id": item.device_id,
+        "device_name": item.device_name,
+        "created_at": item.created_at,
+        "is_starred": bool(item.is_starred),
+        "space_id": item.space_id,
+        "source_app": item.source_app or "",
+        "source_title": item.source_title or "",
+        "tags": list(tag_names),
+    }
+    if isinstance(item, ImageClipboardItem):
+        data["image_data"] = _b64(item.image_data)
+        data["image_thumbnail"] = _b64(item.image_thumbnail)
+    else:
+        data["text_content"] = getattr(item, "text_content", "")
+    return data
+
+
+def item_from_wire(data: dict) -> ClipboardItem:
+    common = dict(
+        content_hash=data["content_hash"],
+        preview=data.get("preview", ""),
+        device_id=data.get("device_id", ""),
+        device_name=data.get("device_name", ""),
+        created_at=int(data.get("created_at", 0)),
+        is_starred=bool(data.get("is_starred", False)),
+        space_id=data.get("space_id"),
+        source_app=data.get("source_app", ""),
+        source_title=data.get("source_title", ""),
+    )
+    if ContentType(data.get("content_type", "text")) == ContentType.IMAGE:
+        return ImageClipboardItem(
+            **common,
+            image_data=_unb64(data.get("image_data")),
+            image_thumbnail=_unb64(data.get("image_thumbnail")),
+        )
+    return TextClipboardItem(**common, text_content=data.get("text_content") or "")
+
+
+# ---------------------------------------------------------------------------
+# 对端 HTTP 服务
+# ---------------------------------------------------------------------------
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "SharedClipboardLAN/1"
+    # 单线程服务：读请求超时，慢连接不能把服务一直占住（HTTP/1.0，每次响应后断开）
+    timeout = 10
+
+    def log_message(self, format, *args):  # noqa: A002 - 覆盖基类签名
+        logger.debug(f"LAN 对端请求 {self.address_string()}: {format % args}")
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        peer: "LanPeerServer" = self.server.peer
+        # Why: 正文要先读完才能验签，这里是未认证的对端能碰到的唯一入口——
+        # 长度缺失 / 非数字 / 负数（rfile.read(-1) 会一直读到 EOF）一律 400，超限 413
+        try:
+            length = int(self.headers["Content-Length"])
+        except (TypeError, ValueError):
+            length = -1
+        if length < 0:
+            self._reply(400, b"", None)
+            return
+        if length > _MAX_REQUEST_BYTES:
+            self._reply(413, b"", None)
+            return
+        body = self.rfile.read(length) if length else b""
+        nonce = peer.authenticate(self.headers.get(AUTH_HEADER, ""), method, self.path, body)
+        if nonce is None:
+            self._reply(401, b"", None)
+            return
+        try:
+            body = unseal(peer.key.enc_key, body, _request_aad(method, self.path))
+        except LanSyncError:
+            self._reply(400, b"", nonce)
+            return
+        try:
+            status, payload, extra = peer.handle(method, self.path, body, self.headers)
+        except Exception as e:
+            logger.warning(f"LAN 对端请求处理失败 {method} {self.path}: {e}")
+            status, payload, extra = 500, b"", {}
+        self._reply(status, payload, nonce, extra)
+
+    def _reply(self, status: int, body: bytes, nonce: Optional[str], extra=None) -> None:
+        if nonce is not None:
+            key = self.server.peer.key
+            path = _response_path(status, nonce)
+            body = seal(key.enc_key, body, path)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (extra or {}).items():
+            self.send_header(name, value)
+        if nonce is not None:
+            self.send_header(AUTH_HEADER, sign(key.mac_key, "RESPONSE", path, body))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+
+class LanPeerServer:
+    """对端服务：清单与载荷两个只读接口。
+
+    单线程 HTTPServer 顺序处理：请求都很短，一条服务线程只占一条数据库连接。
+    """
+
+    def __init__(
+        self,
+        repository: ClipboardRepository,
+        key: PairingKey,
+        device_id: str,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        manifest_limit: int = 10000,
+    ):
+        self.repository = repository
+        self.key = key
+        self.device_id = device_id
+        self.manifest_limit = manifest_limit
+        self._httpd = HTTPServer((host, port), _Handler)
+        self._httpd.peer = self
+        self._thread: Optional[threading.Thread] = None
+        # 最近 _MAX_CLOCK_SKEW_S 内见过的请求随机数（防重放）
+        self._nonces: Dict[str, float] = {}
+        # ((change_log seq, 标签定义代数), etag, body)；两者都没变时直接复用。
+        # 改标签名只写 tag_definitions、不进 change_log，只看 seq 会一直发旧名字
+        self._manifest_cache: Optional[Tuple[Tuple[int, int], str, bytes]] = None
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever,
+            kwargs={"poll_interval": 0.5},
+            name="LanPeerServer",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"局域网同步服务已监听端口 {self.port}")
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        self._httpd.server_close()
+
+    def authenticate(self, header: str, method: str, path: str, body: bytes) -> Optional[str]:
+        nonce = verify(self.key.mac_key, header, method, path, body)
+        if nonce is None:
+            return None
+        now = time.time()
+        if nonce in self._nonces:
+            return None
+        self._nonces = {n: t for n, t in self._nonces.items() if now - t <= _MAX_CLOCK_SKEW_S}
+        self._nonces[nonce] = now
+        return nonce
+
+    def handle(self, method: str, path: str, body: bytes, headers) -> Tuple[int, bytes, dict]:
+        if method == "GET" and path == f"{API_PREFIX}/manifest":
+            etag, payload = self.manifest()
+            if headers.get("If-None-Match") == etag:
+                return 304, b"", {"ETag": etag}
+            return 200, payload, {"ETag": etag}
+        if method == "POST" and path == f"{API_PREFIX}/items":
+            hashes = json.loads(body or b"{}").get("hashes") or []
+            return 200, self.items(hashes[:_ITEMS_PER_REQUEST]), {}
+        return 404, b"", {}
+
+    def manifest(self) -> Tuple[str, bytes]:
+        """(etag, JSON 正文)。有 change_log 时按 seq + 标签定义代数缓存，库没变就不重新扫表。"""
+        seq = None
+        tags = self.repository.tag_service
+        change_log = self.repository.change_log
+        if change_log.available:
+            seq = self.repository.get_latest_change_seq()
+            cached = self._manifest_cache
+            if cached is not None and cached[0] == (seq, tags.generation):
+                return cached[1], cached[2]
+        rows = [
+            [content_hash, int(starred), space_id, tags.names_for(tag_ids) if tag_ids else [], created_at]
+            for content_hash, starred, space_id, tag_ids, created_at
+            in self.repository.get_sync_manifest(self.manifest_limit)
+        ]
+        body = json.dumps(
+            {"v": PROTOCOL_VERSION, "device_id": self.device_id, "items": rows},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        etag = hashlib.sha1(body).hexdigest()[:16]
+        if seq is not None:
+            # 代数在拼完清单后取：解析中遇到新标签会重载定义、代数 +1
+            self._manifest_cache = ((seq, tags.generation), etag, body)
+        return etag, body
+
+    def items(self, hashes: List[str]) -> bytes:
+        tags = self.repository.tag_service
+        items = self.repository.get_items_by_hashes(list(hashes))
+        return json.dumps(
+            {"items": [item_to_wire(it, tags.names_for(it.tag_ids)) for it in items]},
+            separators=(",", ":"),
+        ).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# 客户端
+# ---------------------------------------------------------------------------
+
+class LanSyncClient:
+    """从一个对端拉取：先比清单，再只取本地缺的载荷，最后走 sync_merge 合并。"""
+
+    def __init__(
+        self,
+        repository: ClipboardRepository,
+        key: PairingKey,
+        device_id: str,
+        timeout: float = 10.0,
+    ):
+        self.repository = repository
+        self.key = key
+        self.device_id = device_id
+        self.timeout = timeout
+        # host:port -> 上次的清单 ETag
+        self._etags: Dict[str, str] = {}
+        # 对端 device_id -> {hash: (收藏, 空间, 标签)}，本次运行内只处理有变化的清单项
+        self._seen: Dict[str, Dict[str, tuple]] = {}
+
+    def _request(self, host: str, port: int, method: str, path: str,
+                 body: bytes = b"", headers: Optional[dict] = None) -> Tuple[int, bytes, dict]:
+        body = seal(self.key.enc_key, body, _request_aad(method, path))
+        auth = sign(self.key.mac_key, method, path, body)
+        nonce = auth.split(".")[1]
+        conn = HTTPConnection(host, port, timeout=self.timeout)
+        try:
+            # body 恒为 bytes：空正文也带 Content-Length: 0，服务端拒绝缺长度的请求
+            conn.request(method, path, body=body, headers={
+                AUTH_HEADER: auth, "Content-Type": "application/octet-stream", **(headers or {}),
+            })
+            resp = conn.getresponse()
+            payload = resp.read()
+            resp_headers = {k: v for k, v in resp.getheaders()}
+        except OSError as e:
+            raise LanSyncError(f"连接对端 {host}:{port} 失败: {e}") from e
+        finally:
+            conn.close()
+        if resp.status == 401:
+            raise LanSyncError(f"对端 {host}:{port} 拒绝请求（配对密钥不一致？）")
+        signature = resp_headers.get(AUTH_HEADER, "")
+        resp_path = _response_path(resp.status, nonce)
+        if verify(self.key.mac_key, signature, "RESPONSE", resp_path, payload) is None:
+            raise LanSyncError(f"对端 {host}:{port} 响应签名无效")
+        return resp.status, unseal(self.key.enc_key, payload, resp_path), resp_headers
+
+    def sync_with(self, host: str, port: int) -> MergeResult:
+        address = f"{host}:{port}"
+        headers = {"If-None-Match": self._etags[address]} if address in self._etags else None
+        status, body, resp_headers = self._request(
+            host, port, "GET", f"{API_PREFIX}/manifest", headers=headers
+        )
+        if status == 304:
+            return MergeResult()
+        if status != 200:
+            raise LanSyncError(f"对端 {address} 清单请求失败: HTTP {status}")
+        data = json.loads(body)
+        peer_id = data.get("device_id") or address
+        if peer_id == self.device_id:
+            return MergeResult()
+
+        manifest = {
+            row[0]: (bool(row[1]), row[2], tuple(row[3]), int(row[4]))
+            for row in data.get("items", [])
+        }
+        seen = self._seen.get(peer_id, {})
+        changed = {h: v for h, v in manifest.items() if seen.get(h) != v[:3]}
+        watermark = int(self.repository.get_meta(_WATERMARK_META_PREFIX + peer_id, "0") or 0)
+
+        entries: List[RemoteEntry] = []
+        missing: List[str] = []
+        existing = self.repository.get_existing_hashes(list(changed)) if changed else {}
+        for content_hash, (starred, _space, tags, created_at) in changed.items():
+            local = existing.get(content_hash)
+            if local is None:
+                # 重启后第一次同步：水位线以内本地没有的条目是本机删掉的，不拉回来
+                if seen or created_at > watermark:
+                    missing.append(content_hash)
+            elif (starred and not local.is_starred) or tags:
+                # 已有条目只合并收藏 / 标签，不取载荷；缓存里的对象不能原地改
+                entries.append(RemoteEntry(replace(local, is_starred=starred), list(tags)))
+
+        for i in range(0, len(missing), _ITEMS_PER_REQUEST):
+            chunk = missing[i:i + _ITEMS_PER_REQUEST]
+            status, body, _ = self._request(
+                host, port, "POST", f"{API_PREFIX}/items",
+                body=json.dumps({"hashes": chunk}).encode("utf-8"),
+            )
+            if status != 200:
+                raise LanSyncError(f"对端 {address} 载荷请求失败: HTTP {status}")
+            for wire in json.loads(body).get("items", []):
+                entries.append(RemoteEntry(item_from_wire(wire), list(wire.get("tags") or [])))
+
+        result = merge_remote_items(self.repository, entries, remote_star_wins=False)
+
+        self._seen[peer_id] = {h: v[:3] for h, v in manifest.items()}
+        if "ETag" in resp_headers:
+            self._etags[address] = resp_headers["ETag"]
+        newest = max((v[3] for v in manifest.values()), default=0)
+        if newest > watermark:
+            self.repository.set_meta(_WATERMARK_META_PREFIX + peer_id, str(newest))
+        if result.new_items or result.starred:
+            logger.info(
+                f"局域网同步 {address}: 新增 {len(result.new_items)} 条，收藏合并 {result.starred} 条"
+            )
+        return result
+
+
+# ---------------------------------------------------------------------------
+# 发现
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class LanPeer:
+    device_id: str
+    device_name: str
+    host: str
+    port: int
+    last_seen: float
+
+
+class LanDiscovery:
+    """UDP 组播信标：定时广播自己、收集同组对端，超过 PEER_TTL_S 没有信标的对端过期。"""
+
+    BEACON_INTERVAL_S = 5.0
+    PEER_TTL_S = 20.0
+
+    def __init__(
+        self,
+        key: PairingKey,
+        device_id: str,
+        device_name: str,
+        http_port: int,
+        group: str = MULTICAST_GROUP,
+        port: int = DISCOVERY_PORT,
+        on_new_peer=None,
+    ):
+        self._group_id = key.group
+        self.device_id = device_id
+        self.device_name = device_name
+        self.http_port = http_port
+        self._group = group
+        self._port = port
+        self._on_new_peer = on_new_peer
+        self._peers: Dict[str, LanPeer] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._sock: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def beacon(self) -> bytes:
+        return json.dumps({
+            "v": PROTOCOL_VERSION, "g": self._group_id, "d": self.device_id,
+            "n": self.device_name, "p": self.http_port,
+        }).encode("utf-8")
+
+    def handle_datagram(self, data: bytes, addr) -> Optional[LanPeer]:
+        """处理一条信标；是同组的新对端时返回它。"""
+        try:
+            msg = json.loads(data)
+            if msg.get("v") != PROTOCOL_VERSION or msg.get("g") != self._group_id:
+                return None
+            device_id, port = str(msg["d"]), int(msg["p"])
+        except (ValueError, KeyError, TypeError):
+            return None
+        if device_id == self.device_id:
+            return None
+        peer = LanPeer(device_id, str(msg.get("n", "")), addr[0], port, time.monotonic())
+        with self._lock:
+            previous = self._peers.get(device_id)
+            self._peers[device_id] = peer
+        if previous is None or (previous.host, previous.port) != (peer.host, peer.port):
+            return peer
+        return None
+
+    def peers(self) -> List[LanPeer]:
+        now = time.monotonic()
+        with self._lock:
+            self._peers = {
+                d: p for d, p in self._peers.items() if now - p.last_seen <= self.PEER_TTL_S
+            }
+            return list(self._peers.values())
+
+    def start(self) -> bool:
+        """打开组播套接字并启动收发线程；网络不支持组播时返回 False。"""
+        try:
+            self._sock = self._open_socket()
+        except OSError as e:
+            logger.warning(f"局域网发现不可用（组播失败），仅同步手动配置的对端: {e}")
+            return False
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="LanDiscovery", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def _open_socket(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        try:
+            # 同一台机器上的多个实例共用发现端口
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if hasattr(socket, "SO_REUSEPORT"):
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+                except OSError:
+                    pass
+            sock.bind(("", self._port))
+            mreq = struct.pack("=4sl", socket.inet_aton(self._group), socket.INADDR_ANY)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+            sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+            sock.settimeout(1.0)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def _send_beacon(self) -> None:
+        try:
+            self._sock.sendto(self.beacon(), (self._group, self._port))
+        except OSError as e:
+            logger.debug(f"发送局域网信标失败: {e}")
+
+    def _loop(self) -> None:
+        next_beacon = 0.0
+        while not self._stop.is_set():
+            now = time.monotonic()
+            if now >= next_beacon:
+                self._send_beacon()
+                next_beacon = now + self.BEACON_INTERVAL_S
+            try:
+                data, addr = self._sock.recvfrom(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                if self._stop.is_set():
+                    return
+                continue
+            peer = self.handle_datagram(data, addr)
+            if peer is not None:
+                logger.info(f"发现局域网对端 {peer.device_name or peer.device_id} @ {peer.host}:{peer.port}")
+                # 立即回一条信标，新加入的对端不必等下一个周期
+                self._send_beacon()
+                if self._on_new_peer is not None:
+                    self._on_new_peer(peer)
+
+
+# ---------------------------------------------------------------------------
+# 服务
+# ---------------------------------------------------------------------------
+
+def default_bind_host(group: str = MULTICAST_GROUP) -> str:
+    """通往组播组那条路由所用网卡的地址；取不到（没有网络）时只监听环回。
+
+    UDP connect 不发包，只让系统选路由，借此拿到局域网网卡地址。
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        sock.connect((group, DISCOVERY_PORT))
+        host = sock.getsockname()[0]
+    except OSError:
+        return "127.0.0.1"
+    finally:
+        sock.close()
+    return host if host and host != "0.0.0.0" else "127.0.0.1"
+
+
+def parse_peer_address(text: str) -> Optional[Tuple[str, int]]:
+    host, sep, port = text.strip().rpartition(":")
+    if not sep or not host or not port.isdigit():
+        return None
+    return host, int(port)
+
+
+class LanSyncService(QObject):
+    """局域网同步：对端服务 + 发现 + 后台同步线程（每 SYNC_INTERVAL_S 拉一轮）。"""
+
+    new_items_available = Signal(list)  # List[ClipboardItem]
+    sync_error = Signal(str)
+
+    SYNC_INTERVAL_S = 10.0
+
+    def __init__(
+        self,
+        repository: ClipboardRepository,
+        key: str,
+        device_id: str,
+        device_name: str = "",
+        *,
+        host: str = "",
+        port: int = 0,
+        static_peers: Iterable[str] = (),
+        discovery: bool = True,
+        parent=None,
+    ):
+        super().__init__(parent)
+        # 格式不对直接抛 ValueError，由 AppContext 记日志并跳过局域网同步
+        pairing = parse_pairing_key(key)
+        self.repository = repository
+        self.server = LanPeerServer(
+            repository, pairing, device_id, host=host or default_bind_host(), port=port
+        )
+        self.client = LanSyncClient(repository, pairing, device_id)
+        self.discovery = (
+            LanDiscovery(
+                pairing, device_id, device_name, self.server.port,
+                on_new_peer=lambda _peer: self.sync_now(),
+            )
+            if discovery else None
+        )
+        self._static_peers = [a for a in map(parse_peer_address, static_peers) if a]
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        return self.server.port
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self.server.start()
+        if self.discovery is not None:
+            self.discovery.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="LanSync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=5.0)
+        self._thread = None
+        if self.discovery is not None:
+            self.discovery.stop()
+        self.server.stop()
+        logger.info("局域网同步已停止")
+
+    def sync_now(self) -> None:
+        self._wake.set()
+
+    def peers(self) -> List[Tuple[str, int]]:
+        found = [(p.host, p.port) for p in self.discovery.peers()] if self.discovery else []
+        return list(dict.fromkeys(found + self._static_peers))
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            self.sync_round()
+            self._wake.wait(self.SYNC_INTERVAL_S)
+            self._wake.clear()
+
+    def sync_round(self) -> List[ClipboardItem]:
+        """与所有已知对端各同步一次，返回本轮新增的条目。"""
+        new_items: List[ClipboardItem] = []
+        for host, port in self.peers():
+            if self._stop.is_set():
+                break
+            try:
+                new_items.extend(self.client.sync_with(host, port).new_items)
+            except Exception as e:
+                logger.debug(f"局域网同步 {host}:{port} 失败: {e}")
+                self.sync_error.emit(str(e))
+        if new_items:
+            self.new_items_available.emit(new_items)
+        return new_items
+
+
+__all__ = [
+    "LanDiscovery",
+    "LanPeer",
+    "LanPeerServer",
+    "LanSyncClient",
+    "LanSyncError",
+    "LanSyncService",
+    "PairingKey",
+    "generate_pairing_key",
+    "item_from_wire",
+    "item_to_wire",
+    "parse_pairing_key",
+]
@@ -1,82 +1,366 @@
+"""本地库之间的全量数据迁移（SQLite ⇄ MySQL）。
+
+流式、可续传：
+- 按主键 id 顺序流式读取（WHERE id > last_id，服务端游标 / fetchmany），不再 LIMIT/OFFSET 翻页；
+- 读源库与写目标库放在生产者 / 消费者两个线程里重叠执行；
+- 在途批次按载荷字节数限额（原图 BLOB 不会整页堆在内存里）；
+- 每写完一批把进度记到目标库 app_meta，崩溃或取消后从断点继续；
+- 源库挂了归档层（冷数据）时，热数据搬完后接着按 id 流式搬归档，断点单独记。
+"""
+
+import json
 import logging
-from typing import Callable, Optional
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
 
+from .models import ClipboardItem
 from .repository import ClipboardRepository
 
 logger = logging.getLogger(__name__)
 
-# INSERT OR IGNORE 让 content_hash UNIQUE 冲突静默跳过，避免迁移中 IntegrityError 往上抛
-_INSERT_SQL = """
-    INSERT OR IGNORE INTO clipboard_items (
+# 目标库 app_meta 中的断点键；值为 JSON：
+# {"source": ..., "last_id": ..., "migrated": ..., "archive_last_id": ...}
+# archive_last_id 出现即表示热数据已搬完、正在搬归档层
+CHECKPOINT_KEY = "migration_checkpoint"
+
+# v3.4 全部列 + payload_bytes；顺序与 ClipboardItem.to_db_tuple() + (payload_bytes,) 一致。
+# IGNORE 让 content_hash UNIQUE 冲突静默跳过：目标库已有的条目不用再单独查重。
+_INSERT_COLUMNS = """
+    clipboard_items (
         content_type, text_content, image_data, image_thumbnail,
         content_hash, preview, device_id, device_name,
-        created_at, is_starred
-    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        created_at, is_starred,
+        space_id, source_app, source_title,
+        payload_bytes
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
 """
 
 
+def _insert_ignore(is_mysql: bool) -> str:
+    # SQLite: INSERT OR IGNORE；MySQL: INSERT IGNORE
+    return "INSERT IGNORE INTO " if is_mysql else "INSERT OR IGNORE INTO "
+
+
+def _db_identity(db) -> str:
+    """标识源库，断点只对同一个源库生效。"""
+    if db.is_mysql:
+        return f"mysql://{getattr(db, 'host', '')}:{getattr(db, 'port', '')}/{getattr(db, 'database', '')}"
+    return f"sqlite://{os.path.abspath(getattr(db, 'db_path', ''))}"
+
+
+def _item_bytes(item: ClipboardItem) -> int:
+    return item.payload_bytes + len(getattr(item, "image_thumbnail", None) or b"")
+
+
+@dataclass
+class _Batch:
+    items: List[ClipboardItem]
+    last_id: int
+    nbytes: int
+
+
+class _ByteBudget:
+    """在途字节限额：生产者读一批前先占额度，消费者写完归还。
+
+    单批超过上限时只要当前没有在途批次也放行，避免大图把迁移卡死。
+    """
+
+    def __init__(self, max_bytes: int):
+        self._max = max_bytes
+        self._used = 0
+        self._cond = threading.Condition()
+
+    def acquire(self, nbytes: int, stop: threading.Event) -> bool:
+        with self._cond:
+            while self._used and self._used + nbytes > self._max:
+                if stop.is_set():
+                    return False
+                self._cond.wait(0.2)
+            self._used += nbytes
+            return not stop.is_set()
+
+    def release(self, nbytes: int) -> None:
+        with self._cond:
+            self._used -= nbytes
+            self._cond.notify_all()
+
+
 class DatabaseMigrator:
-    """数据库迁移工具：从源库分页读取全量数据，按 content_hash 去重写入目标库"""
+    """数据库迁移工具：从源库按 id 流式读取全量数据，按 content_hash 去重写入目标库。"""
+
+    # 每次从游标取的行数；含原图的行可能很大，取小一些
+    _FETCH_ROWS = 50
 
     def __init__(
         self,
         source: ClipboardRepository,
         target: ClipboardRepository,
-        page_size: int = 100,
+        page_size: int = 200,
+        max_buffer_bytes: int = 32 * 1024 * 1024,
+        max_batch_bytes: int = 8 * 1024 * 1024,
     ):
         self.source = source
         self.target = target
         self.page_size = page_size
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_batch_bytes = max_batch_bytes
+        self._source_key = _db_identity(source.db)
+
+    # ------------------------------------------------------------------
+    # 断点
+    # ------------------------------------------------------------------
+
+    def _read_checkpoint(self) -> dict:
+        raw = self.target.get_meta(CHECKPOINT_KEY)
+        if not raw:
+            return {}
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            return {}
+        return data if data.get("source") == self._source_key else {}
+
+    def load_checkpoint(self) -> Tuple[int, int]:
+        """返回 (last_id, migrated)；没有断点或断点属于别的源库时为 (0, 0)。"""
+        data = self._read_checkpoint()
+        return int(data.get("last_id", 0)), int(data.get("migrated", 0))
+
+    def load_archive_checkpoint(self) -> Optional[int]:
+        """归档层断点：热数据尚未搬完时为 None，否则为已搬到的归档 id。"""
+        value = self._read_checkpoint().get("archive_last_id")
+        return None if value is None else int(value)
+
+    def _save_checkpoint(self, last_id: int, migrated: int,
+                         archive_last_id: Optional[int] = None) -> None:
+        data = {"source": self._source_key, "last_id": last_id, "migrated": migrated}
+        if archive_last_id is not None:
+            data["archive_last_id"] = archive_last_id
+        self.target.set_meta(CHECKPOINT_KEY, json.dumps(data))
+
+    def clear_checkpoint(self) -> None:
+        self.target.set_meta(CHECKPOINT_KEY, "")
+
+    # ------------------------------------------------------------------
+    # 迁移
+    # ------------------------------------------------------------------
 
     def migrate(
-        self, progress_callback: Optional[Callable[[int, int], None]] = None
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        resume: bool = True,
     ) -> int:
         """
-        执行迁移，返回实际写入的条数。
+        执行迁移，返回实际写入的条数（续传时包含之前几轮已写入的）。
 
         Args:
-            progress_callback: 可选回调 (migrated_so_far, total)
+            progress_callback: 可选回调 (processed_so_far, total)
+            resume: 从目标库记录的断点继续；False 则从头开始（已存在的条目仍按 hash 跳过）
         """
-        page = 0
-        migrated = 0
-        _, total = self.source.get_items_full(0, 1)
+        last_id, migrated = self.load_checkpoint() if resume else (0, 0)
+        archive_last_id = self.load_archive_checkpoint() if resume else None
+        # Why: 归档层（冷数据）不在 clipboard_items 里，只搬热数据会把归档的历史静默丢掉
+        archive = self.source.archive
+        hot_total = self.source.count_items_upto()
+        total = hot_total + (archive.count() if archive is not None else 0)
+        if archive_last_id is None:
+            processed = self.source.count_items_upto(last_id) if last_id else 0
+        else:
+            processed = hot_total + (archive.count(archive_last_id) if archive is not None else 0)
+        if last_id:
+            logger.info(f"迁移从断点继续: id > {last_id}，已处理 {processed}/{total}")
 
-        while True:
-            items, _ = self.source.get_items_full(page, self.page_size)
-            if not items:
-                break
+        tag_map = self._migrate_tag_definitions()
+        state = {
+            "last_id": last_id, "archive_last_id": archive_last_id,
+            "migrated": migrated, "processed": processed,
+        }
 
-            hashes = [it.content_hash for it in items]
-            existing = self._existing_hashes(hashes)
-            pending = [it.to_db_tuple() for it in items if it.content_hash not in existing]
+        def on_batch(batch: _Batch, cursor: str) -> None:
+            state["migrated"] += self._write_batch(batch, tag_map)
+            state[cursor] = batch.last_id
+            self._save_checkpoint(state["last_id"], state["migrated"], state["archive_last_id"])
+            state["processed"] += len(batch.items)
+            if progress_callback:
+                progress_callback(min(state["processed"], total), total)
+
+        if state["archive_last_id"] is None:
+            self._pipeline(
+                lambda: self.source.iter_items_full(last_id, self._FETCH_ROWS),
+                lambda batch: on_batch(batch, "last_id"),
+            )
+            state["archive_last_id"] = 0
+            self._save_checkpoint(state["last_id"], state["migrated"], 0)
+        if archive is not None:
+            self._pipeline(
+                lambda: archive.iter_items_full(state["archive_last_id"], self._FETCH_ROWS),
+                lambda batch: on_batch(batch, "archive_last_id"),
+            )
+
+        self.clear_checkpoint()
+        return state["migrated"]
 
-            if pending:
+    def _pipeline(self, open_stream, on_batch) -> None:
+        """读线程流式切批、当前线程逐批写入；on_batch 负责写和记断点。"""
+        batches: "queue.Queue" = queue.Queue(maxsize=4)
+        budget = _ByteBudget(self.max_buffer_bytes)
+        stop = threading.Event()
+        producer = threading.Thread(
+            target=self._produce,
+            args=(open_stream, batches, budget, stop),
+            name="MigrationReader",
+            daemon=True,
+        )
+        producer.start()
+        try:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    break
+                if isinstance(batch, BaseException):
+                    raise batch
+                try:
+                    on_batch(batch)
+                finally:
+                    budget.release(batch.nbytes)
+        finally:
+            stop.set()
+            # 让阻塞在 put 上的生产者退出
+            while producer.is_alive():
                 try:
-                    def _insert_batch(conn, rows=pending):
-                        self.target.db.execute_many(conn, _INSERT_SQL, rows)
-                        return len(rows)
-                    migrated += self.target.db.execute_with_retry(_insert_batch)
-                except Exception as e:
-                    logger.warning(f"批量迁移失败: {e}")
+                    batches.get_nowait()
+                except queue.Empty:
+                    producer.join(0.05)
 
-            if progress_callback:
-                progress_callback(min((page + 1) * self.page_size, total), total)
+    def _produce(self, open_stream, batches, budget, stop) -> None:
+        """读线程：流式读源库 → 按条数 / 字节切批 → 占额度 → 入队。结束放 None，出错放异常。"""
+        try:
+            stream = open_stream()
+            try:
+                items: List[ClipboardItem] = []
+                nbytes = 0
+                for chunk in stream:
+                    for item in chunk:
+                        size = _item_bytes(item)
+                        if items and (
+                            len(items) >= self.page_size
+                            or nbytes + size > self.max_batch_bytes
+                        ):
+                            if not self._emit(batches, budget, stop, items, nbytes):
+                                return
+                            items, nbytes = [], 0
+                        items.append(item)
+                        nbytes += size
+                    if stop.is_set():
+                        return
+                if items and not self._emit(batches, budget, stop, items, nbytes):
+                    return
+            finally:
+                stream.close()
+            self._put(batches, None, stop)
+        except BaseException as e:
+            self._put(batches, e, stop)
+
+    def _emit(self, batches, budget, stop, items, nbytes) -> bool:
+        if not budget.acquire(nbytes, stop):
+            return False
+        if not self._put(batches, _Batch(items=items, last_id=items[-1].id, nbytes=nbytes), stop):
+            budget.release(nbytes)
+            return False
+        return True
+
+    @staticmethod
+    def _put(batches, value, stop) -> bool:
+        while not stop.is_set():
+            try:
+                batches.put(value, timeout=0.2)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _write_batch(self, batch: _Batch, tag_map: Dict[str, str]) -> int:
+        if not batch.items:
+            return 0
+        db = self.target.db
+        rows = [it.to_db_tuple() + (it.payload_bytes,) for it in batch.items]
+        tagged = {
+            it.content_hash: [tag_map[t] for t in it.tag_ids if t in tag_map]
+            for it in batch.items
+            if it.tag_ids
+        }
+        tagged = {h: tags for h, tags in tagged.items() if tags}
 
-            page += 1
+        def operation(conn) -> int:
+            inserted = db.execute_many(conn, _insert_ignore(db.is_mysql) + _INSERT_COLUMNS, rows)
+            if tagged:
+                self._write_tags(conn, tagged)
+            return inserted
 
-        return migrated
+        return db.execute_with_retry(operation)
 
-    def _existing_hashes(self, hashes: list) -> set:
-        if not hashes:
-            return set()
+    def _write_tags(self, conn, tagged: Dict[str, List[str]]) -> None:
+        """按 content_hash 找回目标库 id 后写 clipboard_tags（已有绑定跳过）。"""
+        db = self.target.db
+        now_ms = int(time.time() * 1000)
+        hashes = list(tagged)
         placeholders = ",".join("?" * len(hashes))
-        sql = f"SELECT content_hash FROM clipboard_items WHERE content_hash IN ({placeholders})"
+        rows = db.fetch_all(
+            conn,
+            f"SELECT id, content_hash FROM clipboard_items WHERE content_hash IN ({placeholders})",
+            tuple(hashes),
+        )
+        links = [
+            (row["id"], tag_id, now_ms)
+            for row in rows
+            for tag_id in tagged.get(row["content_hash"], ())
+        ]
+        if links:
+            db.execute_many(
+                conn,
+                _insert_ignore(db.is_mysql)
+                + "clipboard_tags (item_id, tag_id, created_at) VALUES (?, ?, ?)",
+                links,
+            )
+
+    def _migrate_tag_definitions(self) -> Dict[str, str]:
+        """复制标签定义，返回 源 tag_id -> 目标 tag_id。
+
+        目标库可能已有同 (space_id, name) 的标签（id 不同），按名字对齐而不是照搬 id。
+        任一端没有标签表（v3.4 之前）时返回空表，条目照常迁移、只是不带标签。
+        """
+        try:
+            source_tags = self.source.tag_service.list_tags()
+        except Exception as e:
+            logger.debug(f"源库没有标签定义，跳过标签迁移: {e}")
+            return {}
+        if not source_tags:
+            return {}
+        db = self.target.db
+        rows = [(t.id, t.space_id, t.name, t.color, t.created_at) for t in source_tags]
 
         def operation(conn):
-            return {row["content_hash"] for row in self.target.db.fetch_all(conn, sql, tuple(hashes))}
+            db.execute_many(
+                conn,
+                _insert_ignore(db.is_mysql)
+                + "tag_definitions (id, space_id, name, color, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
 
         try:
-            return self.target.db.execute_read(operation)
+            db.execute_with_retry(operation)
+            self.target.tag_service.invalidate_cache()
+            target_ids = {
+                (t.space_id, t.name): t.id for t in self.target.tag_service.list_tags()
+            }
         except Exception as e:
-            logger.debug(f"批量查重失败，回退逐条: {e}")
-            return {h for h in hashes if self.target.get_by_hash(h) is not None}
+            logger.warning(f"标签定义迁移失败，条目将不带标签迁移: {e}")
+            return {}
+        return {
+            t.id: target_ids[(t.space_id, t.name)]
+            for t in source_tags
+            if (t.space_id, t.name) in target_ids
+        }
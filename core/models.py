@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import ClassVar, Optional, Union
+from functools import lru_cache
+from typing import Callable, ClassVar, Optional, Sequence, Union
+import json
 import logging
 import time
 
@@ -14,7 +16,9 @@ class ContentType(Enum):
     IMAGE = "image"
 
 
-@dataclass
+# Why slots: 列表/搜索一页 50–500 行、同步一批 100 行，每个实例省掉 __dict__
+# 能显著降低分配量；字段集合固定，不需要动态属性。
+@dataclass(slots=True)
 class ClipboardItem:
     """剪贴板条目抽象基类。不要直接实例化,使用子类。"""
 
@@ -36,8 +40,9 @@ class ClipboardItem:
     # source_title: 窗口标题（隐私考虑默认不捕获，但字段保留）
     source_title: str = ""
     # tag_ids: 冗余展示字段；权威数据在 clipboard_tags 关联表
-    # 由 Repository 在 SELECT 时 JOIN 填充，to_db_tuple 不包含它
-    tag_ids: list = field(default_factory=list)
+    # 由 Repository 在 SELECT 时 JOIN 填充，to_db_tuple 不包含它。
+    # 默认共享空 tuple，避免每行都分配一个空 list；回填时整体替换。
+    tag_ids: Sequence[str] = ()
 
     def __post_init__(self):
         if type(self) is ClipboardItem:
@@ -62,6 +67,12 @@ class ClipboardItem:
     def get_display_preview(self, max_length: int = 100) -> str:
         raise NotImplementedError
 
+    @property
+    def payload_bytes(self) -> int:
+        """正文载荷字节数，落库到 payload_bytes 列供 size: 过滤走索引。"""
+        text, image, _ = self._payload_db_fields()
+        return payload_size(text, image)
+
     def _payload_db_fields(self) -> tuple:
         """子类返回 (text_content, image_data, image_thumbnail)。"""
         raise NotImplementedError
@@ -112,6 +123,7 @@ class ClipboardItem:
             space_id=_row_get("space_id", None),
             source_app=_row_get("source_app", "") or "",
             source_title=_row_get("source_title", "") or "",
+            tag_ids=parse_tag_ids(_row_get("tag_ids")),
         )
         if ct == ContentType.TEXT:
             return TextClipboardItem(**common, text_content=row["text_content"] or "")
@@ -122,7 +134,7 @@ class ClipboardItem:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TextClipboardItem(ClipboardItem):
     content_type: ClassVar[ContentType] = ContentType.TEXT
 
@@ -138,7 +150,7 @@ class TextClipboardItem(ClipboardItem):
         return (self.text_content, None, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageClipboardItem(ClipboardItem):
     content_type: ClassVar[ContentType] = ContentType.IMAGE
 
@@ -153,3 +165,81 @@ class ImageClipboardItem(ClipboardItem):
 
 
 AnyClipboardItem = Union[TextClipboardItem, ImageClipboardItem]
+
+
+def payload_size(text_content: Optional[str], image_data: Optional[bytes]) -> int:
+    """文本按 UTF-8 字节、图片按原图字节计；与 SQL 侧回填表达式口径一致。"""
+    size = len(text_content.encode("utf-8")) if text_content else 0
+    if image_data:
+        size += len(image_data)
+    return size
+
+
+def parse_tag_ids(raw) -> Sequence[str]:
+    """解析 SELECT 里聚合出来的 tag_ids 列。
+
+    SQLite 用 group_concat 得到逗号分隔串，MySQL 用 JSON_ARRAYAGG 得到 JSON 数组；
+    没有标签时两者都是 NULL。tag id 是 uuid，不含逗号。
+    """
+    if not raw:
+        return ()
+    if isinstance(raw, (bytes, bytearray)):
+        raw = raw.decode("utf-8")
+    if raw[0] == "[":
+        return [str(t) for t in json.loads(raw)]
+    return raw.split(",")
+
+
+# row_decoder 必需的列；v3.4 的 space_id/source_app/source_title 缺失时回落默认值
+_REQUIRED_COLUMNS = (
+    "id", "content_type", "text_content", "image_data", "image_thumbnail",
+    "content_hash", "preview", "device_id", "device_name",
+    "created_at", "is_starred", "cloud_id",
+)
+
+
+@lru_cache(maxsize=32)
+def row_decoder(columns: tuple) -> Callable[[tuple], AnyClipboardItem]:
+    """按列布局编译一个 positional row -> ClipboardItem 的解码函数。
+
+    与 from_db_row 等价，但列名到下标的解析只在每种 SELECT 列布局上做一次
+    （lru_cache 按 cursor.description 的列名元组缓存），逐行解码时只剩下标访问
+    和一次位置参数构造，不再为每行建 dict / 闭包 / try-except。
+    columns 通常来自 AbstractDatabaseManager.fetch_rows。
+    """
+    index = {name: i for i, name in enumerate(columns)}
+    missing = [c for c in _REQUIRED_COLUMNS if c not in index]
+    if missing:
+        raise ValueError(f"row_decoder 缺少必需列: {missing}")
+    (i_id, i_ct, i_text, i_img, i_thumb, i_hash, i_preview, i_dev,
+     i_dev_name, i_created, i_starred, i_cloud) = (index[c] for c in _REQUIRED_COLUMNS)
+    i_space = index.get("space_id")
+    i_app = index.get("source_app")
+    i_title = index.get("source_title")
+    i_tags = index.get("tag_ids")
+    text_type = ContentType.TEXT.value
+    no_tags = ()
+
+    def decode(row) -> AnyClipboardItem:
+        # 位置参数顺序与 dataclass 字段顺序一致：
+        # id, content_hash, preview, device_id, device_name, created_at,
+        # is_starred, cloud_id, space_id, source_app, source_title, tag_ids
+        common = (
+            row[i_id],
+            row[i_hash] or "",
+            row[i_preview] or "",
+            row[i_dev] or "",
+            row[i_dev_name] or "",
+            row[i_created] or 0,
+            bool(row[i_starred]),
+            row[i_cloud],
+            row[i_space] if i_space is not None else None,
+            (row[i_app] or "") if i_app is not None else "",
+            (row[i_title] or "") if i_title is not None else "",
+            parse_tag_ids(row[i_tags]) if i_tags is not None else no_tags,
+        )
+        if row[i_ct] == text_type:
+            return TextClipboardItem(*common, row[i_text] or "")
+        return ImageClipboardItem(*common, row[i_img], row[i_thumb])
+
+    return decode
@@ -3,10 +3,12 @@ import time
 import random
 import logging
 import threading
-from typing import Callable, Any
+from functools import lru_cache
+from typing import Callable, Any, Iterator, Tuple
 from contextlib import contextmanager
 
 from .base_database import AbstractDatabaseManager
+from .mysql_pool import ConnectionPool, LatencyStats
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,12 @@ except ImportError:
     logger.warning("pymysql 未安装，MySQL 功能不可用")
 
 
+@lru_cache(maxsize=1024)
+def _translate_placeholders(sql: str) -> str:
+    """? → %s。Why: 同一批 SQL 常量在热路径上反复执行，不必每次都扫描 + 复制字符串。"""
+    return sql.replace("?", "%s") if "?" in sql else sql
+
+
 class MySQLDatabaseManager(AbstractDatabaseManager):
     """MySQL 数据库管理器"""
 
@@ -25,7 +33,10 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
     placeholder = "%s"
     is_mysql = True
 
-    SCHEMA_VERSION = 6
+    SCHEMA_VERSION = 9
+
+    # 正文 + 预览的 ngram 全文索引名（ClipboardDAO._detect_fulltext 按名检测）
+    FULLTEXT_INDEX = "ft_text_preview"
 
     CREATE_TABLE_SQL = """
     CREATE TABLE IF NOT EXISTS clipboard_items (
@@ -91,7 +102,27 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
     # 数据库名白名单：仅允许字母、数字、下划线
     _SAFE_DB_NAME = re.compile(r'^[a-zA-Z0-9_]+$')
 
-    def __init__(self, host: str, port: int, user: str, password: str, database: str):
+    # 连接池上限：UI + 同步 + 搜索 + 若干短命工作线程，8 条足够，且不会把共享服务器的
+    # max_connections 吃满（多台设备共用一个库）
+    POOL_MAX_SIZE = 8
+    # 闲置超过该时长的连接由维护线程关闭（低于服务端默认 wait_timeout=8h 很多）
+    POOL_MAX_IDLE_S = 300.0
+    # 借出等待上限；超时抛 PoolTimeout，而不是无限挂住调用线程
+    POOL_ACQUIRE_TIMEOUT_S = 10.0
+    # 闲置超过该时长的连接借出前 ping 一次；维护线程也按此间隔预先校验空闲连接
+    _PING_INTERVAL_S = 60.0
+    # 连接已断开的错误码：归还时直接丢弃，不放回池里
+    _DISCONNECT_ERRORS = (2006, 2013, 2055)
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        database: str,
+        pool_size: int = POOL_MAX_SIZE,
+    ):
         if not PYMYSQL_AVAILABLE:
             raise ImportError("pymysql 未安装，请运行: pip install pymysql")
 
@@ -104,15 +135,26 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
         self.user = user
         self.password = password
         self.database = database
-        # Why: 原先共享单个 _conn + 全局 _lock，所有读写被串行化，UI
-        # 列表查询会阻塞同步线程的写入。PyMySQL 连接本身非线程安全，
-        # 改为每线程一份 connection（对齐 SQLite 做法），并发读写互不干扰。
-        # _all_conns 仅用于 close() 统一回收，_conns_lock 保护列表自身，
-        # 不再对读写加锁。
+        # Why: PyMySQL 连接非线程安全，每次 get_connection 从池里独占借出一条，
+        # 用完归还；并发读写互不干扰，连接数有上限，短命线程也不再各自握手。
+        # _tls 只记录当前线程已借出的连接：嵌套 get_connection / execute_read
+        # 复用同一条（同一会话、同一事务），避免嵌套借出把池耗尽。
         self._tls = threading.local()
-        self._all_conns: list = []
-        self._conns_lock = threading.Lock()
-        self._init_database()
+        self._pool = ConnectionPool(
+            self._create_connection,
+            validate=lambda conn: conn.ping(reconnect=False),
+            max_size=pool_size,
+            max_idle_s=self.POOL_MAX_IDLE_S,
+            validate_after_s=self._PING_INTERVAL_S,
+            acquire_timeout_s=self.POOL_ACQUIRE_TIMEOUT_S,
+        )
+        # 单条语句往返耗时（cursor.execute 含网络 + 服务端执行）
+        self._round_trip = LatencyStats()
+        try:
+            self._init_database()
+        except Exception:
+            self._pool.close()
+            raise
 
     def _init_database(self):
         """初始化数据库和表"""
@@ -315,6 +357,132 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
                 conn.commit()
                 logger.info("MySQL Schema 已迁移到 v6（v3.4 团队 / 标签 / 分享表）")
 
+            if current_version < 7:
+                # v6 → v7: 冗余 payload_bytes 列 + (payload_bytes, created_at) 索引，
+                # size: 过滤不再逐行 LENGTH(image_data) 读整块 LONGBLOB。
+                try:
+                    cursor.execute(
+                        "ALTER TABLE clipboard_items ADD COLUMN payload_bytes BIGINT DEFAULT NULL"
+                    )
+                except pymysql.Error as e:
+                    if "Duplicate column name" not in str(e) and "1060" not in str(e):
+                        raise
+                # MySQL 的 LENGTH 即字节数，与 models.payload_size 的 UTF-8 口径一致
+                cursor.execute(
+                    "UPDATE clipboard_items SET payload_bytes = "
+                    "COALESCE(LENGTH(text_content), 0) + COALESCE(LENGTH(image_data), 0) "
+                    "WHERE payload_bytes IS NULL"
+                )
+                try:
+                    cursor.execute(
+                        "CREATE INDEX idx_payload_created "
+                        "ON clipboard_items(payload_bytes, created_at)"
+                    )
+                except pymysql.Error as e:
+                    if "Duplicate key name" not in str(e) and "1061" not in str(e):
+                        raise
+
+                cursor.execute(
+                    "INSERT INTO app_meta (`key`, `value`) VALUES ('schema_version', '7') "
+                    "ON DUPLICATE KEY UPDATE `value` = '7'"
+                )
+                conn.commit()
+                logger.info("MySQL Schema 已迁移到 v7（新增 payload_bytes）")
+
+            if current_version < 8:
+                # v7 → v8: (text_content, preview) 上的 FULLTEXT 索引，ngram 分词（中日韩
+                # 没有空格分词）。关键词搜索由逐行 LIKE '%kw%' 全表扫描改为 MATCH ... AGAINST。
+                # 失败（MariaDB 无 ngram 插件、权限不足等）不阻断启动，搜索继续走 LIKE 回退。
+                self._create_fulltext_index(cursor)
+                cursor.execute(
+                    "INSERT INTO app_meta (`key`, `value`) VALUES ('schema_version', '8') "
+                    "ON DUPLICATE KEY UPDATE `value` = '8'"
+                )
+                conn.commit()
+                logger.info("MySQL Schema 已迁移到 v8（ngram 全文索引）")
+
+            if current_version < 9:
+                # v8 → v9: 触发器维护的 change_log，SyncService 按 seq 增量拉取增 / 改 / 删。
+                # 建触发器需要 TRIGGER 权限（开了 binlog 时还可能要求
+                # log_bin_trust_function_creators）；失败不阻断启动，同步回退到按 id 轮询。
+                cursor.execute(
+                    """CREATE TABLE IF NOT EXISTS change_log (
+                        seq BIGINT AUTO_INCREMENT PRIMARY KEY,
+                        item_id BIGINT NOT NULL,
+                        op VARCHAR(8) NOT NULL,
+                        device_id VARCHAR(64) DEFAULT NULL,
+                        changed_at BIGINT NOT NULL,
+                        INDEX idx_change_log_changed (changed_at)
+                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci"""
+                )
+                self._create_change_log_triggers(cursor)
+                cursor.execute(
+                    "INSERT INTO app_meta (`key`, `value`) VALUES ('schema_version', '9') "
+                    "ON DUPLICATE KEY UPDATE `value` = '9'"
+                )
+                conn.commit()
+                logger.info("MySQL Schema 已迁移到 v9（change_log 触发器）")
+
+    # 与 sql/migrations/v3_6_0_change_log.sql 的 SQLite 触发器一一对应
+    _NOW_MS_SQL = "CAST(UNIX_TIMESTAMP(NOW(3)) * 1000 AS SIGNED)"
+    _CHANGE_LOG_TRIGGERS = (
+        ("change_log_ai",
+         "CREATE TRIGGER change_log_ai AFTER INSERT ON clipboard_items FOR EACH ROW "
+         "INSERT INTO change_log (item_id, op, device_id, changed_at) "
+         f"VALUES (NEW.id, 'insert', NEW.device_id, {_NOW_MS_SQL})"),
+        # MySQL 没有 UPDATE OF 列清单：用 <=>（NULL 安全比较）只在关心的列变化时记录，
+        # cloud_id 回写等内部字段更新不产生流水
+        ("change_log_au",
+         "CREATE TRIGGER change_log_au AFTER UPDATE ON clipboard_items FOR EACH ROW "
+         "IF NOT (NEW.is_starred <=> OLD.is_starred AND NEW.created_at <=> OLD.created_at "
+         "AND NEW.text_content <=> OLD.text_content AND NEW.preview <=> OLD.preview "
+         "AND NEW.space_id <=> OLD.space_id AND NEW.source_app <=> OLD.source_app "
+         "AND NEW.source_title <=> OLD.source_title) THEN "
+         "INSERT INTO change_log (item_id, op, changed_at) "
+         f"VALUES (NEW.id, 'update', {_NOW_MS_SQL}); END IF"),
+        ("change_log_ad",
+         "CREATE TRIGGER change_log_ad AFTER DELETE ON clipboard_items FOR EACH ROW "
+         "INSERT INTO change_log (item_id, op, changed_at) "
+         f"VALUES (OLD.id, 'delete', {_NOW_MS_SQL})"),
+        ("change_log_tag_ai",
+         "CREATE TRIGGER change_log_tag_ai AFTER INSERT ON clipboard_tags FOR EACH ROW "
+         "INSERT INTO change_log (item_id, op, changed_at) "
+         f"VALUES (NEW.item_id, 'update', {_NOW_MS_SQL})"),
+        ("change_log_tag_ad",
+         "CREATE TRIGGER change_log_tag_ad AFTER DELETE ON clipboard_tags FOR EACH ROW "
+         "INSERT INTO change_log (item_id, op, changed_at) "
+         f"VALUES (OLD.item_id, 'update', {_NOW_MS_SQL})"),
+    )
+
+    def _create_change_log_triggers(self, cursor) -> None:
+        for name, ddl in self._CHANGE_LOG_TRIGGERS:
+            try:
+                cursor.execute(ddl)
+            except pymysql.Error as e:
+                # 1359: Trigger already exists
+                if "1359" in str(e) or "already exists" in str(e):
+                    continue
+                logger.warning(f"创建触发器 {name} 失败，同步将回退到按 id 轮询: {e}")
+                return
+
+    def _create_fulltext_index(self, cursor) -> None:
+        # Why: 默认停用词表里有 "a" / "i" 这类单字母词，ngram 解析器会丢弃所有包含
+        # 停用词的 token（"ab"、"ia" ...），大量英文子串从此搜不到。停用词开关在
+        # 建索引时生效，只需对本会话关闭。
+        try:
+            cursor.execute("SET SESSION innodb_ft_enable_stopword = OFF")
+        except pymysql.Error as e:
+            logger.warning(f"关闭全文停用词失败，继续建索引: {e}")
+        try:
+            cursor.execute(
+                f"ALTER TABLE clipboard_items ADD FULLTEXT INDEX {self.FULLTEXT_INDEX} "
+                "(text_content, preview) WITH PARSER ngram"
+            )
+        except pymysql.Error as e:
+            if "Duplicate key name" in str(e) or "1061" in str(e):
+                return
+            logger.warning(f"创建 ngram 全文索引失败，搜索将继续使用 LIKE: {e}")
+
     def _create_connection(self) -> "pymysql.connections.Connection":
         """创建新的 MySQL 连接"""
         return pymysql.connect(
@@ -330,71 +498,68 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
             write_timeout=30,
         )
 
-    # ping 节流间隔：同一线程距上次 ping <PING_INTERVAL_S 直接复用 conn，
-    # 断开的连接会在 execute 时抛 OperationalError(2006/2013)，由 execute_with_retry 回捞。
-    _PING_INTERVAL_S = 60.0
+    @contextmanager
+    def get_connection(self):
+        """从连接池借出一条 connection，退出上下文时归还（同线程嵌套调用复用同一条）。"""
+        held = getattr(self._tls, "conn", None)
+        if held is not None:
+            yield held
+            return
+        conn = self._pool.acquire()
+        self._tls.conn = conn
+        discard = False
+        try:
+            yield conn
+        except BaseException as e:
+            # 出错时事务状态不明：回滚后再归还；连接已断开或回滚失败则丢弃
+            discard = self._is_disconnect(e) or not self._rollback_quietly(conn)
+            raise
+        finally:
+            self._tls.conn = None
+            self._pool.release(conn, discard=discard)
+
+    @classmethod
+    def _is_disconnect(cls, error: BaseException) -> bool:
+        if not isinstance(error, (pymysql.OperationalError, pymysql.InterfaceError)):
+            return False
+        code = error.args[0] if error.args else 0
+        return isinstance(error, pymysql.InterfaceError) or code in cls._DISCONNECT_ERRORS
 
-    def _discard_thread_conn(self, conn) -> None:
-        """关闭并从池中移除一个已失效连接；单独封装让 _get_thread_conn 主路径平直。"""
+    @staticmethod
+    def _rollback_quietly(conn) -> bool:
         try:
-            conn.close()
+            conn.rollback()
+            return True
         except Exception:
-            pass
-        with self._conns_lock:
-            try:
-                self._all_conns.remove(conn)
-            except ValueError:
-                pass
-
-    def _get_thread_conn(self) -> "pymysql.connections.Connection":
-        """返回当前线程独占的 connection；首次访问或连接失效时创建。
-        Why: PyMySQL 连接非线程安全；每次都 ping 会给热路径加一次 roundtrip，
-        60s 内复用 conn、跳过 ping，依赖 execute_with_retry 的 2006/2013 重试兜底。
-        """
-        conn = getattr(self._tls, "conn", None)
-        if conn is not None:
-            now = time.monotonic()
-            last_ping = getattr(self._tls, "last_ping_ts", 0.0)
-            if now - last_ping < self._PING_INTERVAL_S:
-                return conn
-            try:
-                conn.ping(reconnect=True)
-                self._tls.last_ping_ts = now
-                return conn
-            except Exception:
-                # ping 失败：清理旧连接后 fallthrough 创建新连接
-                self._discard_thread_conn(conn)
-
-        new_conn = self._create_connection()
-        self._tls.conn = new_conn
-        self._tls.last_ping_ts = time.monotonic()
-        with self._conns_lock:
-            self._all_conns.append(new_conn)
-        return new_conn
-
-    @contextmanager
-    def get_connection(self):
-        """yield 当前线程独占的 connection（无全局锁，允许并发读写）。"""
-        yield self._get_thread_conn()
+            return False
 
     def close(self):
-        """关闭所有线程的 connection，供应用退出时调用。"""
-        with self._conns_lock:
-            conns = list(self._all_conns)
-            self._all_conns.clear()
-        for c in conns:
-            try:
-                c.close()
-            except Exception:
-                pass
+        """关闭连接池（空闲连接立即关闭，借出中的在归还时关闭），供应用退出时调用。"""
+        self._pool.close()
         self._tls = threading.local()
 
+    def pool_stats(self) -> dict:
+        """连接池与语句耗时统计：借出等待、往返耗时（毫秒）、SQL 翻译缓存命中。"""
+        stats = self._pool.stats()
+        stats["round_trip"] = self._round_trip.snapshot()
+        info = _translate_placeholders.cache_info()
+        stats["sql_cache"] = {"hits": info.hits, "misses": info.misses, "size": info.currsize}
+        return stats
+
     def execute_with_retry(
         self,
         operation: Callable,
         max_retries: int = 5,
     ) -> Any:
-        """带重试的数据库操作"""
+        """带重试的数据库操作。
+
+        Why nested: 同线程嵌套调用复用外层借出的连接，事务归外层所有——内层不提交，
+        也不重试：断线后整个外层事务已丢失，在死连接上重放只会白白 sleep，
+        直接抛给最外层，由它丢弃连接后整体重试。
+        """
+        held = getattr(self._tls, "conn", None)
+        if held is not None:
+            return operation(held)
         last_error = None
         for attempt in range(max_retries):
             try:
@@ -427,6 +592,10 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
         结束的只读事务会持续持有一个一致性快照，后续读会看到陈旧数据。
         读完显式 commit 结束事务，下次读取时 MySQL 会开启新快照。
         """
+        held = getattr(self._tls, "conn", None)
+        if held is not None:
+            # 嵌套在外层事务里：提交会把外层写一并提交，交给外层结束事务
+            return operation(held)
         with self.get_connection() as conn:
             try:
                 return operation(conn)
@@ -454,27 +623,65 @@ class MySQLDatabaseManager(AbstractDatabaseManager):
 
     @staticmethod
     def _to_mysql(sql: str) -> str:
-        # Repository 用 ? 写 SQL，这里批量替换为 %s
-        return sql.replace("?", "%s") if "?" in sql else sql
+        # Repository 用 ? 写 SQL，这里替换为 %s；SQL 文本是有限的常量集合，按原文缓存
+        return _translate_placeholders(sql)
+
+    def _execute(self, cursor, sql: str, params) -> None:
+        start = time.perf_counter()
+        try:
+            cursor.execute(self._to_mysql(sql), params)
+        finally:
+            self._round_trip.record(time.perf_counter() - start)
 
     def execute_write(self, conn, sql: str, params: tuple = ()):
         with conn.cursor() as cursor:
-            cursor.execute(self._to_mysql(sql), params)
+            self._execute(cursor, sql, params)
             return cursor.rowcount, cursor.lastrowid
 
     def fetch_one(self, conn, sql: str, params: tuple = ()):
         with conn.cursor() as cursor:
-            cursor.execute(self._to_mysql(sql), params)
+            self._execute(cursor, sql, params)
             return cursor.fetchone()
 
     def fetch_all(self, conn, sql: str, params: tuple = ()) -> list:
         with conn.cursor() as cursor:
-            cursor.execute(self._to_mysql(sql), params)
+            self._execute(cursor, sql, params)
             return cursor.fetchall()
 
-    def execute_many(self, conn, sql: str, data: list):
-        with conn.cursor() as cursor:
-            cursor.executemany(self._to_mysql(sql), data)
+    def fetch_rows(self, conn, sql: str, params: tuple = ()) -> Tuple[tuple, list]:
+        # 连接默认是 DictCursor；热路径显式用 tuple 游标，省掉逐行建 dict
+        with conn.cursor(pymysql.cursors.Cursor) as cursor:
+            self._execute(cursor, sql, params)
+            columns = tuple(d[0] for d in cursor.description)
+            return columns, list(cursor.fetchall())
+
+    def iter_rows(
+        self, conn, sql: str, params: tuple = (), batch_size: int = 500
+    ) -> Iterator[Tuple[tuple, list]]:
+        # Why: 默认游标会把整个结果集读进客户端内存；SSCursor 是非缓冲的服务端游标，
+        # 行按 fetchmany 分批从 socket 上读。用 tuple 版而不是 SSDictCursor，
+        # 与 fetch_rows 的 (列名, 行) 形状一致，省掉逐行建 dict。
+        cursor = conn.cursor(pymysql.cursors.SSCursor)
+        try:
+            self._execute(cursor, sql, params)
+            columns = tuple(d[0] for d in cursor.description)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield columns, list(rows)
+        finally:
+            # 提前退出时 close 会把剩余行读完丢弃，连接才能继续用
+            cursor.close()
+
+    def execute_many(self, conn, sql: str, data: list) -> int:
+        start = time.perf_counter()
+        try:
+            with conn.cursor() as cursor:
+                cursor.executemany(self._to_mysql(sql), data)
+                return cursor.rowcount
+        finally:
+            self._round_trip.record(time.perf_counter() - start)
 
     @staticmethod
     def test_connection(host: str, port: int, user: str, password: str, database: str = None) -> tuple[bool, str]:
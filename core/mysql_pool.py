@@ -0,0 +1,291 @@
+"""MySQL 有界连接池：借出 / 归还、空闲淘汰、后台校验与耗时统计。
+
+不依赖 PyMySQL（连接由 connect 回调创建、由 validate 回调校验），方便单元测试；
+MySQLDatabaseManager 负责把 pymysql.connect / conn.ping 接进来。
+
+Why: 原先每线程一条连接、线程退出前不会释放，短命工作线程（搜索、同步、
+缩略图）每次都要重新握手 + 认证，共享服务器上连接数也没有上限。
+池化后连接数有上限，握手只在池空时发生。
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(Exception):
+    """等待空闲连接超时（池已满且无人归还）。"""
+
+
+class LatencyStats:
+    """线程安全的耗时统计：次数 / 均值 / 最大值 / 近期 p95（毫秒）。"""
+
+    _WINDOW = 256
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.count = 0
+        self._total = 0.0
+        self._max = 0.0
+        # 最近 _WINDOW 个样本，用于估算 p95（旧样本被覆盖，反映当前状态）
+        self._recent: List[float] = []
+        self._pos = 0
+
+    def record(self, seconds: float) -> None:
+        ms = seconds * 1000.0
+        with self._lock:
+            self.count += 1
+            self._total += ms
+            if ms > self._max:
+                self._max = ms
+            if len(self._recent) < self._WINDOW:
+                self._recent.append(ms)
+            else:
+                self._recent[self._pos] = ms
+                self._pos = (self._pos + 1) % self._WINDOW
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+            return {
+                "count": self.count,
+                "avg_ms": (self._total / self.count) if self.count else 0.0,
+                "max_ms": self._max,
+                "p95_ms": p95,
+            }
+
+
+class ConnectionPool:
+    """有界连接池。
+
+    - 借出优先复用最近归还的连接（LIFO），让多余连接自然闲置并被淘汰；
+    - 空闲超过 ``validate_after_s`` 的连接借出前先校验，失败就丢弃重建；
+    - 空闲超过 ``max_idle_s`` 的连接由维护线程关闭（保留 ``min_idle`` 条）；
+    - 池满时等待至多 ``acquire_timeout_s``，超时抛 PoolTimeout。
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Any],
+        *,
+        validate: Optional[Callable[[Any], None]] = None,
+        close: Callable[[Any], None] = lambda conn: conn.close(),
+        max_size: int = 8,
+        min_idle: int = 1,
+        max_idle_s: float = 300.0,
+        validate_after_s: float = 60.0,
+        acquire_timeout_s: float = 10.0,
+        maintenance_interval_s: Optional[float] = 30.0,
+    ):
+        if max_size < 1:
+            raise ValueError("max_size 必须 >= 1")
+        self._connect = connect
+        self._validate = validate
+        self._close_conn = close
+        self.max_size = max_size
+        self.min_idle = min(min_idle, max_size)
+        self.max_idle_s = max_idle_s
+        self.validate_after_s = validate_after_s
+        self.acquire_timeout_s = acquire_timeout_s
+
+        self._cond = threading.Condition()
+        # (conn, 归还时刻, 最近一次确认可用的时刻)
+        self._idle: Deque[Tuple[Any, float, float]] = deque()
+        # 借出中 + 正在创建的连接数；与 len(_idle) 之和不超过 max_size
+        self._busy = 0
+        self._closed = False
+
+        self.acquire_wait = LatencyStats()
+        self.created = 0
+        self.discarded = 0
+        self.timeouts = 0
+
+        self._stop = threading.Event()
+        self._maintainer: Optional[threading.Thread] = None
+        if maintenance_interval_s:
+            self._maintainer = threading.Thread(
+                target=self._maintenance_loop,
+                args=(maintenance_interval_s,),
+                name="MySQLPoolMaintainer",
+                daemon=True,
+            )
+            self._maintainer.start()
+
+    # ------------------------------------------------------------------
+    # 借出 / 归还
+    # ------------------------------------------------------------------
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        timeout = self.acquire_timeout_s if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        while True:
+            conn, checked_at, create = self._reserve(deadline)
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    self._unreserve()
+                    raise
+                with self._cond:
+                    self.created += 1
+                break
+            if time.monotonic() - checked_at < self.validate_after_s or self._check(conn):
+                break
+            # 校验失败：丢弃后重新借（可能复用其他空闲连接，也可能新建）
+            self._discard(conn)
+        self.acquire_wait.record(time.monotonic() - start)
+        return conn
+
+    def release(self, conn: Any, discard: bool = False) -> None:
+        """归还连接；discard=True（连接已断开 / 事务状态不明）时直接关闭。"""
+        if discard:
+            self._discard(conn)
+            return
+        now = time.monotonic()
+        with self._cond:
+            self._busy -= 1
+            if self._closed:
+                to_close = conn
+            else:
+                self._idle.append((conn, now, now))
+                to_close = None
+            self._cond.notify()
+        if to_close is not None:
+            self._safe_close(to_close)
+
+    def _reserve(self, deadline: float) -> Tuple[Any, float, bool]:
+        """取一条空闲连接或一个新建名额；返回 (conn, checked_at, 是否需新建)。"""
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeout("连接池已关闭")
+                if self._idle:
+                    conn, _, checked_at = self._idle.pop()
+                    self._busy += 1
+                    return conn, checked_at, False
+                if self._busy < self.max_size:
+                    self._busy += 1
+                    return None, 0.0, True
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout(
+                        f"等待 MySQL 连接超时（池上限 {self.max_size}，全部借出）"
+                    )
+                self._cond.wait(remaining)
+
+    def _unreserve(self) -> None:
+        with self._cond:
+            self._busy -= 1
+            self._cond.notify()
+
+    def _check(self, conn: Any) -> bool:
+        if self._validate is None:
+            return True
+        try:
+            self._validate(conn)
+            return True
+        except Exception as e:
+            logger.debug(f"连接校验失败，丢弃: {e}")
+            return False
+
+    def _discard(self, conn: Any) -> None:
+        self._safe_close(conn)
+        with self._cond:
+            self._busy -= 1
+            self.discarded += 1
+            self._cond.notify()
+
+    def _safe_close(self, conn: Any) -> None:
+        try:
+            self._close_conn(conn)
+        except Exception:
+            pass
+
+    # ------------------------------------------------------------------
+    # 后台维护
+    # ------------------------------------------------------------------
+
+    def _maintenance_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.run_maintenance()
+            except Exception as e:
+                logger.warning(f"连接池维护失败: {e}")
+
+    def run_maintenance(self) -> None:
+        """淘汰闲置过久的连接，并校验即将过期的空闲连接（供维护线程和测试调用）。"""
+        now = time.monotonic()
+        expired: List[Any] = []
+        to_check: List[Tuple[Any, float]] = []
+        with self._cond:
+            keep: Deque[Tuple[Any, float, float]] = deque()
+            # 从最旧的开始看：超出 min_idle 的闲置连接关闭
+            surplus = len(self._idle) - self.min_idle
+            for conn, released_at, checked_at in self._idle:
+                if surplus > 0 and now - released_at > self.max_idle_s:
+                    expired.append(conn)
+                    surplus -= 1
+                elif now - checked_at >= self.validate_after_s:
+                    # 校验期间不能被借走：先移出空闲队列，按 busy 计
+                    to_check.append((conn, released_at))
+                    self._busy += 1
+                else:
+                    keep.append((conn, released_at, checked_at))
+            self._idle = keep
+            self.discarded += len(expired)
+
+        for conn in expired:
+            self._safe_close(conn)
+        for conn, released_at in to_check:
+            if not self._check(conn):
+                self._discard(conn)
+                continue
+            with self._cond:
+                self._busy -= 1
+                closed = self._closed
+                if not closed:
+                    # 插回队首（最旧端），不打乱 LIFO 复用顺序
+                    self._idle.appendleft((conn, released_at, time.monotonic()))
+                self._cond.notify()
+            if closed:
+                self._safe_close(conn)
+
+    # ------------------------------------------------------------------
+
+    def close(self) -> None:
+        """关闭全部空闲连接；借出中的连接在归还时关闭。"""
+        self._stop.set()
+        with self._cond:
+            self._closed = True
+            idle = [conn for conn, _, _ in self._idle]
+            self._idle.clear()
+            self._cond.notify_all()
+        for conn in idle:
+            self._safe_close(conn)
+        if self._maintainer is not None and self._maintainer is not threading.current_thread():
+            self._maintainer.join(timeout=1.0)
+
+    def stats(self) -> dict:
+        with self._cond:
+            out = {
+                "max_size": self.max_size,
+                "idle": len(self._idle),
+                "in_use": self._busy,
+                "created": self.created,
+                "discarded": self.discarded,
+                "timeouts": self.timeouts,
+            }
+        out["acquire_wait"] = self.acquire_wait.snapshot()
+        return out
+
+
+__all__ = ["ConnectionPool", "LatencyStats", "PoolTimeout"]
@@ -6,6 +6,7 @@
 示例::
 
     parse('from:chrome tag:work after:2026-04-01 /hello.*world/ size:>1MB')
+    parse('sort:relevance deploy error')
 
 语法规则见 ``CLAUDE.md`` / 产品文档，本模块只负责解析，不生成 SQL。
 """
@@ -44,6 +45,9 @@ class QuerySpec:
     exact_phrases: List[str] = field(default_factory=list)
     regex: List[str] = field(default_factory=list)
     filters: List[Filter] = field(default_factory=list)
+    # 结果排序方式：SORT_RECENT（created_at 倒序）或 SORT_RELEVANCE（bm25 + 新近/收藏加权）。
+    # 不是过滤条件，不参与 is_empty 判定。
+    sort: str = "recent"
 
     def is_empty(self) -> bool:
         return not (self.keywords or self.exact_phrases or self.regex or self.filters)
@@ -74,6 +78,28 @@ class QuerySpec:
                     parts.append(escaped)
         return " ".join(parts)
 
+    def boolean_mode_expression(self, min_token: int = 2) -> Tuple[str, List[str]]:
+        """把 keywords 和 exact_phrases 拼成 MySQL ``AGAINST (? IN BOOLEAN MODE)`` 表达式。
+
+        返回 ``(expression, leftovers)``：
+        - 每段都包成必选短语 ``+"..."``：ngram 解析器把短语转成连续 ngram 匹配，
+          语义接近 LIKE 回退的子串匹配（关键词的 ``*`` 前缀通配在 ngram 下无意义，去掉）；
+        - 引号内不支持转义，段内的 ``"`` 替换为空格；
+        - 短于 ``min_token``（ngram_token_size）的关键词拆不出 ngram，原样放进
+          leftovers 交给调用方走 LIKE。
+        """
+        parts: List[str] = []
+        leftovers: List[str] = []
+        for term in list(self.exact_phrases) + [kw.rstrip("*") for kw in self.keywords]:
+            cleaned = term.replace('"', " ").strip()
+            if not cleaned:
+                continue
+            if len(cleaned) < min_token:
+                leftovers.append(term)
+                continue
+            parts.append('+"' + cleaned + '"')
+        return " ".join(parts), leftovers
+
 
 # ---------------------------------------------------------------------------
 # Tokenize
@@ -85,6 +111,13 @@ _FILTER_KEYS = {"from", "tag", "space", "size", "before", "after", "is"}
 
 _IS_VALUES = {"starred", "text", "image"}
 
+# 非过滤的选项关键字：``sort:`` 只改变排序，不生成 WHERE 条件。
+_OPTION_KEYS = {"sort"}
+
+SORT_RECENT = "recent"
+SORT_RELEVANCE = "relevance"
+_SORT_VALUES = {SORT_RECENT, SORT_RELEVANCE}
+
 _SIZE_UNITS = {
     "B": 1,
     "KB": 1024,
@@ -113,6 +146,7 @@ def _tokenize(query: str) -> List[Tuple[str, Any]]:
       - ``phrase``: 引号包裹的精确短语，payload 已脱引号并处理 ``\\"`` 转义
       - ``regex``: ``/.../`` 包裹的正则，payload 是中间的 pattern
       - ``filter``: payload 是 ``Filter`` 实例
+      - ``option``: payload 是 ``(key, value)``，目前只有 ``sort``
       - ``word``: 普通单词
     """
     tokens: List[Tuple[str, Any]] = []
@@ -166,6 +200,9 @@ def _tokenize(query: str) -> List[Tuple[str, Any]]:
             if key_part in _FILTER_KEYS:
                 tokens.append(("filter", _encode_filter(key_part, value_part, negate)))
                 continue
+            if key_part in _OPTION_KEYS:
+                tokens.append(("option", (key_part, _encode_option(key_part, value_part))))
+                continue
 
         # 都不是 → 普通关键词。若开头本来是 ``-``（非否定 filter），保留原样。
         tokens.append(("word", raw))
@@ -293,6 +330,16 @@ def _encode_filter(key: str, raw_value: str, negate: bool) -> Filter:
     raise QueryParseError(f"未知 filter：{key}")
 
 
+def _encode_option(key: str, raw_value: str) -> str:
+    if key == "sort":
+        if raw_value not in _SORT_VALUES:
+            raise QueryParseError(
+                f"sort: 不支持的值 {raw_value!r}，可选：{sorted(_SORT_VALUES)}"
+            )
+        return raw_value
+    raise QueryParseError(f"未知选项：{key}")
+
+
 def _split_comparison(raw: str) -> Tuple[Op, str]:
     """从 ``>=1MB`` / ``<500`` / ``=100`` / ``1MB`` 中切出运算符和值。"""
     if not raw:
@@ -387,6 +434,11 @@ def parse(query: str) -> QuerySpec:
             spec.filters.append(payload)
         elif kind == "word":
             spec.keywords.append(payload)
+        elif kind == "option":
+            # 同一选项出现多次时以最后一次为准
+            key, value = payload
+            if key == "sort":
+                spec.sort = value
         else:  # pragma: no cover
             raise QueryParseError(f"未知 token 类型：{kind}")
     return spec
@@ -397,5 +449,7 @@ __all__ = [
     "Filter",
     "QuerySpec",
     "QueryParseError",
+    "SORT_RECENT",
+    "SORT_RELEVANCE",
     "parse",
 ]
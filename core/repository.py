@@ -4,17 +4,22 @@
 - ClipboardDAO     —— CRUD + tags + meta + cleanup
 - ClipboardQuery   —— 列表 / 搜索 / 时间轴 / 按 tag 查询
 - SyncStateDAO     —— cloud_id 状态管理
+- ArchiveDAO       —— 可选的冷数据归档层（ATTACH 的压缩 SQLite 文件）
+- ItemCache        —— DAO 持有的单条读取缓存（按 id / content_hash）
 
 外部仍只引用本模块的 ClipboardRepository，签名保持与拆分前一致。
 新代码建议直接使用 core.db 下的具体 DAO/Query。
 """
 
 import logging
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .base_database import AbstractDatabaseManager
-from .db.clipboard_dao import ClipboardDAO, _INTEGRITY_ERRORS  # noqa: F401 — _INTEGRITY_ERRORS 保留以兼容历史外部 import
-from .db.clipboard_query import ClipboardQuery
+from .db.archive_dao import ArchiveDAO
+from .db.change_log_dao import ChangeLogDAO, ChangeRecord
+from .db.clipboard_dao import ClipboardDAO
+from .db.clipboard_query import FACET_KEYS, ClipboardQuery
+from .db.item_cache import ItemCache
 from .db.sync_state_dao import SyncStateDAO
 from .models import ClipboardItem
 from .query_parser import QuerySpec
@@ -33,7 +38,13 @@ class ClipboardRepository:
         self.db = db_manager
         self._dao = ClipboardDAO(db_manager)
         self._query = ClipboardQuery(db_manager, self._dao)
-        self._sync = SyncStateDAO(db_manager)
+        self._sync = SyncStateDAO(
+            db_manager, cache=self._dao.cache, with_tags=self._dao._has_tags
+        )
+        # 冷数据归档层，enable_archive() 后才存在
+        self._archive: Optional[ArchiveDAO] = None
+        # change_log 流水，首次访问 change_log 时才检测触发器
+        self._change_log: Optional[ChangeLogDAO] = None
         # 兼容字段：少量旧代码会读 repo._is_mysql / repo._has_fts
         self._is_mysql = self._dao._is_mysql
         self._has_fts = self._dao._has_fts
@@ -41,6 +52,47 @@ class ClipboardRepository:
         from .tag_service import TagService
         self.tag_service = TagService(self)
 
+    # ------------------------------------------------------------------
+    # 冷数据归档层 -> ArchiveDAO
+    # ------------------------------------------------------------------
+
+    def enable_archive(self, archive_path: str) -> ArchiveDAO:
+        """挂载归档库并让搜索 / 单条读取透明扇出到归档层。仅 SQLite 支持。"""
+        if self._archive is None:
+            self._archive = ArchiveDAO(
+                self.db, archive_path, with_tags=self._dao._has_tags, cache=self._dao.cache
+            )
+            self._query._archive = self._archive
+        return self._archive
+
+    @property
+    def archive(self) -> Optional[ArchiveDAO]:
+        return self._archive
+
+    # ------------------------------------------------------------------
+    # 条目缓存 -> ItemCache（由 DAO 持有，SyncStateDAO / TagService 共享）
+    # ------------------------------------------------------------------
+
+    @property
+    def item_cache(self) -> ItemCache:
+        return self._dao.cache
+
+    def cache_stats(self) -> dict:
+        """条目缓存的命中 / 未命中 / 淘汰计数与占用，供诊断面板和日志使用。"""
+        return self._dao.cache.stats()
+
+    def _restore_if_archived(self, item_id: int) -> Optional[int]:
+        """写操作命中不到热层时，把归档条目搬回热层，返回它在热层的 id 供重试。
+
+        同内容已在热层时返回的是那条热数据的 id（归档副本已并入），不一定等于 item_id。
+        """
+        if self._archive is None:
+            return None
+        hot_id = self._archive.restore(item_id)
+        if hot_id is not None:
+            self._dao.cache.invalidate(hot_id)
+        return hot_id
+
     # ------------------------------------------------------------------
     # CRUD / 单条访问  -> DAO
     # ------------------------------------------------------------------
@@ -49,23 +101,33 @@ class ClipboardRepository:
         return self._dao.add_item(item)
 
     def get_by_hash(self, content_hash: str) -> Optional[ClipboardItem]:
-        return self._dao.get_by_hash(content_hash)
+        # 归档层兜底：重新复制一条已归档的旧内容时，监听器会 touch_item
+        # 把它搬回热层置顶，而不是在热层再插一条重复记录。
+        item = self._dao.get_by_hash(content_hash)
+        if item is None and self._archive is not None:
+            item = self._archive.get_by_hash(content_hash)
+        return item
 
     def get_existing_hashes(self, hashes: list) -> dict:
         return self._dao.get_existing_hashes(hashes)
 
     def get_item_by_id(self, item_id: int) -> Optional[ClipboardItem]:
-        # 保持旧行为：单条读取后回填 tag_ids。
+        # 两层的单条读取都在同一条 SELECT 里带回 tag_ids
         item = self._dao.get_item_by_id(item_id)
-        if item is not None:
-            self._query._fill_tag_ids([item])
+        if item is None and self._archive is not None:
+            item = self._archive.get_item_by_id(item_id)
         return item
 
     def delete_item(self, item_id: int) -> bool:
-        return self._dao.delete_item(item_id)
+        if self._dao.delete_item(item_id):
+            return True
+        return self._archive is not None and self._archive.delete_item(item_id)
 
     def toggle_star(self, item_id: int) -> bool:
-        return self._dao.toggle_star(item_id)
+        if self._dao.toggle_star(item_id):
+            return True
+        hot_id = self._restore_if_archived(item_id)
+        return hot_id is not None and self._dao.toggle_star(hot_id)
 
     def update_item_content(
         self, item_id: int, text_content: Optional[str] = None,
@@ -79,7 +141,10 @@ class ClipboardRepository:
         )
 
     def touch_item(self, item_id: int, created_at: int) -> bool:
-        return self._dao.touch_item(item_id, created_at)
+        if self._dao.touch_item(item_id, created_at):
+            return True
+        hot_id = self._restore_if_archived(item_id)
+        return hot_id is not None and self._dao.touch_item(hot_id, created_at)
 
     def get_new_items_since(
         self, since_id: int, exclude_device_id: str
@@ -89,6 +154,31 @@ class ClipboardRepository:
     def get_latest_id(self) -> int:
         return self._dao.get_latest_id()
 
+    def get_items_by_ids(self, item_ids: List[int]) -> List[ClipboardItem]:
+        return self._dao.get_items_by_ids(item_ids)
+
+    def get_items_by_hashes(self, hashes: List[str]) -> List[ClipboardItem]:
+        return self._dao.get_items_by_hashes(hashes)
+
+    def get_sync_manifest(self, limit: int = 10000) -> List[tuple]:
+        return self._dao.get_sync_manifest(limit)
+
+    # ------------------------------------------------------------------
+    # 变更流水 -> ChangeLogDAO
+    # ------------------------------------------------------------------
+
+    @property
+    def change_log(self) -> ChangeLogDAO:
+        if self._change_log is None:
+            self._change_log = ChangeLogDAO(self.db)
+        return self._change_log
+
+    def get_latest_change_seq(self) -> int:
+        return self.change_log.latest_seq()
+
+    def get_changes_since(self, seq: int, limit: int = 500) -> List[ChangeRecord]:
+        return self.change_log.get_changes_since(seq, limit)
+
     def cleanup_old_items(self, max_items: int = 10000) -> int:
         return self._dao.cleanup_old_items(max_items)
 
@@ -127,11 +217,31 @@ class ClipboardRepository:
     ) -> Tuple[List[ClipboardItem], int]:
         return self._query.get_items(page, page_size, starred_only, space_id=space_id)
 
+    def get_items_after(
+        self,
+        cursor: Optional[Tuple[int, int]],
+        limit: int,
+        starred_only: bool = False,
+        space_id: Optional[str] = None,
+        min_created_at: Optional[int] = None,
+    ) -> List[ClipboardItem]:
+        return self._query.get_items_after(
+            cursor, limit, starred_only, space_id=space_id, min_created_at=min_created_at
+        )
+
     def get_items_full(
         self, page: int = 0, page_size: int = 100
     ) -> Tuple[List[ClipboardItem], int]:
         return self._query.get_items_full(page, page_size)
 
+    def iter_items_full(
+        self, after_id: int = 0, batch_size: int = 100
+    ) -> Iterator[List[ClipboardItem]]:
+        return self._query.iter_items_full(after_id, batch_size)
+
+    def count_items_upto(self, upto_id: Optional[int] = None) -> int:
+        return self._query.count_items_upto(upto_id)
+
     def search_by_keyword(
         self,
         keyword: str,
@@ -160,20 +270,65 @@ class ClipboardRepository:
             query_spec, page=page, page_size=page_size, space_id=space_id
         )
 
+    def facets(
+        self,
+        query_spec: Optional[QuerySpec] = None,
+        keys: Sequence[str] = FACET_KEYS,
+        *,
+        space_id: Optional[str] = None,
+        limit: int = 20,
+    ) -> Dict[str, List[Tuple[Any, int]]]:
+        return self._query.facets(query_spec, keys, space_id=space_id, limit=limit)
+
+    def explain_search(
+        self,
+        query_spec: QuerySpec,
+        page: int = 1,
+        page_size: int = 50,
+        *,
+        space_id: Optional[str] = None,
+    ) -> dict:
+        return self._query.explain(
+            query_spec, page=page, page_size=page_size, space_id=space_id
+        )
+
+    def refresh_search_stats(self) -> None:
+        """维护钩子：统计缺失 / 过期时在后台重算（含必要时的 ANALYZE）；MySQL / 无 FTS 时无事可做。"""
+        planner = self._query.planner
+        if planner is not None and planner.needs_refresh:
+            planner.refresh_async()
+
+    def wait_search_stats(self, timeout: float = 2.0) -> None:
+        """关库前调用：等后台统计刷新结束。"""
+        planner = self._query.planner
+        if planner is not None:
+            planner.wait_refresh(timeout)
+
     def get_timeline(
         self,
         start_ts: int,
         end_ts: int,
         granularity: str = "day",
         space_id: Optional[str] = None,
+        *,
+        tz_offset_ms: Optional[int] = None,
+        starred_only: bool = False,
     ) -> List[dict]:
-        return self._query.get_timeline(start_ts, end_ts, granularity, space_id)
+        return self._query.get_timeline(
+            start_ts, end_ts, granularity, space_id,
+            tz_offset_ms=tz_offset_ms, starred_only=starred_only,
+        )
 
     def get_items_by_tag(
         self, tag_id: str, page: int = 1, page_size: int = 50
     ) -> List[ClipboardItem]:
         return self._query.get_items_by_tag(tag_id, page=page, page_size=page_size)
 
+    def get_largest_items(
+        self, limit: int = 50, min_bytes: int = 0
+    ) -> List[ClipboardItem]:
+        return self._query.get_largest_items(limit=limit, min_bytes=min_bytes)
+
     # ------------------------------------------------------------------
     # 云同步状态 -> SyncStateDAO
     # ------------------------------------------------------------------
@@ -0,0 +1,285 @@
+"""边输入边搜索：后台执行、结果缓存、增量细化与过期查询取消。
+
+不依赖 Qt（纯 threading + ThreadPoolExecutor），由 ClipboardListController 持有。
+每次 submit 都会让之前提交、尚未完成的查询过期：
+- 还在队列里的直接跳过；
+- 正在执行的通过 db.cancellable() 中断（SQLite progress handler）。
+
+结果按规范化后的 QuerySpec 缓存（关键词大小写 / 顺序、filter 顺序不影响命中）；
+请求带 facet_keys 时分面计数与条目一起计算、一起缓存。
+若新查询只是上一次查询的细化（例如 "cl" → "cla"、追加关键词），且上一次结果
+已完整装在内存里，就直接在上一批结果上过滤，不再查库。
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .base_database import QueryCancelled
+from .db.clipboard_query import facets_from_items
+from .models import ClipboardItem
+from .query_parser import (
+    SORT_RELEVANCE,
+    Filter,
+    Op,
+    QuerySpec,
+    _needs_quoting,
+    parse as parse_query,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SearchRequest:
+    """一次列表搜索的全部输入；space_id 语义同 search_by_keyword。"""
+
+    query: str
+    page: int = 0
+    page_size: int = 50
+    starred_only: bool = False
+    space_id: Optional[str] = ""
+    # 需要随结果一起返回的分面（见 ClipboardQuery.FACET_KEYS）；空 = 不算分面
+    facet_keys: Tuple[str, ...] = ()
+
+
+@dataclass
+class SearchResult:
+    request: SearchRequest
+    seq: int
+    items: List[ClipboardItem] = field(default_factory=list)
+    total: int = 0
+    # "db" | "cache" | "refined"
+    source: str = "db"
+    error: Optional[Exception] = None
+    facets: Optional[Dict[str, List[Tuple[Any, int]]]] = None
+
+
+def normalize_key(spec: QuerySpec, request: SearchRequest) -> Tuple:
+    """把 QuerySpec + 分页 / 空间参数折叠成可哈希的缓存键。"""
+    return (
+        tuple(sorted(kw.lower() for kw in spec.keywords)),
+        tuple(sorted(spec.exact_phrases)),
+        tuple(spec.regex),
+        tuple(sorted((f.key, f.op.value, str(f.value), f.negate) for f in spec.filters)),
+        spec.sort,
+        request.starred_only,
+        request.space_id,
+        request.page,
+        request.page_size,
+        tuple(request.facet_keys),
+    )
+
+
+class SearchService:
+    """单工作线程的搜索执行器；同一时刻只有最新一次 submit 的结果会被回调。"""
+
+    _MAX_ENTRIES = 32
+
+    def __init__(self, repository, max_entries: int = _MAX_ENTRIES):
+        self._repo = repository
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._seq = 0
+        # key -> (items, total, facets)
+        self._cache: "OrderedDict[Tuple, Tuple[List[ClipboardItem], int, Optional[dict]]]" = OrderedDict()
+        # 上一次查库得到的 (spec, request, items, total)，供细化过滤使用
+        self._last: Optional[Tuple[QuerySpec, SearchRequest, List[ClipboardItem], int]] = None
+        # invalidate() 递增；查询期间发生过失效则结果不入缓存（同 ItemCache.generation）
+        self._generation = 0
+        # FTS5 是"词前缀"匹配，LIKE 回退是子串匹配；细化过滤要与之一致
+        self._token_prefix = bool(
+            getattr(repository, "_has_fts", False)
+            and not getattr(repository, "_is_mysql", False)
+        )
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.db_queries = 0
+
+    # ------------------------------------------------------------------
+    # 异步入口
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        request: SearchRequest,
+        callback: Callable[[SearchResult], None],
+    ) -> int:
+        """提交搜索，返回序号；只有未被后续 submit 取代时才会在工作线程调用 callback。"""
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="SearchService"
+                )
+            executor = self._executor
+        executor.submit(self._run, seq, request, callback)
+        return seq
+
+    def cancel_pending(self) -> None:
+        """让所有已提交的查询过期（不再回调）。"""
+        with self._lock:
+            self._seq += 1
+
+    def shutdown(self) -> None:
+        self.cancel_pending()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def invalidate(self) -> None:
+        """数据有变化（新增 / 删除 / 收藏等）后丢弃全部缓存结果。"""
+        with self._lock:
+            self._generation += 1
+            self._cache.clear()
+            self._last = None
+
+    def _is_stale(self, seq: int) -> bool:
+        return seq != self._seq
+
+    def _run(self, seq, request, callback) -> None:
+        if self._is_stale(seq):
+            return
+        try:
+            result = self.search(request, seq=seq, should_cancel=lambda: self._is_stale(seq))
+        except QueryCancelled:
+            logger.debug(f"搜索已被新输入取代: {request.query!r}")
+            return
+        except Exception as e:
+            result = SearchResult(request=request, seq=seq, error=e)
+        if self._is_stale(seq):
+            return
+        try:
+            callback(result)
+        except Exception as e:
+            logger.error(f"搜索结果回调失败: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # 同步执行（工作线程 / 测试）
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        request: SearchRequest,
+        seq: int = 0,
+        should_cancel: Callable[[], bool] = lambda: False,
+    ) -> SearchResult:
+        """缓存 → 细化过滤 → 查库，依次尝试。QueryParseError 原样抛出。"""
+        spec = parse_query(request.query)
+        key = normalize_key(spec, request)
+        with self._lock:
+            generation = self._generation
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return SearchResult(
+                    request, seq, list(cached[0]), cached[1], "cache", facets=cached[2]
+                )
+            last = self._last
+
+        if last is not None and self._refines(last[0], last[1], last[2], last[3], spec, request):
+            items = self._filter_refinement(last[2], spec)
+            # 细化结果是完整集合，分面直接在内存里数
+            facets = (
+                facets_from_items(items, request.facet_keys) if request.facet_keys else None
+            )
+            self._store(generation, key, spec, request, items, len(items), facets)
+            return SearchResult(
+                request, seq, list(items), len(items), "refined", facets=facets
+            )
+
+        facets = None
+        with self._repo.db.cancellable(should_cancel):
+            items, total = self._repo.search_by_keyword(
+                request.query, request.page, request.page_size,
+                starred_only=request.starred_only,
+                space_id=request.space_id,
+            )
+            if request.facet_keys:
+                facet_spec = parse_query(request.query)
+                if request.starred_only:
+                    facet_spec.filters.append(Filter(key="is", op=Op.EQ, value="starred"))
+                facets = self._repo.facets(
+                    facet_spec, request.facet_keys, space_id=request.space_id
+                )
+        self.db_queries += 1
+        self._store(generation, key, spec, request, items, total, facets)
+        return SearchResult(request, seq, list(items), total, "db", facets=facets)
+
+    def _store(self, generation, key, spec, request, items, total, facets=None) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._cache[key] = (list(items), total, facets)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+            self._last = (spec, request, list(items), total)
+
+    # ------------------------------------------------------------------
+    # 细化判定
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _refines(old_spec, old_req, old_items, old_total, spec, request) -> bool:
+        """新查询的命中集合是否一定是旧结果的子集，且旧结果是完整的。
+
+        只处理最常见的"继续打字"：filter / 短语 / 排序 / 分页完全相同，
+        旧的每个关键词都被某个新关键词以前缀方式延长（或原样保留），可以多出新关键词。
+        相关度排序（分数随关键词变化）和正则（total 不精确）不走这条路。
+        """
+        if old_req.page != 0 or request.page != 0 or old_total > len(old_items):
+            return False
+        if (old_req.page_size, old_req.starred_only, old_req.space_id) != (
+            request.page_size, request.starred_only, request.space_id
+        ):
+            return False
+        if old_spec.regex or spec.regex or spec.sort == SORT_RELEVANCE:
+            return False
+        if (
+            old_spec.sort != spec.sort
+            or old_spec.filters != spec.filters
+            or old_spec.exact_phrases != spec.exact_phrases
+        ):
+            return False
+        if not spec.keywords or any(_needs_quoting(kw) for kw in spec.keywords):
+            return False
+        new_kws = [kw.rstrip("*").lower() for kw in spec.keywords]
+        return all(
+            any(new.startswith(old.rstrip("*").lower()) for new in new_kws)
+            for old in old_spec.keywords
+        )
+
+    def _filter_refinement(self, items, spec) -> List[ClipboardItem]:
+        if self._token_prefix:
+            # unicode61 分词按非字母数字切分：关键词须出现在词首
+            patterns = [
+                re.compile(r"(?<![^\W_])" + re.escape(kw.rstrip("*")), re.IGNORECASE)
+                for kw in spec.keywords
+            ]
+        else:
+            patterns = [
+                re.compile(re.escape(kw), re.IGNORECASE) for kw in spec.keywords
+            ]
+        out: List[ClipboardItem] = []
+        for it in items:
+            text = getattr(it, "text_content", None) or ""
+            preview = it.preview or ""
+            if all(p.search(text) or p.search(preview) for p in patterns):
+                out.append(it)
+        return out
+
+
+__all__ = [
+    "SearchRequest",
+    "SearchResult",
+    "SearchService",
+    "normalize_key",
+]
@@ -0,0 +1,195 @@
+"""启动耗时的滚动历史 + 回归检测 + 百分位报告 CLI。
+
+每次启动稳定后（延后阶段跑完）把 StartupMetrics 的各阶段数值追加一行到
+<config>/startup_history.jsonl，只保留最近 MAX_RUNS 次。阶段取耗时，打点（mark）取距进程启动的时刻。
+
+回归：本次某阶段 > 历史 p95 × (1 + margin) 且至少慢出 min_delta_ms，历史样本不足 min_runs 时不判。
+
+报告::
+
+    python -m core.startup_history            # 各阶段 n / p50 / p90 / p95 / max
+    python -m core.startup_history --by-version
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .startup_metrics import StartupMetrics, percentile
+
+logger = logging.getLogger(__name__)
+
+
+MAX_RUNS = 200
+REPORT_PERCENTILES = (50, 90, 95)
+
+
+@dataclass(frozen=True)
+class StartupRun:
+    ts: int
+    version: str
+    machine: str
+    phases: Dict[str, float]
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {"ts": self.ts, "version": self.version, "machine": self.machine, "phases": self.phases},
+            ensure_ascii=False,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StartupRun":
+        return cls(
+            ts=int(data.get("ts", 0)),
+            version=str(data.get("version", "")),
+            machine=str(data.get("machine", "")),
+            phases={str(k): float(v) for k, v in (data.get("phases") or {}).items()},
+        )
+
+
+@dataclass(frozen=True)
+class StartupRegression:
+    phase: str
+    value_ms: float
+    p95_ms: float
+    samples: int
+
+    def describe(self) -> str:
+        return f"{self.phase} {self.value_ms:.0f}ms（历史 p95 {self.p95_ms:.0f}ms，n={self.samples}）"
+
+
+def run_from_metrics(metrics: StartupMetrics, version: str = "") -> StartupRun:
+    """失败的阶段不进历史，免得异常路径的耗时污染基线。"""
+    phases: Dict[str, float] = {}
+    for event in metrics.events():
+        if event.ok:
+            phases[event.name] = round(event.value_ms, 2)
+    return StartupRun(
+        ts=int(time.time()),
+        version=version,
+        machine=f"{platform.system()}-{platform.machine()}",
+        phases=phases,
+    )
+
+
+class StartupHistory:
+    def __init__(self, path: Path, max_runs: int = MAX_RUNS):
+        self._path = Path(path)
+        self._max_runs = max_runs
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def load(self) -> List[StartupRun]:
+        """坏行跳过；文件不存在返回空。"""
+        try:
+            lines = self._path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return []
+        runs = []
+        for line in lines:
+            try:
+                runs.append(StartupRun.from_dict(json.loads(line)))
+            except (ValueError, TypeError, AttributeError):
+                continue
+        return runs[-self._max_runs:]
+
+    def append(self, run: StartupRun) -> None:
+        """追加一行；超过 max_runs 时整体重写截尾（tmp + replace，半截文件不会替换掉旧历史）。"""
+        runs = self.load()
+        runs.append(run)
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            if len(runs) <= self._max_runs:
+                with self._path.open("a", encoding="utf-8") as fh:
+                    fh.write(run.to_json() + "\n")
+                return
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_text("".join(r.to_json() + "\n" for r in runs[-self._max_runs:]), encoding="utf-8")
+            os.replace(tmp, self._path)
+        except OSError as exc:
+            logger.debug(f"写入启动历史失败: {exc}")
+
+    def check(
+        self,
+        run: StartupRun,
+        *,
+        margin: float = 0.5,
+        min_delta_ms: float = 100.0,
+        min_runs: int = 5,
+        history: Optional[Sequence[StartupRun]] = None,
+    ) -> List[StartupRegression]:
+        """对照历史（不含 run 本身）找出变慢的阶段。"""
+        runs = self.load() if history is None else list(history)
+        regressions = []
+        for phase, value in run.phases.items():
+            samples = [r.phases[phase] for r in runs if phase in r.phases]
+            if len(samples) < min_runs:
+                continue
+            p95 = percentile(samples, 95)
+            if value > p95 * (1 + margin) and value - p95 >= min_delta_ms:
+                regressions.append(StartupRegression(phase, value, p95, len(samples)))
+        return regressions
+
+
+def format_report(runs: Sequence[StartupRun], pcts: Iterable[int] = REPORT_PERCENTILES) -> str:
+    """按阶段首次出现的顺序输出 n / 各百分位 / max。"""
+    if not runs:
+        return "no startup history"
+    pcts = tuple(pcts)
+    order: List[str] = []
+    for run in runs:
+        order.extend(name for name in run.phases if name not in order)
+    width = max(len(name) for name in order)
+    header = f"{'phase':<{width}}  {'n':>4}  " + "  ".join(f"{'p' + str(p):>8}" for p in pcts) + f"  {'max':>8}"
+    lines = [header]
+    for name in order:
+        samples = [r.phases[name] for r in runs if name in r.phases]
+        cells = "  ".join(f"{percentile(samples, p):>8.1f}" for p in pcts)
+        lines.append(f"{name:<{width}}  {len(samples):>4}  {cells}  {max(samples):>8.1f}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="启动各阶段耗时百分位报告")
+    parser.add_argument("--path", type=Path, default=None, help="历史文件，默认 <config>/startup_history.jsonl")
+    parser.add_argument("--last", type=int, default=0, help="只看最近 N 次启动")
+    parser.add_argument("--version", default="", help="只看某个版本")
+    parser.add_argument("--by-version", action="store_true", help="按版本分组输出")
+    args = parser.parse_args(argv)
+
+    path = args.path
+    if path is None:
+        from config import get_startup_history_path
+        path = get_startup_history_path()
+    runs = StartupHistory(path).load()
+    if args.version:
+        runs = [r for r in runs if r.version == args.version]
+    if args.last > 0:
+        runs = runs[-args.last:]
+
+    if not args.by_version:
+        print(format_report(runs))
+        return 0
+    versions: List[str] = []
+    for run in runs:
+        if run.version not in versions:
+            versions.append(run.version)
+    for version in versions:
+        print(f"== {version or '(unknown)'}")
+        print(format_report([r for r in runs if r.version == version]))
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
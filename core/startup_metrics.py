@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import bisect
+import math
 import time
+from collections import deque
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Iterator, List, Optional
+from typing import Deque, Dict, Iterator, List, Optional, Sequence
 
 
 @dataclass(frozen=True)
@@ -12,6 +15,21 @@ class StartupEvent:
     started_ms: float
     duration_ms: float
     ok: bool = True
+    is_mark: bool = False
+
+    @property
+    def value_ms(self) -> float:
+        """Phases compare by duration, marks by time since process start."""
+        return self.started_ms if self.is_mark else self.duration_ms
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0 for an empty sequence."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
 
 
 class StartupMetrics:
@@ -20,6 +38,7 @@ class StartupMetrics:
     def __init__(self, started_at: Optional[float] = None):
         self._started_at = time.perf_counter() if started_at is None else started_at
         self._events: List[StartupEvent] = []
+        self._imports: list = []
 
     @contextmanager
     def phase(self, name: str) -> Iterator[None]:
@@ -47,12 +66,20 @@ class StartupMetrics:
                 started_ms=(now - self._started_at) * 1000,
                 duration_ms=0.0,
                 ok=True,
+                is_mark=True,
             )
         )
 
     def events(self) -> list[StartupEvent]:
         return list(self._events)
 
+    def record_imports(self, records: list) -> None:
+        """Attach per-module import costs (core.import_trace.ImportRecord) to the summary."""
+        self._imports = list(records)
+
+    def imports(self) -> list:
+        return list(self._imports)
+
     def total_ms(self) -> float:
         if not self._events:
             return 0.0
@@ -65,4 +92,82 @@ class StartupMetrics:
             f"{event.name}={event.duration_ms:.1f}ms{'!' if not event.ok else ''}"
             for event in self._events
         ]
-        return f"startup total={self.total_ms():.1f}ms; " + ", ".join(parts)
+        summary = f"startup total={self.total_ms():.1f}ms; " + ", ".join(parts)
+        if self._imports:
+            heaviest = sorted(self._imports, key=lambda r: r.self_ms, reverse=True)[:10]
+            summary += f"; imports n={len(self._imports)} top: " + ", ".join(
+                f"{r.name}={r.self_ms:.1f}/{r.cumulative_ms:.1f}ms" for r in heaviest
+            )
+        return summary
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for repeated interactive paths (e.g. hotkey wake)."""
+
+    BUCKETS_MS = (8.0, 16.0, 33.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+    def __init__(self, name: str, budget_ms: Optional[float] = None, max_samples: int = 256):
+        self.name = name
+        self.budget_ms = budget_ms
+        # 最后一个桶收 > 1000ms 的长尾
+        self._counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self._samples: Deque[float] = deque(maxlen=max_samples)
+        self._over_budget = 0
+
+    def record(self, duration_ms: float) -> None:
+        self._counts[bisect.bisect_left(self.BUCKETS_MS, duration_ms)] += 1
+        self._samples.append(duration_ms)
+        if self.budget_ms is not None and duration_ms > self.budget_ms:
+            self._over_budget += 1
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def over_budget(self) -> int:
+        return self._over_budget
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """[(桶上界 ms, 次数)]；最后一项上界为 inf。"""
+        bounds = list(self.BUCKETS_MS) + [float("inf")]
+        return list(zip(bounds, self._counts))
+
+    def percentile(self, pct: float) -> float:
+        """最近 max_samples 个样本的最近秩百分位；无样本时为 0。"""
+        return percentile(self._samples, pct)
+
+    def format_summary(self) -> str:
+        if not self.count:
+            return f"{self.name}: no samples"
+        text = (
+            f"{self.name}: n={self.count} p50={self.percentile(50):.1f}ms "
+            f"p95={self.percentile(95):.1f}ms max={max(self._samples):.1f}ms"
+        )
+        if self.budget_ms is not None:
+            text += f" over_{self.budget_ms:.0f}ms={self._over_budget}"
+        return text
+
+
+class LatencyMetrics:
+    """Named LatencyHistogram registry, created on first record."""
+
+    def __init__(self) -> None:
+        self._histograms: Dict[str, LatencyHistogram] = {}
+
+    def histogram(self, name: str, budget_ms: Optional[float] = None) -> LatencyHistogram:
+        hist = self._histograms.get(name)
+        if hist is None:
+            hist = self._histograms[name] = LatencyHistogram(name, budget_ms)
+        return hist
+
+    def record(self, name: str, duration_ms: float, budget_ms: Optional[float] = None) -> None:
+        self.histogram(name, budget_ms).record(duration_ms)
+
+    def names(self) -> list[str]:
+        return list(self._histograms)
+
+    def format_summary(self) -> str:
+        if not self._histograms:
+            return "latency: no samples"
+        return "; ".join(h.format_summary() for h in self._histograms.values())
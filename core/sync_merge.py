@@ -0,0 +1,90 @@
+"""远端条目合并到本地库：云端拉取与局域网同步共用的去重 / 收藏 / 标签语义。
+
+- 按 content_hash 去重：本地没有的条目新增，已有的只合并元数据；
+- 收藏：云端以服务端为准（remote_star_wins=True）；局域网对等同步没有权威端，
+  只传播"收藏"，不传播"取消收藏"，否则两端互相覆盖会来回翻转；
+- 标签：add-only，删除不同步以避免误删；本地缺失的标签定义按 (space_id, name) 自动创建。
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Iterable, List, Tuple
+
+from .models import ClipboardItem
+from .repository import ClipboardRepository
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RemoteEntry:
+    item: ClipboardItem
+    tag_names: List[str] = field(default_factory=list)
+    # 云端条目 id；局域网同步没有服务端 id，为 0
+    server_id: int = 0
+
+
+@dataclass
+class MergeResult:
+    new_items: List[ClipboardItem] = field(default_factory=list)
+    # 新增条目的 (本地 id, 云端 id)，由调用方批量写 cloud_id
+    cloud_id_pairs: List[Tuple[int, int]] = field(default_factory=list)
+    starred: int = 0
+
+
+def merge_remote_items(
+    repository: ClipboardRepository,
+    entries: Iterable[RemoteEntry],
+    *,
+    remote_star_wins: bool = True,
+) -> MergeResult:
+    entries = list(entries)
+    result = MergeResult()
+    if not entries:
+        return result
+
+    # 批量查询已存在的 hash（替代逐条 get_by_hash，减少 N 次查询为 1 次）
+    existing_map = repository.get_existing_hashes([e.item.content_hash for e in entries])
+
+    for entry in entries:
+        item, server_id = entry.item, entry.server_id
+        existing = existing_map.get(item.content_hash)
+        local_item_id = None
+        if existing is None:
+            item_id = repository.add_item(item)
+            item.id = item_id
+            result.new_items.append(item)
+            if server_id and item_id:
+                result.cloud_id_pairs.append((item_id, server_id))
+            local_item_id = item_id
+            # 同一批里重复的 hash 只新增一次
+            existing_map[item.content_hash] = item
+        elif existing.id:
+            remote_starred = bool(item.is_starred)
+            if not remote_star_wins:
+                remote_starred = remote_starred or bool(existing.is_starred)
+            needs_cloud_id = bool(server_id and existing.cloud_id != server_id)
+            needs_star_merge = bool(existing.is_starred) != remote_starred
+            if needs_cloud_id or needs_star_merge:
+                repository.update_cloud_sync_metadata(
+                    existing.id,
+                    cloud_id=server_id if needs_cloud_id else None,
+                    is_starred=remote_starred if needs_star_merge else None,
+                )
+                if needs_star_merge:
+                    result.starred += 1
+            local_item_id = existing.id
+
+        # apply_tag_names 内部 INSERT OR IGNORE，幂等
+        if entry.tag_names and local_item_id:
+            try:
+                repository.tag_service.apply_tag_names(
+                    local_item_id, item.space_id or "", entry.tag_names
+                )
+            except Exception as exc:
+                logger.warning(
+                    "为 item %s 写入远端标签 %s 失败: %s",
+                    local_item_id, entry.tag_names, exc,
+                )
+
+    return result
@@ -1,11 +1,23 @@
-"""本地同步服务:轮询共享数据库,拉取其他设备写入的条目。"""
+"""本地同步服务:轮询共享数据库,拉取其他设备写入的条目。
+
+共享库有 change_log 触发器时按 seq 增量拉取增 / 改 / 删流水，每轮批量拉到追平为止，
+以 ItemChange 事件交给 UI 做增量更新；没有触发器（旧库 / 无 TRIGGER 权限）时
+回退到按 id 轮询新条目。
+
+本机独占的 SQLite（默认路径）上触发器照样记流水，但里面只有本机自己的写：
+不排空、不当"远端变更"重放，只按 id 轮询（云端 / 局域网拉下来的条目由 advance_sync_id 跳过）。
+两种模式下 change_log 都每小时按保留期清理一次，长时间运行不会无限增长。
+"""
 
 import logging
+import time
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 
 from PySide6.QtCore import QObject, Signal, QTimer
 
+from .db.change_log_dao import OP_DELETE, OP_INSERT, ChangeRecord
 from .models import ClipboardItem
 from .repository import ClipboardRepository
 from config import settings, update_settings, SYNC_INTERVAL_MS
@@ -20,8 +32,24 @@ class SyncState(Enum):
     POLLING_SLOW = "polling_slow"
 
 
+class ChangeOp(Enum):
+    INSERT = "insert"
+    UPDATE = "update"
+    DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class ItemChange:
+    """一条已合并的条目变更；INSERT / UPDATE 带库里的最新行（不含原图）。"""
+
+    op: ChangeOp
+    item_id: int
+    item: Optional[ClipboardItem] = None
+
+
 class SyncService(QObject):
     new_items_available = Signal(list)  # List[ClipboardItem]
+    changes_available = Signal(list)  # List[ItemChange]
     sync_error = Signal(str)
 
     # 自适应轮询参数
@@ -29,14 +57,35 @@ class SyncService(QObject):
     _MAX_INTERVAL_MS = 30000  # 无新数据时最大间隔 30s
     _INTERVAL_STEP_MS = 2000  # 每次无数据增加 2s
 
-    def __init__(self, repository: ClipboardRepository, parent=None):
+    # change_log 追平：每批 500 条，单次定时器回调最多 20 批，
+    # 剩余的让出事件循环后立刻接着拉（不等下一个轮询间隔）
+    _DRAIN_BATCH = 500
+    _DRAIN_MAX_BATCHES = 20
+    # MySQL 自增 seq 按分配顺序而非提交顺序可见：遇到空洞先等并发事务提交，
+    # 超过宽限仍未出现视为回滚留下的永久空洞，跳过
+    _GAP_GRACE_S = 5.0
+    # change_log 保留天数；启动时和之后每 _PRUNE_INTERVAL_S 清理一次
+    _CHANGE_LOG_RETENTION_DAYS = 7
+    _PRUNE_INTERVAL_S = 3600.0
+
+    def __init__(self, repository: ClipboardRepository, parent=None, shared: Optional[bool] = None):
         super().__init__(parent)
         self.repository = repository
         s = settings()
         self._last_sync_id = s.last_sync_id
         self._device_id = s.device_id
+        # 共享库：MySQL，或用户指定了路径的 SQLite（放在共享目录里）
+        self._shared = (
+            bool(getattr(repository.db, "is_mysql", False) or s.database_path)
+            if shared is None else shared
+        )
+        self._last_prune_at = 0.0
         self._state: SyncState = SyncState.STOPPED
         self._current_interval = self._MIN_INTERVAL_MS
+        # change_log 游标；None = 库上没有 change_log，走按 id 轮询
+        self._last_seq: Optional[int] = None
+        self._gap_seq: Optional[int] = None
+        self._gap_seen_at = 0.0
 
         self._sync_timer = QTimer(self)
         self._sync_timer.timeout.connect(self._check_for_updates)
@@ -59,9 +108,7 @@ class SyncService(QObject):
 
         # 启动时获取最新ID,把游标对齐到当前库尾,避免首轮把历史条目全当新数据
         try:
-            latest_id = self.repository.get_latest_id()
-            if latest_id > self._last_sync_id:
-                self._last_sync_id = latest_id
+            self._align_cursors()
             self._transition(SyncState.POLLING_FAST)
         except Exception as e:
             self._transition(SyncState.UNINITIALIZED)
@@ -89,9 +136,7 @@ class SyncService(QObject):
         # 启动初始化失败的情况下,每轮重试一次,避免把全部历史条目视为新数据
         if self._state == SyncState.UNINITIALIZED:
             try:
-                latest_id = self.repository.get_latest_id()
-                if latest_id > self._last_sync_id:
-                    self._last_sync_id = latest_id
+                self._align_cursors()
                 self._transition(SyncState.POLLING_FAST)
                 logger.info("同步服务延迟初始化成功")
             except Exception as e:
@@ -99,15 +144,13 @@ class SyncService(QObject):
                 return
 
         try:
-            new_items = self.repository.get_new_items_since(
-                self._last_sync_id, self._device_id
-            )
-
-            if new_items:
-                self._last_sync_id = max(item.id for item in new_items)
-                logger.debug(f"发现 {len(new_items)} 条来自其他设备的新记录")
-                self.new_items_available.emit(new_items)
+            if self._last_seq is not None:
+                changed = self._drain_change_log()
+            else:
+                changed = self._poll_new_items()
+            self._maybe_prune()
 
+            if changed:
                 # 有新数据,重置为最短间隔并进入 FAST 状态
                 if self._current_interval != self._MIN_INTERVAL_MS:
                     self._current_interval = self._MIN_INTERVAL_MS
@@ -129,6 +172,139 @@ class SyncService(QObject):
             logger.error(f"同步检查失败: {e}")
             self.sync_error.emit(str(e))
 
+    # ------------------------------------------------------------------
+    # 游标对齐 / 拉取
+    # ------------------------------------------------------------------
+
+    def _align_cursors(self) -> None:
+        latest_id = self.repository.get_latest_id()
+        if latest_id > self._last_sync_id:
+            self._last_sync_id = latest_id
+        change_log = self.repository.change_log
+        if not change_log.available:
+            self._last_seq = None
+            return
+        # 本机独占的库里流水全是自己的写，重放只会让 UI 白白重绘：走按 id 轮询
+        self._last_seq = self.repository.get_latest_change_seq() if self._shared else None
+        self._maybe_prune(force=True)
+
+    def _maybe_prune(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_prune_at < self._PRUNE_INTERVAL_S:
+            return
+        change_log = self.repository.change_log
+        if not change_log.available:
+            return
+        self._last_prune_at = now
+        try:
+            pruned = change_log.prune(self._CHANGE_LOG_RETENTION_DAYS)
+            if pruned:
+                logger.debug(f"清理了 {pruned} 条过期 change_log")
+        except Exception as e:
+            logger.debug(f"清理 change_log 失败: {e}")
+
+    def _poll_new_items(self) -> bool:
+        """旧路径：只看其他设备新插入的条目（每轮至多 100 条）。"""
+        new_items = self.repository.get_new_items_since(
+            self._last_sync_id, self._device_id
+        )
+        if not new_items:
+            return False
+        self._last_sync_id = max(item.id for item in new_items)
+        logger.debug(f"发现 {len(new_items)} 条来自其他设备的新记录")
+        self.changes_available.emit(
+            [ItemChange(ChangeOp.INSERT, item.id, item) for item in new_items]
+        )
+        self.new_items_available.emit(new_items)
+        return True
+
+    def _drain_change_log(self) -> bool:
+        """按 seq 批量拉取 change_log 直到追平（或遇到待定空洞），返回是否有变更。"""
+        # 整轮的流水合并后一次性发出，UI 每轮只重绘一次
+        pending: List[ChangeRecord] = []
+        seq = self._last_seq
+        caught_up = False
+        for _ in range(self._DRAIN_MAX_BATCHES):
+            records = self.repository.get_changes_since(seq, self._DRAIN_BATCH)
+            ready = self._contiguous(records, seq)
+            if ready:
+                pending.extend(ready)
+                seq = ready[-1].seq
+            if len(ready) < len(records) or len(records) < self._DRAIN_BATCH:
+                caught_up = True
+                break
+        changed = self._apply_records(pending) if pending else False
+        # 应用成功后才推进游标：读回失败时下一轮重拉同一段
+        self._last_seq = seq
+        if not caught_up:
+            # 积压超过单轮上限：让出事件循环后继续，不等下一个轮询间隔
+            QTimer.singleShot(0, self._check_for_updates)
+        return changed
+
+    def _contiguous(self, records: List[ChangeRecord], after: int) -> List[ChangeRecord]:
+        """取 after 之后连续的一段；空洞在宽限期内等待，超期跳过。"""
+        expected = after + 1
+        out: List[ChangeRecord] = []
+        for rec in records:
+            if rec.seq != expected:
+                now = time.monotonic()
+                if self._gap_seq != expected:
+                    self._gap_seq, self._gap_seen_at = expected, now
+                    break
+                if now - self._gap_seen_at < self._GAP_GRACE_S:
+                    break
+                logger.debug(f"change_log 空洞 {expected}..{rec.seq - 1} 超过宽限，跳过")
+                self._gap_seq = None
+            out.append(rec)
+            expected = rec.seq + 1
+        return out
+
+    def _apply_records(self, records: List[ChangeRecord]) -> bool:
+        """合并同一条目的多次变更、读回最新行并发出事件。"""
+        final: Dict[int, str] = {}
+        for rec in records:
+            if rec.op == OP_INSERT and (
+                rec.device_id == self._device_id or rec.item_id <= self._last_sync_id
+            ):
+                # 本机写入 / 已经通过其他途径（云端拉取）知道的条目
+                final.setdefault(rec.item_id, None)
+                continue
+            prev = final.get(rec.item_id)
+            if prev == OP_DELETE:
+                continue
+            if rec.op == OP_DELETE or prev is None or prev != OP_INSERT:
+                final[rec.item_id] = rec.op
+        pending = {item_id: op for item_id, op in final.items() if op is not None}
+        if not pending:
+            return False
+
+        cache = self.repository.item_cache
+        for item_id in pending:
+            cache.invalidate(item_id)
+        fetched = {
+            it.id: it
+            for it in self.repository.get_items_by_ids(
+                [i for i, op in pending.items() if op != OP_DELETE]
+            )
+        }
+
+        changes: List[ItemChange] = []
+        for item_id, op in pending.items():
+            item = fetched.get(item_id)
+            if op == OP_DELETE or item is None:
+                changes.append(ItemChange(ChangeOp.DELETE, item_id))
+            else:
+                changes.append(ItemChange(ChangeOp(op), item_id, item))
+
+        inserted = [c.item for c in changes if c.op == ChangeOp.INSERT]
+        if inserted:
+            self._last_sync_id = max(self._last_sync_id, max(it.id for it in inserted))
+        logger.debug(f"应用 {len(changes)} 条来自共享库的变更")
+        self.changes_available.emit(changes)
+        if inserted:
+            self.new_items_available.emit(inserted)
+        return True
+
     def force_sync(self):
         if self._state == SyncState.STOPPED:
             return
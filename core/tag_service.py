@@ -7,10 +7,11 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 import uuid
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +35,56 @@ class TagService:
     def __init__(self, repository):
         self._repo = repository
         self._db = repository.db
+        # tag_definitions 的进程内缓存：id -> TagDefinition。
+        # Why: 列表查询只带回 tag_ids，名字/颜色在这里解析；标签定义一般只有几十条，
+        # 整表缓存后每次渲染都不用再 JOIN。由本服务的写操作失效。
+        self._defs: Optional[Dict[str, TagDefinition]] = None
+        self._defs_lock = threading.Lock()
+        # 每次丢弃缓存 +1；按名字输出标签的缓存（如局域网清单）用它判断是否过期
+        self._generation = 0
+
+    # ========== 标签定义缓存 ==========
+
+    def _definitions(self) -> Dict[str, TagDefinition]:
+        defs = self._defs
+        if defs is not None:
+            return defs
+        try:
+            loaded = {t.id: t for t in self.list_tags()}
+        except Exception as exc:
+            # v3.4 之前没有 tag_definitions：不缓存，下次再试
+            logger.debug("加载 tag_definitions 失败: %s", exc)
+            return {}
+        with self._defs_lock:
+            if self._defs is None:
+                self._defs = loaded
+            return self._defs
+
+    def invalidate_cache(self) -> None:
+        """丢弃标签定义缓存；其他进程/同步改了 tag_definitions 时由调用方触发。"""
+        with self._defs_lock:
+            self._defs = None
+            self._generation += 1
+
+    @property
+    def generation(self) -> int:
+        """标签定义缓存的代数：建 / 改 / 删标签或重载定义后递增。"""
+        return self._generation
+
+    def resolve(self, tag_ids: Iterable[str]) -> List[TagDefinition]:
+        """把条目的 tag_ids 解析为 TagDefinition（保持顺序，未知 id 跳过）。"""
+        tag_ids = list(tag_ids)
+        defs = self._definitions()
+        missing = [tid for tid in tag_ids if tid not in defs]
+        if missing:
+            # 别的连接刚建的标签：整表重载一次
+            self.invalidate_cache()
+            defs = self._definitions()
+        return [defs[tid] for tid in tag_ids if tid in defs]
+
+    def names_for(self, tag_ids: Iterable[str]) -> List[str]:
+        """条目 tag_ids -> 标签名列表，走缓存不查库。"""
+        return [t.name for t in self.resolve(tag_ids)]
 
     def list_tags(self, space_id: Optional[str] = None) -> List[TagDefinition]:
         """space_id=None 返回所有 space 的标签；"" 返回个人空间（space_id == '' ）的。"""
@@ -72,6 +123,7 @@ class TagService:
             self._db.execute_write(conn, sql, (tag_id, space_id, name, color, now))
 
         self._db.execute_with_retry(op)
+        self.invalidate_cache()
         return TagDefinition(
             id=tag_id,
             space_id=space_id,
@@ -107,6 +159,7 @@ class TagService:
             self._db.execute_write(conn, sql, tuple(params))
 
         self._db.execute_with_retry(op)
+        self.invalidate_cache()
         current = self.get_tag(tag_id)
         if current is None:
             raise ValueError(f"tag {tag_id} 不存在")
@@ -123,6 +176,9 @@ class TagService:
             )
 
         self._db.execute_with_retry(op)
+        self.invalidate_cache()
+        # 标签被删会改变任意多条目的 tag_ids
+        self._repo.item_cache.clear()
 
     def get_tag(self, tag_id: str) -> Optional[TagDefinition]:
         sql = (
@@ -219,7 +275,10 @@ class TagService:
             for tid in tag_ids:
                 self._db.execute_write(conn, sql, (item_id, tid, now))
 
-        self._db.execute_with_retry(op)
+        try:
+            self._db.execute_with_retry(op)
+        finally:
+            self._repo.item_cache.invalidate(item_id)
         return tag_ids
 
     # ========== internal ==========
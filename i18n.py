@@ -1,6 +1,7 @@
 """i18n shim。
 
-字符串数据按领域拆到 i18n_strings/ 包内,运行时由 load_all() 合并。
+字符串数据按语言拆在 i18n_strings/ 包内 (每种语言一个扁平 dict 模块),
+只加载当前语言,英语作为回退在第一次缺 key 时才加载。
 对外保持原有 t / set_language / get_language / get_languages 接口,
 以及 TRANSLATIONS / SUPPORTED_LANGUAGES / I18n 三个模块级符号 (向后兼容)。
 
@@ -9,7 +10,7 @@
 
 from typing import Dict, Optional
 
-from i18n_strings import load_all
+from i18n_strings import load_language
 
 # 支持的语言列表
 SUPPORTED_LANGUAGES: Dict[str, str] = {
@@ -23,8 +24,71 @@ SUPPORTED_LANGUAGES: Dict[str, str] = {
     "ru_RU": "Русский",
 }
 
-# 完整翻译字典 (由 i18n_strings 各领域文件合并而来)
-TRANSLATIONS: Dict[str, Dict[str, str]] = load_all()
+_FALLBACK_LANGUAGE = "en_US"
+
+
+class _LazyTranslations(dict):
+    """lang -> 扁平 dict;按下标取某种语言时才加载那一种。
+
+    Why: 旧代码 / 测试会直接读 TRANSLATIONS[lang] 或遍历它;下标访问只加载一种语言,
+    枚举类操作 (in / 遍历 / len / items ...) 则先把全部语言补齐,语义与原来的完整 dict 一致。
+    """
+
+    def __missing__(self, lang: str) -> Dict[str, str]:
+        if lang not in SUPPORTED_LANGUAGES:
+            raise KeyError(lang)
+        strings = load_language(lang)
+        dict.__setitem__(self, lang, strings)
+        return strings
+
+    def _load_all(self) -> None:
+        if dict.__len__(self) < len(SUPPORTED_LANGUAGES):
+            for lang in SUPPORTED_LANGUAGES:
+                self[lang]
+
+    def get(self, lang, default=None):
+        if lang in SUPPORTED_LANGUAGES:
+            return self[lang]
+        return dict.get(self, lang, default)
+
+    def __contains__(self, lang) -> bool:
+        return lang in SUPPORTED_LANGUAGES or dict.__contains__(self, lang)
+
+    def __iter__(self):
+        self._load_all()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        self._load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self._load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self._load_all()
+        return dict.values(self)
+
+    def items(self):
+        self._load_all()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self._load_all()
+        return dict(dict.items(self))
+
+    def __repr__(self) -> str:
+        self._load_all()
+        return dict.__repr__(self)
+
+
+# 翻译字典 (lang -> key -> value),按需加载
+TRANSLATIONS: Dict[str, Dict[str, str]] = _LazyTranslations()
+
+# 当前语言的扁平表;t() 的热路径只查这一张 dict
+_active: Dict[str, str] = {}
+_active_language: Optional[str] = None
 
 
 class I18n:
@@ -57,22 +121,40 @@ class I18n:
     @classmethod
     def t(cls, key: str, **kwargs) -> str:
         """获取翻译文本。当前语言找不到时回退到英语,仍找不到则返回 key。"""
-        translations = TRANSLATIONS.get(cls._current_language, {})
-        text = translations.get(key, key)
-        if text == key and cls._current_language != "en_US":
-            text = TRANSLATIONS.get("en_US", {}).get(key, key)
-        if kwargs:
-            try:
-                text = text.format(**kwargs)
-            except (KeyError, ValueError):
-                pass
-        return text
+        return t(key, **kwargs)
+
+
+def _activate() -> Dict[str, str]:
+    """切换 _active 到 I18n 当前语言 (首次调用 / 语言变化后由 t() 触发)。"""
+    global _active, _active_language
+    language = I18n._current_language
+    _active = TRANSLATIONS[language]
+    _active_language = language
+    return _active
+
+
+def _lookup_fallback(key: str) -> str:
+    if I18n._current_language == _FALLBACK_LANGUAGE:
+        return key
+    return TRANSLATIONS[_FALLBACK_LANGUAGE].get(key, key)
 
 
 # 便捷函数
 def t(key: str, **kwargs) -> str:
-    """翻译便捷函数。"""
-    return I18n.t(key, **kwargs)
+    """翻译便捷函数。
+
+    热路径:一次 dict 查找,无 kwargs 时不调 format;缺 key 才去英语表回退。
+    """
+    table = _active if _active_language == I18n._current_language else _activate()
+    text = table.get(key)
+    if text is None:
+        text = _lookup_fallback(key)
+    if kwargs:
+        try:
+            text = text.format(**kwargs)
+        except (KeyError, ValueError):
+            pass
+    return text
 
 
 def set_language(language: str) -> None:
@@ -1,23 +1,47 @@
 """i18n 字符串包。
 
-按领域拆分子文件,每个子文件导出 STRINGS = {lang_code: {key: value}}。
-load_all() 合并所有子文件,返回最终的三层 dict:lang -> key -> value。
+每种语言一个模块 (zh_CN.py / en_US.py / ...),导出扁平的 STRINGS = {key: value}。
+load_language() 只 import 需要的那一种语言 (按需的字面 import,打包工具仍能静态发现);import 一次后 .pyc 里就是预编译好的常量 dict,
+不再像按领域拆分时那样每次启动把 8 种语言 × 5 个领域全部建出来再合并。
 
-领域划分:
+每个语言模块内部按原领域分节:
 - main     主界面 / 通用 / 托盘 / 右键菜单
 - settings 设置对话框 / 数据库 / 过滤存储
-- cloud    云同步 / 登录 / 订阅 / 分享 (暂为占位)
+- cloud    云同步 / 登录 / 订阅 / 分享
 - plugins  插件系统
 - misc     其他 (剪贴板项 / 图片保存 / 数据迁移 / 关于)
 """
 
-from i18n_strings import cloud, main, misc, plugins, settings
+from typing import Dict
+
+LANGUAGES = ("zh_CN", "en_US", "ja_JP", "ko_KR", "es_ES", "fr_FR", "de_DE", "ru_RU")
+
+
+def load_language(lang: str) -> Dict[str, str]:
+    """返回 lang 的扁平 dict[key] -> value;未知语言返回空 dict。"""
+    # Why: 逐个写字面 import 而不是 importlib.import_module(f"...{lang}"),
+    # PyInstaller 静态分析才能找到这些模块;动态拼名字的打包产物首次 t() 就会 ModuleNotFoundError。
+    if lang == "zh_CN":
+        from i18n_strings import zh_CN as module
+    elif lang == "en_US":
+        from i18n_strings import en_US as module
+    elif lang == "ja_JP":
+        from i18n_strings import ja_JP as module
+    elif lang == "ko_KR":
+        from i18n_strings import ko_KR as module
+    elif lang == "es_ES":
+        from i18n_strings import es_ES as module
+    elif lang == "fr_FR":
+        from i18n_strings import fr_FR as module
+    elif lang == "de_DE":
+        from i18n_strings import de_DE as module
+    elif lang == "ru_RU":
+        from i18n_strings import ru_RU as module
+    else:
+        return {}
+    return module.STRINGS
 
 
 def load_all() -> dict:
-    """合并所有领域文件的 STRINGS,返回 dict[lang][key] -> value。"""
-    merged: dict = {}
-    for module in (main, settings, cloud, plugins, misc):
-        for lang, kv in module.STRINGS.items():
-            merged.setdefault(lang, {}).update(kv)
-    return merged
+    """加载全部语言,返回 dict[lang][key] -> value (完整性检查 / 工具脚本用)。"""
+    return {lang: load_language(lang) for lang in LANGUAGES}
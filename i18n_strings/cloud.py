@@ -1,46 +0,0 @@
-"""i18n 字符串 - cloud 领域。
-
-云同步 / 登录 / 订阅 / 分享相关字符串。当前实现暂无此类字符串,保留占位以便后续添加。
-"""
-
-STRINGS = {
-    # ========== 简体中文 / Simplified Chinese ==========
-    "zh_CN": {
-        # (暂无字符串)
-    },
-
-    # ========== English ==========
-    "en_US": {
-        # (暂无字符串)
-    },
-
-    # ========== 日本語 / Japanese ==========
-    "ja_JP": {
-        # (暂无字符串)
-    },
-
-    # ========== 한국어 / Korean ==========
-    "ko_KR": {
-        # (暂无字符串)
-    },
-
-    # ========== Español / Spanish ==========
-    "es_ES": {
-        # (暂无字符串)
-    },
-
-    # ========== Français / French ==========
-    "fr_FR": {
-        # (暂无字符串)
-    },
-
-    # ========== Deutsch / German ==========
-    "de_DE": {
-        # (暂无字符串)
-    },
-
-    # ========== Русский / Russian ==========
-    "ru_RU": {
-        # (暂无字符串)
-    },
-}
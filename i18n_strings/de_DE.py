@@ -0,0 +1,191 @@
+"""i18n 字符串 - Deutsch / German。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": 'Geteilte Zwischenablage',
+    "settings": 'Einstellungen',
+    "ok": 'OK',
+    "cancel": 'Abbrechen',
+    "yes": 'Ja',
+    "no": 'Nein',
+    "confirm": 'Bestätigen',
+    "error": 'Fehler',
+    "warning": 'Warnung',
+    "info": 'Information',
+    "success": 'Erfolg',
+
+    # 主窗口 Main window
+    "search_placeholder": 'Zwischenablage durchsuchen...',
+    "pin_window": 'Fenster anheften',
+    "unpin_window": 'Fenster lösen',
+    "minimize": 'Minimieren',
+    "quit_app": 'Beenden',
+    "prev_page": '◀ Zurück',
+    "next_page": 'Weiter ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'Fenster anzeigen',
+    "quit": 'Beenden',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'In Zwischenablage kopiert ✓',
+    "copy_failed": 'Kopieren fehlgeschlagen',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'Nur Favoriten',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'Kopieren',
+    "ctx_star": 'Favorit',
+    "ctx_unstar": 'Favorit entfernen',
+    "ctx_delete": 'Löschen',
+    "refresh": 'Aktualisieren',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": 'Allgemein',
+    "database": 'Datenbank',
+    "dock_position": 'Andockposition:',
+    "dock_right": 'Rechts',
+    "dock_left": 'Links',
+    "dock_top": 'Oben',
+    "dock_bottom": 'Unten',
+    "global_hotkey": 'Globale Tastenkombination:',
+    "hotkey_placeholder": 'z.B.: <cmd>+v',
+    "hotkey_help": 'Tastenkombinationsformat:\n• <cmd> = Win-Taste (Windows) / Cmd-Taste (macOS)\n• <ctrl> = Strg-Taste\n• <alt> = Alt-Taste\n• <shift> = Umschalt-Taste\n• Beispiele: <cmd>+v, <ctrl>+<shift>+c',
+    "language": 'Sprache:',
+
+    # 数据库设置 Database settings
+    "db_type": 'Datenbanktyp:',
+    "db_sqlite": 'SQLite (Lokale Datei)',
+    "db_mysql": 'MySQL (Netzwerkdatenbank)',
+    "sqlite_config": 'SQLite-Konfiguration',
+    "mysql_config": 'MySQL-Konfiguration',
+    "db_path": 'Datenbankpfad:',
+    "path_placeholder": 'Pfad eingeben oder auf Durchsuchen klicken...',
+    "browse": 'Durchsuchen...',
+    "select_db_file": 'Datenbankdatei-Speicherort auswählen',
+    "host": 'Host:',
+    "port": 'Port:',
+    "username": 'Benutzername:',
+    "password": 'Passwort:',
+    "db_name": 'Datenbankname:',
+    "test_connection": 'Verbindung testen',
+    "connection_success": 'Verbindung erfolgreich',
+    "connection_failed": 'Verbindung fehlgeschlagen',
+    "missing_dependency": 'Fehlende Abhängigkeit',
+    "pymysql_required": 'pymysql ist nicht installiert.\nFühren Sie aus: pip install pymysql',
+    "save_anyway": '{message}\n\nEinstellungen trotzdem speichern?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'Datenbankprofil:',
+    "add_profile": 'Hinzufügen',
+    "delete_profile": 'Löschen',
+    "profile_name": 'Profilname',
+    "enter_profile_name": 'Neuen Profilnamen eingeben:',
+    "profile_exists": 'Profilname existiert bereits',
+    "cannot_delete_active": 'Das aktive Profil kann nicht gelöscht werden',
+    "confirm_delete_profile": 'Profil "{name}" löschen?',
+
+    # 提示消息 Messages
+    "need_restart": 'Neustart erforderlich',
+    "restart_msg": 'Die Einstellungen wurden geändert. Bitte starten Sie die Anwendung neu, damit die Änderungen wirksam werden.',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'Filter und Speicher',
+    "content_filter": 'Inhaltsfilter',
+    "save_text": 'Text speichern',
+    "save_images": 'Bilder speichern',
+    "max_text_length": 'Max. Textlänge:',
+    "max_image_size": 'Max. Bildgröße:',
+    "unlimited": 'Unbegrenzt',
+    "characters": 'Zeichen',
+    "storage_management": 'Speicherverwaltung',
+    "max_items": 'Max. Einträge:',
+    "retention_days": 'Auto-Bereinigung Tage:',
+    "never_cleanup": 'Nie',
+    "archive_after_days": 'Archivieren nach:',
+    "never_archive": 'Nie',
+    "days": 'Tage',
+    "poll_interval": 'Abfrageintervall:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'Plugins',
+    "installed_plugins": 'Installierte Plugins',
+    "open_plugins_dir": 'Plugin-Ordner öffnen',
+    "reload_plugins": 'Neu laden',
+    "view_plugin_logs": 'Protokolle anzeigen',
+    "plugin_dev_docs": 'Entwicklerdoku',
+    "plugin_settings": 'Einstellungen',
+    "plugin_enabled": 'Aktiviert',
+    "plugin_disabled": 'Deaktiviert',
+    "plugin_missing_deps": 'Fehlende Abhängigkeiten: {deps}',
+    "plugin_incompatible": 'Inkompatible Version',
+    "plugin_error": 'Laden fehlgeschlagen',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} wird ausgeführt... {percent}%',
+    "plugin_timeout": 'Plugin-Zeitüberschreitung',
+    "plugin_busy": 'Ein Plugin wird ausgeführt, bitte warten',
+    "plugin_not_loaded": 'Plugin nicht geladen: {id}',
+    "plugin_exec_failed": 'Ausführung fehlgeschlagen',
+    "plugin_config_title": '{name} - Einstellungen',
+    "plugin_config_required": 'Bitte füllen Sie die Pflichtfelder aus',
+    "plugin_save": 'Speichern',
+    "plugin_cancel": 'Abbrechen',
+    "plugin_saved_entry": 'Als neuer Eintrag gespeichert',
+    "plugin_replaced_entry": 'Inhalt ersetzt',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'Netzwerkzugriff',
+    "plugin_perm_file_read": 'Dateien lesen',
+    "plugin_perm_file_write": 'Dateien schreiben',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'Plugin-Store',
+    "plugin_install": 'Installieren',
+    "plugin_uninstall": 'Deinstallieren',
+    "plugin_installing": 'Wird installiert...',
+    "plugin_installed_tag": 'Installiert',
+    "plugin_install_failed": 'Installation fehlgeschlagen',
+    "plugin_uninstall_confirm_title": 'Deinstallation bestätigen',
+    "plugin_uninstall_confirm": 'Möchten Sie "{name}" wirklich deinstallieren?',
+    "plugin_uninstall_failed": 'Deinstallation fehlgeschlagen',
+    "plugin_store_loading": 'Plugin-Liste wird geladen...',
+    "plugin_store_empty": 'Keine Plugins verfügbar',
+    "plugin_store_error": 'Plugin-Liste konnte nicht geladen werden',
+    "plugin_no_installed": 'Keine Plugins installiert',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": 'Löschen bestätigen',
+    "delete_confirm_msg": 'Sind Sie sicher, dass Sie dieses Element löschen möchten?',
+    "image": '[Bild]',
+    "from_device": 'Von: {device}',
+
+    # 图片保存 Image save
+    "save_image": 'Bild speichern',
+    "image_load_failed": 'Bilddaten konnten nicht geladen werden',
+    "save_failed": 'Speichern fehlgeschlagen: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": 'Daten migrieren',
+    "migrate_data_confirm": 'Bestehende Daten in die neue Datenbank migrieren?',
+    "migrating": 'Daten werden migriert...',
+    "migration_complete": 'Migration abgeschlossen. {count} Elemente migriert.',
+    "migration_failed": 'Migration fehlgeschlagen: {error}',
+
+    # 关于 About
+    "about": 'Über',
+    "about_description": 'Ein geräteübergreifendes Tool zur Verwaltung und Synchronisierung der Zwischenablage',
+    "official_website": 'Offizielle Website:',
+    "github_repo": 'GitHub-Repository:',
+    "download_page": 'Herunterladen:',
+}
@@ -0,0 +1,191 @@
+"""i18n 字符串 - English。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": 'Shared Clipboard',
+    "settings": 'Settings',
+    "ok": 'OK',
+    "cancel": 'Cancel',
+    "yes": 'Yes',
+    "no": 'No',
+    "confirm": 'Confirm',
+    "error": 'Error',
+    "warning": 'Warning',
+    "info": 'Information',
+    "success": 'Success',
+
+    # 主窗口 Main window
+    "search_placeholder": 'Search clipboard...',
+    "pin_window": 'Pin window',
+    "unpin_window": 'Unpin window',
+    "minimize": 'Minimize',
+    "quit_app": 'Quit',
+    "prev_page": '◀ Previous',
+    "next_page": 'Next ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'Show Window',
+    "quit": 'Quit',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'Copied to clipboard ✓',
+    "copy_failed": 'Copy failed',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'Starred only',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'Copy',
+    "ctx_star": 'Star',
+    "ctx_unstar": 'Unstar',
+    "ctx_delete": 'Delete',
+    "refresh": 'Refresh',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": 'General',
+    "database": 'Database',
+    "dock_position": 'Dock position:',
+    "dock_right": 'Right',
+    "dock_left": 'Left',
+    "dock_top": 'Top',
+    "dock_bottom": 'Bottom',
+    "global_hotkey": 'Global hotkey:',
+    "hotkey_placeholder": 'e.g.: <cmd>+v',
+    "hotkey_help": 'Hotkey format:\n• <cmd> = Win key (Windows) / Cmd key (macOS)\n• <ctrl> = Ctrl key\n• <alt> = Alt key\n• <shift> = Shift key\n• Examples: <cmd>+v, <ctrl>+<shift>+c',
+    "language": 'Language:',
+
+    # 数据库设置 Database settings
+    "db_type": 'Database type:',
+    "db_sqlite": 'SQLite (Local file)',
+    "db_mysql": 'MySQL (Network database)',
+    "sqlite_config": 'SQLite Configuration',
+    "mysql_config": 'MySQL Configuration',
+    "db_path": 'Database path:',
+    "path_placeholder": 'Enter path or click Browse...',
+    "browse": 'Browse...',
+    "select_db_file": 'Select database file location',
+    "host": 'Host:',
+    "port": 'Port:',
+    "username": 'Username:',
+    "password": 'Password:',
+    "db_name": 'Database name:',
+    "test_connection": 'Test Connection',
+    "connection_success": 'Connection Successful',
+    "connection_failed": 'Connection Failed',
+    "missing_dependency": 'Missing Dependency',
+    "pymysql_required": 'pymysql is not installed. Please run:\npip install pymysql',
+    "save_anyway": '{message}\n\nSave settings anyway?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'Database profile:',
+    "add_profile": 'Add',
+    "delete_profile": 'Delete',
+    "profile_name": 'Profile name',
+    "enter_profile_name": 'Enter new profile name:',
+    "profile_exists": 'Profile name already exists',
+    "cannot_delete_active": 'Cannot delete the active profile',
+    "confirm_delete_profile": 'Delete profile "{name}"?',
+
+    # 提示消息 Messages
+    "need_restart": 'Restart Required',
+    "restart_msg": 'Settings have changed. Please restart the application for changes to take effect.',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'Filter & Storage',
+    "content_filter": 'Content Filter',
+    "save_text": 'Save text',
+    "save_images": 'Save images',
+    "max_text_length": 'Max text length:',
+    "max_image_size": 'Max image size:',
+    "unlimited": 'Unlimited',
+    "characters": 'chars',
+    "storage_management": 'Storage Management',
+    "max_items": 'Max items:',
+    "retention_days": 'Auto-cleanup days:',
+    "never_cleanup": 'Never',
+    "archive_after_days": 'Archive items after:',
+    "never_archive": 'Never',
+    "days": 'days',
+    "poll_interval": 'Poll interval:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'Plugins',
+    "installed_plugins": 'Installed Plugins',
+    "open_plugins_dir": 'Open Plugins Folder',
+    "reload_plugins": 'Reload',
+    "view_plugin_logs": 'View Logs',
+    "plugin_dev_docs": 'Dev Docs',
+    "plugin_settings": 'Settings',
+    "plugin_enabled": 'Enabled',
+    "plugin_disabled": 'Disabled',
+    "plugin_missing_deps": 'Missing dependencies: {deps}',
+    "plugin_incompatible": 'Incompatible version',
+    "plugin_error": 'Load failed',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} running... {percent}%',
+    "plugin_timeout": 'Plugin execution timed out',
+    "plugin_busy": 'A plugin is already running, please wait',
+    "plugin_not_loaded": 'Plugin not loaded: {id}',
+    "plugin_exec_failed": 'Execution failed',
+    "plugin_config_title": '{name} - Settings',
+    "plugin_config_required": 'Please fill in required fields',
+    "plugin_save": 'Save',
+    "plugin_cancel": 'Cancel',
+    "plugin_saved_entry": 'Saved as new entry',
+    "plugin_replaced_entry": 'Content replaced',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'Network access',
+    "plugin_perm_file_read": 'File read',
+    "plugin_perm_file_write": 'File write',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'Plugin Store',
+    "plugin_install": 'Install',
+    "plugin_uninstall": 'Uninstall',
+    "plugin_installing": 'Installing...',
+    "plugin_installed_tag": 'Installed',
+    "plugin_install_failed": 'Installation Failed',
+    "plugin_uninstall_confirm_title": 'Confirm Uninstall',
+    "plugin_uninstall_confirm": 'Are you sure you want to uninstall "{name}"?',
+    "plugin_uninstall_failed": 'Uninstall failed',
+    "plugin_store_loading": 'Loading plugin list...',
+    "plugin_store_empty": 'No plugins available',
+    "plugin_store_error": 'Failed to load plugin list',
+    "plugin_no_installed": 'No plugins installed',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": 'Confirm Delete',
+    "delete_confirm_msg": 'Are you sure you want to delete this item?',
+    "image": '[Image]',
+    "from_device": 'From: {device}',
+
+    # 图片保存 Image save
+    "save_image": 'Save Image',
+    "image_load_failed": 'Failed to load image data',
+    "save_failed": 'Save failed: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": 'Migrate Data',
+    "migrate_data_confirm": 'Migrate existing data to the new database?',
+    "migrating": 'Migrating data...',
+    "migration_complete": 'Migration complete. {count} items migrated.',
+    "migration_failed": 'Migration failed: {error}',
+
+    # 关于 About
+    "about": 'About',
+    "about_description": 'A cross-device clipboard history management and sync tool',
+    "official_website": 'Official Website:',
+    "github_repo": 'GitHub Repository:',
+    "download_page": 'Download:',
+}
@@ -0,0 +1,191 @@
+"""i18n 字符串 - Español / Spanish。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": 'Portapapeles Compartido',
+    "settings": 'Configuración',
+    "ok": 'Aceptar',
+    "cancel": 'Cancelar',
+    "yes": 'Sí',
+    "no": 'No',
+    "confirm": 'Confirmar',
+    "error": 'Error',
+    "warning": 'Advertencia',
+    "info": 'Información',
+    "success": 'Éxito',
+
+    # 主窗口 Main window
+    "search_placeholder": 'Buscar en portapapeles...',
+    "pin_window": 'Fijar ventana',
+    "unpin_window": 'Desfijar ventana',
+    "minimize": 'Minimizar',
+    "quit_app": 'Salir',
+    "prev_page": '◀ Anterior',
+    "next_page": 'Siguiente ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'Mostrar ventana',
+    "quit": 'Salir',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'Copiado al portapapeles ✓',
+    "copy_failed": 'Error al copiar',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'Solo favoritos',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'Copiar',
+    "ctx_star": 'Favorito',
+    "ctx_unstar": 'Quitar favorito',
+    "ctx_delete": 'Eliminar',
+    "refresh": 'Actualizar',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": 'General',
+    "database": 'Base de datos',
+    "dock_position": 'Posición de acoplamiento:',
+    "dock_right": 'Derecha',
+    "dock_left": 'Izquierda',
+    "dock_top": 'Arriba',
+    "dock_bottom": 'Abajo',
+    "global_hotkey": 'Tecla de acceso rápido:',
+    "hotkey_placeholder": 'ej.: <cmd>+v',
+    "hotkey_help": 'Formato de teclas:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Ejemplos: <cmd>+v, <ctrl>+<shift>+c',
+    "language": 'Idioma:',
+
+    # 数据库设置 Database settings
+    "db_type": 'Tipo de base de datos:',
+    "db_sqlite": 'SQLite (Archivo local)',
+    "db_mysql": 'MySQL (Base de datos en red)',
+    "sqlite_config": 'Configuración SQLite',
+    "mysql_config": 'Configuración MySQL',
+    "db_path": 'Ruta de base de datos:',
+    "path_placeholder": 'Ingrese ruta o haga clic en Examinar...',
+    "browse": 'Examinar...',
+    "select_db_file": 'Seleccionar ubicación del archivo de base de datos',
+    "host": 'Host:',
+    "port": 'Puerto:',
+    "username": 'Usuario:',
+    "password": 'Contraseña:',
+    "db_name": 'Nombre de base de datos:',
+    "test_connection": 'Probar conexión',
+    "connection_success": 'Conexión exitosa',
+    "connection_failed": 'Conexión fallida',
+    "missing_dependency": 'Dependencia faltante',
+    "pymysql_required": 'pymysql no está instalado.\nEjecute: pip install pymysql',
+    "save_anyway": '{message}\n\n¿Guardar configuración de todos modos?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'Perfil de base de datos:',
+    "add_profile": 'Agregar',
+    "delete_profile": 'Eliminar',
+    "profile_name": 'Nombre del perfil',
+    "enter_profile_name": 'Ingrese el nombre del nuevo perfil:',
+    "profile_exists": 'El nombre del perfil ya existe',
+    "cannot_delete_active": 'No se puede eliminar el perfil activo',
+    "confirm_delete_profile": '¿Eliminar el perfil "{name}"?',
+
+    # 提示消息 Messages
+    "need_restart": 'Reinicio requerido',
+    "restart_msg": 'La configuración ha cambiado. Reinicie la aplicación para que los cambios surtan efecto.',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'Filtro y almacenamiento',
+    "content_filter": 'Filtro de contenido',
+    "save_text": 'Guardar texto',
+    "save_images": 'Guardar imágenes',
+    "max_text_length": 'Longitud máx. de texto:',
+    "max_image_size": 'Tamaño máx. de imagen:',
+    "unlimited": 'Sin límite',
+    "characters": 'caracteres',
+    "storage_management": 'Gestión de almacenamiento',
+    "max_items": 'Máx. elementos:',
+    "retention_days": 'Días de limpieza automática:',
+    "never_cleanup": 'Nunca',
+    "archive_after_days": 'Archivar después de:',
+    "never_archive": 'Nunca',
+    "days": 'días',
+    "poll_interval": 'Intervalo de sondeo:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'Plugins',
+    "installed_plugins": 'Plugins instalados',
+    "open_plugins_dir": 'Abrir carpeta de plugins',
+    "reload_plugins": 'Recargar',
+    "view_plugin_logs": 'Ver registros',
+    "plugin_dev_docs": 'Docs de desarrollo',
+    "plugin_settings": 'Configuración',
+    "plugin_enabled": 'Habilitado',
+    "plugin_disabled": 'Deshabilitado',
+    "plugin_missing_deps": 'Dependencias faltantes: {deps}',
+    "plugin_incompatible": 'Versión incompatible',
+    "plugin_error": 'Error de carga',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} ejecutando... {percent}%',
+    "plugin_timeout": 'Tiempo de espera del plugin agotado',
+    "plugin_busy": 'Un plugin se está ejecutando, por favor espere',
+    "plugin_not_loaded": 'Plugin no cargado: {id}',
+    "plugin_exec_failed": 'Error de ejecución',
+    "plugin_config_title": '{name} - Configuración',
+    "plugin_config_required": 'Complete los campos obligatorios',
+    "plugin_save": 'Guardar',
+    "plugin_cancel": 'Cancelar',
+    "plugin_saved_entry": 'Guardado como nueva entrada',
+    "plugin_replaced_entry": 'Contenido reemplazado',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'Acceso a red',
+    "plugin_perm_file_read": 'Lectura de archivos',
+    "plugin_perm_file_write": 'Escritura de archivos',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'Tienda de plugins',
+    "plugin_install": 'Instalar',
+    "plugin_uninstall": 'Desinstalar',
+    "plugin_installing": 'Instalando...',
+    "plugin_installed_tag": 'Instalado',
+    "plugin_install_failed": 'Error de instalación',
+    "plugin_uninstall_confirm_title": 'Confirmar desinstalación',
+    "plugin_uninstall_confirm": '¿Está seguro de que desea desinstalar "{name}"?',
+    "plugin_uninstall_failed": 'Error al desinstalar',
+    "plugin_store_loading": 'Cargando lista de plugins...',
+    "plugin_store_empty": 'No hay plugins disponibles',
+    "plugin_store_error": 'Error al cargar la lista de plugins',
+    "plugin_no_installed": 'No hay plugins instalados',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": 'Confirmar eliminación',
+    "delete_confirm_msg": '¿Está seguro de que desea eliminar este elemento?',
+    "image": '[Imagen]',
+    "from_device": 'Desde: {device}',
+
+    # 图片保存 Image save
+    "save_image": 'Guardar imagen',
+    "image_load_failed": 'No se pudieron cargar los datos de la imagen',
+    "save_failed": 'Error al guardar: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": 'Migrar datos',
+    "migrate_data_confirm": '¿Migrar los datos existentes a la nueva base de datos?',
+    "migrating": 'Migrando datos...',
+    "migration_complete": 'Migración completada. {count} elementos migrados.',
+    "migration_failed": 'Error en la migración: {error}',
+
+    # 关于 About
+    "about": 'Acerca de',
+    "about_description": 'Herramienta de gestión y sincronización del historial del portapapeles entre dispositivos',
+    "official_website": 'Sitio web oficial:',
+    "github_repo": 'Repositorio GitHub:',
+    "download_page": 'Descargar:',
+}
@@ -0,0 +1,191 @@
+"""i18n 字符串 - Français / French。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": 'Presse-papiers Partagé',
+    "settings": 'Paramètres',
+    "ok": 'OK',
+    "cancel": 'Annuler',
+    "yes": 'Oui',
+    "no": 'Non',
+    "confirm": 'Confirmer',
+    "error": 'Erreur',
+    "warning": 'Avertissement',
+    "info": 'Information',
+    "success": 'Succès',
+
+    # 主窗口 Main window
+    "search_placeholder": 'Rechercher dans le presse-papiers...',
+    "pin_window": 'Épingler la fenêtre',
+    "unpin_window": 'Désépingler la fenêtre',
+    "minimize": 'Réduire',
+    "quit_app": 'Quitter',
+    "prev_page": '◀ Précédent',
+    "next_page": 'Suivant ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'Afficher la fenêtre',
+    "quit": 'Quitter',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'Copié dans le presse-papiers ✓',
+    "copy_failed": 'Échec de la copie',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'Favoris uniquement',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'Copier',
+    "ctx_star": 'Favori',
+    "ctx_unstar": 'Retirer des favoris',
+    "ctx_delete": 'Supprimer',
+    "refresh": 'Actualiser',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": 'Général',
+    "database": 'Base de données',
+    "dock_position": "Position d'ancrage:",
+    "dock_right": 'Droite',
+    "dock_left": 'Gauche',
+    "dock_top": 'Haut',
+    "dock_bottom": 'Bas',
+    "global_hotkey": 'Raccourci global:',
+    "hotkey_placeholder": 'ex: <cmd>+v',
+    "hotkey_help": 'Format des raccourcis:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Exemples: <cmd>+v, <ctrl>+<shift>+c',
+    "language": 'Langue:',
+
+    # 数据库设置 Database settings
+    "db_type": 'Type de base de données:',
+    "db_sqlite": 'SQLite (Fichier local)',
+    "db_mysql": 'MySQL (Base de données réseau)',
+    "sqlite_config": 'Configuration SQLite',
+    "mysql_config": 'Configuration MySQL',
+    "db_path": 'Chemin de la base de données:',
+    "path_placeholder": 'Entrez le chemin ou cliquez sur Parcourir...',
+    "browse": 'Parcourir...',
+    "select_db_file": "Sélectionner l'emplacement du fichier de base de données",
+    "host": 'Hôte:',
+    "port": 'Port:',
+    "username": 'Utilisateur:',
+    "password": 'Mot de passe:',
+    "db_name": 'Nom de la base de données:',
+    "test_connection": 'Tester la connexion',
+    "connection_success": 'Connexion réussie',
+    "connection_failed": 'Connexion échouée',
+    "missing_dependency": 'Dépendance manquante',
+    "pymysql_required": "pymysql n'est pas installé.\nExécutez: pip install pymysql",
+    "save_anyway": '{message}\n\nEnregistrer les paramètres quand même?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'Profil de base de données:',
+    "add_profile": 'Ajouter',
+    "delete_profile": 'Supprimer',
+    "profile_name": 'Nom du profil',
+    "enter_profile_name": 'Entrez le nom du nouveau profil:',
+    "profile_exists": 'Le nom du profil existe déjà',
+    "cannot_delete_active": 'Impossible de supprimer le profil actif',
+    "confirm_delete_profile": 'Supprimer le profil "{name}"?',
+
+    # 提示消息 Messages
+    "need_restart": 'Redémarrage requis',
+    "restart_msg": "Les paramètres ont été modifiés. Veuillez redémarrer l'application pour que les modifications prennent effet.",
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'Filtre et stockage',
+    "content_filter": 'Filtre de contenu',
+    "save_text": 'Enregistrer le texte',
+    "save_images": 'Enregistrer les images',
+    "max_text_length": 'Longueur max. du texte:',
+    "max_image_size": "Taille max. de l'image:",
+    "unlimited": 'Illimité',
+    "characters": 'caractères',
+    "storage_management": 'Gestion du stockage',
+    "max_items": "Nombre max. d'éléments:",
+    "retention_days": 'Jours de nettoyage auto:',
+    "never_cleanup": 'Jamais',
+    "archive_after_days": 'Archiver après :',
+    "never_archive": 'Jamais',
+    "days": 'jours',
+    "poll_interval": 'Intervalle de sondage:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'Plugins',
+    "installed_plugins": 'Plugins installés',
+    "open_plugins_dir": 'Ouvrir le dossier des plugins',
+    "reload_plugins": 'Recharger',
+    "view_plugin_logs": 'Voir les journaux',
+    "plugin_dev_docs": 'Docs de développement',
+    "plugin_settings": 'Paramètres',
+    "plugin_enabled": 'Activé',
+    "plugin_disabled": 'Désactivé',
+    "plugin_missing_deps": 'Dépendances manquantes : {deps}',
+    "plugin_incompatible": 'Version incompatible',
+    "plugin_error": 'Échec du chargement',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} en cours... {percent}%',
+    "plugin_timeout": "Délai d'exécution du plugin dépassé",
+    "plugin_busy": "Un plugin est en cours d'exécution, veuillez patienter",
+    "plugin_not_loaded": 'Plugin non chargé : {id}',
+    "plugin_exec_failed": "Échec de l'exécution",
+    "plugin_config_title": '{name} - Paramètres',
+    "plugin_config_required": 'Veuillez remplir les champs obligatoires',
+    "plugin_save": 'Enregistrer',
+    "plugin_cancel": 'Annuler',
+    "plugin_saved_entry": 'Enregistré comme nouvelle entrée',
+    "plugin_replaced_entry": 'Contenu remplacé',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'Accès réseau',
+    "plugin_perm_file_read": 'Lecture de fichiers',
+    "plugin_perm_file_write": 'Écriture de fichiers',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'Boutique de plugins',
+    "plugin_install": 'Installer',
+    "plugin_uninstall": 'Désinstaller',
+    "plugin_installing": 'Installation...',
+    "plugin_installed_tag": 'Installé',
+    "plugin_install_failed": "Échec de l'installation",
+    "plugin_uninstall_confirm_title": 'Confirmer la désinstallation',
+    "plugin_uninstall_confirm": 'Êtes-vous sûr de vouloir désinstaller "{name}" ?',
+    "plugin_uninstall_failed": 'Échec de la désinstallation',
+    "plugin_store_loading": 'Chargement de la liste des plugins...',
+    "plugin_store_empty": 'Aucun plugin disponible',
+    "plugin_store_error": 'Impossible de charger la liste des plugins',
+    "plugin_no_installed": 'Aucun plugin installé',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": 'Confirmer la suppression',
+    "delete_confirm_msg": 'Êtes-vous sûr de vouloir supprimer cet élément?',
+    "image": '[Image]',
+    "from_device": 'De: {device}',
+
+    # 图片保存 Image save
+    "save_image": "Enregistrer l'image",
+    "image_load_failed": "Impossible de charger les données de l'image",
+    "save_failed": "Échec de l'enregistrement: {error}",
+
+    # 数据迁移 Data migration
+    "migrate_data": 'Migrer les données',
+    "migrate_data_confirm": 'Migrer les données existantes vers la nouvelle base de données?',
+    "migrating": 'Migration des données en cours...',
+    "migration_complete": 'Migration terminée. {count} éléments migrés.',
+    "migration_failed": 'Échec de la migration: {error}',
+
+    # 关于 About
+    "about": 'À propos',
+    "about_description": "Outil de gestion et de synchronisation de l'historique du presse-papiers entre appareils",
+    "official_website": 'Site officiel:',
+    "github_repo": 'Dépôt GitHub:',
+    "download_page": 'Télécharger:',
+}
@@ -0,0 +1,191 @@
+"""i18n 字符串 - 日本語 / Japanese。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": '共有クリップボード',
+    "settings": '設定',
+    "ok": 'OK',
+    "cancel": 'キャンセル',
+    "yes": 'はい',
+    "no": 'いいえ',
+    "confirm": '確認',
+    "error": 'エラー',
+    "warning": '警告',
+    "info": '情報',
+    "success": '成功',
+
+    # 主窗口 Main window
+    "search_placeholder": 'クリップボードを検索...',
+    "pin_window": 'ウィンドウを固定',
+    "unpin_window": '固定を解除',
+    "minimize": '最小化',
+    "quit_app": '終了',
+    "prev_page": '◀ 前へ',
+    "next_page": '次へ ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'ウィンドウを表示',
+    "quit": '終了',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'クリップボードにコピーしました ✓',
+    "copy_failed": 'コピーに失敗しました',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'スター付きのみ',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'コピー',
+    "ctx_star": 'お気に入り',
+    "ctx_unstar": 'お気に入り解除',
+    "ctx_delete": '削除',
+    "refresh": '更新',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": '一般',
+    "database": 'データベース',
+    "dock_position": 'ドック位置:',
+    "dock_right": '右',
+    "dock_left": '左',
+    "dock_top": '上',
+    "dock_bottom": '下',
+    "global_hotkey": 'グローバルホットキー:',
+    "hotkey_placeholder": '例: <cmd>+v',
+    "hotkey_help": 'ホットキーの形式:\n• <cmd> = Winキー(Windows) / Cmdキー(macOS)\n• <ctrl> = Ctrlキー\n• <alt> = Altキー\n• <shift> = Shiftキー\n• 例: <cmd>+v, <ctrl>+<shift>+c',
+    "language": '言語:',
+
+    # 数据库设置 Database settings
+    "db_type": 'データベースタイプ:',
+    "db_sqlite": 'SQLite (ローカルファイル)',
+    "db_mysql": 'MySQL (ネットワークデータベース)',
+    "sqlite_config": 'SQLite 設定',
+    "mysql_config": 'MySQL 設定',
+    "db_path": 'データベースパス:',
+    "path_placeholder": 'パスを入力または参照...',
+    "browse": '参照...',
+    "select_db_file": 'データベースファイルの場所を選択',
+    "host": 'ホスト:',
+    "port": 'ポート:',
+    "username": 'ユーザー名:',
+    "password": 'パスワード:',
+    "db_name": 'データベース名:',
+    "test_connection": '接続テスト',
+    "connection_success": '接続成功',
+    "connection_failed": '接続失敗',
+    "missing_dependency": '依存関係が不足',
+    "pymysql_required": 'pymysqlがインストールされていません。\n実行してください: pip install pymysql',
+    "save_anyway": '{message}\n\n設定を保存しますか？',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'データベースプロファイル:',
+    "add_profile": '追加',
+    "delete_profile": '削除',
+    "profile_name": 'プロファイル名',
+    "enter_profile_name": '新しいプロファイル名を入力してください:',
+    "profile_exists": 'プロファイル名は既に存在します',
+    "cannot_delete_active": '使用中のプロファイルは削除できません',
+    "confirm_delete_profile": 'プロファイル "{name}" を削除しますか？',
+
+    # 提示消息 Messages
+    "need_restart": '再起動が必要',
+    "restart_msg": '設定が変更されました。変更を反映するにはアプリケーションを再起動してください。',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'フィルタとストレージ',
+    "content_filter": 'コンテンツフィルタ',
+    "save_text": 'テキストを保存',
+    "save_images": '画像を保存',
+    "max_text_length": '最大テキスト長:',
+    "max_image_size": '最大画像サイズ:',
+    "unlimited": '無制限',
+    "characters": '文字',
+    "storage_management": 'ストレージ管理',
+    "max_items": '最大アイテム数:',
+    "retention_days": '自動クリーンアップ日数:',
+    "never_cleanup": 'クリーンアップしない',
+    "archive_after_days": 'アーカイブまでの日数:',
+    "never_archive": 'アーカイブしない',
+    "days": '日',
+    "poll_interval": 'ポーリング間隔:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'プラグイン',
+    "installed_plugins": 'インストール済みプラグイン',
+    "open_plugins_dir": 'プラグインフォルダを開く',
+    "reload_plugins": '再読み込み',
+    "view_plugin_logs": 'ログを見る',
+    "plugin_dev_docs": '開発ドキュメント',
+    "plugin_settings": '設定',
+    "plugin_enabled": '有効',
+    "plugin_disabled": '無効',
+    "plugin_missing_deps": '依存関係不足: {deps}',
+    "plugin_incompatible": 'バージョン非互換',
+    "plugin_error": '読み込み失敗',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} 実行中... {percent}%',
+    "plugin_timeout": 'プラグインがタイムアウトしました',
+    "plugin_busy": 'プラグインが実行中です。お待ちください',
+    "plugin_not_loaded": 'プラグインが読み込まれていません: {id}',
+    "plugin_exec_failed": '実行に失敗しました',
+    "plugin_config_title": '{name} - 設定',
+    "plugin_config_required": '必須項目を入力してください',
+    "plugin_save": '保存',
+    "plugin_cancel": 'キャンセル',
+    "plugin_saved_entry": '新しいエントリとして保存しました',
+    "plugin_replaced_entry": '内容を置換しました',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'ネットワークアクセス',
+    "plugin_perm_file_read": 'ファイル読み取り',
+    "plugin_perm_file_write": 'ファイル書き込み',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'プラグインストア',
+    "plugin_install": 'インストール',
+    "plugin_uninstall": 'アンインストール',
+    "plugin_installing": 'インストール中...',
+    "plugin_installed_tag": 'インストール済み',
+    "plugin_install_failed": 'インストール失敗',
+    "plugin_uninstall_confirm_title": 'アンインストールの確認',
+    "plugin_uninstall_confirm": 'プラグイン「{name}」をアンインストールしますか？',
+    "plugin_uninstall_failed": 'アンインストール失敗',
+    "plugin_store_loading": 'プラグインリストを読み込み中...',
+    "plugin_store_empty": '利用可能なプラグインはありません',
+    "plugin_store_error": 'プラグインリストの読み込みに失敗しました',
+    "plugin_no_installed": 'インストール済みプラグインはありません',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": '削除の確認',
+    "delete_confirm_msg": 'このアイテムを削除してもよろしいですか？',
+    "image": '[画像]',
+    "from_device": '送信元: {device}',
+
+    # 图片保存 Image save
+    "save_image": '画像を保存',
+    "image_load_failed": '画像データの読み込みに失敗しました',
+    "save_failed": '保存に失敗しました: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": 'データ移行',
+    "migrate_data_confirm": '既存のデータを新しいデータベースに移行しますか？',
+    "migrating": 'データを移行中...',
+    "migration_complete": '移行完了。{count} 件のアイテムを移行しました。',
+    "migration_failed": '移行に失敗しました: {error}',
+
+    # 关于 About
+    "about": 'について',
+    "about_description": 'クロスデバイスのクリップボード履歴管理と同期ツール',
+    "official_website": '公式サイト:',
+    "github_repo": 'GitHub リポジトリ:',
+    "download_page": 'ダウンロード:',
+}
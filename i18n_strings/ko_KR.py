@@ -0,0 +1,191 @@
+"""i18n 字符串 - 한국어 / Korean。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": '공유 클립보드',
+    "settings": '설정',
+    "ok": '확인',
+    "cancel": '취소',
+    "yes": '예',
+    "no": '아니오',
+    "confirm": '확인',
+    "error": '오류',
+    "warning": '경고',
+    "info": '정보',
+    "success": '성공',
+
+    # 主窗口 Main window
+    "search_placeholder": '클립보드 검색...',
+    "pin_window": '창 고정',
+    "unpin_window": '고정 해제',
+    "minimize": '최소화',
+    "quit_app": '종료',
+    "prev_page": '◀ 이전',
+    "next_page": '다음 ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": '창 표시',
+    "quit": '종료',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": '클립보드에 복사됨 ✓',
+    "copy_failed": '복사 실패',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": '즐겨찾기만',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": '복사',
+    "ctx_star": '즐겨찾기',
+    "ctx_unstar": '즐겨찾기 해제',
+    "ctx_delete": '삭제',
+    "refresh": '새로고침',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": '일반',
+    "database": '데이터베이스',
+    "dock_position": '도킹 위치:',
+    "dock_right": '오른쪽',
+    "dock_left": '왼쪽',
+    "dock_top": '위',
+    "dock_bottom": '아래',
+    "global_hotkey": '전역 단축키:',
+    "hotkey_placeholder": '예: <cmd>+v',
+    "hotkey_help": '단축키 형식:\n• <cmd> = Win키(Windows) / Cmd키(macOS)\n• <ctrl> = Ctrl키\n• <alt> = Alt키\n• <shift> = Shift키\n• 예: <cmd>+v, <ctrl>+<shift>+c',
+    "language": '언어:',
+
+    # 数据库设置 Database settings
+    "db_type": '데이터베이스 유형:',
+    "db_sqlite": 'SQLite (로컬 파일)',
+    "db_mysql": 'MySQL (네트워크 데이터베이스)',
+    "sqlite_config": 'SQLite 설정',
+    "mysql_config": 'MySQL 설정',
+    "db_path": '데이터베이스 경로:',
+    "path_placeholder": '경로 입력 또는 찾아보기...',
+    "browse": '찾아보기...',
+    "select_db_file": '데이터베이스 파일 위치 선택',
+    "host": '호스트:',
+    "port": '포트:',
+    "username": '사용자 이름:',
+    "password": '비밀번호:',
+    "db_name": '데이터베이스 이름:',
+    "test_connection": '연결 테스트',
+    "connection_success": '연결 성공',
+    "connection_failed": '연결 실패',
+    "missing_dependency": '종속성 누락',
+    "pymysql_required": 'pymysql이 설치되지 않았습니다.\n실행하세요: pip install pymysql',
+    "save_anyway": '{message}\n\n설정을 저장하시겠습니까?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": '데이터베이스 프로필:',
+    "add_profile": '추가',
+    "delete_profile": '삭제',
+    "profile_name": '프로필 이름',
+    "enter_profile_name": '새 프로필 이름을 입력하세요:',
+    "profile_exists": '프로필 이름이 이미 존재합니다',
+    "cannot_delete_active": '사용 중인 프로필은 삭제할 수 없습니다',
+    "confirm_delete_profile": '프로필 "{name}"을(를) 삭제하시겠습니까?',
+
+    # 提示消息 Messages
+    "need_restart": '재시작 필요',
+    "restart_msg": '설정이 변경되었습니다. 변경 사항을 적용하려면 응용 프로그램을 다시 시작하세요.',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": '필터 및 저장소',
+    "content_filter": '콘텐츠 필터',
+    "save_text": '텍스트 저장',
+    "save_images": '이미지 저장',
+    "max_text_length": '최대 텍스트 길이:',
+    "max_image_size": '최대 이미지 크기:',
+    "unlimited": '무제한',
+    "characters": '자',
+    "storage_management": '저장소 관리',
+    "max_items": '최대 항목 수:',
+    "retention_days": '자동 정리 일수:',
+    "never_cleanup": '정리 안 함',
+    "archive_after_days": '보관 처리 일수:',
+    "never_archive": '보관 안 함',
+    "days": '일',
+    "poll_interval": '폴링 간격:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": '플러그인',
+    "installed_plugins": '설치된 플러그인',
+    "open_plugins_dir": '플러그인 폴더 열기',
+    "reload_plugins": '다시 로드',
+    "view_plugin_logs": '로그 보기',
+    "plugin_dev_docs": '개발 문서',
+    "plugin_settings": '설정',
+    "plugin_enabled": '활성화됨',
+    "plugin_disabled": '비활성화됨',
+    "plugin_missing_deps": '누락된 종속성: {deps}',
+    "plugin_incompatible": '호환되지 않는 버전',
+    "plugin_error": '로드 실패',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} 실행 중... {percent}%',
+    "plugin_timeout": '플러그인 실행 시간 초과',
+    "plugin_busy": '플러그인이 실행 중입니다. 기다려 주세요',
+    "plugin_not_loaded": '플러그인이 로드되지 않았습니다: {id}',
+    "plugin_exec_failed": '실행 실패',
+    "plugin_config_title": '{name} - 설정',
+    "plugin_config_required": '필수 항목을 입력하세요',
+    "plugin_save": '저장',
+    "plugin_cancel": '취소',
+    "plugin_saved_entry": '새 항목으로 저장됨',
+    "plugin_replaced_entry": '내용이 교체됨',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": '네트워크 액세스',
+    "plugin_perm_file_read": '파일 읽기',
+    "plugin_perm_file_write": '파일 쓰기',
+
+    # 插件商店 Plugin store
+    "plugin_store": '플러그인 스토어',
+    "plugin_install": '설치',
+    "plugin_uninstall": '제거',
+    "plugin_installing": '설치 중...',
+    "plugin_installed_tag": '설치됨',
+    "plugin_install_failed": '설치 실패',
+    "plugin_uninstall_confirm_title": '제거 확인',
+    "plugin_uninstall_confirm": '플러그인 "{name}"을(를) 제거하시겠습니까?',
+    "plugin_uninstall_failed": '제거 실패',
+    "plugin_store_loading": '플러그인 목록 로딩 중...',
+    "plugin_store_empty": '사용 가능한 플러그인이 없습니다',
+    "plugin_store_error": '플러그인 목록을 불러오지 못했습니다',
+    "plugin_no_installed": '설치된 플러그인이 없습니다',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": '삭제 확인',
+    "delete_confirm_msg": '이 항목을 삭제하시겠습니까?',
+    "image": '[이미지]',
+    "from_device": '보낸 기기: {device}',
+
+    # 图片保存 Image save
+    "save_image": '이미지 저장',
+    "image_load_failed": '이미지 데이터를 불러올 수 없습니다',
+    "save_failed": '저장 실패: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": '데이터 마이그레이션',
+    "migrate_data_confirm": '기존 데이터를 새 데이터베이스로 마이그레이션하시겠습니까?',
+    "migrating": '데이터 마이그레이션 중...',
+    "migration_complete": '마이그레이션 완료. {count}개 항목이 마이그레이션되었습니다.',
+    "migration_failed": '마이그레이션 실패: {error}',
+
+    # 关于 About
+    "about": '정보',
+    "about_description": '크로스 디바이스 클립보드 기록 관리 및 동기화 도구',
+    "official_website": '공식 웹사이트:',
+    "github_repo": 'GitHub 저장소:',
+    "download_page": '다운로드:',
+}
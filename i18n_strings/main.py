@@ -1,358 +0,0 @@
-"""i18n 字符串 - main 领域。
-
-主界面字符串:通用文案、主窗口、托盘菜单、复制反馈、收藏筛选、上下文菜单。
-"""
-
-STRINGS = {
-    # ========== 简体中文 / Simplified Chinese ==========
-    "zh_CN": {
-        # 通用 General
-        "app_name": '共享剪贴板',
-        "settings": '设置',
-        "ok": '确定',
-        "cancel": '取消',
-        "yes": '是',
-        "no": '否',
-        "confirm": '确认',
-        "error": '错误',
-        "warning": '警告',
-        "info": '信息',
-        "success": '成功',
-
-        # 主窗口 Main window
-        "search_placeholder": '搜索剪贴板...',
-        "pin_window": '固定窗口',
-        "unpin_window": '取消固定',
-        "minimize": '最小化',
-        "quit_app": '退出应用',
-        "prev_page": '◀ 上一页',
-        "next_page": '下一页 ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": '显示窗口',
-        "quit": '退出',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": '已复制到剪贴板 ✓',
-        "copy_failed": '复制失败',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": '只看收藏',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": '复制',
-        "ctx_star": '收藏',
-        "ctx_unstar": '取消收藏',
-        "ctx_delete": '删除',
-        "refresh": '刷新',
-    },
-
-    # ========== English ==========
-    "en_US": {
-        # 通用 General
-        "app_name": 'Shared Clipboard',
-        "settings": 'Settings',
-        "ok": 'OK',
-        "cancel": 'Cancel',
-        "yes": 'Yes',
-        "no": 'No',
-        "confirm": 'Confirm',
-        "error": 'Error',
-        "warning": 'Warning',
-        "info": 'Information',
-        "success": 'Success',
-
-        # 主窗口 Main window
-        "search_placeholder": 'Search clipboard...',
-        "pin_window": 'Pin window',
-        "unpin_window": 'Unpin window',
-        "minimize": 'Minimize',
-        "quit_app": 'Quit',
-        "prev_page": '◀ Previous',
-        "next_page": 'Next ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'Show Window',
-        "quit": 'Quit',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'Copied to clipboard ✓',
-        "copy_failed": 'Copy failed',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'Starred only',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'Copy',
-        "ctx_star": 'Star',
-        "ctx_unstar": 'Unstar',
-        "ctx_delete": 'Delete',
-        "refresh": 'Refresh',
-    },
-
-    # ========== 日本語 / Japanese ==========
-    "ja_JP": {
-        # 通用 General
-        "app_name": '共有クリップボード',
-        "settings": '設定',
-        "ok": 'OK',
-        "cancel": 'キャンセル',
-        "yes": 'はい',
-        "no": 'いいえ',
-        "confirm": '確認',
-        "error": 'エラー',
-        "warning": '警告',
-        "info": '情報',
-        "success": '成功',
-
-        # 主窗口 Main window
-        "search_placeholder": 'クリップボードを検索...',
-        "pin_window": 'ウィンドウを固定',
-        "unpin_window": '固定を解除',
-        "minimize": '最小化',
-        "quit_app": '終了',
-        "prev_page": '◀ 前へ',
-        "next_page": '次へ ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'ウィンドウを表示',
-        "quit": '終了',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'クリップボードにコピーしました ✓',
-        "copy_failed": 'コピーに失敗しました',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'スター付きのみ',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'コピー',
-        "ctx_star": 'お気に入り',
-        "ctx_unstar": 'お気に入り解除',
-        "ctx_delete": '削除',
-        "refresh": '更新',
-    },
-
-    # ========== 한국어 / Korean ==========
-    "ko_KR": {
-        # 通用 General
-        "app_name": '공유 클립보드',
-        "settings": '설정',
-        "ok": '확인',
-        "cancel": '취소',
-        "yes": '예',
-        "no": '아니오',
-        "confirm": '확인',
-        "error": '오류',
-        "warning": '경고',
-        "info": '정보',
-        "success": '성공',
-
-        # 主窗口 Main window
-        "search_placeholder": '클립보드 검색...',
-        "pin_window": '창 고정',
-        "unpin_window": '고정 해제',
-        "minimize": '최소화',
-        "quit_app": '종료',
-        "prev_page": '◀ 이전',
-        "next_page": '다음 ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": '창 표시',
-        "quit": '종료',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": '클립보드에 복사됨 ✓',
-        "copy_failed": '복사 실패',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": '즐겨찾기만',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": '복사',
-        "ctx_star": '즐겨찾기',
-        "ctx_unstar": '즐겨찾기 해제',
-        "ctx_delete": '삭제',
-        "refresh": '새로고침',
-    },
-
-    # ========== Español / Spanish ==========
-    "es_ES": {
-        # 通用 General
-        "app_name": 'Portapapeles Compartido',
-        "settings": 'Configuración',
-        "ok": 'Aceptar',
-        "cancel": 'Cancelar',
-        "yes": 'Sí',
-        "no": 'No',
-        "confirm": 'Confirmar',
-        "error": 'Error',
-        "warning": 'Advertencia',
-        "info": 'Información',
-        "success": 'Éxito',
-
-        # 主窗口 Main window
-        "search_placeholder": 'Buscar en portapapeles...',
-        "pin_window": 'Fijar ventana',
-        "unpin_window": 'Desfijar ventana',
-        "minimize": 'Minimizar',
-        "quit_app": 'Salir',
-        "prev_page": '◀ Anterior',
-        "next_page": 'Siguiente ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'Mostrar ventana',
-        "quit": 'Salir',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'Copiado al portapapeles ✓',
-        "copy_failed": 'Error al copiar',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'Solo favoritos',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'Copiar',
-        "ctx_star": 'Favorito',
-        "ctx_unstar": 'Quitar favorito',
-        "ctx_delete": 'Eliminar',
-        "refresh": 'Actualizar',
-    },
-
-    # ========== Français / French ==========
-    "fr_FR": {
-        # 通用 General
-        "app_name": 'Presse-papiers Partagé',
-        "settings": 'Paramètres',
-        "ok": 'OK',
-        "cancel": 'Annuler',
-        "yes": 'Oui',
-        "no": 'Non',
-        "confirm": 'Confirmer',
-        "error": 'Erreur',
-        "warning": 'Avertissement',
-        "info": 'Information',
-        "success": 'Succès',
-
-        # 主窗口 Main window
-        "search_placeholder": 'Rechercher dans le presse-papiers...',
-        "pin_window": 'Épingler la fenêtre',
-        "unpin_window": 'Désépingler la fenêtre',
-        "minimize": 'Réduire',
-        "quit_app": 'Quitter',
-        "prev_page": '◀ Précédent',
-        "next_page": 'Suivant ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'Afficher la fenêtre',
-        "quit": 'Quitter',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'Copié dans le presse-papiers ✓',
-        "copy_failed": 'Échec de la copie',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'Favoris uniquement',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'Copier',
-        "ctx_star": 'Favori',
-        "ctx_unstar": 'Retirer des favoris',
-        "ctx_delete": 'Supprimer',
-        "refresh": 'Actualiser',
-    },
-
-    # ========== Deutsch / German ==========
-    "de_DE": {
-        # 通用 General
-        "app_name": 'Geteilte Zwischenablage',
-        "settings": 'Einstellungen',
-        "ok": 'OK',
-        "cancel": 'Abbrechen',
-        "yes": 'Ja',
-        "no": 'Nein',
-        "confirm": 'Bestätigen',
-        "error": 'Fehler',
-        "warning": 'Warnung',
-        "info": 'Information',
-        "success": 'Erfolg',
-
-        # 主窗口 Main window
-        "search_placeholder": 'Zwischenablage durchsuchen...',
-        "pin_window": 'Fenster anheften',
-        "unpin_window": 'Fenster lösen',
-        "minimize": 'Minimieren',
-        "quit_app": 'Beenden',
-        "prev_page": '◀ Zurück',
-        "next_page": 'Weiter ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'Fenster anzeigen',
-        "quit": 'Beenden',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'In Zwischenablage kopiert ✓',
-        "copy_failed": 'Kopieren fehlgeschlagen',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'Nur Favoriten',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'Kopieren',
-        "ctx_star": 'Favorit',
-        "ctx_unstar": 'Favorit entfernen',
-        "ctx_delete": 'Löschen',
-        "refresh": 'Aktualisieren',
-    },
-
-    # ========== Русский / Russian ==========
-    "ru_RU": {
-        # 通用 General
-        "app_name": 'Общий буфер обмена',
-        "settings": 'Настройки',
-        "ok": 'ОК',
-        "cancel": 'Отмена',
-        "yes": 'Да',
-        "no": 'Нет',
-        "confirm": 'Подтвердить',
-        "error": 'Ошибка',
-        "warning": 'Предупреждение',
-        "info": 'Информация',
-        "success": 'Успешно',
-
-        # 主窗口 Main window
-        "search_placeholder": 'Поиск в буфере обмена...',
-        "pin_window": 'Закрепить окно',
-        "unpin_window": 'Открепить окно',
-        "minimize": 'Свернуть',
-        "quit_app": 'Выход',
-        "prev_page": '◀ Назад',
-        "next_page": 'Далее ▶',
-        "page_info": '{current} / {total}',
-
-        # 托盘菜单 Tray menu
-        "show_window": 'Показать окно',
-        "quit": 'Выход',
-
-        # 复制反馈 Copy feedback
-        "copied_to_clipboard": 'Скопировано в буфер обмена ✓',
-        "copy_failed": 'Ошибка копирования',
-
-        # 收藏筛选 Star filter
-        "show_starred_only": 'Только избранное',
-
-        # 上下文菜单 Context menu
-        "ctx_copy": 'Копировать',
-        "ctx_star": 'В избранное',
-        "ctx_unstar": 'Из избранного',
-        "ctx_delete": 'Удалить',
-        "refresh": 'Обновить',
-    },
-}
@@ -0,0 +1,191 @@
+"""i18n 字符串 - Русский / Russian。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": 'Общий буфер обмена',
+    "settings": 'Настройки',
+    "ok": 'ОК',
+    "cancel": 'Отмена',
+    "yes": 'Да',
+    "no": 'Нет',
+    "confirm": 'Подтвердить',
+    "error": 'Ошибка',
+    "warning": 'Предупреждение',
+    "info": 'Информация',
+    "success": 'Успешно',
+
+    # 主窗口 Main window
+    "search_placeholder": 'Поиск в буфере обмена...',
+    "pin_window": 'Закрепить окно',
+    "unpin_window": 'Открепить окно',
+    "minimize": 'Свернуть',
+    "quit_app": 'Выход',
+    "prev_page": '◀ Назад',
+    "next_page": 'Далее ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": 'Показать окно',
+    "quit": 'Выход',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": 'Скопировано в буфер обмена ✓',
+    "copy_failed": 'Ошибка копирования',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": 'Только избранное',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": 'Копировать',
+    "ctx_star": 'В избранное',
+    "ctx_unstar": 'Из избранного',
+    "ctx_delete": 'Удалить',
+    "refresh": 'Обновить',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": 'Общие',
+    "database": 'База данных',
+    "dock_position": 'Позиция закрепления:',
+    "dock_right": 'Справа',
+    "dock_left": 'Слева',
+    "dock_top": 'Сверху',
+    "dock_bottom": 'Снизу',
+    "global_hotkey": 'Глобальная горячая клавиша:',
+    "hotkey_placeholder": 'напр.: <cmd>+v',
+    "hotkey_help": 'Формат горячих клавиш:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Примеры: <cmd>+v, <ctrl>+<shift>+c',
+    "language": 'Язык:',
+
+    # 数据库设置 Database settings
+    "db_type": 'Тип базы данных:',
+    "db_sqlite": 'SQLite (Локальный файл)',
+    "db_mysql": 'MySQL (Сетевая база данных)',
+    "sqlite_config": 'Настройки SQLite',
+    "mysql_config": 'Настройки MySQL',
+    "db_path": 'Путь к базе данных:',
+    "path_placeholder": 'Введите путь или нажмите Обзор...',
+    "browse": 'Обзор...',
+    "select_db_file": 'Выберите расположение файла базы данных',
+    "host": 'Хост:',
+    "port": 'Порт:',
+    "username": 'Имя пользователя:',
+    "password": 'Пароль:',
+    "db_name": 'Имя базы данных:',
+    "test_connection": 'Проверить соединение',
+    "connection_success": 'Соединение успешно',
+    "connection_failed": 'Соединение не удалось',
+    "missing_dependency": 'Отсутствует зависимость',
+    "pymysql_required": 'pymysql не установлен.\nВыполните: pip install pymysql',
+    "save_anyway": '{message}\n\nСохранить настройки в любом случае?',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": 'Профиль базы данных:',
+    "add_profile": 'Добавить',
+    "delete_profile": 'Удалить',
+    "profile_name": 'Имя профиля',
+    "enter_profile_name": 'Введите имя нового профиля:',
+    "profile_exists": 'Имя профиля уже существует',
+    "cannot_delete_active": 'Невозможно удалить активный профиль',
+    "confirm_delete_profile": 'Удалить профиль "{name}"?',
+
+    # 提示消息 Messages
+    "need_restart": 'Требуется перезапуск',
+    "restart_msg": 'Настройки были изменены. Пожалуйста, перезапустите приложение для применения изменений.',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": 'Фильтр и хранение',
+    "content_filter": 'Фильтр содержимого',
+    "save_text": 'Сохранять текст',
+    "save_images": 'Сохранять изображения',
+    "max_text_length": 'Макс. длина текста:',
+    "max_image_size": 'Макс. размер изображения:',
+    "unlimited": 'Без ограничений',
+    "characters": 'символов',
+    "storage_management": 'Управление хранилищем',
+    "max_items": 'Макс. записей:',
+    "retention_days": 'Авто-очистка дней:',
+    "never_cleanup": 'Никогда',
+    "archive_after_days": 'Архивировать через:',
+    "never_archive": 'Никогда',
+    "days": 'дней',
+    "poll_interval": 'Интервал опроса:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": 'Плагины',
+    "installed_plugins": 'Установленные плагины',
+    "open_plugins_dir": 'Открыть папку плагинов',
+    "reload_plugins": 'Перезагрузить',
+    "view_plugin_logs": 'Просмотр журналов',
+    "plugin_dev_docs": 'Документация',
+    "plugin_settings": 'Настройки',
+    "plugin_enabled": 'Включен',
+    "plugin_disabled": 'Отключен',
+    "plugin_missing_deps": 'Отсутствуют зависимости: {deps}',
+    "plugin_incompatible": 'Несовместимая версия',
+    "plugin_error": 'Ошибка загрузки',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} выполняется... {percent}%',
+    "plugin_timeout": 'Время выполнения плагина истекло',
+    "plugin_busy": 'Плагин уже выполняется, пожалуйста подождите',
+    "plugin_not_loaded": 'Плагин не загружен: {id}',
+    "plugin_exec_failed": 'Ошибка выполнения',
+    "plugin_config_title": '{name} - Настройки',
+    "plugin_config_required": 'Пожалуйста, заполните обязательные поля',
+    "plugin_save": 'Сохранить',
+    "plugin_cancel": 'Отмена',
+    "plugin_saved_entry": 'Сохранено как новая запись',
+    "plugin_replaced_entry": 'Содержимое заменено',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": 'Сетевой доступ',
+    "plugin_perm_file_read": 'Чтение файлов',
+    "plugin_perm_file_write": 'Запись файлов',
+
+    # 插件商店 Plugin store
+    "plugin_store": 'Магазин плагинов',
+    "plugin_install": 'Установить',
+    "plugin_uninstall": 'Удалить',
+    "plugin_installing": 'Установка...',
+    "plugin_installed_tag": 'Установлен',
+    "plugin_install_failed": 'Ошибка установки',
+    "plugin_uninstall_confirm_title": 'Подтверждение удаления',
+    "plugin_uninstall_confirm": 'Вы уверены, что хотите удалить "{name}"?',
+    "plugin_uninstall_failed": 'Ошибка удаления',
+    "plugin_store_loading": 'Загрузка списка плагинов...',
+    "plugin_store_empty": 'Нет доступных плагинов',
+    "plugin_store_error": 'Не удалось загрузить список плагинов',
+    "plugin_no_installed": 'Нет установленных плагинов',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": 'Подтвердить удаление',
+    "delete_confirm_msg": 'Вы уверены, что хотите удалить этот элемент?',
+    "image": '[Изображение]',
+    "from_device": 'От: {device}',
+
+    # 图片保存 Image save
+    "save_image": 'Сохранить изображение',
+    "image_load_failed": 'Не удалось загрузить данные изображения',
+    "save_failed": 'Ошибка сохранения: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": 'Миграция данных',
+    "migrate_data_confirm": 'Перенести существующие данные в новую базу данных?',
+    "migrating": 'Миграция данных...',
+    "migration_complete": 'Миграция завершена. Перенесено элементов: {count}.',
+    "migration_failed": 'Ошибка миграции: {error}',
+
+    # 关于 About
+    "about": 'О программе',
+    "about_description": 'Инструмент управления и синхронизации истории буфера обмена между устройствами',
+    "official_website": 'Официальный сайт:',
+    "github_repo": 'Репозиторий GitHub:',
+    "download_page": 'Скачать:',
+}
@@ -1,550 +0,0 @@
-"""i18n 字符串 - settings 领域。
-
-设置对话框相关字符串:通用设置、数据库、数据库 profile、过滤存储、提示消息。
-"""
-
-STRINGS = {
-    # ========== 简体中文 / Simplified Chinese ==========
-    "zh_CN": {
-        # 设置对话框 Settings dialog
-        "general": '通用',
-        "database": '数据库',
-        "dock_position": '停靠位置:',
-        "dock_right": '右侧',
-        "dock_left": '左侧',
-        "dock_top": '顶部',
-        "dock_bottom": '底部',
-        "global_hotkey": '全局热键:',
-        "hotkey_placeholder": '例如: <cmd>+v',
-        "hotkey_help": '热键格式说明:\n• <cmd> = Win键(Windows) / Cmd键(macOS)\n• <ctrl> = Ctrl键\n• <alt> = Alt键\n• <shift> = Shift键\n• 示例: <cmd>+v, <ctrl>+<shift>+c',
-        "language": '语言:',
-
-        # 数据库设置 Database settings
-        "db_type": '数据库类型:',
-        "db_sqlite": 'SQLite (本地文件)',
-        "db_mysql": 'MySQL (网络数据库)',
-        "sqlite_config": 'SQLite 配置',
-        "mysql_config": 'MySQL 配置',
-        "db_path": '数据库路径:',
-        "path_placeholder": '输入路径或点击浏览...',
-        "browse": '浏览...',
-        "select_db_file": '选择数据库文件位置',
-        "host": '主机:',
-        "port": '端口:',
-        "username": '用户名:',
-        "password": '密码:',
-        "db_name": '数据库名:',
-        "test_connection": '测试连接',
-        "connection_success": '连接成功',
-        "connection_failed": '连接失败',
-        "missing_dependency": '缺少依赖',
-        "pymysql_required": 'pymysql 未安装，请运行:\npip install pymysql',
-        "save_anyway": '{message}\n\n是否仍要保存设置？',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": '数据库配置:',
-        "add_profile": '添加',
-        "delete_profile": '删除',
-        "profile_name": '配置名称',
-        "enter_profile_name": '请输入新配置名称:',
-        "profile_exists": '配置名称已存在',
-        "cannot_delete_active": '不能删除当前使用的配置',
-        "confirm_delete_profile": '确定要删除配置 "{name}" 吗？',
-
-        # 提示消息 Messages
-        "need_restart": '需要重启',
-        "restart_msg": '设置已更改，请重启应用程序以生效。',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": '过滤与存储',
-        "content_filter": '内容过滤',
-        "save_text": '保存文本',
-        "save_images": '保存图片',
-        "max_text_length": '最大文本长度:',
-        "max_image_size": '最大图片大小:',
-        "unlimited": '不限',
-        "characters": '字符',
-        "storage_management": '存储管理',
-        "max_items": '最大条目数:',
-        "retention_days": '自动清理天数:',
-        "never_cleanup": '永不清理',
-        "days": '天',
-        "poll_interval": '轮询间隔:',
-    },
-
-    # ========== English ==========
-    "en_US": {
-        # 设置对话框 Settings dialog
-        "general": 'General',
-        "database": 'Database',
-        "dock_position": 'Dock position:',
-        "dock_right": 'Right',
-        "dock_left": 'Left',
-        "dock_top": 'Top',
-        "dock_bottom": 'Bottom',
-        "global_hotkey": 'Global hotkey:',
-        "hotkey_placeholder": 'e.g.: <cmd>+v',
-        "hotkey_help": 'Hotkey format:\n• <cmd> = Win key (Windows) / Cmd key (macOS)\n• <ctrl> = Ctrl key\n• <alt> = Alt key\n• <shift> = Shift key\n• Examples: <cmd>+v, <ctrl>+<shift>+c',
-        "language": 'Language:',
-
-        # 数据库设置 Database settings
-        "db_type": 'Database type:',
-        "db_sqlite": 'SQLite (Local file)',
-        "db_mysql": 'MySQL (Network database)',
-        "sqlite_config": 'SQLite Configuration',
-        "mysql_config": 'MySQL Configuration',
-        "db_path": 'Database path:',
-        "path_placeholder": 'Enter path or click Browse...',
-        "browse": 'Browse...',
-        "select_db_file": 'Select database file location',
-        "host": 'Host:',
-        "port": 'Port:',
-        "username": 'Username:',
-        "password": 'Password:',
-        "db_name": 'Database name:',
-        "test_connection": 'Test Connection',
-        "connection_success": 'Connection Successful',
-        "connection_failed": 'Connection Failed',
-        "missing_dependency": 'Missing Dependency',
-        "pymysql_required": 'pymysql is not installed. Please run:\npip install pymysql',
-        "save_anyway": '{message}\n\nSave settings anyway?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'Database profile:',
-        "add_profile": 'Add',
-        "delete_profile": 'Delete',
-        "profile_name": 'Profile name',
-        "enter_profile_name": 'Enter new profile name:',
-        "profile_exists": 'Profile name already exists',
-        "cannot_delete_active": 'Cannot delete the active profile',
-        "confirm_delete_profile": 'Delete profile "{name}"?',
-
-        # 提示消息 Messages
-        "need_restart": 'Restart Required',
-        "restart_msg": 'Settings have changed. Please restart the application for changes to take effect.',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'Filter & Storage',
-        "content_filter": 'Content Filter',
-        "save_text": 'Save text',
-        "save_images": 'Save images',
-        "max_text_length": 'Max text length:',
-        "max_image_size": 'Max image size:',
-        "unlimited": 'Unlimited',
-        "characters": 'chars',
-        "storage_management": 'Storage Management',
-        "max_items": 'Max items:',
-        "retention_days": 'Auto-cleanup days:',
-        "never_cleanup": 'Never',
-        "days": 'days',
-        "poll_interval": 'Poll interval:',
-    },
-
-    # ========== 日本語 / Japanese ==========
-    "ja_JP": {
-        # 设置对话框 Settings dialog
-        "general": '一般',
-        "database": 'データベース',
-        "dock_position": 'ドック位置:',
-        "dock_right": '右',
-        "dock_left": '左',
-        "dock_top": '上',
-        "dock_bottom": '下',
-        "global_hotkey": 'グローバルホットキー:',
-        "hotkey_placeholder": '例: <cmd>+v',
-        "hotkey_help": 'ホットキーの形式:\n• <cmd> = Winキー(Windows) / Cmdキー(macOS)\n• <ctrl> = Ctrlキー\n• <alt> = Altキー\n• <shift> = Shiftキー\n• 例: <cmd>+v, <ctrl>+<shift>+c',
-        "language": '言語:',
-
-        # 数据库设置 Database settings
-        "db_type": 'データベースタイプ:',
-        "db_sqlite": 'SQLite (ローカルファイル)',
-        "db_mysql": 'MySQL (ネットワークデータベース)',
-        "sqlite_config": 'SQLite 設定',
-        "mysql_config": 'MySQL 設定',
-        "db_path": 'データベースパス:',
-        "path_placeholder": 'パスを入力または参照...',
-        "browse": '参照...',
-        "select_db_file": 'データベースファイルの場所を選択',
-        "host": 'ホスト:',
-        "port": 'ポート:',
-        "username": 'ユーザー名:',
-        "password": 'パスワード:',
-        "db_name": 'データベース名:',
-        "test_connection": '接続テスト',
-        "connection_success": '接続成功',
-        "connection_failed": '接続失敗',
-        "missing_dependency": '依存関係が不足',
-        "pymysql_required": 'pymysqlがインストールされていません。\n実行してください: pip install pymysql',
-        "save_anyway": '{message}\n\n設定を保存しますか？',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'データベースプロファイル:',
-        "add_profile": '追加',
-        "delete_profile": '削除',
-        "profile_name": 'プロファイル名',
-        "enter_profile_name": '新しいプロファイル名を入力してください:',
-        "profile_exists": 'プロファイル名は既に存在します',
-        "cannot_delete_active": '使用中のプロファイルは削除できません',
-        "confirm_delete_profile": 'プロファイル "{name}" を削除しますか？',
-
-        # 提示消息 Messages
-        "need_restart": '再起動が必要',
-        "restart_msg": '設定が変更されました。変更を反映するにはアプリケーションを再起動してください。',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'フィルタとストレージ',
-        "content_filter": 'コンテンツフィルタ',
-        "save_text": 'テキストを保存',
-        "save_images": '画像を保存',
-        "max_text_length": '最大テキスト長:',
-        "max_image_size": '最大画像サイズ:',
-        "unlimited": '無制限',
-        "characters": '文字',
-        "storage_management": 'ストレージ管理',
-        "max_items": '最大アイテム数:',
-        "retention_days": '自動クリーンアップ日数:',
-        "never_cleanup": 'クリーンアップしない',
-        "days": '日',
-        "poll_interval": 'ポーリング間隔:',
-    },
-
-    # ========== 한국어 / Korean ==========
-    "ko_KR": {
-        # 设置对话框 Settings dialog
-        "general": '일반',
-        "database": '데이터베이스',
-        "dock_position": '도킹 위치:',
-        "dock_right": '오른쪽',
-        "dock_left": '왼쪽',
-        "dock_top": '위',
-        "dock_bottom": '아래',
-        "global_hotkey": '전역 단축키:',
-        "hotkey_placeholder": '예: <cmd>+v',
-        "hotkey_help": '단축키 형식:\n• <cmd> = Win키(Windows) / Cmd키(macOS)\n• <ctrl> = Ctrl키\n• <alt> = Alt키\n• <shift> = Shift키\n• 예: <cmd>+v, <ctrl>+<shift>+c',
-        "language": '언어:',
-
-        # 数据库设置 Database settings
-        "db_type": '데이터베이스 유형:',
-        "db_sqlite": 'SQLite (로컬 파일)',
-        "db_mysql": 'MySQL (네트워크 데이터베이스)',
-        "sqlite_config": 'SQLite 설정',
-        "mysql_config": 'MySQL 설정',
-        "db_path": '데이터베이스 경로:',
-        "path_placeholder": '경로 입력 또는 찾아보기...',
-        "browse": '찾아보기...',
-        "select_db_file": '데이터베이스 파일 위치 선택',
-        "host": '호스트:',
-        "port": '포트:',
-        "username": '사용자 이름:',
-        "password": '비밀번호:',
-        "db_name": '데이터베이스 이름:',
-        "test_connection": '연결 테스트',
-        "connection_success": '연결 성공',
-        "connection_failed": '연결 실패',
-        "missing_dependency": '종속성 누락',
-        "pymysql_required": 'pymysql이 설치되지 않았습니다.\n실행하세요: pip install pymysql',
-        "save_anyway": '{message}\n\n설정을 저장하시겠습니까?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": '데이터베이스 프로필:',
-        "add_profile": '추가',
-        "delete_profile": '삭제',
-        "profile_name": '프로필 이름',
-        "enter_profile_name": '새 프로필 이름을 입력하세요:',
-        "profile_exists": '프로필 이름이 이미 존재합니다',
-        "cannot_delete_active": '사용 중인 프로필은 삭제할 수 없습니다',
-        "confirm_delete_profile": '프로필 "{name}"을(를) 삭제하시겠습니까?',
-
-        # 提示消息 Messages
-        "need_restart": '재시작 필요',
-        "restart_msg": '설정이 변경되었습니다. 변경 사항을 적용하려면 응용 프로그램을 다시 시작하세요.',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": '필터 및 저장소',
-        "content_filter": '콘텐츠 필터',
-        "save_text": '텍스트 저장',
-        "save_images": '이미지 저장',
-        "max_text_length": '최대 텍스트 길이:',
-        "max_image_size": '최대 이미지 크기:',
-        "unlimited": '무제한',
-        "characters": '자',
-        "storage_management": '저장소 관리',
-        "max_items": '최대 항목 수:',
-        "retention_days": '자동 정리 일수:',
-        "never_cleanup": '정리 안 함',
-        "days": '일',
-        "poll_interval": '폴링 간격:',
-    },
-
-    # ========== Español / Spanish ==========
-    "es_ES": {
-        # 设置对话框 Settings dialog
-        "general": 'General',
-        "database": 'Base de datos',
-        "dock_position": 'Posición de acoplamiento:',
-        "dock_right": 'Derecha',
-        "dock_left": 'Izquierda',
-        "dock_top": 'Arriba',
-        "dock_bottom": 'Abajo',
-        "global_hotkey": 'Tecla de acceso rápido:',
-        "hotkey_placeholder": 'ej.: <cmd>+v',
-        "hotkey_help": 'Formato de teclas:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Ejemplos: <cmd>+v, <ctrl>+<shift>+c',
-        "language": 'Idioma:',
-
-        # 数据库设置 Database settings
-        "db_type": 'Tipo de base de datos:',
-        "db_sqlite": 'SQLite (Archivo local)',
-        "db_mysql": 'MySQL (Base de datos en red)',
-        "sqlite_config": 'Configuración SQLite',
-        "mysql_config": 'Configuración MySQL',
-        "db_path": 'Ruta de base de datos:',
-        "path_placeholder": 'Ingrese ruta o haga clic en Examinar...',
-        "browse": 'Examinar...',
-        "select_db_file": 'Seleccionar ubicación del archivo de base de datos',
-        "host": 'Host:',
-        "port": 'Puerto:',
-        "username": 'Usuario:',
-        "password": 'Contraseña:',
-        "db_name": 'Nombre de base de datos:',
-        "test_connection": 'Probar conexión',
-        "connection_success": 'Conexión exitosa',
-        "connection_failed": 'Conexión fallida',
-        "missing_dependency": 'Dependencia faltante',
-        "pymysql_required": 'pymysql no está instalado.\nEjecute: pip install pymysql',
-        "save_anyway": '{message}\n\n¿Guardar configuración de todos modos?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'Perfil de base de datos:',
-        "add_profile": 'Agregar',
-        "delete_profile": 'Eliminar',
-        "profile_name": 'Nombre del perfil',
-        "enter_profile_name": 'Ingrese el nombre del nuevo perfil:',
-        "profile_exists": 'El nombre del perfil ya existe',
-        "cannot_delete_active": 'No se puede eliminar el perfil activo',
-        "confirm_delete_profile": '¿Eliminar el perfil "{name}"?',
-
-        # 提示消息 Messages
-        "need_restart": 'Reinicio requerido',
-        "restart_msg": 'La configuración ha cambiado. Reinicie la aplicación para que los cambios surtan efecto.',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'Filtro y almacenamiento',
-        "content_filter": 'Filtro de contenido',
-        "save_text": 'Guardar texto',
-        "save_images": 'Guardar imágenes',
-        "max_text_length": 'Longitud máx. de texto:',
-        "max_image_size": 'Tamaño máx. de imagen:',
-        "unlimited": 'Sin límite',
-        "characters": 'caracteres',
-        "storage_management": 'Gestión de almacenamiento',
-        "max_items": 'Máx. elementos:',
-        "retention_days": 'Días de limpieza automática:',
-        "never_cleanup": 'Nunca',
-        "days": 'días',
-        "poll_interval": 'Intervalo de sondeo:',
-    },
-
-    # ========== Français / French ==========
-    "fr_FR": {
-        # 设置对话框 Settings dialog
-        "general": 'Général',
-        "database": 'Base de données',
-        "dock_position": "Position d'ancrage:",
-        "dock_right": 'Droite',
-        "dock_left": 'Gauche',
-        "dock_top": 'Haut',
-        "dock_bottom": 'Bas',
-        "global_hotkey": 'Raccourci global:',
-        "hotkey_placeholder": 'ex: <cmd>+v',
-        "hotkey_help": 'Format des raccourcis:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Exemples: <cmd>+v, <ctrl>+<shift>+c',
-        "language": 'Langue:',
-
-        # 数据库设置 Database settings
-        "db_type": 'Type de base de données:',
-        "db_sqlite": 'SQLite (Fichier local)',
-        "db_mysql": 'MySQL (Base de données réseau)',
-        "sqlite_config": 'Configuration SQLite',
-        "mysql_config": 'Configuration MySQL',
-        "db_path": 'Chemin de la base de données:',
-        "path_placeholder": 'Entrez le chemin ou cliquez sur Parcourir...',
-        "browse": 'Parcourir...',
-        "select_db_file": "Sélectionner l'emplacement du fichier de base de données",
-        "host": 'Hôte:',
-        "port": 'Port:',
-        "username": 'Utilisateur:',
-        "password": 'Mot de passe:',
-        "db_name": 'Nom de la base de données:',
-        "test_connection": 'Tester la connexion',
-        "connection_success": 'Connexion réussie',
-        "connection_failed": 'Connexion échouée',
-        "missing_dependency": 'Dépendance manquante',
-        "pymysql_required": "pymysql n'est pas installé.\nExécutez: pip install pymysql",
-        "save_anyway": '{message}\n\nEnregistrer les paramètres quand même?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'Profil de base de données:',
-        "add_profile": 'Ajouter',
-        "delete_profile": 'Supprimer',
-        "profile_name": 'Nom du profil',
-        "enter_profile_name": 'Entrez le nom du nouveau profil:',
-        "profile_exists": 'Le nom du profil existe déjà',
-        "cannot_delete_active": 'Impossible de supprimer le profil actif',
-        "confirm_delete_profile": 'Supprimer le profil "{name}"?',
-
-        # 提示消息 Messages
-        "need_restart": 'Redémarrage requis',
-        "restart_msg": "Les paramètres ont été modifiés. Veuillez redémarrer l'application pour que les modifications prennent effet.",
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'Filtre et stockage',
-        "content_filter": 'Filtre de contenu',
-        "save_text": 'Enregistrer le texte',
-        "save_images": 'Enregistrer les images',
-        "max_text_length": 'Longueur max. du texte:',
-        "max_image_size": "Taille max. de l'image:",
-        "unlimited": 'Illimité',
-        "characters": 'caractères',
-        "storage_management": 'Gestion du stockage',
-        "max_items": "Nombre max. d'éléments:",
-        "retention_days": 'Jours de nettoyage auto:',
-        "never_cleanup": 'Jamais',
-        "days": 'jours',
-        "poll_interval": 'Intervalle de sondage:',
-    },
-
-    # ========== Deutsch / German ==========
-    "de_DE": {
-        # 设置对话框 Settings dialog
-        "general": 'Allgemein',
-        "database": 'Datenbank',
-        "dock_position": 'Andockposition:',
-        "dock_right": 'Rechts',
-        "dock_left": 'Links',
-        "dock_top": 'Oben',
-        "dock_bottom": 'Unten',
-        "global_hotkey": 'Globale Tastenkombination:',
-        "hotkey_placeholder": 'z.B.: <cmd>+v',
-        "hotkey_help": 'Tastenkombinationsformat:\n• <cmd> = Win-Taste (Windows) / Cmd-Taste (macOS)\n• <ctrl> = Strg-Taste\n• <alt> = Alt-Taste\n• <shift> = Umschalt-Taste\n• Beispiele: <cmd>+v, <ctrl>+<shift>+c',
-        "language": 'Sprache:',
-
-        # 数据库设置 Database settings
-        "db_type": 'Datenbanktyp:',
-        "db_sqlite": 'SQLite (Lokale Datei)',
-        "db_mysql": 'MySQL (Netzwerkdatenbank)',
-        "sqlite_config": 'SQLite-Konfiguration',
-        "mysql_config": 'MySQL-Konfiguration',
-        "db_path": 'Datenbankpfad:',
-        "path_placeholder": 'Pfad eingeben oder auf Durchsuchen klicken...',
-        "browse": 'Durchsuchen...',
-        "select_db_file": 'Datenbankdatei-Speicherort auswählen',
-        "host": 'Host:',
-        "port": 'Port:',
-        "username": 'Benutzername:',
-        "password": 'Passwort:',
-        "db_name": 'Datenbankname:',
-        "test_connection": 'Verbindung testen',
-        "connection_success": 'Verbindung erfolgreich',
-        "connection_failed": 'Verbindung fehlgeschlagen',
-        "missing_dependency": 'Fehlende Abhängigkeit',
-        "pymysql_required": 'pymysql ist nicht installiert.\nFühren Sie aus: pip install pymysql',
-        "save_anyway": '{message}\n\nEinstellungen trotzdem speichern?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'Datenbankprofil:',
-        "add_profile": 'Hinzufügen',
-        "delete_profile": 'Löschen',
-        "profile_name": 'Profilname',
-        "enter_profile_name": 'Neuen Profilnamen eingeben:',
-        "profile_exists": 'Profilname existiert bereits',
-        "cannot_delete_active": 'Das aktive Profil kann nicht gelöscht werden',
-        "confirm_delete_profile": 'Profil "{name}" löschen?',
-
-        # 提示消息 Messages
-        "need_restart": 'Neustart erforderlich',
-        "restart_msg": 'Die Einstellungen wurden geändert. Bitte starten Sie die Anwendung neu, damit die Änderungen wirksam werden.',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'Filter und Speicher',
-        "content_filter": 'Inhaltsfilter',
-        "save_text": 'Text speichern',
-        "save_images": 'Bilder speichern',
-        "max_text_length": 'Max. Textlänge:',
-        "max_image_size": 'Max. Bildgröße:',
-        "unlimited": 'Unbegrenzt',
-        "characters": 'Zeichen',
-        "storage_management": 'Speicherverwaltung',
-        "max_items": 'Max. Einträge:',
-        "retention_days": 'Auto-Bereinigung Tage:',
-        "never_cleanup": 'Nie',
-        "days": 'Tage',
-        "poll_interval": 'Abfrageintervall:',
-    },
-
-    # ========== Русский / Russian ==========
-    "ru_RU": {
-        # 设置对话框 Settings dialog
-        "general": 'Общие',
-        "database": 'База данных',
-        "dock_position": 'Позиция закрепления:',
-        "dock_right": 'Справа',
-        "dock_left": 'Слева',
-        "dock_top": 'Сверху',
-        "dock_bottom": 'Снизу',
-        "global_hotkey": 'Глобальная горячая клавиша:',
-        "hotkey_placeholder": 'напр.: <cmd>+v',
-        "hotkey_help": 'Формат горячих клавиш:\n• <cmd> = Win (Windows) / Cmd (macOS)\n• <ctrl> = Ctrl\n• <alt> = Alt\n• <shift> = Shift\n• Примеры: <cmd>+v, <ctrl>+<shift>+c',
-        "language": 'Язык:',
-
-        # 数据库设置 Database settings
-        "db_type": 'Тип базы данных:',
-        "db_sqlite": 'SQLite (Локальный файл)',
-        "db_mysql": 'MySQL (Сетевая база данных)',
-        "sqlite_config": 'Настройки SQLite',
-        "mysql_config": 'Настройки MySQL',
-        "db_path": 'Путь к базе данных:',
-        "path_placeholder": 'Введите путь или нажмите Обзор...',
-        "browse": 'Обзор...',
-        "select_db_file": 'Выберите расположение файла базы данных',
-        "host": 'Хост:',
-        "port": 'Порт:',
-        "username": 'Имя пользователя:',
-        "password": 'Пароль:',
-        "db_name": 'Имя базы данных:',
-        "test_connection": 'Проверить соединение',
-        "connection_success": 'Соединение успешно',
-        "connection_failed": 'Соединение не удалось',
-        "missing_dependency": 'Отсутствует зависимость',
-        "pymysql_required": 'pymysql не установлен.\nВыполните: pip install pymysql',
-        "save_anyway": '{message}\n\nСохранить настройки в любом случае?',
-
-        # 数据库配置文件 Database profiles
-        "db_profile": 'Профиль базы данных:',
-        "add_profile": 'Добавить',
-        "delete_profile": 'Удалить',
-        "profile_name": 'Имя профиля',
-        "enter_profile_name": 'Введите имя нового профиля:',
-        "profile_exists": 'Имя профиля уже существует',
-        "cannot_delete_active": 'Невозможно удалить активный профиль',
-        "confirm_delete_profile": 'Удалить профиль "{name}"?',
-
-        # 提示消息 Messages
-        "need_restart": 'Требуется перезапуск',
-        "restart_msg": 'Настройки были изменены. Пожалуйста, перезапустите приложение для применения изменений.',
-
-        # 过滤与存储 Filter & Storage
-        "filter_storage": 'Фильтр и хранение',
-        "content_filter": 'Фильтр содержимого',
-        "save_text": 'Сохранять текст',
-        "save_images": 'Сохранять изображения',
-        "max_text_length": 'Макс. длина текста:',
-        "max_image_size": 'Макс. размер изображения:',
-        "unlimited": 'Без ограничений',
-        "characters": 'символов',
-        "storage_management": 'Управление хранилищем',
-        "max_items": 'Макс. записей:',
-        "retention_days": 'Авто-очистка дней:',
-        "never_cleanup": 'Никогда',
-        "days": 'дней',
-        "poll_interval": 'Интервал опроса:',
-    },
-}
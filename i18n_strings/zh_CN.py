@@ -0,0 +1,191 @@
+"""i18n 字符串 - 简体中文 / Simplified Chinese。
+
+扁平 key -> 文案；只在切到该语言（或作为英语回退）时 import。
+分节顺序与历史上的领域文件一致：main / settings / cloud / plugins / misc，同名 key 后者覆盖前者。
+"""
+
+STRINGS = {
+    # ==================== main: 主界面 / 通用 / 托盘 / 右键菜单 ====================
+    # 通用 General
+    "app_name": '共享剪贴板',
+    "settings": '设置',
+    "ok": '确定',
+    "cancel": '取消',
+    "yes": '是',
+    "no": '否',
+    "confirm": '确认',
+    "error": '错误',
+    "warning": '警告',
+    "info": '信息',
+    "success": '成功',
+
+    # 主窗口 Main window
+    "search_placeholder": '搜索剪贴板...',
+    "pin_window": '固定窗口',
+    "unpin_window": '取消固定',
+    "minimize": '最小化',
+    "quit_app": '退出应用',
+    "prev_page": '◀ 上一页',
+    "next_page": '下一页 ▶',
+    "page_info": '{current} / {total}',
+
+    # 托盘菜单 Tray menu
+    "show_window": '显示窗口',
+    "quit": '退出',
+
+    # 复制反馈 Copy feedback
+    "copied_to_clipboard": '已复制到剪贴板 ✓',
+    "copy_failed": '复制失败',
+
+    # 收藏筛选 Star filter
+    "show_starred_only": '只看收藏',
+
+    # 上下文菜单 Context menu
+    "ctx_copy": '复制',
+    "ctx_star": '收藏',
+    "ctx_unstar": '取消收藏',
+    "ctx_delete": '删除',
+    "refresh": '刷新',
+
+    # ==================== settings: 设置对话框 / 数据库 / 过滤存储 ====================
+    # 设置对话框 Settings dialog
+    "general": '通用',
+    "database": '数据库',
+    "dock_position": '停靠位置:',
+    "dock_right": '右侧',
+    "dock_left": '左侧',
+    "dock_top": '顶部',
+    "dock_bottom": '底部',
+    "global_hotkey": '全局热键:',
+    "hotkey_placeholder": '例如: <cmd>+v',
+    "hotkey_help": '热键格式说明:\n• <cmd> = Win键(Windows) / Cmd键(macOS)\n• <ctrl> = Ctrl键\n• <alt> = Alt键\n• <shift> = Shift键\n• 示例: <cmd>+v, <ctrl>+<shift>+c',
+    "language": '语言:',
+
+    # 数据库设置 Database settings
+    "db_type": '数据库类型:',
+    "db_sqlite": 'SQLite (本地文件)',
+    "db_mysql": 'MySQL (网络数据库)',
+    "sqlite_config": 'SQLite 配置',
+    "mysql_config": 'MySQL 配置',
+    "db_path": '数据库路径:',
+    "path_placeholder": '输入路径或点击浏览...',
+    "browse": '浏览...',
+    "select_db_file": '选择数据库文件位置',
+    "host": '主机:',
+    "port": '端口:',
+    "username": '用户名:',
+    "password": '密码:',
+    "db_name": '数据库名:',
+    "test_connection": '测试连接',
+    "connection_success": '连接成功',
+    "connection_failed": '连接失败',
+    "missing_dependency": '缺少依赖',
+    "pymysql_required": 'pymysql 未安装，请运行:\npip install pymysql',
+    "save_anyway": '{message}\n\n是否仍要保存设置？',
+
+    # 数据库配置文件 Database profiles
+    "db_profile": '数据库配置:',
+    "add_profile": '添加',
+    "delete_profile": '删除',
+    "profile_name": '配置名称',
+    "enter_profile_name": '请输入新配置名称:',
+    "profile_exists": '配置名称已存在',
+    "cannot_delete_active": '不能删除当前使用的配置',
+    "confirm_delete_profile": '确定要删除配置 "{name}" 吗？',
+
+    # 提示消息 Messages
+    "need_restart": '需要重启',
+    "restart_msg": '设置已更改，请重启应用程序以生效。',
+
+    # 过滤与存储 Filter & Storage
+    "filter_storage": '过滤与存储',
+    "content_filter": '内容过滤',
+    "save_text": '保存文本',
+    "save_images": '保存图片',
+    "max_text_length": '最大文本长度:',
+    "max_image_size": '最大图片大小:',
+    "unlimited": '不限',
+    "characters": '字符',
+    "storage_management": '存储管理',
+    "max_items": '最大条目数:',
+    "retention_days": '自动清理天数:',
+    "never_cleanup": '永不清理',
+    "archive_after_days": '归档冷数据天数:',
+    "never_archive": '不归档',
+    "days": '天',
+    "poll_interval": '轮询间隔:',
+
+    # ==================== plugins: 插件系统 ====================
+    # 插件管理 Plugin management
+    "plugins": '插件',
+    "installed_plugins": '已安装插件',
+    "open_plugins_dir": '打开插件目录',
+    "reload_plugins": '重新加载',
+    "view_plugin_logs": '查看日志',
+    "plugin_dev_docs": '开发文档',
+    "plugin_settings": '设置',
+    "plugin_enabled": '已启用',
+    "plugin_disabled": '已禁用',
+    "plugin_missing_deps": '缺少依赖: {deps}',
+    "plugin_incompatible": '版本不兼容',
+    "plugin_error": '加载失败',
+
+    # 插件运行 Plugin runtime
+    "plugin_executing": '{name} 执行中... {percent}%',
+    "plugin_timeout": '插件执行超时',
+    "plugin_busy": '有插件正在执行，请等待完成',
+    "plugin_not_loaded": '插件未加载: {id}',
+    "plugin_exec_failed": '执行失败',
+    "plugin_config_title": '{name} - 设置',
+    "plugin_config_required": '请填写必填项',
+    "plugin_save": '保存',
+    "plugin_cancel": '取消',
+    "plugin_saved_entry": '已保存为新条目',
+    "plugin_replaced_entry": '已替换原内容',
+
+    # 插件权限 Plugin permissions
+    "plugin_perm_network": '网络访问',
+    "plugin_perm_file_read": '读取文件',
+    "plugin_perm_file_write": '写入文件',
+
+    # 插件商店 Plugin store
+    "plugin_store": '插件商店',
+    "plugin_install": '安装',
+    "plugin_uninstall": '卸载',
+    "plugin_installing": '安装中...',
+    "plugin_installed_tag": '已安装',
+    "plugin_install_failed": '安装失败',
+    "plugin_uninstall_confirm_title": '确认卸载',
+    "plugin_uninstall_confirm": '确定要卸载插件「{name}」吗？',
+    "plugin_uninstall_failed": '卸载失败',
+    "plugin_store_loading": '正在加载插件列表...',
+    "plugin_store_empty": '暂无可用插件',
+    "plugin_store_error": '获取插件列表失败',
+    "plugin_no_installed": '暂无已安装插件',
+
+    # ==================== misc: 剪贴板项 / 图片保存 / 数据迁移 / 关于 ====================
+    # 剪贴板项 Clipboard items
+    "confirm_delete": '确认删除',
+    "delete_confirm_msg": '确定要删除这条记录吗？',
+    "image": '[图片]',
+    "from_device": '来自: {device}',
+
+    # 图片保存 Image save
+    "save_image": '保存图片',
+    "image_load_failed": '无法加载图片数据',
+    "save_failed": '保存失败: {error}',
+
+    # 数据迁移 Data migration
+    "migrate_data": '迁移数据',
+    "migrate_data_confirm": '是否将现有数据迁移到新数据库？',
+    "migrating": '正在迁移数据...',
+    "migration_complete": '数据迁移完成，共迁移 {count} 条记录。',
+    "migration_failed": '数据迁移失败: {error}',
+
+    # 关于 About
+    "about": '关于',
+    "about_description": '一款跨设备剪贴板历史管理与同步工具',
+    "official_website": '官方网站:',
+    "github_repo": 'GitHub 仓库:',
+    "download_page": '软件下载:',
+}
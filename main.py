@@ -13,6 +13,12 @@ _STARTUP_PERF_T0 = time.perf_counter()
 # 添加项目根目录到路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+# SC_IMPORT_TRACE=1：赶在 PySide6 等重模块之前装上追踪器，逐模块 import 耗时并入启动摘要
+_IMPORT_TRACER = None
+if os.environ.get("SC_IMPORT_TRACE", "").strip() not in ("", "0", "false", "False"):
+    from core.import_trace import ImportTracer
+    _IMPORT_TRACER = ImportTracer().install()
+
 from PySide6.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QMessageBox
 from PySide6.QtGui import QIcon, QAction, QPixmap, QPainter, QColor, QCursor
 from PySide6.QtCore import Qt, QMetaObject, Q_ARG, QUrl, QTimer
@@ -27,12 +33,8 @@ from config import (
     get_effective_hotkey,
 )
 from i18n import t, set_language
+# 仓储 / 监控 / 同步 / 插件等由 AppContext.bootstrap 在装配时按需 import
 from core.app_context import AppContext
-from core.db_factory import create_database_manager
-from core.repository import ClipboardRepository
-from core.clipboard_monitor import ClipboardMonitor
-from core.sync_service import SyncService
-from core.plugin_manager import PluginManager
 from core.startup_metrics import StartupMetrics
 from ui.main_window import MainWindow
 
@@ -77,6 +79,11 @@ logger = logging.getLogger(__name__)
 if _SC_DEBUG:
     logger.warning(f"[startup] SC_DEBUG 已启用，DEBUG 日志将写入 logs/debug.log  t=+{time.time()-_STARTUP_T0:.2f}s")
 
+# 启动后多久把本次各阶段耗时写入启动历史（需晚于 20s 的延后云同步）
+_STARTUP_TRACE_SETTLE_MS = 30000
+# 搜索 planner 统计的维护检查间隔（未过期时检查本身不查库）
+_SEARCH_STATS_CHECK_MS = 60000
+
 
 def get_app_icon() -> QIcon:
     """获取应用图标"""
@@ -205,6 +212,11 @@ class ClipboardApp:
             self._collect_mysql_fallback_health()
             self._flush_startup_health_notifications()
         self.startup_metrics.mark("event_loop_ready")
+        if _IMPORT_TRACER is not None:
+            self.startup_metrics.record_imports(_IMPORT_TRACER.uninstall())
+        self._watch_first_list_paint()
+        # 延后阶段（插件 1.5s、云同步 20s）都跑过之后再落盘本次启动耗时
+        QTimer.singleShot(_STARTUP_TRACE_SETTLE_MS, self._persist_startup_trace)
 
     def _init_components(self):
         """初始化核心组件（Phase 1: 全部走 AppContext）"""
@@ -292,7 +304,16 @@ class ClipboardApp:
         )
         self.clipboard_monitor.start()
         self.sync_service.start()
+        if ctx.archive_service is not None:
+            # 服务线程自带首轮延迟，启动期不会和 UI 首屏抢 SQLite 写锁
+            ctx.archive_service.start()
         QTimer.singleShot(1500, self._load_plugins_deferred)
+        # 搜索 planner 的全表统计 / ANALYZE 不在按键路径上算：启动稳定后先刷一次，
+        # 之后每分钟检查一次是否过期（refresh_search_stats 未过期时什么都不做）
+        self._search_stats_timer = QTimer()
+        self._search_stats_timer.setInterval(_SEARCH_STATS_CHECK_MS)
+        self._search_stats_timer.timeout.connect(self._refresh_search_stats)
+        QTimer.singleShot(5000, self._start_search_stats_maintenance)
         if self.cloud_sync_service:
             # 云端拉取的新条目也通知 UI 刷新
             self.cloud_sync_service.new_items_available.connect(
@@ -308,6 +329,21 @@ class ClipboardApp:
             QTimer.singleShot(20000, self._start_cloud_sync_deferred)
         if self.cloud_api and settings().files_sync_enabled:
             QTimer.singleShot(20000, self._start_file_sync_deferred)
+        if ctx.lan_sync_service is not None:
+            # 局域网对端写入本地的新条目：与云端拉取同样通知 UI 并推进 SyncService 游标
+            ctx.lan_sync_service.new_items_available.connect(self.main_window._on_new_items)
+            ctx.lan_sync_service.new_items_available.connect(self._advance_sync_after_cloud)
+            ctx.lan_sync_service.start()
+
+    def _start_search_stats_maintenance(self):
+        self._refresh_search_stats()
+        self._search_stats_timer.start()
+
+    def _refresh_search_stats(self):
+        try:
+            self.repository.refresh_search_stats()
+        except Exception as e:
+            logger.debug(f"搜索统计刷新失败: {e}")
 
     def _load_plugins_deferred(self):
         """Load optional plugins after the core clipboard services are running."""
@@ -331,6 +367,40 @@ class ClipboardApp:
         metrics = getattr(self, "startup_metrics", None)
         return metrics.phase(name) if metrics is not None else nullcontext()
 
+    def _watch_first_list_paint(self):
+        """列表首次带内容绘制完成时打点 first_list_paint（窗口收在边缘时也会绘制）。"""
+        try:
+            from ui.wake_latency import FirstPaintWatcher
+            view = self.main_window.list_view
+            model = self.main_window.list_controller.model
+            self._first_paint_watcher = FirstPaintWatcher(
+                view.viewport(),
+                lambda: self.startup_metrics.mark("first_list_paint"),
+                lambda: model.rowCount() > 0 or not model.canFetchMore(),
+                timeout_ms=_STARTUP_TRACE_SETTLE_MS,
+            )
+        except Exception:
+            logger.debug("首屏绘制打点失败", exc_info=True)
+
+    def _persist_startup_trace(self):
+        """把本次各阶段耗时追加到启动历史；比历史 p95 明显变慢的阶段登记为健康告警。"""
+        try:
+            from config import APP_VERSION, get_startup_history_path
+            from core.startup_history import StartupHistory, run_from_metrics
+            history = StartupHistory(get_startup_history_path())
+            run = run_from_metrics(self.startup_metrics, APP_VERSION)
+            regressions = history.check(run)
+            history.append(run)
+        except Exception:
+            logger.debug("记录启动历史失败", exc_info=True)
+            return
+        if not regressions:
+            return
+        message = "启动变慢：" + "；".join(r.describe() for r in regressions[:3])
+        logger.warning(f"[startup-metrics] {message}")
+        # 只登记不弹托盘：性能回归不影响使用，留给设置页 / 日志排查
+        self._record_health_issue("startup_performance", "warning", message)
+
     def _start_cloud_sync_deferred(self):
         """Start optional cloud sync after the local clipboard path is ready."""
         if not getattr(self, "cloud_sync_service", None):
@@ -672,6 +742,8 @@ class ClipboardApp:
         # 在主线程中显示窗口
         # 使用 QMetaObject.invokeMethod 从非 Qt 线程安全调用
         try:
+            # 先打点再排队，唤起延迟从热键事件算起
+            self.main_window.wake_probe.begin()
             QMetaObject.invokeMethod(
                 self.main_window,
                 "show_window",
@@ -682,6 +754,8 @@ class ClipboardApp:
 
     def _quit(self):
         """退出应用"""
+        if _SC_DEBUG or _SC_STARTUP_METRICS:
+            logger.warning(f"[wake-metrics] {self.main_window.wake_probe.metrics.format_summary()}")
         # 停止热键监听
         if self.hotkey_listener:
             self.hotkey_listener.stop()
@@ -691,8 +765,14 @@ class ClipboardApp:
             self.plugin_manager.unload_all()
 
         self.clipboard_monitor.stop()
+        if self.ctx.archive_service is not None:
+            self.ctx.archive_service.stop()
+        self._search_stats_timer.stop()
+        self.repository.wait_search_stats()
         self.main_window._copy_executor.shutdown(wait=False)
         self.main_window._cloud_executor.shutdown(wait=False)
+        self.main_window.list_controller.shutdown()
+        self.main_window._edge_strips.close()
         self.sync_service.stop()
         if self.cloud_sync_service:
             self.cloud_sync_service.stop()
@@ -701,6 +781,11 @@ class ClipboardApp:
                 self.file_sync_service.stop()
             except Exception:
                 logger.debug("文件云同步停止失败", exc_info=True)
+        if self.ctx.lan_sync_service is not None:
+            try:
+                self.ctx.lan_sync_service.stop()
+            except Exception:
+                logger.debug("局域网同步停止失败", exc_info=True)
         self.tray_icon.hide()
         # 关闭云端 API 客户端（统一通过 reset_cloud_client 清理单例）
         try:
@@ -726,7 +811,7 @@ class ClipboardApp:
     def run(self) -> int:
         """运行应用"""
         logger.debug(f"[startup] 进入 app.exec() 事件循环 t=+{time.time()-_STARTUP_T0:.2f}s")
-        if _SC_DEBUG or _SC_STARTUP_METRICS:
+        if _SC_DEBUG or _SC_STARTUP_METRICS or _IMPORT_TRACER is not None:
             logger.warning(f"[startup-metrics] {self.startup_metrics.format_summary()}")
         return self.app.exec()
 
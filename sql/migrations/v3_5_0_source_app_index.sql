@@ -0,0 +1,2 @@
+-- 查询规划器：from:App 过滤可以走索引驱动（filter_first），并按 created_at 取序。
+CREATE INDEX IF NOT EXISTS idx_source_created ON clipboard_items(source_app, created_at);
@@ -0,0 +1,27 @@
+-- v3.6.0: 触发器维护的 change_log（条目级增 / 改 / 删流水），供 SyncService 增量同步。
+-- 触发器体写在一行内（语句以行尾分号切分，体内分号不能落在行尾）。
+-- changed_at 为 Unix 毫秒，仅用于过期清理。
+
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL,
+    op TEXT NOT NULL,
+    device_id TEXT DEFAULT NULL,
+    changed_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_change_log_changed ON change_log(changed_at);
+
+CREATE TRIGGER IF NOT EXISTS change_log_ai AFTER INSERT ON clipboard_items BEGIN
+    INSERT INTO change_log (item_id, op, device_id, changed_at) VALUES (new.id, 'insert', new.device_id, CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)); END;
+
+CREATE TRIGGER IF NOT EXISTS change_log_au AFTER UPDATE OF is_starred, created_at, text_content, preview, space_id, source_app, source_title ON clipboard_items BEGIN
+    INSERT INTO change_log (item_id, op, changed_at) VALUES (new.id, 'update', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)); END;
+
+CREATE TRIGGER IF NOT EXISTS change_log_ad AFTER DELETE ON clipboard_items BEGIN
+    INSERT INTO change_log (item_id, op, changed_at) VALUES (old.id, 'delete', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)); END;
+
+CREATE TRIGGER IF NOT EXISTS change_log_tag_ai AFTER INSERT ON clipboard_tags BEGIN
+    INSERT INTO change_log (item_id, op, changed_at) VALUES (new.item_id, 'update', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)); END;
+
+CREATE TRIGGER IF NOT EXISTS change_log_tag_ad AFTER DELETE ON clipboard_tags BEGIN
+    INSERT INTO change_log (item_id, op, changed_at) VALUES (old.item_id, 'update', CAST((julianday('now') - 2440587.5) * 86400000 AS INTEGER)); END;
@@ -0,0 +1,4 @@
+-- 列表无限滚动的 keyset 翻页：WHERE space 过滤 + (created_at, id) 倒序直接走索引，不再临时排序。
+CREATE INDEX IF NOT EXISTS idx_space_created_id ON clipboard_items(space_id, created_at DESC, id DESC);
+-- "全部空间"（不带 space 过滤）的 keyset 翻页
+CREATE INDEX IF NOT EXISTS idx_created_id ON clipboard_items(created_at DESC, id DESC);
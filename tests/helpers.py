@@ -0,0 +1,16 @@
+"""测试共用的条目工厂（各测试模块经 sys.path 导入，不依赖 conftest）。"""
+
+from core.models import TextClipboardItem
+
+
+def text_item(i, created_at=None, *, device="", starred=False, **fields):
+    """第 i 条文本条目：正文 / 预览为 "text {i}"，content_hash 为 "h{i}"。
+
+    created_at 缺省为 1000 + i；其余字段（id、device_name 等）经 fields 覆盖。
+    """
+    values = dict(
+        text_content=f"text {i}", content_hash=f"h{i}", preview=f"text {i}",
+        device_id=device, created_at=1000 + i if created_at is None else created_at, is_starred=starred,
+    )
+    values.update(fields)
+    return TextClipboardItem(**values)
@@ -176,6 +176,24 @@ def test_logged_in_bootstrap_defers_file_sync_worker(monkeypatch):
         ctx.shutdown()
 
 
+@pytest.mark.parametrize("shared", [False, True])
+def test_archive_moves_disabled_on_shared_database(tmp_path, shared):
+    """共享库上搬迁会变成 change_log 删除事件广播给其他设备：只挂归档、不装配搬迁服务。"""
+    import config
+    from core.app_context import AppContext
+
+    config.update_settings(
+        archive_after_days=30,
+        database_path=str(tmp_path / "shared.db") if shared else "",
+    )
+    ctx = AppContext.bootstrap()
+    try:
+        assert ctx.repository.archive is not None
+        assert (ctx.archive_service is None) is shared
+    finally:
+        ctx.shutdown()
+
+
 def test_shutdown_handles_partial_init():
     """部分初始化的 ctx 也应能安全 shutdown,不抛异常。"""
     from core.app_context import AppContext
@@ -0,0 +1,200 @@
+"""冷数据归档层（ArchiveDAO / ArchiveService）测试。"""
+
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.archive_service import ArchiveService
+from core.database import DatabaseManager
+from core.db.archive_dao import default_archive_path
+from core.models import ImageClipboardItem, TextClipboardItem
+from core.query_parser import parse as parse_query
+from core.repository import ClipboardRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db_path = str(tmp_path / "test.db")
+    db = DatabaseManager(db_path)
+    repository = ClipboardRepository(db)
+    repository.enable_archive(default_archive_path(db_path))
+    yield repository
+    db.close()
+
+
+def _mk(text, h, ts):
+    return TextClipboardItem(
+        text_content=text,
+        content_hash=h,
+        preview=text[:50],
+        device_id="dev1",
+        device_name="TestPC",
+        created_at=ts,
+    )
+
+
+def _hot_ids(repo):
+    def op(conn):
+        return [r[0] for r in conn.execute("SELECT id FROM main.clipboard_items")]
+    return set(repo.db.execute_read(op))
+
+
+def test_default_archive_path():
+    assert default_archive_path("/x/clipboard.db") == "/x/clipboard.archive.db"
+
+
+def test_archive_moves_old_unstarred_items(repo):
+    old_id = repo.add_item(_mk("old text", "h_old", ts=1000))
+    starred_id = repo.add_item(_mk("old starred", "h_star", ts=1001))
+    repo.toggle_star(starred_id)
+    new_id = repo.add_item(_mk("new text", "h_new", ts=5000))
+
+    moved = repo.archive.archive_older_than(cutoff_ms=2000)
+
+    assert moved == 1
+    assert _hot_ids(repo) == {starred_id, new_id}
+    assert repo.archive.count() == 1
+    # 单条读取透明回落到归档层，正文被解压还原
+    item = repo.get_item_by_id(old_id)
+    assert item is not None
+    assert item.text_content == "old text"
+
+
+def test_archive_payload_is_compressed(repo):
+    text = "abc " * 2000
+    repo.add_item(_mk(text, "h_big", ts=1000))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+
+    def op(conn):
+        return conn.execute("SELECT text_z FROM archive.clipboard_items").fetchone()[0]
+
+    stored = repo.db.execute_read(op)
+    assert isinstance(stored, bytes)
+    assert len(stored) < len(text)
+
+
+def test_image_roundtrip_through_archive(repo):
+    payload = b"\x89PNG" + b"\x00" * 4096
+    iid = repo.add_item(ImageClipboardItem(
+        content_hash="img1", device_id="dev1", created_at=1000,
+        image_data=payload, image_thumbnail=b"thumb",
+    ))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    item = repo.get_item_by_id(iid)
+    assert item.image_data == payload
+    assert item.image_thumbnail == b"thumb"
+
+
+def test_search_fans_out_only_when_page_not_filled(repo):
+    for i in range(3):
+        repo.add_item(_mk(f"needle old {i}", f"o{i}", ts=1000 + i))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    for i in range(2):
+        repo.add_item(_mk(f"needle new {i}", f"n{i}", ts=5000 + i))
+
+    spec = parse_query("needle")
+    page1 = repo.search(spec, page=1, page_size=2)
+    assert [it.text_content for it in page1] == ["needle new 1", "needle new 0"]
+
+    page2 = repo.search(spec, page=2, page_size=2)
+    assert [it.text_content for it in page2] == ["needle old 2", "needle old 1"]
+
+    page3 = repo.search(spec, page=3, page_size=2)
+    assert [it.text_content for it in page3] == ["needle old 0"]
+
+    items, total = repo.search_by_keyword("needle", page=0, page_size=10)
+    assert total == 5
+    assert len(items) == 5
+
+
+def test_search_skips_archived_copy_of_recopied_content(repo):
+    repo.add_item(_mk("same content", "dup", ts=1000))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    # 监听器把已归档内容重新复制：get_by_hash 命中归档 → touch 搬回热层
+    existing = repo.get_by_hash("dup")
+    assert existing is not None
+    assert repo.touch_item(existing.id, 9000) is True
+    assert repo.archive.count() == 0
+
+    results = repo.search(parse_query("same"))
+    assert len(results) == 1
+    assert results[0].created_at == 9000
+
+
+def test_toggle_star_restores_archived_item(repo):
+    iid = repo.add_item(_mk("star me", "h_s", ts=1000))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    assert iid not in _hot_ids(repo)
+
+    assert repo.toggle_star(iid) is True
+    assert iid in _hot_ids(repo)
+    assert repo.get_item_by_id(iid).is_starred is True
+    # 搬回热层后主库 FTS 可再次命中
+    assert [it.id for it in repo.search(parse_query("star"))] == [iid]
+
+
+def test_star_archived_copy_merges_into_recopied_hot_item(repo):
+    old = repo.add_item(_mk("again", "h_again", ts=1000))
+    repo.add_tags_to_item(old, ["t1"])
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    # 同内容在归档期间被重新复制进热层（不同 id）
+    hot = repo.add_item(_mk("again", "h_again", ts=9000))
+    assert hot != old
+
+    assert repo.toggle_star(old) is True
+    assert repo.archive.count() == 0
+    assert repo.get_item_by_id(hot).is_starred is True
+    assert repo.get_item_by_id(old) is None
+
+    def tags(conn):
+        return sorted(tuple(r) for r in conn.execute("SELECT item_id, tag_id FROM clipboard_tags"))
+    assert repo.db.execute_read(tags) == [(hot, "t1")]
+
+
+def test_archiving_invalidates_cached_hot_snapshot(repo):
+    iid = repo.add_item(_mk("cached", "h_c", ts=1000))
+    assert repo.get_item_by_id(iid) is not None
+    assert repo.item_cache.get_by_id(iid) is not None
+
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    assert repo.item_cache.get_by_id(iid) is None
+    assert repo.item_cache.get_by_hash("h_c") is None
+
+
+def test_delete_archived_item(repo):
+    iid = repo.add_item(_mk("bye", "h_bye", ts=1000))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    assert repo.delete_item(iid) is True
+    assert repo.get_item_by_id(iid) is None
+    assert repo.search(parse_query("bye")) == []
+
+
+def test_archive_visible_from_other_thread(repo):
+    repo.add_item(_mk("cross thread", "h_ct", ts=1000))
+    repo.archive.archive_older_than(cutoff_ms=2000)
+    result = {}
+
+    def worker():
+        result["items"] = repo.search(parse_query("cross"))
+
+    t = threading.Thread(target=worker)
+    t.start()
+    t.join()
+    assert [it.text_content for it in result["items"]] == ["cross thread"]
+
+
+def test_archive_service_run_once_moves_in_batches(repo):
+    for i in range(5):
+        repo.add_item(_mk(f"t{i}", f"b{i}", ts=1000 + i))
+    service = ArchiveService(repo.archive, archive_after_days=1)
+    service._BATCH_SIZE = 2
+    assert service.run_once() == 5
+    assert _hot_ids(repo) == set()
+
+    service.set_archive_after_days(0)
+    repo.add_item(_mk("t5", "b5", ts=1000))
+    assert service.run_once() == 0
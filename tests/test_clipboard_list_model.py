@@ -0,0 +1,87 @@
+"""ClipboardListModel：keyset 续取、LRU 淘汰后按 id 回读、增量插入 / 删除。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtWidgets import QApplication, QListView, QStyleOptionViewItem
+
+from core.database import DatabaseManager
+from core.repository import ClipboardRepository
+from tests.helpers import text_item as _text
+from ui.clipboard_list_model import ClipboardItemDelegate, ClipboardListModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = ClipboardRepository(DatabaseManager(str(tmp_path / "list.db")))
+    yield repository
+    repository.db.close()
+
+
+def _model(repo, monkeypatch, fetch_size=4, resident=6):
+    monkeypatch.setattr(ClipboardListModel, "FETCH_SIZE", fetch_size)
+    monkeypatch.setattr(ClipboardListModel, "MAX_RESIDENT", resident)
+    monkeypatch.setattr(ClipboardListModel, "RELOAD_SPAN", 2)
+    model = ClipboardListModel()
+    model.set_loader(repo.get_items_by_ids)
+    model.set_fetcher(lambda cursor, limit: repo.get_items_after(cursor, limit, space_id=""), prefetch=True)
+    return model
+
+
+def test_fetch_more_walks_keyset_across_created_at_ties(qapp, repo, monkeypatch):
+    # 同一毫秒的多条：游标必须带上 id，否则翻页会漏 / 重
+    ids = [repo.add_item(_text(i, 1000 + i // 3)) for i in range(10)]
+    model = _model(repo, monkeypatch)
+    assert model.rowCount() == 4
+    while model.canFetchMore():
+        model.fetchMore()
+    expected = sorted(ids, key=lambda i: (1000 + (i - ids[0]) // 3, i), reverse=True)
+    assert model.ids() == expected
+
+
+def test_evicted_rows_reload_by_id(qapp, repo, monkeypatch):
+    for i in range(10):
+        repo.add_item(_text(i, 1000 + i))
+    model = _model(repo, monkeypatch)
+    while model.canFetchMore():
+        model.fetchMore()
+    assert len(model.resident_items()) == 6
+    calls = []
+    model.set_loader(lambda ids: calls.append(ids) or repo.get_items_by_ids(ids))
+    first = model.item_at(0)
+    assert first.text_content == "text 9"
+    assert calls and model.ids()[0] in calls[0]
+    assert len(model.resident_items()) <= 6
+
+
+def test_insert_and_remove_keep_order(qapp, repo, monkeypatch):
+    for i in range(6):
+        repo.add_item(_text(i, 1000 + i * 10))
+    model = _model(repo, monkeypatch)
+    # 已加载 1050..1020；更旧的插入留给 fetchMore，中间的就地插入
+    newer = _text(20, 1035)
+    newer.id = 99
+    assert model.insert_item(newer)
+    older = _text(21, 1001)
+    older.id = 100
+    assert not model.insert_item(older)
+    assert [model.row_info(r).created_at for r in range(model.rowCount())] == [1050, 1040, 1035, 1030, 1020]
+    assert model.remove_id(99)
+    assert model.row_of(99) == -1
+
+    view = QListView()
+    view.resize(400, 600)
+    view.setModel(model)
+    view.setItemDelegate(ClipboardItemDelegate(view))
+    hint = view.itemDelegate().sizeHint(QStyleOptionViewItem(), model.index(0, 0))
+    assert hint.height() >= 76
+    assert model.cached_height(model.row_info(0).id) == hint.height()
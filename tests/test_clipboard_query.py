@@ -2,6 +2,7 @@
 
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -81,3 +82,168 @@ def test_get_timeline_groups_by_day(dao_and_query):
     assert len(timeline) >= 2
     total_cnt = sum(t["count"] for t in timeline)
     assert total_cnt == 2
+
+
+# ---------------------------------------------------------------------------
+# payload_bytes 冗余列 / size: 过滤
+# ---------------------------------------------------------------------------
+
+
+def _mk_image(h, size, ts=1000):
+    from core.models import ImageClipboardItem
+
+    return ImageClipboardItem(
+        content_hash=h, device_id="dev1", created_at=ts, image_data=b"\x00" * size,
+    )
+
+
+def _payload(dao, item_id):
+    return dao.db.execute_read(
+        lambda c: c.execute(
+            "SELECT payload_bytes FROM clipboard_items WHERE id = ?", (item_id,)
+        ).fetchone()[0]
+    )
+
+
+def test_payload_bytes_populated_on_insert(dao_and_query):
+    dao, _ = dao_and_query
+    tid = dao.add_item(_mk("héllo", "t1"))
+    iid = dao.add_item(_mk_image("i1", 4096))
+    # 文本按 UTF-8 字节计
+    assert _payload(dao, tid) == len("héllo".encode("utf-8"))
+    assert _payload(dao, iid) == 4096
+
+
+def test_payload_bytes_recomputed_on_update(dao_and_query):
+    dao, _ = dao_and_query
+    iid = dao.add_item(_mk_image("i1", 4096))
+    dao.update_item_content(iid, text_content="abc", content_type="text")
+    assert _payload(dao, iid) == 3
+    tid = dao.add_item(_mk("short", "t1"))
+    dao.update_item_content(tid, text_content="x" * 100)
+    assert _payload(dao, tid) == 100
+
+
+def test_size_filter_uses_payload_index(dao_and_query):
+    dao, q = dao_and_query
+    dao.add_item(_mk("small", "t1", ts=1000))
+    dao.add_item(_mk_image("big1", 2 * 1024 * 1024, ts=2000))
+    dao.add_item(_mk_image("big2", 3 * 1024 * 1024, ts=3000))
+
+    results = q.search(parse_query("size:>1MB"), space_id="")
+    assert [it.content_hash for it in results] == ["big2", "big1"]
+    assert [it.content_hash for it in q.search(parse_query("size:<1KB"), space_id="")] == ["t1"]
+
+    plans = []
+
+    def op(conn):
+        conn.set_trace_callback(plans.append)
+    dao.db.execute_read(op)
+    q.search(parse_query("size:>1MB"), space_id="")
+    dao.db.execute_read(lambda c: c.set_trace_callback(None))
+    sql = plans[0]
+    plan = dao.db.execute_read(
+        lambda c: [r[3] for r in c.execute("EXPLAIN QUERY PLAN " + sql).fetchall()]
+    )
+    assert any("idx_payload_created" in p for p in plan)
+
+
+def test_get_largest_items(dao_and_query):
+    dao, q = dao_and_query
+    dao.add_item(_mk("tiny", "t1"))
+    dao.add_item(_mk_image("mid", 2048))
+    dao.add_item(_mk_image("big", 8192))
+    assert [it.content_hash for it in q.get_largest_items(limit=2)] == ["big", "mid"]
+    assert [it.content_hash for it in q.get_largest_items(min_bytes=4096)] == ["big"]
+
+
+def test_v5_migration_backfills_payload_bytes(tmp_path):
+    db_path = str(tmp_path / "old.db")
+    db = DatabaseManager(db_path)
+    dao = ClipboardDAO(db)
+    iid = dao.add_item(_mk_image("i1", 1000))
+    # 模拟 v4 库：冗余列为空、版本号回退
+    def op(conn):
+        conn.execute("UPDATE clipboard_items SET payload_bytes = NULL")
+        conn.execute("UPDATE app_meta SET value = '4' WHERE key = 'schema_version'")
+    db.execute_with_retry(op)
+    db.close()
+
+    db = DatabaseManager(db_path)
+    assert _payload(ClipboardDAO(db), iid) == 1000
+    db.close()
+
+
+def test_sort_relevance_ranks_by_bm25_then_recency(dao_and_query):
+    dao, q = dao_and_query
+    now = int(time.time() * 1000)
+    day = 86400000
+    dao.add_item(_mk("deploy deploy deploy", "dense", ts=now - 100 * day))
+    dao.add_item(_mk("notes mention deploy among many other unrelated words", "weak", ts=now))
+    dao.add_item(_mk("weather report", "other", ts=now))
+
+    recent = q.search(parse_query("deploy"), space_id="")
+    assert [it.content_hash for it in recent] == ["weak", "dense"]
+    ranked = q.search(parse_query("sort:relevance deploy"), space_id="")
+    assert [it.content_hash for it in ranked] == ["dense", "weak"]
+
+
+def test_sort_relevance_recency_and_star_break_ties(dao_and_query):
+    dao, q = dao_and_query
+    now = int(time.time() * 1000)
+    day = 86400000
+    dao.add_item(_mk("alpha report", "old", ts=now - 365 * day))
+    dao.add_item(_mk("alpha report", "new", ts=now - day))
+    starred = dao.add_item(_mk("alpha report", "star", ts=now - 365 * day))
+    dao.toggle_star(starred)
+
+    ranked = q.search(parse_query("sort:relevance alpha"), space_id="")
+    assert [it.content_hash for it in ranked] == ["new", "star", "old"]
+    # 分页与 LIMIT 一起下推到 SQLite
+    page2 = q.search(parse_query("sort:relevance alpha"), page=2, page_size=2, space_id="")
+    assert [it.content_hash for it in page2] == ["old"]
+
+
+def _mk_src(text, h, ts, app):
+    item = _mk(text, h, ts)
+    item.source_app = app
+    return item
+
+
+def test_facets_counts_filtered_set_in_one_statement(dao_and_query):
+    dao, q = dao_and_query
+    day = 86400000
+    for i in range(6):
+        dao.add_item(_mk_src(f"needle {i}", f"n{i}", ts=i * day // 2, app="Editor" if i % 2 else "Term"))
+    dao.add_item(_mk_src("haystack", "x", ts=0, app="Editor"))
+    dao.add_item(_mk_image("img", 10))
+
+    statements = []
+    dao.db.execute_read(lambda c: c.set_trace_callback(statements.append))
+    facets = q.facets(parse_query("needle"), space_id="")
+    dao.db.execute_read(lambda c: c.set_trace_callback(None))
+
+    assert len([s for s in statements if not s.startswith("--")]) == 1
+    assert facets["source_app"] == [("Editor", 3), ("Term", 3)]
+    assert facets["content_type"] == [("text", 6)]
+    assert facets["day"] == [(0, 2), (day, 2), (2 * day, 2)]
+    assert facets["tag"] == []
+
+    all_items = q.facets(keys=["content_type"], space_id="")
+    assert all_items == {"content_type": [("text", 7), ("image", 1)]}
+
+
+def test_facets_match_in_memory_counts(dao_and_query):
+    from core.db.clipboard_query import facets_from_items
+
+    dao, q = dao_and_query
+    for i in range(5):
+        dao.add_item(_mk_src(f"row {i}", f"r{i}", ts=1000 + i, app="" if i == 0 else "Editor"))
+    spec = parse_query("row -from:Nope")
+    assert q.facets(spec, space_id="") == facets_from_items(q.search(spec, space_id=""))
+
+
+def test_facets_rejects_unknown_key(dao_and_query):
+    _, q = dao_and_query
+    with pytest.raises(ValueError):
+        q.facets(keys=["color"])
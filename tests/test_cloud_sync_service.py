@@ -513,6 +513,47 @@ class TestCloudSyncTagsRoundTrip(unittest.TestCase):
         finally:
             db.close()
 
+    def test_push_resolves_hydrated_tags_without_per_item_queries(self):
+        """上行源查询带回 tag_ids，标签名走定义缓存：推送时不再逐条查 clipboard_tags。"""
+        from core.cloud_sync_service import _SyncWorker
+
+        db = self._make_db("push_hydrated.db")
+        try:
+            repo = ClipboardRepository(db)
+            for i in range(3):
+                item_id = repo.add_item(
+                    TextClipboardItem(
+                        text_content=f"t{i}",
+                        content_hash=f"hash-h{i}",
+                        preview=f"t{i}",
+                        device_id="local-dev",
+                        device_name="Local",
+                        created_at=1000 + i,
+                    )
+                )
+                repo.tag_service.apply_tag_names(item_id, "", [f"tag{i}"])
+
+            batch = repo.get_unsynced_items(limit=10)
+            self.assertEqual(sorted(len(it.tag_ids) for it in batch), [1, 1, 1])
+
+            cloud_api = MagicMock()
+            cloud_api.upload_items.return_value = []
+            worker = _SyncWorker(cloud_api, repo)
+            with patch.object(
+                repo.tag_service, "list_names_for_item", side_effect=AssertionError("per-item query")
+            ), patch.object(repo.db, "execute_read", wraps=repo.db.execute_read) as reads:
+                worker.do_push(None, batch)
+
+            sent_payload = cloud_api.upload_items.call_args.args[0]
+            self.assertEqual(
+                {p["content_hash"]: p["tags"] for p in sent_payload},
+                {f"hash-h{i}": [f"tag{i}"] for i in range(3)},
+            )
+            # 至多一次整表加载标签定义，与批大小无关
+            self.assertLessEqual(reads.call_count, 1)
+        finally:
+            db.close()
+
     def test_push_no_tags_omits_field(self):
         """没有标签的条目不应在 payload 中带 tags（减小负载，向后兼容）。"""
         from core.cloud_sync_service import _SyncWorker
@@ -29,3 +29,114 @@ def test_controller_constructs(qapp):
     assert c is not None
     parent.close()
     parent.deleteLater()
+
+
+def test_on_changes_applies_deltas_in_place(qapp):
+    from PySide6.QtWidgets import QListView
+    from core.sync_service import ChangeOp, ItemChange
+    from tests.helpers import text_item
+
+    def text(i, created_at, starred=False):
+        return text_item(i, created_at, starred=starred, id=i)
+
+    parent = QWidget()
+    parent.list_view = QListView(parent)
+    parent.timeline_view = None
+    ctx = MagicMock()
+    ctx.repository.get_items_after.return_value = [text(3, 300), text(2, 200), text(1, 100)]
+    c = ClipboardListController(parent, ctx)
+    c.attach_view(parent.list_view)
+    c._model.set_fetcher(c._fetch_after, prefetch=True)
+
+    c.on_changes([
+        ItemChange(ChangeOp.DELETE, 2),
+        ItemChange(ChangeOp.UPDATE, 1, text(1, 100, starred=True)),
+        ItemChange(ChangeOp.INSERT, 4, text(4, 250)),
+    ])
+    assert c.model.ids() == [3, 4, 1]
+    assert c.item_at(2).is_starred
+    assert parent.list_view.model().rowCount() == 3
+    ctx.repository.get_items_after.assert_called_once()
+    parent.close()
+    parent.deleteLater()
+
+
+def test_prewarm_measures_first_screen_rows(qapp):
+    from PySide6.QtWidgets import QListView
+    from tests.helpers import text_item
+
+    parent = QWidget()
+    parent.list_view = QListView(parent)
+    parent.list_view.resize(360, 400)
+    parent.timeline_view = None
+    ctx = MagicMock()
+    ctx.repository.get_items_after.return_value = [
+        text_item(i, i, id=i) for i in (3, 2, 1)
+    ]
+    c = ClipboardListController(parent, ctx)
+    c.attach_view(parent.list_view)
+    c._model.set_fetcher(c._fetch_after, prefetch=True)
+    c.model.invalidate_heights()
+
+    c.prewarm()
+    assert all(c.model.cached_height(i) for i in (3, 2, 1))
+    parent.close()
+    parent.deleteLater()
+
+
+def test_search_cache_invalidated_by_capture_in_list_mode(qapp, tmp_path):
+    from PySide6.QtWidgets import QLineEdit, QListView
+    from core.database import DatabaseManager
+    from core.repository import ClipboardRepository
+    from tests.helpers import text_item
+
+    db = DatabaseManager(str(tmp_path / "test.db"))
+    repo = ClipboardRepository(db)
+
+    def add(i, text):
+        item = text_item(i, device="dev1", text_content=text, preview=text)
+        item.id = repo.add_item(item)
+        return item
+
+    first = add(1, "hello world")
+    add(2, "other")
+
+    parent = QWidget()
+    parent.list_view = QListView(parent)
+    parent.timeline_view = None
+    parent.search_input = QLineEdit(parent)
+    parent.page_label = parent.prev_btn = parent.next_btn = MagicMock()
+    ctx = MagicMock()
+    ctx.repository = repo
+    c = ClipboardListController(parent, ctx)
+    c.attach_view(parent.list_view)
+
+    # 同步执行搜索：submit 只记下请求，do_search 返回后在 UI 线程跑完并回调
+    pending = []
+    service = c.search_service
+
+    def submit(request, callback):
+        service._seq += 1
+        pending.append((service._seq, request, callback))
+        return service._seq
+
+    service.submit = submit
+
+    def search(text):
+        parent.search_input.setText(text)
+        c.do_search()
+        while pending:
+            service._run(*pending.pop(0))
+        return c.model.ids()
+
+    try:
+        assert search("hello") == [first.id]
+        search("")
+        new = add(3, "hello again")
+        c.on_item_added(new)
+        assert sorted(search("hello")) == sorted([first.id, new.id])
+    finally:
+        c.shutdown()
+        parent.close()
+        parent.deleteLater()
+        db.close()
@@ -0,0 +1,102 @@
+"""边缘唤出：每屏一条 1px 条带 + 不支持时的轮询退避间隔。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QPoint, QPointF, QRect, Qt, QTimer
+from PySide6.QtGui import QEnterEvent, QGuiApplication
+from PySide6.QtWidgets import QApplication
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ui.edge_trigger import EdgeTriggerStrips, strip_rect
+from ui.edge_window import (
+    POLL_FAR_MS,
+    POLL_MID_MS,
+    POLL_NEAR_MS,
+    POLL_VISIBLE_MS,
+    POLL_WATCHDOG_MS,
+    EdgeHiddenWindow,
+)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def test_strip_rect_hugs_each_edge():
+    screen = QRect(0, 25, 1440, 875)
+    assert strip_rect(screen, "right") == QRect(1439, 25, 1, 875)
+    assert strip_rect(screen, "left") == QRect(0, 25, 1, 875)
+    assert strip_rect(screen, "top") == QRect(0, 25, 1440, 1)
+    assert strip_rect(screen, "bottom") == QRect(0, 899, 1440, 1)
+
+
+def test_strips_follow_screens_and_report_trigger(qapp):
+    strips = EdgeTriggerStrips("left")
+    # offscreen 插件下无法摆放顶层窗口：调用方应退回轮询
+    assert strips.supported is False
+    strips.set_active(True)
+    assert strips.active is False
+
+    strips.supported = True
+    strips.set_active(True)
+    screen = QGuiApplication.primaryScreen()
+    assert strip_rect(screen.availableGeometry(), "left") in strips.geometries()
+
+    hits = []
+    strips.triggered.connect(hits.append)
+    strips._strips[screen].entered.emit()
+    assert hits == [screen.availableGeometry()]
+
+    strips.set_edge("top")
+    assert strip_rect(screen.availableGeometry(), "top") in strips.geometries()
+    strips.close()
+
+
+def test_fallback_polling_backs_off_with_distance():
+    zone = QRect(1430, 0, 10, 900)
+    interval = EdgeHiddenWindow._fallback_interval
+    assert interval(QPoint(1435, 400), zone) == POLL_NEAR_MS
+    assert interval(QPoint(1300, 400), zone) == POLL_MID_MS
+    assert interval(QPoint(200, 400), zone) == POLL_FAR_MS
+
+
+def test_enter_event_on_active_strip_reveals_and_polling_keeps_watchdog(qapp):
+    from types import SimpleNamespace
+
+    strips = EdgeTriggerStrips("right")
+    strips.supported = True
+    # 看门狗轮询 + 条带并存：_update_trigger_mode 只用到这几个属性
+    window = SimpleNamespace(
+        _is_visible=False, _is_floating=False,
+        _edge_strips=strips, _mouse_check_timer=QTimer(),
+    )
+    EdgeHiddenWindow._update_trigger_mode(window)
+    assert strips.active
+    assert window._mouse_check_timer.isActive()
+    assert window._mouse_check_timer.interval() == POLL_WATCHDOG_MS
+
+    screen = QGuiApplication.primaryScreen()
+    strip = strips._strips[screen]
+    assert strip.testAttribute(Qt.WA_MacAlwaysShowToolWindow)
+    assert strip.isVisible()
+
+    hits = []
+    strips.triggered.connect(hits.append)
+    local = QPointF(0, 10)
+    QApplication.sendEvent(strip, QEnterEvent(local, local, strip.mapToGlobal(local)))
+    assert hits == [screen.availableGeometry()]
+
+    window._is_visible = True
+    EdgeHiddenWindow._update_trigger_mode(window)
+    assert not strips.active and not strip.isVisible()
+    assert window._mouse_check_timer.interval() == POLL_VISIBLE_MS
+    window._mouse_check_timer.stop()
+    strips.close()
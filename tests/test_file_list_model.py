@@ -0,0 +1,60 @@
+"""FileListModel：id → 行索引、进度 / 状态变化按帧合并成一次 dataChanged。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication
+
+from core.file_models import CloudFile, FileSyncState
+from ui.file_list_model import FileListModel
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _file(i, state=FileSyncState.SYNCING.value):
+    return CloudFile(id=i, name=f"f{i}.bin", size_bytes=1000, sync_state=state)
+
+
+def test_index_tracks_inserts_and_removals(qapp):
+    model = FileListModel()
+    model.load([_file(i) for i in range(5)])
+    model.upsert(_file(10))
+    model.remove_by_local_id(2)
+    assert [model.file_at(r).id for r in range(model.rowCount())] == [10, 0, 1, 3, 4]
+    assert model._row_of == {10: 0, 0: 1, 1: 2, 3: 3, 4: 4}
+    # 已有行走更新，不插入新行
+    model.upsert(_file(3, FileSyncState.SYNCED.value))
+    assert model.rowCount() == 5 and model.file_at(3).sync_state == FileSyncState.SYNCED.value
+
+
+def test_progress_and_state_changes_coalesce_per_frame(qapp):
+    model = FileListModel()
+    model.load([_file(i) for i in range(100)])
+    emitted = []
+    model.dataChanged.connect(lambda tl, br, roles=None: emitted.append(
+        (tl.row(), br.row(), tl.column(), br.column())
+    ))
+    for done in range(0, 1000, 10):
+        for fid in (5, 40, 70):
+            model.set_progress(fid, done, 1000)
+    assert emitted == []
+    model._flush()
+    assert emitted == [(5, 70, FileListModel.COL_STATE, FileListModel.COL_STATE)]
+    assert model.data(model.index(40, FileListModel.COL_STATE), Qt.UserRole + 1) == (True, 990, 1000)
+
+    model.set_progress(7, 1, 1000)
+    model.upsert(_file(9, FileSyncState.SYNCED.value))
+    model.remove_by_local_id(7)
+    model._flush()
+    assert emitted[-1] == (8, 8, 0, model.columnCount() - 1)
+    model._flush()
+    assert len(emitted) == 2
+
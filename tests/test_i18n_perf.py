@@ -0,0 +1,88 @@
+"""i18n 性能基准：import 只加载当前语言，t() 热路径的单次调用开销。
+
+import 耗时在子进程里测，避免被本进程里其他测试已加载的语言表污染。
+"""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import timeit
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import i18n
+
+# 墙钟上限都留足 CI / 无 .pyc 时的余量；实测 import ~5ms、t() ~0.3µs
+I18N_IMPORT_BUDGET_MS = 200
+T_CALL_BUDGET_US = 5.0
+
+_PROBE = textwrap.dedent("""
+    import json, sys, time
+    started = time.perf_counter()
+    import i18n
+    imported = (time.perf_counter() - started) * 1000
+    i18n.set_language("ja_JP")
+    i18n.t("settings")
+    print(json.dumps({
+        "import_ms": imported,
+        "loaded": sorted(m for m in sys.modules if m.startswith("i18n_strings.")),
+    }))
+""")
+
+
+def test_import_loads_only_active_language():
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=PROJECT_ROOT,
+        capture_output=True, text=True, timeout=60, check=True,
+    )
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    assert result["loaded"] == ["i18n_strings.ja_JP"]
+    assert result["import_ms"] < I18N_IMPORT_BUDGET_MS, result
+
+
+def test_t_call_cost_within_budget():
+    original = i18n.get_language()
+    try:
+        i18n.set_language("zh_CN")
+        number = 20000
+        plain = min(timeit.repeat(lambda: i18n.t("settings"), number=number, repeat=3))
+        formatted = min(timeit.repeat(
+            lambda: i18n.t("page_info", current=1, total=9), number=number, repeat=3))
+        assert plain / number * 1e6 < T_CALL_BUDGET_US
+        # format 路径只在带 kwargs 时走，开销允许高一些
+        assert formatted / number * 1e6 < T_CALL_BUDGET_US * 4
+    finally:
+        i18n.set_language(original)
+
+
+def test_missing_key_falls_back_to_english_then_key():
+    original = i18n.get_language()
+    try:
+        i18n.set_language("ja_JP")
+        i18n.TRANSLATIONS["en_US"]["__probe_only_en__"] = "English only"
+        assert i18n.t("__probe_only_en__") == "English only"
+        assert i18n.t("__no_such_key__") == "__no_such_key__"
+        i18n.set_language("en_US")
+        assert i18n.t("__no_such_key__") == "__no_such_key__"
+    finally:
+        i18n.TRANSLATIONS["en_US"].pop("__probe_only_en__", None)
+        i18n.set_language(original)
+
+
+def test_every_language_module_is_imported_literally():
+    """打包工具只认字面 import：每种语言都要在 load_language 里有一条 from-import。"""
+    import ast
+    import i18n_strings
+
+    tree = ast.parse(Path(i18n_strings.__file__).read_text(encoding="utf-8"))
+    imported = {
+        alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ImportFrom) and node.module == "i18n_strings"
+        for alias in node.names
+    }
+    assert imported == set(i18n_strings.LANGUAGES) == set(i18n.SUPPORTED_LANGUAGES)
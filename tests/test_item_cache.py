@@ -0,0 +1,135 @@
+"""条目读穿缓存（ItemCache）及其在 DAO 写路径上的失效测试。"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.database import DatabaseManager
+from core.db.item_cache import ItemCache
+from core.models import ImageClipboardItem, TextClipboardItem
+from core.repository import ClipboardRepository
+from tests.helpers import text_item
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db = DatabaseManager(str(tmp_path / "test.db"))
+    repository = ClipboardRepository(db)
+    yield repository
+    db.close()
+
+
+def _text(i):
+    return text_item(i, device="dev1", id=i)
+
+
+class TestItemCacheUnit:
+    def test_get_by_id_and_hash(self):
+        cache = ItemCache()
+        cache.put(_text(1), cache.generation)
+        assert cache.get_by_id(1).text_content == "text 1"
+        assert cache.get_by_hash("h1").id == 1
+        assert cache.get_by_id(2) is None
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (2, 1)
+
+    def test_returns_copies(self):
+        cache = ItemCache()
+        cache.put(_text(1), cache.generation)
+        cache.get_by_id(1).is_starred = True
+        assert cache.get_by_id(1).is_starred is False
+
+    def test_evicts_lru_by_payload_bytes(self):
+        cache = ItemCache(max_bytes=64 * 1024)
+        blob = b"x" * 7000
+        for i in range(8):  # 8 * ~7.5KiB 刚好装满 64KiB
+            cache.put(ImageClipboardItem(id=i, content_hash=f"i{i}", image_data=blob), cache.generation)
+        cache.get_by_id(0)  # 0 变为最近使用
+        cache.put(ImageClipboardItem(id=99, content_hash="i99", image_data=blob), cache.generation)
+        stats = cache.stats()
+        assert stats["bytes"] <= stats["max_bytes"]
+        assert stats["evictions"] > 0
+        assert cache.get_by_id(0) is not None
+        assert cache.get_by_id(1) is None
+
+    def test_oversized_entry_not_cached(self):
+        cache = ItemCache(max_bytes=8 * 1024)
+        cache.put(ImageClipboardItem(id=1, content_hash="big", image_data=b"x" * 4096), cache.generation)
+        assert cache.stats()["entries"] == 0
+
+    def test_stale_put_after_invalidate_is_dropped(self):
+        cache = ItemCache()
+        generation = cache.generation
+        cache.invalidate(1)  # 读库期间发生了写
+        cache.put(_text(1), generation)
+        assert cache.get_by_id(1) is None
+
+    def test_partial_entry_does_not_satisfy_full_read(self):
+        cache = ItemCache()
+        cache.put(_text(1), cache.generation, full=False)
+        assert cache.get_by_hash("h1") is not None
+        assert cache.get_by_id(1) is None
+
+    def test_disabled_cache(self):
+        cache = ItemCache(max_bytes=0)
+        cache.put(_text(1), cache.generation)
+        assert not cache.enabled
+        assert cache.get_by_id(1) is None
+
+
+class TestRepositoryCache:
+    def _add(self, repo, text, h):
+        return repo.add_item(TextClipboardItem(
+            text_content=text, content_hash=h, preview=text,
+            device_id="dev1", created_at=1000,
+        ))
+
+    def test_repeated_reads_hit_cache(self, repo):
+        iid = self._add(repo, "a", "ha")
+        repo.get_item_by_id(iid)
+        repo.get_item_by_id(iid)
+        assert repo.cache_stats()["hits"] == 1
+        repo.get_by_hash("ha")
+        assert repo.cache_stats()["hits"] == 2
+
+    def test_write_paths_invalidate(self, repo):
+        iid = self._add(repo, "a", "ha")
+        assert repo.get_item_by_id(iid).is_starred is False
+        repo.toggle_star(iid)
+        assert repo.get_item_by_id(iid).is_starred is True
+        repo.touch_item(iid, 5000)
+        assert repo.get_by_hash("ha").created_at == 5000
+        repo.set_cloud_id(iid, 42)
+        assert repo.get_item_by_id(iid).cloud_id == 42
+        repo.tag_service.apply_tag_names(iid, "", ["t"])
+        assert len(repo.get_item_by_id(iid).tag_ids) == 1
+        repo.delete_item(iid)
+        assert repo.get_item_by_id(iid) is None
+        assert repo.get_by_hash("ha") is None
+
+    def test_existing_hashes_served_from_cache(self, repo):
+        self._add(repo, "a", "ha")
+        self._add(repo, "b", "hb")
+        repo.get_by_hash("ha")
+        found = repo.get_existing_hashes(["ha", "hb", "missing"])
+        assert set(found) == {"ha", "hb"}
+        assert repo.cache_stats()["hits"] == 1
+
+    def test_cleanup_clears_cache(self, repo):
+        iid = self._add(repo, "a", "ha")
+        repo.get_item_by_id(iid)
+        repo.cleanup_old_items(max_items=0)
+        assert repo.cache_stats()["entries"] == 0
+        assert repo.get_item_by_id(iid) is None
+
+    def test_invalidation_visible_across_threads(self, repo):
+        iid = self._add(repo, "a", "ha")
+        repo.get_item_by_id(iid)
+        t = threading.Thread(target=repo.toggle_star, args=(iid,))
+        t.start()
+        t.join()
+        assert repo.get_item_by_id(iid).is_starred is True
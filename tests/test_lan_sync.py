@@ -0,0 +1,192 @@
+"""局域网对等同步：签名校验、正文加密、清单 + 按需载荷、收藏 / 标签合并、发现信标过滤。"""
+
+import json
+import os
+import sys
+import time
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.database import DatabaseManager
+from core.lan_sync import (
+    API_PREFIX,
+    AUTH_HEADER,
+    LanDiscovery,
+    LanPeerServer,
+    LanSyncClient,
+    LanSyncError,
+    default_bind_host,
+    generate_pairing_key,
+    parse_pairing_key,
+    sign,
+    unseal,
+    verify,
+)
+from core.models import ImageClipboardItem
+from core.repository import ClipboardRepository
+from tests.helpers import text_item
+
+KEY_TEXT = generate_pairing_key()
+KEY = parse_pairing_key(KEY_TEXT)
+
+
+_text = partial(text_item, device="dev-a")
+
+
+@pytest.fixture
+def peers(tmp_path):
+    a = ClipboardRepository(DatabaseManager(str(tmp_path / "a.db")))
+    b = ClipboardRepository(DatabaseManager(str(tmp_path / "b.db")))
+    server = LanPeerServer(a, KEY, "dev-a", host="127.0.0.1")
+    server.start()
+    yield a, b, server
+    server.stop()
+    a.db.close()
+    b.db.close()
+
+
+def test_sign_and_verify():
+    mac = KEY.mac_key
+    header = sign(mac, "GET", "/x", b"body")
+    assert verify(mac, header, "GET", "/x", b"body") == header.split(".")[1]
+    assert verify(mac, header, "GET", "/x", b"tampered") is None
+    assert verify(b"other", header, "GET", "/x", b"body") is None
+    stale = sign(mac, "GET", "/x", b"", ts=int(time.time()) - 3600)
+    assert verify(mac, stale, "GET", "/x", b"") is None
+
+
+def test_pairing_key_is_random_and_group_is_not_derived_from_secret():
+    with pytest.raises(ValueError):
+        parse_pairing_key("correct horse battery staple")
+    other = parse_pairing_key(generate_pairing_key())
+    assert other.group != KEY.group and other.secret != KEY.secret
+    assert len(KEY.secret) == 32
+    # 信标只带公开的随机组标识，没有由密钥本体算出的任何值
+    beacon = json.loads(LanDiscovery(KEY, "dev-a", "A", 5000).beacon())
+    assert beacon["g"] == KEY.group
+    assert KEY.mac_key.hex()[:16] not in json.dumps(beacon)
+    assert default_bind_host() != "0.0.0.0"
+
+
+def test_bodies_are_encrypted_on_the_wire(peers):
+    from http.client import HTTPConnection
+
+    a, _, server = peers
+    a.add_item(_text(1))
+    path = f"{API_PREFIX}/manifest"
+    auth = sign(KEY.mac_key, "GET", path, b"")
+    conn = HTTPConnection("127.0.0.1", server.port, timeout=5)
+    try:
+        conn.request("GET", path, body=b"", headers={AUTH_HEADER: auth})
+        resp = conn.getresponse()
+        raw = resp.read()
+    finally:
+        conn.close()
+    assert resp.status == 200
+    assert b"h1" not in raw and b"dev-a" not in raw
+    aad = f"200 {auth.split('.')[1]}"
+    assert json.loads(unseal(KEY.enc_key, raw, aad))["items"][0][0] == "h1"
+    with pytest.raises(LanSyncError):
+        unseal(parse_pairing_key(generate_pairing_key()).enc_key, raw, aad)
+
+
+@pytest.mark.parametrize("length", [None, "-1", "abc"])
+def test_bad_content_length_rejected_before_reading(peers, length):
+    import socket
+
+    _, _, server = peers
+    request = f"POST {API_PREFIX}/items HTTP/1.0\r\n"
+    if length is not None:
+        request += f"Content-Length: {length}\r\n"
+    with socket.create_connection(("127.0.0.1", server.port), timeout=5) as sock:
+        # 不关写端：服务端若按 -1 读到 EOF 会卡住直到超时
+        sock.sendall((request + "\r\n").encode("ascii"))
+        status = sock.recv(64).split(b"\r\n", 1)[0]
+    assert b" 400 " in status
+
+
+def test_manifest_cache_follows_tag_renames(peers):
+    a, _, server = peers
+    iid = a.add_item(_text(1))
+    a.tag_service.apply_tag_names(iid, "", ["work"])
+    _, body = server.manifest()
+    assert json.loads(body)["items"][0][3] == ["work"]
+
+    tag = a.tag_service.list_tags("")[0]
+    a.tag_service.update_tag(tag.id, name="office")
+    _, body = server.manifest()
+    assert json.loads(body)["items"][0][3] == ["office"]
+
+
+def test_pulls_missing_payloads_and_merges_stars_and_tags(peers):
+    a, b, server = peers
+    shared_id = a.add_item(_text(1, starred=True))
+    a.tag_service.apply_tag_names(shared_id, "", ["work"])
+    a.add_item(_text(2))
+    a.add_item(ImageClipboardItem(
+        content_hash="img", image_data=b"\x89PNG" * 100, image_thumbnail=b"thumb",
+        device_id="dev-a", created_at=3000,
+    ))
+    # b 已有 h1（未收藏、无标签）和自己收藏的 h2
+    b.add_item(_text(1, device="dev-b"))
+    b.add_item(_text(2, device="dev-b", starred=True))
+
+    client = LanSyncClient(b, KEY, "dev-b")
+    fetched = []
+    original = server.items
+    server.items = lambda hashes: fetched.extend(hashes) or original(hashes)
+    result = client.sync_with("127.0.0.1", server.port)
+
+    # 只取本地缺的载荷
+    assert fetched == ["img"]
+    assert [it.content_hash for it in result.new_items] == ["img"]
+    image = b.get_item_by_id(b.get_by_hash("img").id)
+    assert image.image_data == b"\x89PNG" * 100
+    h1 = b.get_by_hash("h1")
+    assert h1.is_starred
+    assert b.tag_service.list_names_for_item(h1.id) == ["work"]
+    # 对等同步只传播收藏，不传播取消收藏
+    assert b.get_by_hash("h2").is_starred
+
+    # 清单未变：304，不再合并
+    assert client.sync_with("127.0.0.1", server.port).new_items == []
+    assert fetched == ["img"]
+
+
+def test_wrong_key_and_watermark_after_restart(peers):
+    a, b, server = peers
+    a.add_item(_text(1))
+    with pytest.raises(LanSyncError):
+        LanSyncClient(b, parse_pairing_key(generate_pairing_key()), "dev-b").sync_with(
+            "127.0.0.1", server.port)
+
+    assert len(LanSyncClient(b, KEY, "dev-b").sync_with("127.0.0.1", server.port).new_items) == 1
+    # 本机删掉同步来的条目后"重启"：水位线以内的旧条目不拉回来，新条目照常拉取
+    b.delete_item(b.get_by_hash("h1").id)
+    a.add_item(_text(2, created_at=5000))
+    result = LanSyncClient(b, KEY, "dev-b").sync_with("127.0.0.1", server.port)
+    assert [it.content_hash for it in result.new_items] == ["h2"]
+    assert b.get_by_hash("h1") is None
+
+
+def test_replayed_request_rejected(peers):
+    _, _, server = peers
+    header = sign(KEY.mac_key, "GET", "/lan/v1/manifest", b"")
+    assert server.authenticate(header, "GET", "/lan/v1/manifest", b"") is not None
+    assert server.authenticate(header, "GET", "/lan/v1/manifest", b"") is None
+
+
+def test_discovery_accepts_only_same_group():
+    disc = LanDiscovery(KEY, "dev-a", "A", 5000)
+    beacon = json.loads(LanDiscovery(KEY, "dev-b", "B", 6000).beacon())
+    peer = disc.handle_datagram(json.dumps(beacon).encode(), ("10.0.0.2", 47700))
+    assert (peer.device_id, peer.host, peer.port) == ("dev-b", "10.0.0.2", 6000)
+    # 同一对端重复信标不算新对端
+    assert disc.handle_datagram(json.dumps(beacon).encode(), ("10.0.0.2", 47700)) is None
+    other = parse_pairing_key(generate_pairing_key())
+    assert disc.handle_datagram(LanDiscovery(other, "dev-c", "C", 1).beacon(), ("10.0.0.3", 1)) is None
+    assert disc.handle_datagram(disc.beacon(), ("127.0.0.1", 1)) is None
+    assert [p.device_id for p in disc.peers()] == ["dev-b"]
@@ -0,0 +1,157 @@
+"""DatabaseMigrator：keyset 流式迁移、v3.4 列与标签、按字节切批、断点续传。"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.database import DatabaseManager
+from core.migration import CHECKPOINT_KEY, DatabaseMigrator
+from core.models import ImageClipboardItem, TextClipboardItem
+from core.repository import ClipboardRepository
+from tests.helpers import text_item
+
+
+def _repo(path):
+    return ClipboardRepository(DatabaseManager(str(path)))
+
+
+@pytest.fixture
+def pair(tmp_path):
+    source = _repo(tmp_path / "source.db")
+    target = _repo(tmp_path / "target.db")
+    for i in range(25):
+        iid = source.add_item(text_item(
+            i, device="dev1", starred=(i == 3),
+            space_id="team" if i % 2 else None, source_app="Editor",
+            source_title=f"doc{i}",
+        ))
+        if i % 5 == 0:
+            source.tag_service.apply_tag_names(iid, "", ["work"])
+    source.add_item(ImageClipboardItem(
+        content_hash="img", image_data=b"x" * 5000, device_id="dev1", created_at=5000,
+    ))
+    yield source, target
+    source.db.close()
+    target.db.close()
+
+
+def test_migrates_all_columns_and_tags(pair):
+    source, target = pair
+    # 目标库已有一条同 hash 的条目和一个同名标签（id 不同）
+    target.add_item(TextClipboardItem(
+        text_content="text 0", content_hash="h0", preview="text 0", device_id="other",
+        created_at=1,
+    ))
+    existing_tag = target.tag_service.create_tag("", "work")
+
+    progress = []
+    migrated = DatabaseMigrator(source, target, page_size=7).migrate(
+        lambda cur, tot: progress.append((cur, tot))
+    )
+    assert migrated == 25
+    assert progress[-1] == (26, 26)
+
+    item = target.get_by_hash("h3")
+    assert (item.is_starred, item.space_id, item.source_app, item.source_title) == (
+        True, "team", "Editor", "doc3",
+    )
+    image = target.get_item_by_id(target.get_by_hash("img").id)
+    assert image.image_data == b"x" * 5000
+    assert target.get_tags_for_item(target.get_by_hash("h5").id) == [existing_tag.id]
+    assert target.get_tags_for_item(target.get_by_hash("h0").id) == [existing_tag.id]
+    assert target.get_meta(CHECKPOINT_KEY) == ""
+
+
+def test_batches_capped_by_payload_bytes(pair):
+    source, target = pair
+    migrator = DatabaseMigrator(source, target, page_size=100, max_batch_bytes=64)
+    sizes = []
+    original = migrator._write_batch
+
+    def spy(batch, tag_map):
+        sizes.append(sum(it.payload_bytes for it in batch.items))
+        return original(batch, tag_map)
+
+    migrator._write_batch = spy
+    assert migrator.migrate() == 26
+    # 每批 ≤ 64 字节；超大的单张图片单独成批
+    assert len(sizes) > 1
+    assert all(n <= 64 for n in sizes[:-1]) and sizes[-1] == 5000
+
+
+def test_resume_from_checkpoint_after_failure(pair):
+    source, target = pair
+    migrator = DatabaseMigrator(source, target, page_size=10)
+    original = migrator._write_batch
+    writes = []
+
+    def failing(batch, tag_map):
+        if writes:
+            raise RuntimeError("disk full")
+        writes.append(batch.last_id)
+        return original(batch, tag_map)
+
+    migrator._write_batch = failing
+    with pytest.raises(RuntimeError):
+        migrator.migrate()
+    last_id, migrated = migrator.load_checkpoint()
+    assert (last_id, migrated) == (writes[0], 10)
+
+    read_from = []
+    original_iter = source.iter_items_full
+    source.iter_items_full = lambda a, n: read_from.append(a) or original_iter(a, n)
+    progress = []
+    assert DatabaseMigrator(source, target, page_size=10).migrate(
+        lambda cur, tot: progress.append(cur)
+    ) == 26
+    assert read_from == [last_id]
+    assert progress[0] == 20
+    assert target.count_items_upto() == 26
+
+
+def test_iter_rows_streams_in_batches(pair):
+    source, _ = pair
+    sql = "SELECT id, content_hash FROM clipboard_items ORDER BY id"
+    with source.db.get_connection() as conn:
+        batches = list(source.db.iter_rows(conn, sql, (), batch_size=10))
+    assert [len(rows) for _, rows in batches] == [10, 10, 6]
+    assert batches[0][0] == ("id", "content_hash")
+    assert [len(chunk) for chunk in source.iter_items_full(20, batch_size=4)] == [4, 2]
+
+
+def test_migrates_archived_rows_with_their_own_checkpoint(pair):
+    from core.db.archive_dao import default_archive_path
+
+    source, target = pair
+    archive = source.enable_archive(default_archive_path(source.db.db_path))
+    # 除收藏外的前 10 条（含带标签的 h0 / h5）进归档层
+    assert archive.archive_older_than(cutoff_ms=1010) == 9
+    assert source.count_items_upto() == 17
+
+    migrator = DatabaseMigrator(source, target, page_size=4)
+    original = migrator._write_batch
+    failed = []
+
+    def failing(batch, tag_map):
+        if batch.items[0].content_hash == "h5" and not failed:
+            failed.append(batch.last_id)
+            raise RuntimeError("disk full")
+        return original(batch, tag_map)
+
+    migrator._write_batch = failing
+    with pytest.raises(RuntimeError):
+        migrator.migrate()
+    # 热数据已搬完，归档层从自己的断点（第一批归档的最后一条 h4）继续
+    assert migrator.load_archive_checkpoint() == source.archive.get_by_hash("h4").id
+
+    progress = []
+    assert migrator.migrate(lambda cur, tot: progress.append((cur, tot))) == 26
+    assert progress[-1] == (26, 26)
+    assert target.count_items_upto() == 26
+    moved = target.get_by_hash("h5")
+    assert moved.text_content == "text 5"
+    assert target.get_tags_for_item(moved.id) == [target.tag_service.list_tags("")[0].id]
+    assert target.get_meta(CHECKPOINT_KEY) == ""
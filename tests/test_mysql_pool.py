@@ -0,0 +1,176 @@
+"""ConnectionPool：有界借出 / 归还、校验、空闲淘汰；MySQLDatabaseManager 的池化接入。"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.mysql_pool import ConnectionPool, PoolTimeout
+
+
+class _FakeConn:
+    _next = 0
+
+    def __init__(self):
+        _FakeConn._next += 1
+        self.n = _FakeConn._next
+        self.closed = False
+        self.alive = True
+        self.pings = 0
+        self.rollbacks = 0
+
+    def ping(self, reconnect=False):
+        self.pings += 1
+        if not self.alive:
+            raise ConnectionError("gone")
+
+    def close(self):
+        self.closed = True
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def commit(self):
+        pass
+
+
+def _pool(**kw):
+    kw.setdefault("maintenance_interval_s", None)
+    return ConnectionPool(_FakeConn, validate=lambda c: c.ping(), **kw)
+
+
+def test_release_reuses_connection():
+    pool = _pool()
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert pool.stats()["created"] == 1
+    assert pool.stats()["acquire_wait"]["count"] == 2
+
+
+def test_full_pool_waits_then_times_out():
+    pool = _pool(max_size=2)
+    a = pool.acquire()
+    pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire(timeout=0.05)
+    threading.Timer(0.05, pool.release, args=(a,)).start()
+    assert pool.acquire(timeout=2) is a
+    stats = pool.stats()
+    assert (stats["timeouts"], stats["in_use"]) == (1, 2)
+    assert stats["acquire_wait"]["max_ms"] >= 40
+
+
+def test_stale_idle_connection_validated_on_checkout():
+    pool = _pool(validate_after_s=0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.alive = False
+    fresh = pool.acquire()
+    assert fresh is not conn and conn.closed
+    assert pool.stats()["discarded"] == 1
+
+
+def test_maintenance_evicts_idle_beyond_min_and_pings_rest():
+    pool = _pool(max_idle_s=0, validate_after_s=0, min_idle=1)
+    conns = [pool.acquire() for _ in range(3)]
+    for c in conns:
+        pool.release(c)
+    time.sleep(0.01)
+    pool.run_maintenance()
+    assert [c.closed for c in conns] == [True, True, False]
+    assert conns[2].pings == 1
+    assert pool.stats()["idle"] == 1
+
+
+def test_discard_frees_slot_and_close_closes_idle():
+    pool = _pool(max_size=1)
+    conn = pool.acquire()
+    pool.release(conn, discard=True)
+    other = pool.acquire(timeout=0.1)
+    pool.release(other)
+    pool.close()
+    assert conn.closed and other.closed
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+
+
+def test_mysql_manager_nested_checkout_and_rollback(monkeypatch):
+    pymysql = pytest.importorskip("pymysql")
+    from core import mysql_database
+    from core.mysql_database import MySQLDatabaseManager
+
+    monkeypatch.setattr(MySQLDatabaseManager, "_create_connection", lambda self: _FakeConn())
+    monkeypatch.setattr(MySQLDatabaseManager, "_init_database", lambda self: None)
+    db = MySQLDatabaseManager("h", 3306, "u", "p", "db", pool_size=2)
+    try:
+        with db.get_connection() as outer:
+            # 同线程嵌套复用同一条连接，不占第二个名额
+            assert db.execute_read(lambda conn: conn) is outer
+            assert db.pool_stats()["in_use"] == 1
+        with pytest.raises(ValueError):
+            with db.get_connection():
+                raise ValueError("boom")
+        assert outer.rollbacks == 1 and not outer.closed
+        with pytest.raises(pymysql.OperationalError):
+            with db.get_connection():
+                raise pymysql.OperationalError(2013, "lost")
+        assert outer.closed
+        assert db.pool_stats()["in_use"] == 0
+    finally:
+        db.close()
+
+    assert mysql_database._translate_placeholders("a = ? AND b = ?") == "a = %s AND b = %s"
+    assert db.pool_stats()["sql_cache"]["size"] >= 1
+
+
+class _CountingConn(_FakeConn):
+    def __init__(self):
+        super().__init__()
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+
+
+def test_mysql_nested_retry_leaves_commit_and_disconnect_to_outer(monkeypatch):
+    pymysql = pytest.importorskip("pymysql")
+    from core import mysql_database
+    from core.mysql_database import MySQLDatabaseManager
+
+    monkeypatch.setattr(MySQLDatabaseManager, "_create_connection", lambda self: _CountingConn())
+    monkeypatch.setattr(MySQLDatabaseManager, "_init_database", lambda self: None)
+    sleeps = []
+    monkeypatch.setattr(mysql_database.time, "sleep", sleeps.append)
+    db = MySQLDatabaseManager("h", 3306, "u", "p", "db", pool_size=2)
+    try:
+        def outer_op(conn):
+            db.execute_with_retry(lambda c: None)
+            db.execute_read(lambda c: None)
+            # 内层不能提前提交外层事务
+            assert conn.commits == 0
+            return conn
+
+        conn = db.execute_with_retry(outer_op)
+        assert conn.commits == 1
+
+        calls = []
+
+        def lost(conn):
+            calls.append(conn)
+            if len(calls) == 1:
+                raise pymysql.OperationalError(2013, "lost")
+            return "ok"
+
+        # 内层断线不在死连接上重试，抛到最外层：丢弃连接、换新连接整体重放
+        result = db.execute_with_retry(lambda conn: db.execute_with_retry(lost))
+        assert result == "ok"
+        assert len(calls) == 2 and calls[0] is not calls[1]
+        assert calls[0].closed
+        assert len(sleeps) == 1
+    finally:
+        db.close()
@@ -53,3 +53,31 @@ def test_mysql_init_creates_v34_team_tables():
         "clipboard_tags", "share_links",
     ):
         assert required in tables, f"缺少表 {required}；实际表：{sorted(tables)}"
+
+
+def test_mysql_fulltext_keyword_search():
+    """v8 迁移建出 ngram FULLTEXT 索引，关键词搜索走 MATCH ... AGAINST。"""
+    import uuid
+
+    from core.models import TextClipboardItem
+    from core.mysql_database import MySQLDatabaseManager
+    from core.repository import ClipboardRepository
+
+    db = MySQLDatabaseManager(_HOST, _PORT, _USER, _PASSWORD, _DATABASE)
+    try:
+        repo = ClipboardRepository(db)
+        assert repo._dao._has_fulltext
+        marker = uuid.uuid4().hex[:12]
+        text = f"全文检索 {marker} 测试"
+        iid = repo.add_item(TextClipboardItem(
+            text_content=text, content_hash=f"ft-{marker}", preview=text,
+            device_id="test", created_at=1000,
+        ))
+        try:
+            items, total = repo.search_by_keyword(f"{marker[2:8]} 检索", space_id=None)
+            assert [it.id for it in items] == [iid]
+            assert total == 1
+        finally:
+            repo.delete_item(iid)
+    finally:
+        db.close()
@@ -258,6 +258,28 @@ def test_filter_is_unknown_raises():
         parse("is:video")
 
 
+# ---------------------------------------------------------------------------
+# 选项: sort
+# ---------------------------------------------------------------------------
+
+
+def test_sort_defaults_to_recent():
+    assert parse("hello").sort == "recent"
+
+
+def test_sort_relevance_is_not_a_filter():
+    spec = parse("sort:relevance deploy")
+    assert spec.sort == "relevance"
+    assert spec.keywords == ["deploy"]
+    assert spec.filters == []
+    assert spec.fts_match_expression() == "deploy*"
+
+
+def test_sort_unknown_value_raises():
+    with pytest.raises(QueryParseError):
+        parse("sort:oldest")
+
+
 # ---------------------------------------------------------------------------
 # 否定
 # ---------------------------------------------------------------------------
@@ -379,3 +401,14 @@ def test_fts_expression_filters_do_not_leak_into_match():
     """filters 不应进入 FTS 表达式，只有 keywords/phrases 会。"""
     spec = parse("tag:work python")
     assert spec.fts_match_expression() == "python*"
+
+
+def test_boolean_mode_expression_requires_every_term():
+    spec = parse('"hello world" py* 剪贴')
+    # 短语先于关键词；ngram 下 * 无意义被去掉
+    assert spec.boolean_mode_expression() == ('+"hello world" +"py" +"剪贴"', [])
+
+
+def test_boolean_mode_expression_short_keywords_left_for_like():
+    spec = QuerySpec(keywords=["a", 'say"hi', "剪"])
+    assert spec.boolean_mode_expression() == ('+"say hi"', ["a", "剪"])
@@ -0,0 +1,130 @@
+"""QueryPlanner：按选择率在 fts_first / filter_first / scan 之间选择。"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.database import DatabaseManager
+from core.db.query_planner import (
+    STRATEGY_FILTER_FIRST,
+    STRATEGY_FTS_FIRST,
+    STRATEGY_SCAN,
+)
+from core.models import TextClipboardItem
+from core.query_parser import parse as parse_query
+from core.repository import ClipboardRepository
+
+_ROWS = 3000
+
+
+@pytest.fixture(scope="module")
+def repo(tmp_path_factory):
+    db = DatabaseManager(str(tmp_path_factory.mktemp("planner") / "test.db"))
+    repository = ClipboardRepository(db)
+    for i in range(_ROWS):
+        text = f"common entry {i}" + (" rare" if i % 600 == 0 else "")
+        repository.add_item(TextClipboardItem(
+            text_content=text, content_hash=f"h{i}", preview=text[:50],
+            device_id="dev1", created_at=1000 + i,
+            source_app="Terminal" if i % 300 == 0 else "Editor",
+        ))
+    # 应用里由启动后的后台线程刷新；测试里同步刷一次
+    repository._query.planner.refresh()
+    yield repository
+    db.close()
+
+
+def _strategy(repo, query, **kw):
+    return repo.explain_search(parse_query(query), space_id="", **kw)["strategy"]
+
+
+def test_selective_filter_with_common_keyword_goes_filter_first(repo):
+    info = repo.explain_search(parse_query("from:Terminal common"), space_id="")
+    assert info["strategy"] == STRATEGY_FILTER_FIRST
+    assert any("idx_source_created" in step for step in info["sqlite_plan"])
+    assert "filter_first" in info["description"]
+
+
+def test_rare_keyword_goes_fts_first(repo):
+    assert _strategy(repo, "rare") == STRATEGY_FTS_FIRST
+
+
+def test_unselective_query_scans_recent_rows(repo):
+    info = repo.explain_search(parse_query("common"), space_id="", page_size=20)
+    assert info["strategy"] == STRATEGY_SCAN
+    assert any("idx_created_at" in step for step in info["sqlite_plan"])
+
+
+def test_non_fts_query_has_no_plan(repo):
+    assert _strategy(repo, "from:Terminal") is None
+    assert _strategy(repo, "sort:relevance common") is None
+
+
+@pytest.mark.parametrize("strategy", [STRATEGY_FTS_FIRST, STRATEGY_FILTER_FIRST, STRATEGY_SCAN])
+@pytest.mark.parametrize("query", ["from:Terminal common", "rare", "common -from:Editor"])
+def test_all_strategies_return_same_rows(repo, monkeypatch, strategy, query):
+    spec = parse_query(query)
+    expected = [it.id for it in repo.search(spec, page_size=10, space_id="")]
+    expected_total = repo.search_by_keyword(query, page_size=10, space_id="")[1]
+
+    planner = repo._query.planner
+    original = planner.plan
+
+    def forced(*args, **kwargs):
+        plan = original(*args, **kwargs)
+        plan.strategy = strategy
+        return plan
+
+    monkeypatch.setattr(planner, "plan", forced)
+    assert [it.id for it in repo.search(spec, page_size=10, space_id="")] == expected
+    assert repo.search_by_keyword(query, page_size=10, space_id="")[1] == expected_total
+
+
+def test_plan_reads_only_cached_stats_and_refresh_runs_in_maintenance(tmp_path):
+    db = DatabaseManager(str(tmp_path / "cold.db"))
+    repository = ClipboardRepository(db)
+    for i in range(20):
+        repository.add_item(TextClipboardItem(
+            text_content=f"cold entry {i}", content_hash=f"c{i}", preview=f"cold {i}",
+            device_id="dev1", created_at=1000 + i, source_app="Editor",
+        ))
+    planner = repository._query.planner
+    statements = []
+    with db.get_connection() as conn:
+        conn.set_trace_callback(statements.append)
+        try:
+            plan = planner.plan(conn, parse_query("from:Editor cold"), "", 20)
+        finally:
+            conn.set_trace_callback(None)
+    # 按键路径：不扫表分组、不 ANALYZE、不建 fts5vocab
+    joined = "\n".join(statements).upper()
+    assert "GROUP BY" not in joined and "ANALYZE" not in joined and "CREATE" not in joined
+    assert plan.total_rows == 20
+    assert planner.needs_refresh
+
+    repository.refresh_search_stats()
+    repository.wait_search_stats(5.0)
+    assert not planner.needs_refresh
+    with db.get_connection() as conn:
+        assert planner.stats(conn).sources == {"Editor": 20}
+    planner.invalidate()
+    assert planner.needs_refresh
+    db.close()
+
+
+def test_refresh_skips_tag_stats_without_tag_tables(tmp_path):
+    from core.db.query_planner import QueryPlanner
+
+    db = DatabaseManager(str(tmp_path / "notags.db"))
+    repository = ClipboardRepository(db)
+    repository.add_item(TextClipboardItem(
+        text_content="x", content_hash="x", preview="x", device_id="d", created_at=1,
+    ))
+    # 老库 / 未迁移标签的库：没有 clipboard_tags，分组统计不能因此整体失败
+    db.execute_with_retry(lambda conn: conn.execute("DROP TABLE IF EXISTS clipboard_tags"))
+    stats = QueryPlanner(db, has_tags=False).refresh()
+    assert stats.tags == {} and stats.total == 1
+    db.close()
@@ -0,0 +1,168 @@
+"""列表/搜索热路径的行解码测试：row_decoder + __slots__ 模型。
+
+末尾的分配量对比同时是一个 micro-benchmark：
+    python tests/test_row_decoding.py
+会打印两条路径解码同一批行的耗时与 tracemalloc 峰值。
+"""
+
+import os
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.database import DatabaseManager
+from core.db.clipboard_dao import ClipboardDAO
+from core.models import (
+    ClipboardItem,
+    ImageClipboardItem,
+    TextClipboardItem,
+    row_decoder,
+)
+from core.repository import ClipboardRepository
+from tests.helpers import text_item
+
+_ROWS = 2000
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(str(tmp_path / "test.db"))
+    yield manager
+    manager.close()
+
+
+def _populate(db, n):
+    repo = ClipboardRepository(db)
+    for i in range(n):
+        if i % 10 == 0:
+            repo.add_item(ImageClipboardItem(
+                content_hash=f"img{i}", device_id="dev1", device_name="PC",
+                created_at=1000 + i, image_thumbnail=b"t",
+            ))
+        else:
+            repo.add_item(text_item(
+                i, device="dev1", device_name="PC", source_app="Editor",
+            ))
+    return repo
+
+
+def _select_sql():
+    return f"SELECT {ClipboardDAO._SELECT_FIELDS_NO_IMAGE} FROM clipboard_items ORDER BY id"
+
+
+def _decode_legacy(db):
+    def op(conn):
+        return [ClipboardItem.from_db_row(r) for r in db.fetch_all(conn, _select_sql())]
+    return db.execute_read(op)
+
+
+def _decode_fast(db):
+    def op(conn):
+        columns, rows = db.fetch_rows(conn, _select_sql())
+        decode = row_decoder(columns)
+        return [decode(r) for r in rows]
+    return db.execute_read(op)
+
+
+def test_decoder_matches_from_db_row(db):
+    _populate(db, 30)
+    assert _decode_fast(db) == _decode_legacy(db)
+
+
+def test_fetch_rows_returns_plain_tuples(db):
+    _populate(db, 3)
+
+    def op(conn):
+        return db.fetch_rows(conn, _select_sql())
+
+    columns, rows = db.execute_read(op)
+    assert columns[:3] == ("id", "content_type", "text_content")
+    assert all(type(r) is tuple for r in rows)
+    # 本游标关掉 row_factory 不影响连接上的其他读取
+    assert isinstance(db.execute_read(lambda c: c.execute("SELECT 1").fetchone()), sqlite3.Row)
+
+
+def test_decoder_is_cached_per_column_layout():
+    cols = (
+        "id", "content_type", "text_content", "image_data", "image_thumbnail",
+        "content_hash", "preview", "device_id", "device_name",
+        "created_at", "is_starred", "cloud_id",
+    )
+    assert row_decoder(cols) is row_decoder(tuple(cols))
+
+
+def test_decoder_defaults_missing_v34_columns():
+    cols = (
+        "id", "content_type", "text_content", "image_data", "image_thumbnail",
+        "content_hash", "preview", "device_id", "device_name",
+        "created_at", "is_starred", "cloud_id",
+    )
+    item = row_decoder(cols)((7, "text", "x", None, None, "h", "x", "d", "n", 5, 1, None))
+    assert isinstance(item, TextClipboardItem)
+    assert item.is_starred is True
+    assert item.space_id is None
+    assert item.source_app == ""
+    assert item.tag_ids == ()
+
+
+def test_decoder_rejects_incomplete_layout():
+    with pytest.raises(ValueError):
+        row_decoder(("id", "content_type"))
+
+
+def test_items_are_slotted():
+    item = TextClipboardItem(text_content="a", content_hash="h")
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(AttributeError):
+        item.not_a_field = 1
+
+
+def test_fast_path_allocates_less(db):
+    _populate(db, _ROWS)
+    # 预热：建连接、编译语句、填充解码器缓存
+    _decode_legacy(db)
+    _decode_fast(db)
+
+    legacy_peak = _peak_alloc(lambda: _decode_legacy(db))
+    fast_peak = _peak_alloc(lambda: _decode_fast(db))
+    assert fast_peak < legacy_peak
+
+
+def _peak_alloc(fn):
+    tracemalloc.start()
+    try:
+        result = fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(result) == _ROWS
+    return peak
+
+
+def _bench(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(os.path.join(tmp, "bench.db"))
+        _populate(manager, _ROWS)
+        for name, fn in (("sqlite3.Row + from_db_row", _decode_legacy),
+                         ("tuple + row_decoder", _decode_fast)):
+            fn(manager)
+            elapsed = _bench(lambda: fn(manager))
+            peak = _peak_alloc(lambda: fn(manager))
+            print(f"{name:28s} {elapsed * 1000:7.2f} ms  peak {peak / 1024:8.1f} KiB  ({_ROWS} rows)")
+        manager.close()
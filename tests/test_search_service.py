@@ -0,0 +1,142 @@
+"""SearchService：结果缓存、细化过滤、过期查询取消。"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from core.base_database import QueryCancelled
+from core.database import DatabaseManager
+from core.models import TextClipboardItem
+from core.repository import ClipboardRepository
+from core.search_service import SearchRequest, SearchService
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db = DatabaseManager(str(tmp_path / "test.db"))
+    repository = ClipboardRepository(db)
+    texts = ["hello world", "help wanted", "shell script", "hello again", "other"]
+    for i, text in enumerate(texts):
+        repository.add_item(TextClipboardItem(
+            text_content=text, content_hash=f"h{i}", preview=text,
+            device_id="dev1", created_at=1000 + i,
+        ))
+    yield repository
+    db.close()
+
+
+def _texts(result):
+    return [it.text_content for it in result.items]
+
+
+def test_repeated_query_served_from_cache(repo):
+    service = SearchService(repo)
+    first = service.search(SearchRequest("hello WORLD"))
+    again = service.search(SearchRequest("world hello"))
+    assert first.source == "db"
+    assert again.source == "cache"
+    assert _texts(again) == ["hello world"]
+    assert service.db_queries == 1
+
+
+def test_refinement_filters_previous_results(repo):
+    service = SearchService(repo)
+    assert _texts(service.search(SearchRequest("hel"))) == ["hello again", "help wanted", "hello world"]
+    refined = service.search(SearchRequest("hell"))
+    assert refined.source == "refined"
+    # 与查库结果一致：FTS 是词前缀匹配，"shell" 不命中 "hell"
+    assert _texts(refined) == ["hello again", "hello world"]
+    assert refined.total == 2
+    assert _texts(service.search(SearchRequest("hell again"))) == ["hello again"]
+    assert service.db_queries == 1
+
+
+def test_incomplete_page_is_not_refined(repo):
+    service = SearchService(repo)
+    service.search(SearchRequest("hel", page_size=2))
+    assert service.search(SearchRequest("hell", page_size=2)).source == "db"
+
+
+def test_changed_filters_hit_database(repo):
+    service = SearchService(repo)
+    service.search(SearchRequest("hel"))
+    assert service.search(SearchRequest("hell", starred_only=True)).source == "db"
+    assert service.search(SearchRequest("sort:relevance hello")).source == "db"
+
+
+def test_facets_cached_and_refined_with_results(repo):
+    service = SearchService(repo)
+    keys = ("content_type", "source_app")
+    first = service.search(SearchRequest("hel", facet_keys=keys))
+    assert first.facets["content_type"] == [("text", 3)]
+    assert service.search(SearchRequest("hel", facet_keys=keys)).facets == first.facets
+    refined = service.search(SearchRequest("hell", facet_keys=keys))
+    assert refined.source == "refined"
+    assert refined.facets["content_type"] == [("text", 2)]
+    assert service.db_queries == 1
+
+
+def test_invalidate_drops_cache(repo):
+    service = SearchService(repo)
+    service.search(SearchRequest("hello"))
+    service.invalidate()
+    assert service.search(SearchRequest("hello")).source == "db"
+
+
+def test_progress_handler_interrupts_running_query(repo):
+    calls = []
+
+    def should_cancel():
+        calls.append(1)
+        return len(calls) > 3
+
+    def op(conn):
+        return conn.execute(
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 50000000) "
+            "SELECT COUNT(*) FROM n"
+        ).fetchone()
+
+    with pytest.raises(QueryCancelled):
+        with repo.db.cancellable(should_cancel):
+            repo.db.execute_read(op)
+    # handler 已卸载：后续查询不受影响
+    assert repo.db.execute_read(lambda c: c.execute("SELECT 1").fetchone()[0]) == 1
+
+
+class _BlockingRepo:
+    """第一次查询卡住直到放行，用来制造"旧查询还在跑、新查询已提交"。"""
+
+    def __init__(self, db):
+        self.db = db
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def search_by_keyword(self, keyword, page, page_size, starred_only=False, space_id=None):
+        if keyword == "slow":
+            self.started.set()
+            self.release.wait(5)
+        return [], 0
+
+
+def test_superseded_submit_never_calls_back(repo):
+    blocking = _BlockingRepo(repo.db)
+    service = SearchService(blocking)
+    results = []
+    done = threading.Event()
+
+    def callback(result):
+        results.append(result.request.query)
+        done.set()
+
+    service.submit(SearchRequest("slow"), callback)
+    assert blocking.started.wait(5)
+    latest = service.submit(SearchRequest("fast"), callback)
+    blocking.release.set()
+    assert done.wait(5)
+    service.shutdown()
+    assert results == ["fast"]
+    assert latest == 2
@@ -83,10 +83,11 @@ def test_each_tab_constructs(qapp, ctx):
     from ui.settings.database_tab import DatabaseTab
     from ui.settings.filter_tab import FilterTab
     from ui.settings.general_tab import GeneralTab
+    from ui.settings.lan_tab import LanTab
     from ui.settings.plugins_tab import PluginsTab
     from ui.settings.team_tab import TeamTab
 
-    for cls in (GeneralTab, DatabaseTab, FilterTab, CloudTab, TeamTab, AboutTab):
+    for cls in (GeneralTab, DatabaseTab, FilterTab, CloudTab, LanTab, TeamTab, AboutTab):
         w = cls(ctx=ctx)
         assert w is not None
         w.close()
@@ -96,6 +97,33 @@ def test_each_tab_constructs(qapp, ctx):
     w.close()
 
 
+def test_lan_tab_generates_and_persists_pairing_key(qapp, ctx, monkeypatch):
+    import config
+    from ui.settings import lan_tab as lan_module
+    from ui.settings.lan_tab import LanTab
+
+    stored = {}
+    monkeypatch.setattr(lan_module, "set_lan_sync_key", lambda key: stored.update(key=key))
+    warnings = []
+    monkeypatch.setattr(lan_module.QMessageBox, "warning", lambda *a: warnings.append(a))
+    tab = LanTab(ctx=ctx)
+    try:
+        tab.enabled_check.setChecked(True)
+        tab.key_edit.setText("correct horse battery staple")
+        assert tab.validate_on_accept() is False
+        assert len(warnings) == 1
+
+        tab.generate_btn.click()
+        tab.peers_edit.setText("10.0.0.2:47000, ")
+        assert tab.validate_on_accept() is True
+        tab.apply()
+        assert stored["key"] == tab.key_edit.text()
+        assert config.settings().lan_sync_enabled is True
+        assert config.settings().lan_sync_peers == ("10.0.0.2:47000",)
+    finally:
+        tab.close()
+
+
 def test_show_settings_dialog_full_chain_propagates_cloud_api(qapp, ctx):
     """端到端复现 user-reported "未登录" bug 的完整链路：
 
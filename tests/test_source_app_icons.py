@@ -0,0 +1,69 @@
+"""SourceAppIconCache：未就绪返回兜底、空闲时解析并落盘、重启后从磁盘 PNG 命中。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtGui import QColor, QIcon, QPixmap
+from PySide6.QtWidgets import QApplication
+
+from ui.source_app_icons import SourceAppIconCache
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _settle(qapp, cache):
+    # 磁盘读在线程池，解析走 0ms 定时器：各需要一轮事件
+    for _ in range(3):
+        cache.wait(5000)
+        qapp.processEvents()
+
+
+def _red_icon():
+    pix = QPixmap(32, 32)
+    pix.fill(QColor("red"))
+    return QIcon(pix)
+
+
+def test_resolves_off_hot_path_and_persists(qapp, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(SourceAppIconCache, "_resolve", lambda self, b, e: calls.append(b) or _red_icon())
+    cache = SourceAppIconCache(cache_dir=tmp_path)
+    ready = []
+    cache.icon_ready.connect(lambda b, e: ready.append(b))
+
+    first = cache.get("org.example.editor")
+    assert first.cacheKey() == cache._get_fallback().cacheKey()
+    assert calls == []  # get() 本身不解析
+    cache.get("org.example.editor")
+    _settle(qapp, cache)
+    assert calls == ["org.example.editor"] and ready == ["org.example.editor"]
+    assert cache.is_resolved("org.example.editor")
+    assert cache.get("org.example.editor").pixmap(16, 16).toImage().pixelColor(8, 8) == QColor("red")
+    assert len(list(tmp_path.glob("*.png"))) == 1
+
+    # "重启"：从磁盘 PNG 命中，不再走平台解析
+    monkeypatch.setattr(SourceAppIconCache, "_resolve", lambda self, b, e: pytest.fail("不应再解析"))
+    restarted = SourceAppIconCache(cache_dir=tmp_path)
+    restarted.get("org.example.editor")
+    _settle(qapp, restarted)
+    assert restarted.is_resolved("org.example.editor")
+
+
+def test_unresolvable_icon_is_remembered(qapp, tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(SourceAppIconCache, "_resolve", lambda self, b, e: calls.append(b))
+    cache = SourceAppIconCache(cache_dir=tmp_path)
+    cache.get("unknown.app")
+    _settle(qapp, cache)
+    restarted = SourceAppIconCache(cache_dir=tmp_path)
+    restarted.get("unknown.app")
+    _settle(qapp, restarted)
+    assert calls == ["unknown.app"]
+    assert restarted.get("unknown.app").cacheKey() == restarted._get_fallback().cacheKey()
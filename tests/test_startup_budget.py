@@ -0,0 +1,73 @@
+"""冷启动 import 预算：重模块（云端 / MySQL / Pillow / 设置对话框等）必须推迟到首次使用。
+
+在子进程里跑，避免被本进程里其他测试已经 import 过的模块污染。
+"""
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from core.import_trace import ImportTracer, total_import_ms
+
+# import main + 启动装配会用到的模块，墙钟上限（含无 .pyc 时的编译，留足 CI 余量）
+STARTUP_IMPORT_BUDGET_MS = 1500
+
+_PROBE = textwrap.dedent("""
+    import json, sys, time
+    started = time.perf_counter()
+    import main
+    # AppContext.bootstrap / MainWindow 在事件循环前会 import 的模块
+    import core.db_factory, core.database, core.repository, core.clipboard_monitor
+    import core.sync_service, core.plugin_manager, core.space_service, core.tag_service
+    import ui.main_window_helpers, ui.controllers.clipboard_list_controller
+    import ui.controllers.item_action_controller, ui.controllers.plugin_action_controller
+    import ui.controllers.cloud_lifecycle_controller
+    elapsed = (time.perf_counter() - started) * 1000
+    from utils.lazy_import import DEFERRED_MODULES
+    records = main._IMPORT_TRACER.uninstall()
+    print(json.dumps({
+        "elapsed_ms": elapsed,
+        "loaded": [m for m in DEFERRED_MODULES if m in sys.modules],
+        "traced": len(records),
+    }))
+""")
+
+
+def _run_probe():
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", SC_IMPORT_TRACE="1")
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE], cwd=PROJECT_ROOT, env=env,
+        capture_output=True, text=True, timeout=120, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def test_cold_start_defers_heavy_modules_within_budget():
+    result = _run_probe()
+    assert result["loaded"] == []
+    assert result["traced"] > 0
+    assert result["elapsed_ms"] < STARTUP_IMPORT_BUDGET_MS, result
+
+
+def test_tracer_records_self_and_cumulative_time(tmp_path, monkeypatch):
+    (tmp_path / "sc_trace_parent.py").write_text("import sc_trace_child\n")
+    (tmp_path / "sc_trace_child.py").write_text("import time\ntime.sleep(0.02)\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    tracer = ImportTracer().install()
+    try:
+        import sc_trace_parent  # noqa: F401
+    finally:
+        records = {r.name: r for r in tracer.uninstall()}
+    parent, child = records["sc_trace_parent"], records["sc_trace_child"]
+    assert (parent.depth, child.depth) == (0, 1)
+    assert child.cumulative_ms >= 15
+    assert parent.cumulative_ms >= child.cumulative_ms
+    assert parent.self_ms < child.cumulative_ms
+    assert total_import_ms(list(records.values())) == parent.cumulative_ms
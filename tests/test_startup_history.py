@@ -0,0 +1,73 @@
+"""启动历史：滚动截尾、回归判定、百分位报告 CLI。"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.startup_history import (
+    StartupHistory,
+    StartupRun,
+    format_report,
+    main,
+    run_from_metrics,
+)
+from core.startup_metrics import StartupMetrics
+
+
+def _run(i, **phases):
+    return StartupRun(ts=1000 + i, version="3.3.5", machine="Darwin-arm64", phases=phases)
+
+
+def test_append_keeps_last_runs_and_skips_bad_lines(tmp_path):
+    path = tmp_path / "startup_history.jsonl"
+    history = StartupHistory(path, max_runs=3)
+    for i in range(5):
+        history.append(_run(i, init_components=100.0 + i))
+    with path.open("a", encoding="utf-8") as fh:
+        fh.write("{not json\n")
+
+    runs = history.load()
+    assert [r.ts for r in runs] == [1002, 1003, 1004]
+    assert runs[-1].phases == {"init_components": 104.0}
+
+
+def test_run_from_metrics_uses_durations_and_mark_offsets():
+    metrics = StartupMetrics(started_at=0.0)
+    with metrics.phase("init_components"):
+        pass
+    metrics.mark("first_list_paint")
+
+    run = run_from_metrics(metrics, "3.3.5")
+    assert set(run.phases) == {"init_components", "first_list_paint"}
+    # 打点取距进程启动的时刻，不是 0
+    assert run.phases["first_list_paint"] > run.phases["init_components"]
+
+
+def test_check_flags_phase_well_above_p95(tmp_path):
+    history = StartupHistory(tmp_path / "h.jsonl")
+    for i in range(10):
+        history.append(_run(i, plugin_load_deferred=200.0 + i, qt_app_init=50.0))
+
+    slow = _run(99, plugin_load_deferred=600.0, qt_app_init=80.0, first_list_paint=900.0)
+    regressions = history.check(slow)
+    # qt_app_init 超出比例但绝对值只慢 30ms；first_list_paint 没有历史
+    assert [(r.phase, r.p95_ms) for r in regressions] == [("plugin_load_deferred", 209.0)]
+    assert "plugin_load_deferred 600ms" in regressions[0].describe()
+    assert history.check(slow, min_runs=20) == []
+
+
+def test_report_cli(tmp_path, capsys):
+    path = tmp_path / "h.jsonl"
+    history = StartupHistory(path)
+    for i in range(4):
+        history.append(_run(i, init_components=10.0 * (i + 1)))
+    history.append(StartupRun(ts=1, version="3.4.0", machine="x", phases={"init_components": 5.0}))
+
+    assert "p95" in format_report(history.load())
+    assert main(["--path", str(path), "--version", "3.3.5"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[1].split() == ["init_components", "4", "20.0", "40.0", "40.0", "40.0"]
+
+    main(["--path", str(path), "--by-version"])
+    out = capsys.readouterr().out
+    assert "== 3.3.5" in out and "== 3.4.0" in out
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from core.startup_metrics import StartupMetrics
+from core.startup_metrics import LatencyMetrics, StartupMetrics
 
 
 def test_phase_records_duration_and_summary():
@@ -43,3 +43,31 @@ def test_mark_records_zero_duration_event():
     assert len(events) == 1
     assert events[0].name == "ready"
     assert events[0].duration_ms == 0
+
+
+def test_latency_histogram_buckets_percentiles_and_budget():
+    metrics = LatencyMetrics()
+    for ms in (5, 12, 20, 40, 120):
+        metrics.record("wake", ms, budget_ms=50)
+
+    hist = metrics.histogram("wake")
+    assert hist.count == 5
+    assert hist.over_budget == 1
+    assert dict(hist.buckets())[8.0] == 1
+    assert dict(hist.buckets())[250.0] == 1
+    assert hist.percentile(50) == 20
+    assert hist.percentile(95) == 120
+    assert "p95=120.0ms" in metrics.format_summary()
+
+
+def test_summary_includes_heaviest_imports():
+    from core.import_trace import ImportRecord
+
+    metrics = StartupMetrics()
+    metrics.mark("ready")
+    metrics.record_imports([
+        ImportRecord("light", 1.0, 1.0, 0),
+        ImportRecord("heavy", 30.0, 25.0, 0),
+    ])
+    summary = metrics.format_summary()
+    assert "imports n=2 top: heavy=25.0/30.0ms, light=" in summary
@@ -149,3 +149,59 @@ class TestApplyTagNames:
         item_id = _make_item(repo, "itE")
         ids = service.apply_tag_names(item_id, "", ["dup", "dup", "unique"])
         assert len(ids) == 2
+
+
+class TestTagHydration:
+    """列表查询在同一条 SELECT 里带回 tag_ids，名字经 TagService 缓存解析。"""
+
+    def test_listings_carry_tag_ids(self, service, repo):
+        from core.query_parser import parse as parse_query
+
+        item_id = _make_item(repo, "tagged")
+        _make_item(repo, "plain")
+        ids = service.apply_tag_names(item_id, "", ["a", "b"])
+
+        items, _ = repo.get_items(space_id="")
+        by_id = {it.id: it for it in items}
+        assert sorted(by_id[item_id].tag_ids) == sorted(ids)
+        assert all(not it.tag_ids for it in items if it.id != item_id)
+
+        found = repo.search(parse_query("tagged"), space_id="")
+        assert sorted(found[0].tag_ids) == sorted(ids)
+        assert sorted(repo.get_item_by_id(item_id).tag_ids) == sorted(ids)
+        assert [it.id for it in repo.get_items_by_tag(ids[0])] == [item_id]
+
+    def test_search_issues_single_statement(self, service, repo):
+        from core.query_parser import parse as parse_query
+
+        item_id = _make_item(repo, "once")
+        service.apply_tag_names(item_id, "", ["x"])
+        # 预热查询规划器的统计缓存，只统计列表本身的语句
+        repo.search(parse_query("once"), space_id="")
+        statements = []
+
+        def op(conn):
+            conn.set_trace_callback(statements.append)
+        repo.db.execute_read(op)
+        try:
+            repo.search(parse_query("once"), space_id="")
+        finally:
+            repo.db.execute_read(lambda conn: conn.set_trace_callback(None))
+        # FTS5 内部语句以 "--" 开头出现在 trace 里，不算应用层 round trip
+        issued = [s for s in statements if not s.startswith("--")]
+        assert len(issued) == 1
+        assert "clipboard_tags" in issued[0]
+
+    def test_names_for_uses_cache_and_invalidates(self, service, repo):
+        tag = service.create_tag("", "old")
+        assert service.names_for([tag.id]) == ["old"]
+        service.update_tag(tag.id, name="new")
+        assert service.names_for([tag.id]) == ["new"]
+        service.delete_tag(tag.id)
+        assert service.names_for([tag.id]) == []
+
+    def test_names_for_reloads_on_unknown_id(self, service, repo):
+        assert service.names_for([]) == []
+        # 另一个 TagService 实例（如同步线程）建的标签，本实例缓存里没有
+        other = TagService(repo).create_tag("", "elsewhere")
+        assert service.names_for([other.id]) == ["elsewhere"]
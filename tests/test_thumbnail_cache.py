@@ -0,0 +1,78 @@
+"""ThumbnailCache：后台解码、磁盘瓦片冷启动命中、预取去重。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QColor, QImage, QPixmapCache
+from PySide6.QtWidgets import QApplication
+
+from core.models import ImageClipboardItem
+from ui import thumbnail_cache as thumb_module
+from ui.thumbnail_cache import TILE, ThumbnailCache
+
+HASH = "0123456789abcdef"
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _png(w=120, h=60):
+    image = QImage(w, h, QImage.Format_RGB32)
+    image.fill(QColor("red"))
+    data = QByteArray()
+    buf = QBuffer(data)
+    buf.open(QIODevice.WriteOnly)
+    image.save(buf, "PNG")
+    return bytes(data)
+
+
+def _drain(qapp, cache):
+    assert cache.wait(5000)
+    qapp.processEvents()
+
+
+def test_decodes_off_thread_then_hits_disk_after_restart(qapp, tmp_path, monkeypatch):
+    QPixmapCache.clear()
+    cache = ThumbnailCache(cache_dir=tmp_path)
+    ready = []
+    cache.ready.connect(ready.append)
+    assert cache.get(HASH, _png()) is None
+    _drain(qapp, cache)
+    assert ready == [HASH]
+    pixmap = cache.get(HASH, _png())
+    assert (pixmap.width(), pixmap.height()) == (TILE, TILE // 2)
+    assert (tmp_path / HASH[:2] / f"{HASH}.tile").exists()
+
+    # "重启"：内存缓存清空，磁盘瓦片直接命中，不再解码
+    QPixmapCache.clear()
+    monkeypatch.setattr(thumb_module, "decode_tile", lambda data: pytest.fail("不应再解码"))
+    restarted = ThumbnailCache(cache_dir=tmp_path)
+    pixmap = restarted.get(HASH, _png())
+    assert pixmap is not None and pixmap.width() == TILE
+    restarted.wait(5000)
+
+
+def test_prefetch_dedupes_pending_requests(qapp, tmp_path, monkeypatch):
+    QPixmapCache.clear()
+    calls = []
+    real = thumb_module.decode_tile
+    monkeypatch.setattr(thumb_module, "decode_tile", lambda data: calls.append(1) or real(data))
+    cache = ThumbnailCache(cache_dir=tmp_path)
+    item = ImageClipboardItem(content_hash="fedcba9876543210", image_thumbnail=_png())
+    cache.prefetch([item, item])
+    cache.request(item.content_hash, item.image_thumbnail)
+    _drain(qapp, cache)
+    assert len(calls) == 1
+    assert cache.get(item.content_hash, item.image_thumbnail) is not None
+    # 损坏的瓦片文件当作未命中
+    (tmp_path / "fe" / "fedcba9876543210.tile").write_bytes(b"junk")
+    QPixmapCache.clear()
+    assert cache.get(item.content_hash, item.image_thumbnail) is None
+    _drain(qapp, cache)
@@ -0,0 +1,132 @@
+"""TimelineView：按天桶懒加载、远离视口的分组卸载、增量 upsert / remove。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import datetime as dt
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from PySide6.QtWidgets import QApplication
+
+from core.database import DatabaseManager
+from core.repository import ClipboardRepository
+from tests.helpers import text_item as _text
+from ui.timeline_view import TimelineView, buckets_from_timeline, local_offset_ms
+
+DAYS = 30
+PER_DAY = 3
+
+
+def _noon(days_ago):
+    day = dt.date.today() - dt.timedelta(days=days_ago)
+    return int(dt.datetime.combine(day, dt.time(12)).timestamp() * 1000)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repository = ClipboardRepository(DatabaseManager(str(tmp_path / "timeline.db")))
+    for d in range(DAYS):
+        for k in range(PER_DAY):
+            repository.add_item(_text(d * PER_DAY + k, _noon(d) + k, starred=(d == 0 and k == 0)))
+    yield repository
+    repository.db.close()
+
+
+def test_local_day_buckets(repo):
+    rows = repo.get_timeline(0, 2 ** 53, "hour", "", tz_offset_ms=local_offset_ms())
+    buckets = buckets_from_timeline(rows)
+    assert len(buckets) == DAYS
+    assert buckets[0].day == dt.date.today() and buckets[0].count == PER_DAY
+    assert buckets[-1].day == dt.date.today() - dt.timedelta(days=DAYS - 1)
+    starred = repo.get_timeline(0, 2 ** 53, "day", "", tz_offset_ms=local_offset_ms(), starred_only=True)
+    assert [r["count"] for r in starred] == [1]
+    items = repo.get_items_after((buckets[1].end_ts, 0), 10, space_id="", min_created_at=buckets[1].start_ts)
+    assert [it.created_at for it in items] == [_noon(1) + 2, _noon(1) + 1, _noon(1)]
+
+
+def _settle(qapp, view):
+    # 滚动区按新内容调整尺寸要两轮事件
+    qapp.processEvents()
+    qapp.processEvents()
+    view._update_visible()
+
+
+def test_groups_load_lazily_and_apply_deltas(qapp, repo):
+    calls = {"buckets": 0, "days": []}
+
+    def buckets():
+        calls["buckets"] += 1
+        return buckets_from_timeline(
+            repo.get_timeline(0, 2 ** 53, "hour", "", tz_offset_ms=local_offset_ms())
+        )
+
+    def day_items(start, end, limit):
+        calls["days"].append(start)
+        return repo.get_items_after((end, 0), limit, space_id="", min_created_at=start)
+
+    view = TimelineView()
+    view.resize(400, 300)
+    view.set_source(buckets, day_items)
+    assert calls["buckets"] == 0  # 隐藏时只标脏
+    view.show()
+    _settle(qapp, view)
+    groups = list(view._groups.values())
+    assert len(groups) == DAYS
+    loaded = [g for g in groups if g.loaded]
+    assert 0 < len(loaded) < DAYS and groups[0].loaded and not groups[-1].loaded
+    assert len(groups[0].widgets) == PER_DAY
+
+    bar = view._scroll.verticalScrollBar()
+    bar.setValue(bar.maximum())
+    _settle(qapp, view)
+    assert groups[-1].loaded and not groups[0].loaded
+
+    bar.setValue(0)
+    _settle(qapp, view)
+    new_id = repo.add_item(_text(999, _noon(0) + 100))
+    view.upsert_item(repo.get_item_by_id(new_id))
+    assert groups[0].count == PER_DAY + 1
+    assert groups[0].body_layout.itemAt(0).widget() is groups[0].widgets[new_id]
+    view.remove_item(new_id)
+    assert groups[0].count == PER_DAY and new_id not in groups[0].widgets
+
+    # 元数据变化（收藏）不是新条目：展开分组原地替换、未展开分组不动计数
+    loaded_item = groups[0].widgets[next(iter(groups[0].widgets))].item
+    repo.toggle_star(loaded_item.id)
+    view.upsert_item(repo.get_item_by_id(loaded_item.id), is_new=False)
+    assert groups[0].count == PER_DAY and len(groups[0].widgets) == PER_DAY
+    assert groups[0].widgets[loaded_item.id].item.is_starred != loaded_item.is_starred
+    unloaded_id = (DAYS - 1) * PER_DAY + 1
+    assert not groups[-1].loaded
+    view.upsert_item(repo.get_item_by_id(unloaded_id), is_new=False)
+    assert groups[-1].count == PER_DAY
+    assert calls["buckets"] == 1
+    view.close()
+    view.deleteLater()
+
+
+def test_buckets_follow_local_dates_across_dst(repo, monkeypatch):
+    import time
+
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    try:
+        # 冬令时（UTC+1）1 月 15 日 23:30 的条目，用夏令时（UTC+2）的当前偏移分桶
+        late = int(dt.datetime(2026, 1, 15, 23, 30).timestamp() * 1000)
+        repo.add_item(_text(5000, late))
+        rows = repo.get_timeline(0, late + 1, "hour", "", tz_offset_ms=7_200_000)
+        buckets = buckets_from_timeline(rows)
+        assert [(b.day, b.count) for b in buckets] == [(dt.date(2026, 1, 15), 1)]
+        bucket = buckets[0]
+        assert bucket.start_ts <= late < bucket.end_ts
+        assert bucket.start_ts == int(dt.datetime(2026, 1, 15).timestamp() * 1000)
+    finally:
+        monkeypatch.undo()
+        time.tzset()
@@ -0,0 +1,59 @@
+"""热键唤起延迟探针：只统计热键触发的唤起，等到有内容的绘制才记首帧。"""
+import os
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from PySide6.QtWidgets import QApplication, QWidget
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from ui.wake_latency import WakeLatencyProbe
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QApplication.instance() or QApplication([])
+
+
+def _settle(qapp, rounds=5):
+    for _ in range(rounds):
+        qapp.processEvents()
+        time.sleep(0.01)
+
+
+def test_records_first_paint_once_populated(qapp):
+    probe = WakeLatencyProbe()
+    widget = QWidget()
+    widget.resize(100, 100)
+    widget.show()
+    _settle(qapp)
+
+    # 非热键唤起不计
+    assert probe.dispatched() is False
+
+    populated = []
+    probe.begin()
+    assert probe.dispatched() is True
+    probe.shown(time.perf_counter())
+    probe.watch(widget, lambda: bool(populated))
+    _settle(qapp)
+    assert "wake.first_paint" not in probe.metrics.names()
+
+    populated.append(True)
+    widget.update()
+    _settle(qapp)
+    hist = probe.metrics.histogram("wake.first_paint")
+    assert hist.count == 1
+    assert probe.metrics.histogram("wake.dispatch").count == 1
+
+    # 之后的普通重绘不再记样本
+    widget.update()
+    _settle(qapp)
+    assert hist.count == 1
+    widget.close()
@@ -1,7 +1,7 @@
 from datetime import datetime
 
-from PySide6.QtCore import Qt, Signal, QTimer
-from PySide6.QtGui import QPixmap, QImage, QPixmapCache
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -13,6 +13,48 @@ from PySide6.QtWidgets import (
 
 from core.models import ClipboardItem, TextClipboardItem, ImageClipboardItem
 
+from .thumbnail_cache import ThumbnailCache
+
+
+def multiline_preview(item: ClipboardItem, max_lines: int = 3, max_chars: int = 120) -> str:
+    """保留原始换行结构，取前几行，更自然地展示内容"""
+    if not isinstance(item, TextClipboardItem) or not item.text_content:
+        return item.preview or ""
+    text = item.text_content
+    result_lines: list[str] = []
+    total_chars = 0
+    start = 0
+    while start < len(text) and len(result_lines) < max_lines and total_chars < max_chars:
+        end = text.find("\n", start)
+        if end == -1:
+            end = len(text)
+        stripped = text[start:end].strip()
+        start = end + 1
+        if not stripped and not result_lines:
+            continue
+        remaining = max_chars - total_chars
+        if len(stripped) > remaining:
+            stripped = stripped[:remaining] + "…"
+        result_lines.append(stripped)
+        total_chars += len(stripped)
+    result = "\n".join(result_lines)
+    if total_chars < len(text.strip()):
+        if not result.endswith("…"):
+            result += " …"
+    return result or item.preview or ""
+
+
+def format_item_time(timestamp_ms: int) -> str:
+    dt = datetime.fromtimestamp(timestamp_ms / 1000)
+    now = datetime.now()
+
+    if dt.date() == now.date():
+        return dt.strftime("%H:%M")
+    elif dt.year == now.year:
+        return dt.strftime("%m-%d %H:%M")
+    else:
+        return dt.strftime("%Y-%m-%d")
+
 
 class ClipboardItemWidget(QWidget):
     clicked = Signal(ClipboardItem)
@@ -27,6 +69,8 @@ class ClipboardItemWidget(QWidget):
         self.item = item
         self.setObjectName("itemWidget")
         self._text_preview_label: QLabel | None = None
+        self._image_label: QLabel | None = None
+        self._source_icon_label: QLabel | None = None
         # 样式已合并到 MAIN_STYLE，由父级 MainWindow 统一设置
         self.setCursor(Qt.PointingHandCursor)
         self._setup_ui()
@@ -72,30 +116,15 @@ class ClipboardItemWidget(QWidget):
         if isinstance(self.item, ImageClipboardItem) and self.item.image_thumbnail:
             image_label = QLabel()
             image_label.setObjectName("imageLabel")
-            cache_key = self.item.content_hash
             image_label.setFixedSize(56, 56)
-            cached = QPixmapCache.find(cache_key) if cache_key else None
-            if cached is not None:
-                # 命中缓存直接同步设置, 避免小图后台化开销
-                image_label.setPixmap(cached)
+            # 命中内存 / 磁盘瓦片直接设置；未命中时后台解码，就绪后经 ready 回填
+            pixmap = ThumbnailCache.instance().get(self.item.content_hash, self.item.image_thumbnail)
+            if pixmap is not None:
+                image_label.setPixmap(pixmap)
             else:
-                # 未命中: 占位 + 下一 tick 解码, 不阻塞首屏布局
                 image_label.setPixmap(QPixmap())
-                thumb_bytes = self.item.image_thumbnail
-                def _decode_and_set(lbl=image_label, key=cache_key, data=thumb_bytes):
-                    if lbl is None:
-                        return
-                    pixmap = QPixmap()
-                    pixmap.loadFromData(data)
-                    if pixmap.isNull():
-                        return
-                    scaled = pixmap.scaled(
-                        56, 56, Qt.KeepAspectRatio, Qt.FastTransformation
-                    )
-                    if key:
-                        QPixmapCache.insert(key, scaled)
-                    lbl.setPixmap(scaled)
-                QTimer.singleShot(0, _decode_and_set)
+                self._image_label = image_label
+                ThumbnailCache.instance().ready.connect(self._on_thumbnail_ready)
             layout.addWidget(image_label)
 
             # 图片信息
@@ -204,6 +233,15 @@ class ClipboardItemWidget(QWidget):
         button_layout.addStretch()
         layout.addWidget(button_container)
 
+    def _on_thumbnail_ready(self, content_hash: str) -> None:
+        if self._image_label is None or content_hash != self.item.content_hash:
+            return
+        pixmap = ThumbnailCache.instance().get(content_hash, self.item.image_thumbnail)
+        if pixmap is not None:
+            self._image_label.setPixmap(pixmap)
+            self._image_label = None
+            ThumbnailCache.instance().ready.disconnect(self._on_thumbnail_ready)
+
     def _make_meta_label(self) -> QLabel:
         meta_text = self._format_time(self.item.created_at)
         if self.item.device_name:
@@ -218,13 +256,14 @@ class ClipboardItemWidget(QWidget):
 
     def _make_source_icon_label(self):
         """若 item 有 source_app，返回一个 16x16 的 QLabel；否则返回 None。
-        图标从 SourceAppIconCache 懒加载，失败返回 None（不撑布局）。"""
+        图标从 SourceAppIconCache 异步解析：未就绪时先显示兜底图标，就绪后经 icon_ready 替换。"""
         source_app = getattr(self.item, "source_app", "") or ""
         if not source_app:
             return None
         try:
             from .source_app_icons import SourceAppIconCache
-            icon = SourceAppIconCache.instance().get(source_app, "")
+            cache = SourceAppIconCache.instance()
+            icon = cache.get(source_app, "")
             if icon is None or icon.isNull():
                 return None
             pix = icon.pixmap(16, 16)
@@ -234,48 +273,28 @@ class ClipboardItemWidget(QWidget):
             lbl.setFixedSize(16, 16)
             lbl.setPixmap(pix)
             lbl.setToolTip(source_app)
+            if not cache.is_resolved(source_app, ""):
+                self._source_icon_label = lbl
+                cache.icon_ready.connect(self._on_source_icon_ready)
             return lbl
         except Exception:
             return None
 
+    def _on_source_icon_ready(self, bundle_id: str, exe_path: str) -> None:
+        if self._source_icon_label is None or bundle_id != (self.item.source_app or ""):
+            return
+        from .source_app_icons import SourceAppIconCache
+        cache = SourceAppIconCache.instance()
+        self._source_icon_label.setPixmap(cache.get(bundle_id, exe_path).pixmap(16, 16))
+        self._source_icon_label = None
+        cache.icon_ready.disconnect(self._on_source_icon_ready)
+
     @staticmethod
     def _get_multiline_preview(item: ClipboardItem, max_lines: int = 3, max_chars: int = 120) -> str:
-        """保留原始换行结构，取前几行，更自然地展示内容"""
-        if not isinstance(item, TextClipboardItem) or not item.text_content:
-            return item.preview or ""
-        text = item.text_content
-        result_lines: list[str] = []
-        total_chars = 0
-        start = 0
-        while start < len(text) and len(result_lines) < max_lines and total_chars < max_chars:
-            end = text.find("\n", start)
-            if end == -1:
-                end = len(text)
-            stripped = text[start:end].strip()
-            start = end + 1
-            if not stripped and not result_lines:
-                continue
-            remaining = max_chars - total_chars
-            if len(stripped) > remaining:
-                stripped = stripped[:remaining] + "…"
-            result_lines.append(stripped)
-            total_chars += len(stripped)
-        result = "\n".join(result_lines)
-        if total_chars < len(text.strip()):
-            if not result.endswith("…"):
-                result += " …"
-        return result or item.preview or ""
+        return multiline_preview(item, max_lines, max_chars)
 
     def _format_time(self, timestamp_ms: int) -> str:
-        dt = datetime.fromtimestamp(timestamp_ms / 1000)
-        now = datetime.now()
-
-        if dt.date() == now.date():
-            return dt.strftime("%H:%M")
-        elif dt.year == now.year:
-            return dt.strftime("%m-%d %H:%M")
-        else:
-            return dt.strftime("%Y-%m-%d")
+        return format_item_time(timestamp_ms)
 
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
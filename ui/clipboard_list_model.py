@@ -0,0 +1,586 @@
+"""剪贴板列表的 QAbstractListModel 与自绘 delegate。
+
+替代"每行一个 ClipboardItemWidget"的 QListWidget：
+- 模型只常驻每行的紧凑索引 (id, created_at, 预览文本…)，完整条目放在有上限的 LRU 里，
+  被淘汰的行再次可见时按 id 批量读回；
+- 列表模式由 fetcher 驱动 canFetchMore / fetchMore，按 (created_at, id) keyset 续取下一段；
+- delegate 只为可见行绘制，行高按 id 缓存，宽度变化时整体失效。
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from PySide6.QtCore import (
+    QAbstractListModel, QEvent, QModelIndex, QPoint, QRect, QSize, Qt, Signal,
+)
+from PySide6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QToolTip
+
+from core.models import ClipboardItem
+
+from .clipboard_item import format_item_time, multiline_preview
+from .styles import LIST_PREVIEW_PX
+from .source_app_icons import SourceAppIconCache
+from .thumbnail_cache import ThumbnailCache
+
+logger = logging.getLogger(__name__)
+
+# (created_at, id)：keyset 游标，与 get_items_after 的排序键一致
+Cursor = Tuple[int, int]
+Fetcher = Callable[[Optional[Cursor], int], List[ClipboardItem]]
+Loader = Callable[[List[int]], List[ClipboardItem]]
+
+
+class _Row(NamedTuple):
+    id: int
+    created_at: int
+    is_image: bool
+    is_cloud: bool
+    text: str
+
+
+def _row_for(item: ClipboardItem) -> _Row:
+    if item.is_image:
+        text = item.preview or ""
+    else:
+        text = multiline_preview(item, max_lines=3, max_chars=120)
+    return _Row(item.id or 0, item.created_at or 0, bool(item.is_image), bool(item.is_cloud_synced), text)
+
+
+def _sort_key(row: _Row) -> Tuple[int, int]:
+    # 倒序列表里做 bisect：取负后变成升序
+    return (-row.created_at, -row.id)
+
+
+class ClipboardListModel(QAbstractListModel):
+    """列表数据源。行顺序恒为 (created_at, id) 倒序，keyset 游标取自最后一行。"""
+
+    ItemRole = Qt.UserRole + 1
+
+    FETCH_SIZE = 100
+    # 常驻完整条目上限（含缩略图字节），超出按 LRU 淘汰
+    MAX_RESIDENT = 1000
+    # 未命中时连同前后相邻行一起读回，滚动时不会逐行查库
+    RELOAD_SPAN = 50
+
+    # fetchMore 由视图在滚动时调用，异常无法抛给调用方，改用信号上报
+    fetch_failed = Signal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[_Row] = []
+        self._keys: List[Tuple[int, int]] = []
+        self._resident: "OrderedDict[int, ClipboardItem]" = OrderedDict()
+        self._fetcher: Optional[Fetcher] = None
+        self._loader: Optional[Loader] = None
+        self._exhausted = True
+        self._placeholder = ""
+        self._heights: Dict[int, int] = {}
+
+    # ---- 数据源 ----
+    def set_loader(self, loader: Optional[Loader]) -> None:
+        """被淘汰条目的回读函数（按 id 批量，通常是 repository.get_items_by_ids）。"""
+        self._loader = loader
+
+    def set_fetcher(self, fetcher: Optional[Fetcher], prefetch: bool = False) -> None:
+        """切到无限滚动，之后由视图按需 fetchMore。
+
+        prefetch=True 时先同步取首屏再重置模型：首屏失败直接抛给调用方，且列表不会闪空。
+        """
+        first = fetcher(None, self.FETCH_SIZE) if fetcher is not None and prefetch else None
+        self.beginResetModel()
+        self._clear()
+        self._fetcher = fetcher
+        self._exhausted = fetcher is None
+        if first is not None:
+            self._append(first)
+        self.endResetModel()
+
+    def set_items(self, items: List[ClipboardItem]) -> None:
+        """静态结果集（搜索 / 标签分页），不再续取。"""
+        self.beginResetModel()
+        self._clear()
+        self._fetcher = None
+        self._exhausted = True
+        for item in items:
+            self._rows.append(_row_for(item))
+            self._remember(item)
+        self._keys = [_sort_key(r) for r in self._rows]
+        self.endResetModel()
+
+    def set_placeholder(self, text: str) -> None:
+        """清空列表并显示一行不可选的提示（加载失败）。"""
+        self.beginResetModel()
+        self._clear()
+        self._fetcher = None
+        self._exhausted = True
+        self._placeholder = text
+        self.endResetModel()
+
+    def _clear(self) -> None:
+        self._rows = []
+        self._keys = []
+        self._resident.clear()
+        self._heights.clear()
+        self._placeholder = ""
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetcher is not None and not self._exhausted
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        cursor = (self._rows[-1].created_at, self._rows[-1].id) if self._rows else None
+        try:
+            items = self._fetcher(cursor, self.FETCH_SIZE)
+        except Exception as e:
+            self._exhausted = True
+            self.fetch_failed.emit(e)
+            return
+        if not items:
+            self._exhausted = True
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+        self._append(items)
+        self.endInsertRows()
+
+    def _append(self, items: List[ClipboardItem]) -> None:
+        if len(items) < self.FETCH_SIZE:
+            self._exhausted = True
+        for item in items:
+            row = _row_for(item)
+            self._rows.append(row)
+            self._keys.append(_sort_key(row))
+            self._remember(item)
+
+    # ---- 完整条目缓存 ----
+    def _remember(self, item: ClipboardItem) -> None:
+        if item.id is None:
+            return
+        self._resident[item.id] = item
+        self._resident.move_to_end(item.id)
+        while len(self._resident) > self.MAX_RESIDENT:
+            self._resident.popitem(last=False)
+
+    def item_at(self, row: int) -> Optional[ClipboardItem]:
+        if not 0 <= row < len(self._rows):
+            return None
+        item_id = self._rows[row].id
+        item = self._resident.get(item_id)
+        if item is not None:
+            self._resident.move_to_end(item_id)
+            return item
+        if self._loader is None:
+            return None
+        lo = max(0, row - self.RELOAD_SPAN // 2)
+        ids = [r.id for r in self._rows[lo:lo + self.RELOAD_SPAN] if r.id not in self._resident]
+        try:
+            loaded = self._loader(ids)
+        except Exception as e:
+            logger.warning(f"回读列表条目失败: {e}")
+            return None
+        for it in loaded:
+            self._remember(it)
+        # 回读的整段里当前行最后放，避免刚读回就被同一批挤掉
+        item = self._resident.get(item_id)
+        if item is not None:
+            self._resident.move_to_end(item_id)
+        return item
+
+    def row_of(self, item_id: int) -> int:
+        for i, r in enumerate(self._rows):
+            if r.id == item_id:
+                return i
+        return -1
+
+    def find_item(self, item_id: int) -> Optional[ClipboardItem]:
+        row = self.row_of(item_id)
+        return self.item_at(row) if row >= 0 else None
+
+    def ids(self) -> List[int]:
+        return [r.id for r in self._rows]
+
+    def items(self, limit: Optional[int] = None) -> List[ClipboardItem]:
+        """前 limit 行的完整条目（被淘汰的会按 id 读回）。"""
+        rows = range(len(self._rows) if limit is None else min(limit, len(self._rows)))
+        return [it for it in (self.item_at(r) for r in rows) if it is not None]
+
+    def resident_items(self) -> List[ClipboardItem]:
+        return list(self._resident.values())
+
+    # ---- 增量更新 ----
+    def insert_item(self, item: ClipboardItem) -> bool:
+        """按排序键插入（已存在则先移除）。落在已加载范围之后、仍可续取的不插，交给 fetchMore。"""
+        self.remove_id(item.id)
+        if self._placeholder:
+            self.set_items([])
+        row = _row_for(item)
+        key = _sort_key(row)
+        pos = bisect.bisect_left(self._keys, key)
+        if pos == len(self._rows) and self.canFetchMore():
+            return False
+        self.beginInsertRows(QModelIndex(), pos, pos)
+        self._rows.insert(pos, row)
+        self._keys.insert(pos, key)
+        self._remember(item)
+        self.endInsertRows()
+        return True
+
+    def update_item(self, item: ClipboardItem) -> None:
+        """同一条目的元数据变化（收藏、cloud_id、标签…）：就地刷新这一行。"""
+        row = self.row_of(item.id)
+        if row < 0:
+            return
+        new_row = _row_for(item)
+        if _sort_key(new_row) != self._keys[row]:
+            self.insert_item(item)
+            return
+        self._rows[row] = new_row
+        self._remember(item)
+        self._heights.pop(item.id, None)
+        idx = self.index(row, 0)
+        self.dataChanged.emit(idx, idx)
+
+    def remove_id(self, item_id: Optional[int]) -> bool:
+        if item_id is None:
+            return False
+        row = self.row_of(item_id)
+        if row < 0:
+            return False
+        self.remove_row(row)
+        return True
+
+    def remove_row(self, row: int) -> None:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        removed = self._rows.pop(row)
+        self._keys.pop(row)
+        self.endRemoveRows()
+        self._resident.pop(removed.id, None)
+        self._heights.pop(removed.id, None)
+
+    # ---- 行高缓存（由 delegate 读写） ----
+    def row_info(self, row: int) -> Optional[_Row]:
+        return self._rows[row] if 0 <= row < len(self._rows) else None
+
+    def cached_height(self, item_id: int) -> Optional[int]:
+        return self._heights.get(item_id)
+
+    def store_height(self, item_id: int, height: int) -> None:
+        self._heights[item_id] = height
+
+    def invalidate_heights(self) -> None:
+        self._heights.clear()
+
+    # ---- Qt interface ----
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows) or (1 if self._placeholder else 0)
+
+    def flags(self, index: QModelIndex):
+        if not index.isValid() or not self._rows:
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if not self._rows:
+            return self._placeholder if role == Qt.DisplayRole else None
+        row = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return row.text
+        if role == self.ItemRole:
+            return self.item_at(index.row())
+        return None
+
+
+# 按钮列：(名称, 字形, 颜色, 提示)；与 ClipboardItemWidget 的按钮顺序一致
+_BTN_STAR = "star"
+_BTN_CLOUD = "cloud"
+_BTN_URL = "url"
+_BTN_SAVE = "save"
+_BTN_DELETE = "delete"
+
+
+def _buttons_for(item: ClipboardItem) -> List[Tuple[str, str, str, str]]:
+    buttons = [(
+        _BTN_STAR, "★" if item.is_starred else "☆", "#ffffff",
+        "取消收藏" if item.is_starred else "收藏",
+    )]
+    if item.is_cloud_synced:
+        buttons.append((_BTN_CLOUD, "☁", "#58a6ff", "已同步到云端\n点击删除云端副本"))
+    if item.is_image:
+        if item.is_cloud_synced:
+            buttons.append((_BTN_URL, "🔗", "#4fc3f7", "复制图片链接"))
+        buttons.append((_BTN_SAVE, "💾", "#4fc3f7", "保存图片"))
+    buttons.append((_BTN_DELETE, "×", "#ff6b6b", "删除"))
+    return buttons
+
+
+class ClipboardItemDelegate(QStyledItemDelegate):
+    """按 ClipboardItemWidget 的版式自绘一行：缩略图 / 预览 / 元信息 / 右侧按钮列。"""
+
+    clicked = Signal(ClipboardItem)
+    delete_clicked = Signal(ClipboardItem)
+    star_clicked = Signal(ClipboardItem)
+    save_clicked = Signal(ClipboardItem)
+    cloud_delete_clicked = Signal(ClipboardItem)
+    image_url_clicked = Signal(ClipboardItem)
+
+    # 卡片外边距 (margin 3px 2px) 与 1px 边框；内容边距同原 widget 的 (14, 10, 10, 10)
+    _CARD_MARGIN_X = 2
+    _CARD_MARGIN_Y = 3
+    _MARGINS = (14, 10, 10, 10)
+    _SPACING = 10
+    _BTN_COL_W = 28
+    _BTN_W = 24
+    _BTN_H = 22
+    _BTN_SPACING = 2
+    _THUMB = 56
+    _META_H = 18
+    _MIN_H_IMAGE = 92
+    _MIN_H_TEXT = 76
+
+    _BG = QColor("#333333")
+    _BG_HOVER = QColor("#3a3a3a")
+    _BG_SELECTED = QColor(0, 120, 212, 64)
+    _BORDER = QColor(255, 255, 255, 10)
+    _BORDER_HOVER = QColor(255, 255, 255, 20)
+    _BORDER_SELECTED = QColor(0, 120, 212, 102)
+    _THUMB_BG = QColor("#1e1e1e")
+    _PREVIEW_COLOR = QColor("#e8e8e8")
+    _META_COLOR = QColor("#777777")
+    _BTN_HOVER_BG = QColor(255, 255, 255, 26)
+
+    def __init__(self, view):
+        super().__init__(view)
+        self._view = view
+        self._preview_font = QFont(view.font())
+        self._preview_font.setPixelSize(LIST_PREVIEW_PX)
+        self._meta_font = QFont(view.font())
+        self._meta_font.setPixelSize(11)
+        self._height_width = 0
+        self._pressed: Optional[Tuple[int, str]] = None
+        self._hover: Optional[Tuple[int, str]] = None
+        ThumbnailCache.instance().ready.connect(self._repaint)
+        SourceAppIconCache.instance().icon_ready.connect(self._repaint)
+
+    def _repaint(self, *_args) -> None:
+        # 缩略图 / 来源图标在后台就绪：只重绘视口，行高不变
+        self._view.viewport().update()
+
+    # ---- 几何 ----
+    def _row_width(self) -> int:
+        vw = self._view.viewport().width()
+        return max(vw - 2 * self._view.spacing(), 200)
+
+    def _inner(self, rect: QRect) -> QRect:
+        left, top, right, bottom = self._MARGINS
+        card = rect.adjusted(self._CARD_MARGIN_X, self._CARD_MARGIN_Y, -self._CARD_MARGIN_X, -self._CARD_MARGIN_Y)
+        return card.adjusted(1 + left, 1 + top, -1 - right, -1 - bottom)
+
+    def _button_rects(self, rect: QRect, count: int) -> List[QRect]:
+        inner = self._inner(rect)
+        x = inner.right() - self._BTN_COL_W + 1 + (self._BTN_COL_W - self._BTN_W) // 2
+        return [
+            QRect(x, inner.top() + i * (self._BTN_H + self._BTN_SPACING), self._BTN_W, self._BTN_H)
+            for i in range(count)
+        ]
+
+    def _button_at(self, rect: QRect, item: ClipboardItem, pos: QPoint) -> Optional[str]:
+        buttons = _buttons_for(item)
+        for (name, *_), r in zip(buttons, self._button_rects(rect, len(buttons))):
+            if r.contains(pos):
+                return name
+        return None
+
+    def _content_rect(self, rect: QRect) -> QRect:
+        inner = self._inner(rect)
+        return inner.adjusted(0, 0, -(self._BTN_COL_W + self._SPACING), 0)
+
+    def sizeHint(self, option, index):
+        width = self._row_width()
+        model = index.model()
+        info = model.row_info(index.row()) if hasattr(model, "row_info") else None
+        if info is None:
+            return QSize(width, self._MIN_H_TEXT)
+        if width != self._height_width:
+            # 宽度变了：文字换行结果全部作废
+            self._height_width = width
+            model.invalidate_heights()
+        cached = model.cached_height(info.id)
+        if cached is not None:
+            return QSize(width, cached)
+        height = self._measure(info, width)
+        model.store_height(info.id, height)
+        return QSize(width, height)
+
+    def _measure(self, info: _Row, width: int) -> int:
+        left, top, right, bottom = self._MARGINS
+        # 右侧按钮列按 22px/个 + 2px 间距堆叠，比文字高时取按钮列高度，否则删除键会被截掉
+        btn_count = 2 + (1 if info.is_cloud else 0)
+        if info.is_image:
+            btn_count += 2 if info.is_cloud else 1
+        buttons_h = btn_count * self._BTN_H + (btn_count - 1) * self._BTN_SPACING
+        if info.is_image:
+            preview_h = QFontMetrics(self._preview_font).height()
+            content_h = max(self._THUMB, preview_h + 3 + self._META_H)
+            min_h = self._MIN_H_IMAGE
+        else:
+            avail = width - 2 * (self._CARD_MARGIN_X + 1) - left - right - self._BTN_COL_W - self._SPACING
+            text_h = QFontMetrics(self._preview_font).boundingRect(
+                QRect(0, 0, max(avail, 1), 100000), Qt.TextWordWrap, info.text,
+            ).height()
+            # meta 行约 18px + 内容区 spacing 6
+            content_h = text_h + 6 + self._META_H
+            min_h = self._MIN_H_TEXT
+        # +8: 卡片 margin(3+3) + border(1+1)
+        return max(top + bottom + max(content_h, buttons_h) + 8, min_h)
+
+    # ---- 绘制 ----
+    def paint(self, painter, option, index):
+        model = index.model()
+        item = index.data(ClipboardListModel.ItemRole)
+        if item is None:
+            painter.save()
+            painter.setPen(self._META_COLOR)
+            painter.drawText(option.rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+            painter.restore()
+            return
+        info = model.row_info(index.row())
+        rect = option.rect
+        selected = bool(option.state & QStyle.State_Selected)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        card = rect.adjusted(self._CARD_MARGIN_X, self._CARD_MARGIN_Y, -self._CARD_MARGIN_X, -self._CARD_MARGIN_Y)
+        if selected:
+            bg, border = self._BG_SELECTED, self._BORDER_SELECTED
+        elif hovered:
+            bg, border = self._BG_HOVER, self._BORDER_HOVER
+        else:
+            bg, border = self._BG, self._BORDER
+        painter.setPen(border)
+        painter.setBrush(bg)
+        painter.drawRoundedRect(card.adjusted(0, 0, -1, -1), 8, 8)
+
+        content = self._content_rect(rect)
+        meta_fm = QFontMetrics(self._meta_font)
+        if item.is_image:
+            thumb_rect = QRect(content.left(), content.top(), self._THUMB, self._THUMB)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(self._THUMB_BG)
+            painter.drawRoundedRect(thumb_rect, 6, 6)
+            # 未就绪时先画底色，ThumbnailCache 后台解码完成后发 ready 触发重绘
+            pixmap = ThumbnailCache.instance().get(item.content_hash, getattr(item, "image_thumbnail", None))
+            if pixmap is not None:
+                x = thumb_rect.left() + (self._THUMB - pixmap.width()) // 2
+                y = thumb_rect.top() + (self._THUMB - pixmap.height()) // 2
+                painter.drawPixmap(x, y, pixmap)
+            info_rect = content.adjusted(self._THUMB + self._SPACING, 0, 0, 0)
+            fm = QFontMetrics(self._preview_font)
+            painter.setFont(self._preview_font)
+            painter.setPen(self._PREVIEW_COLOR)
+            painter.drawText(
+                QRect(info_rect.left(), info_rect.top(), info_rect.width(), fm.height()),
+                Qt.AlignLeft | Qt.AlignVCenter,
+                fm.elidedText(info.text, Qt.ElideRight, info_rect.width()),
+            )
+            meta_rect = QRect(info_rect.left(), info_rect.top() + fm.height() + 3, info_rect.width(), self._META_H)
+        else:
+            text_rect = content.adjusted(0, 0, 0, -(self._META_H + 6))
+            painter.setFont(self._preview_font)
+            painter.setPen(self._PREVIEW_COLOR)
+            painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignTop | Qt.TextWordWrap, info.text)
+            meta_rect = QRect(content.left(), content.bottom() - self._META_H + 1, content.width(), self._META_H)
+
+        self._paint_meta(painter, item, meta_rect, meta_fm)
+        self._paint_buttons(painter, item, rect, index.row())
+        painter.restore()
+
+    def _paint_meta(self, painter, item: ClipboardItem, rect: QRect, fm: QFontMetrics) -> None:
+        x = rect.left()
+        source_app = getattr(item, "source_app", "") or ""
+        if source_app:
+            try:
+                icon = SourceAppIconCache.instance().get(source_app, "")
+                if icon is not None and not icon.isNull():
+                    icon.paint(painter, QRect(x, rect.top() + (rect.height() - 16) // 2, 16, 16))
+                    x += 16 + 4
+            except Exception:
+                pass
+        meta_text = format_item_time(item.created_at)
+        if item.device_name:
+            meta_text += "  ·  " + item.device_name
+        painter.setFont(self._meta_font)
+        painter.setPen(self._META_COLOR)
+        width = rect.right() - x + 1
+        painter.drawText(
+            QRect(x, rect.top(), width, rect.height()), Qt.AlignLeft | Qt.AlignVCenter,
+            fm.elidedText(meta_text, Qt.ElideRight, width),
+        )
+
+    def _paint_buttons(self, painter, item: ClipboardItem, rect: QRect, row: int) -> None:
+        buttons = _buttons_for(item)
+        painter.setFont(self._preview_font)
+        for (name, glyph, color, _tip), r in zip(buttons, self._button_rects(rect, len(buttons))):
+            if self._hover == (row, name):
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self._BTN_HOVER_BG)
+                painter.drawRoundedRect(r, 4, 4)
+            painter.setPen(QColor(color))
+            painter.drawText(r, Qt.AlignCenter, glyph)
+
+    # ---- 交互 ----
+    def editorEvent(self, event, model, option, index):
+        etype = event.type()
+        if etype not in (QEvent.MouseButtonPress, QEvent.MouseButtonRelease, QEvent.MouseMove):
+            return super().editorEvent(event, model, option, index)
+        item = index.data(ClipboardListModel.ItemRole)
+        if item is None:
+            return False
+        pos = event.position().toPoint()
+        hit = self._button_at(option.rect, item, pos)
+        row = index.row()
+        if etype == QEvent.MouseMove:
+            hover = (row, hit) if hit else None
+            if hover != self._hover:
+                self._hover = hover
+                self._view.viewport().update()
+            return False
+        if event.button() != Qt.LeftButton:
+            return False
+        if etype == QEvent.MouseButtonPress:
+            if hit is None:
+                self.clicked.emit(item)
+                return False
+            self._pressed = (row, hit)
+            return True
+        pressed, self._pressed = self._pressed, None
+        if hit is None or pressed != (row, hit):
+            return pressed is not None
+        {
+            _BTN_STAR: self.star_clicked,
+            _BTN_CLOUD: self.cloud_delete_clicked,
+            _BTN_URL: self.image_url_clicked,
+            _BTN_SAVE: self.save_clicked,
+            _BTN_DELETE: self.delete_clicked,
+        }[hit].emit(item)
+        return True
+
+    def helpEvent(self, event, view, option, index):
+        item = index.data(ClipboardListModel.ItemRole)
+        if item is not None and event.type() == QEvent.ToolTip:
+            hit = self._button_at(option.rect, item, event.pos())
+            if hit is not None:
+                tip = next(t for name, _g, _c, t in _buttons_for(item) if name == hit)
+                QToolTip.showText(event.globalPos(), tip, view)
+                return True
+        return super().helpEvent(event, view, option, index)
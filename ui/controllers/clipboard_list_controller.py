@@ -4,16 +4,22 @@ from __future__ import annotations
 import logging
 from typing import List, Optional
 
-from PySide6.QtCore import QEvent, QObject, Qt, QSize, QTimer, QUrl, Signal
+from PySide6.QtCore import QEvent, QObject, QPoint, QTimer, QUrl, Signal
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtWidgets import QListWidgetItem, QMessageBox
+from PySide6.QtWidgets import QMessageBox
 
 from core import analytics
 from core.models import ClipboardItem
+from core.query_parser import QueryParseError
+from core.search_service import SearchRequest, SearchResult, SearchService
+from core.sync_service import ChangeOp, ItemChange
 from config import PAGE_SIZE, PRICING_URL
 from i18n import t
 
-from ..clipboard_item import ClipboardItemWidget
+from ..clipboard_list_model import ClipboardItemDelegate, ClipboardListModel
+from ..source_app_icons import SourceAppIconCache
+from ..thumbnail_cache import ThumbnailCache
+from ..timeline_view import buckets_from_timeline, local_offset_ms
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +29,14 @@ class ClipboardListController(QObject):
 
     # 单项点击转发给 ItemActionController(由 shell 串接)
     item_clicked = Signal(object)
-    # 单项基本操作(由 widget 信号转发,shell 串到 ItemActionController)
+    # 单项基本操作(由 delegate 信号转发,shell 串到 ItemActionController)
     item_delete_requested = Signal(object)
     item_star_requested = Signal(object)
     item_save_requested = Signal(object)
     cloud_delete_requested = Signal(object)
     image_url_copy_requested = Signal(object)
+    # SearchService 工作线程 → UI 线程（跨线程自动排队）
+    _search_done = Signal(object)
 
     def __init__(self, parent, ctx):
         super().__init__(parent)
@@ -40,7 +48,10 @@ class ClipboardListController(QObject):
         self._page_size = PAGE_SIZE
         self._search_query = ""
         self._starred_only = False
-        self._items: List[ClipboardItem] = []
+        # 列表模式无限滚动（keyset 续取），搜索 / 标签模式仍按页 set_items
+        self._model = ClipboardListModel(self)
+        self._model.fetch_failed.connect(self._show_load_error)
+        self._delegate: Optional[ClipboardItemDelegate] = None
         self._current_space_id: Optional[str] = None
         self._current_tag_id: Optional[str] = None
         self._view_mode = "list"
@@ -50,8 +61,12 @@ class ClipboardListController(QObject):
         self._search_timer = QTimer(self)
         self._search_timer.setSingleShot(True)
         self._search_timer.timeout.connect(self.do_search)
+        # 搜索在后台线程执行；首次搜索时才创建（ctx 在构造期可能尚未装配 repository）
+        self._search_service: Optional[SearchService] = None
+        self._search_seq = 0
+        self._search_done.connect(self._on_search_done)
 
-        # list 宽度变化时重算行高(防抖)
+        # list 宽度变化时让 delegate 重算行高(防抖)
         self._resize_debounce = QTimer(self)
         self._resize_debounce.setSingleShot(True)
         self._resize_debounce.setInterval(80)
@@ -65,125 +80,212 @@ class ClipboardListController(QObject):
     def repository(self):
         return self.ctx.repository if self.ctx is not None else self._parent.repository
 
+    @property
+    def search_service(self) -> SearchService:
+        if self._search_service is None:
+            self._search_service = SearchService(self.repository)
+        return self._search_service
+
     # ========== 加载 / 渲染 ==========
 
+    def attach_view(self, view) -> None:
+        """把 main_window_helpers 建好的 QListView 接到模型和 delegate 上。"""
+        self._model.set_loader(lambda ids: self.repository.get_items_by_ids(ids))
+        view.setModel(self._model)
+        delegate = ClipboardItemDelegate(view)
+        delegate.clicked.connect(self.item_clicked)
+        delegate.delete_clicked.connect(self.item_delete_requested)
+        delegate.star_clicked.connect(self.item_star_requested)
+        delegate.save_clicked.connect(self.item_save_requested)
+        delegate.cloud_delete_clicked.connect(self.cloud_delete_requested)
+        delegate.image_url_clicked.connect(self.image_url_copy_requested)
+        view.setItemDelegate(delegate)
+        self._delegate = delegate
+        self._install_resize_filter()
+        view.verticalScrollBar().valueChanged.connect(self._prefetch_thumbnails)
+        self._model.rowsInserted.connect(self._prefetch_thumbnails)
+        self._model.modelReset.connect(self._prefetch_thumbnails)
+
+    def _prefetch_thumbnails(self, *_args) -> None:
+        """把视口上方一屏、下方两屏内图片行的缩略图提前交给后台解码。"""
+        view = getattr(self._parent, "list_view", None)
+        rows = self._model.rowCount()
+        if view is None or rows == 0:
+            return
+        top = view.indexAt(QPoint(0, 0)).row()
+        bottom = view.indexAt(QPoint(0, view.viewport().height() - 1)).row()
+        top = max(top, 0)
+        if bottom < 0:
+            bottom = min(rows - 1, top + self._page_size)
+        span = bottom - top + 1
+        first, last = max(0, top - span), min(rows - 1, bottom + 2 * span)
+        ThumbnailCache.instance().prefetch(
+            self._model.item_at(r) for r in range(first, last + 1)
+            if self._model.row_info(r) is not None and self._model.row_info(r).is_image
+        )
+
+    def prewarm(self) -> None:
+        """窗口收起时把首屏准备好：行常驻内存、行高已量、缩略图 / 来源图标在缓存里。
+
+        Why: 热键唤起走的是"滑入 + 绘制"，任何一项在绘制时才做都会把首帧拖过 50ms 预算。
+        """
+        view = getattr(self._parent, "list_view", None)
+        if view is None or not self._is_live_list():
+            return
+        items = []
+        for row in range(min(self._model.rowCount(), self._page_size)):
+            if self._model.row_info(row) is None:
+                break  # 占位提示行
+            item = self._model.item_at(row)
+            if item is None:
+                continue
+            view.sizeHintForIndex(self._model.index(row))
+            items.append(item)
+        ThumbnailCache.instance().prefetch(items)
+        icons = SourceAppIconCache.instance()
+        for item in items:
+            if getattr(item, "source_app", ""):
+                icons.get(item.source_app, "")
+
+    def invalidate_search(self) -> None:
+        """数据有变化时丢弃搜索缓存；与当前是否在搜索无关，之后重新输入旧查询也要看到新数据。"""
+        if self._search_service is not None:
+            self._search_service.invalidate()
+
+    def refresh_items(self):
+        """增删改之后的刷新入口：先丢弃搜索缓存再重载当前视图。"""
+        self.invalidate_search()
+        self.load_items()
+
     def load_items(self):
+        if self._search_query:
+            self._submit_search()
+            return
         try:
-            if self._search_query:
-                # search() 的 space_id 语义：None=仅个人空间(space_id IS NULL)，
-                # ""=不过滤。而本 controller 里 _current_space_id=None 表示
-                # "未选择特定空间，显示全部"（与 get_items 路径一致），所以这里
-                # 要把 None 翻译成 "" 才能让搜索覆盖所有空间。
-                search_space_id = (
-                    "" if self._current_space_id is None else self._current_space_id
-                )
-                items, total = self.repository.search_by_keyword(
-                    self._search_query, self._current_page, self._page_size,
-                    starred_only=self._starred_only,
-                    space_id=search_space_id,
-                )
-            elif self._current_tag_id:
+            if self._current_tag_id:
                 items = self.repository.get_items_by_tag(
                     self._current_tag_id,
                     page=self._current_page + 1,
                     page_size=self._page_size,
                 )
-                total = len(items)
+                self._apply_items(items, len(items))
             else:
-                # _current_space_id 语义：None = 显示全部空间；具体值 = 过滤到该空间。
-                # get_items 的 space_id 语义：None = 仅个人空间(IS NULL)；"" = 全部空间。
-                # 因此 controller 的 None 必须翻译为 ""，具体值原样透传。
-                get_space_id = "" if self._current_space_id is None else self._current_space_id
-                items, total = self.repository.get_items(
-                    self._current_page, self._page_size,
-                    starred_only=self._starred_only,
-                    space_id=get_space_id,
-                )
-
-            self._items = items
-            self._total_pages = max(1, (total + self._page_size - 1) // self._page_size)
-            self.update_list()
-            self.update_pagination()
-            self._load_error_notified = False
-        except Exception as e:
-            logger.error(f"加载剪贴板条目失败: {e}", exc_info=True)
-            self._items = []
-            self._total_pages = 1
-            try:
-                self.update_list()
+                # 列表模式不分页：首屏同步取一段，滚到底部时视图调 fetchMore 按 keyset 续取
+                self._model.set_fetcher(self._fetch_after, prefetch=True)
+                self._total_pages = 1
                 self.update_pagination()
-                self._parent.list_widget.clear()
-                placeholder = QListWidgetItem("加载失败，请查看日志或重启应用。")
-                placeholder.setFlags(Qt.NoItemFlags)
-                self._parent.list_widget.addItem(placeholder)
-            except Exception:
-                logger.error("更新失败占位 UI 时出错", exc_info=True)
-            if not self._load_error_notified:
-                self._load_error_notified = True
-                QMessageBox.warning(
-                    self._parent,
-                    t("error") if callable(t) else "错误",
-                    f"加载剪贴板条目失败：{e}\n\n请查看日志，必要时重启应用。",
-                )
+                self._reset_timeline()
+                self._load_error_notified = False
+        except Exception as e:
+            self._show_load_error(e)
+
+    def _fetch_after(self, cursor, limit: int) -> List[ClipboardItem]:
+        # _current_space_id 语义：None = 显示全部空间；具体值 = 过滤到该空间。
+        # get_items_after 的 space_id 语义：None = 仅个人空间(IS NULL)；"" = 全部空间。
+        # 因此 controller 的 None 必须翻译为 ""，具体值原样透传。
+        get_space_id = "" if self._current_space_id is None else self._current_space_id
+        return self.repository.get_items_after(
+            cursor, limit,
+            starred_only=self._starred_only,
+            space_id=get_space_id,
+        )
 
-    def make_list_item(self, item: ClipboardItem):
-        """创建 ClipboardItemWidget 和对应的 QListWidgetItem，连接信号。"""
-        widget = ClipboardItemWidget(item)
-        widget.clicked.connect(self.item_clicked)
-        widget.delete_clicked.connect(self.item_delete_requested)
-        widget.star_clicked.connect(self.item_star_requested)
-        widget.save_clicked.connect(self.item_save_requested)
-        widget.cloud_delete_clicked.connect(self.cloud_delete_requested)
-        widget.image_url_clicked.connect(self.image_url_copy_requested)
-
-        list_item = QListWidgetItem()
-        hint = widget.sizeHint()
-        if widget.hasHeightForWidth():
-            target_w = self._target_row_width(hint.width())
-            # +8: QListWidget::item 的 margin(3+3) + border(1+1) 占据的纵向空间
-            hint_h = widget.heightForWidth(target_w) + 8
-        else:
-            hint_h = hint.height()
-        min_h = 92 if item.is_image else 76
-        # 宽度仍用 widget 的 sizeHint().width(),让 QListView 自行扩展到 viewport;
-        # 若强行写 viewport 宽,纵向滚动条出现后 viewport 变窄,行会比 viewport 宽,
-        # 导致右侧按钮被滚动条遮挡。
-        list_item.setSizeHint(QSize(hint.width(), max(hint_h, min_h)))
-        return list_item, widget
-
-    def _target_row_width(self, fallback: int) -> int:
-        """list viewport 的可用宽度,优先用真实值,启动期回退到 fallback。"""
+    def _apply_items(self, items: List[ClipboardItem], total: int):
+        self._model.set_items(items)
+        self._total_pages = max(1, (total + self._page_size - 1) // self._page_size)
+        self.update_pagination()
+        if self._timeline is not None:
+            self._timeline.set_items(items)
+        self._load_error_notified = False
+
+    @property
+    def _timeline(self):
+        return getattr(self._parent, "timeline_view", None)
+
+    def _reset_timeline(self):
+        """列表模式：时间线按天聚合桶 + 按需取当天条目，切到时间线时才查询。"""
+        if self._timeline is not None:
+            self._timeline.set_source(self._timeline_buckets, self._timeline_day_items)
+
+    def _timeline_buckets(self):
+        get_space_id = "" if self._current_space_id is None else self._current_space_id
+        rows = self.repository.get_timeline(
+            0, 2 ** 53, "hour", get_space_id,
+            tz_offset_ms=local_offset_ms(), starred_only=self._starred_only,
+        )
+        return buckets_from_timeline(rows)
+
+    def _timeline_day_items(self, start_ts: int, end_ts: int, limit: int) -> List[ClipboardItem]:
+        get_space_id = "" if self._current_space_id is None else self._current_space_id
+        # 游标 (end_ts, 0) 即 created_at < end_ts
+        return self.repository.get_items_after(
+            (end_ts, 0), limit,
+            starred_only=self._starred_only,
+            space_id=get_space_id,
+            min_created_at=start_ts,
+        )
+
+    def _show_load_error(self, e: Exception):
+        logger.error(f"加载剪贴板条目失败: {e}", exc_info=e)
+        self._total_pages = 1
         try:
-            vw = self._parent.list_widget.viewport().width()
+            self._model.set_placeholder("加载失败，请查看日志或重启应用。")
+            self.update_pagination()
+            if self._timeline is not None:
+                self._timeline.clear()
         except Exception:
-            vw = 0
-        return vw if vw > 50 else max(fallback, 400)
+            logger.error("更新失败占位 UI 时出错", exc_info=True)
+        if not self._load_error_notified:
+            self._load_error_notified = True
+            QMessageBox.warning(
+                self._parent,
+                t("error") if callable(t) else "错误",
+                f"加载剪贴板条目失败：{e}\n\n请查看日志，必要时重启应用。",
+            )
+
+    def _submit_search(self):
+        # search() 的 space_id 语义：None=仅个人空间(space_id IS NULL)，
+        # ""=不过滤。而本 controller 里 _current_space_id=None 表示
+        # "未选择特定空间，显示全部"（与 get_items 路径一致），所以这里
+        # 要把 None 翻译成 "" 才能让搜索覆盖所有空间。
+        search_space_id = "" if self._current_space_id is None else self._current_space_id
+        request = SearchRequest(
+            query=self._search_query,
+            page=self._current_page,
+            page_size=self._page_size,
+            starred_only=self._starred_only,
+            space_id=search_space_id,
+        )
+        self._search_seq = self.search_service.submit(request, self._search_done.emit)
+
+    def _on_search_done(self, result: SearchResult):
+        # 工作线程只回调最新一次 submit，但排队中的信号仍可能晚于新的 submit 到达
+        if result.seq != self._search_seq:
+            return
+        if result.error is None:
+            self._apply_items(result.items, result.total)
+        elif isinstance(result.error, QueryParseError):
+            # 输入到一半的语法（如未闭合引号）不弹窗，保留当前列表
+            logger.debug(f"搜索语法不完整: {result.error}")
+        else:
+            self._show_load_error(result.error)
 
     def refresh_row_sizes(self):
-        """list 宽度变化时按真实宽度重算各行高度,避免文字裁切。"""
-        lw = getattr(self._parent, "list_widget", None)
-        if lw is None:
+        """list 宽度变化时丢弃行高缓存并重新布局，delegate 按新宽度重算换行。"""
+        view = getattr(self._parent, "list_view", None)
+        if view is None:
             return
-        target_w = self._target_row_width(lw.viewport().width() or 600)
-        for i in range(lw.count()):
-            li = lw.item(i)
-            if li is None:
-                continue
-            w = lw.itemWidget(li)
-            if isinstance(w, ClipboardItemWidget) and w.hasHeightForWidth():
-                h = w.heightForWidth(target_w) + 8
-                min_h = 92 if w.item.is_image else 76
-                cur_w = li.sizeHint().width()
-                li.setSizeHint(QSize(cur_w, max(h, min_h)))
+        self._model.invalidate_heights()
+        view.doItemsLayout()
 
     def _install_resize_filter(self):
         if self._resize_filter_installed:
             return
-        lw = getattr(self._parent, "list_widget", None)
-        if lw is None:
+        view = getattr(self._parent, "list_view", None)
+        if view is None:
             return
         try:
-            lw.viewport().installEventFilter(self)
+            view.viewport().installEventFilter(self)
             self._resize_filter_installed = True
         except Exception:
             pass
@@ -199,40 +301,17 @@ class ClipboardListController(QObject):
                 pass
         return super().eventFilter(obj, event)
 
-    def update_list(self):
-        list_widget = self._parent.list_widget
-        self._install_resize_filter()
-        list_widget.clear()
-        for item in self._items:
-            list_item, widget = self.make_list_item(item)
-            list_widget.addItem(list_item)
-            list_widget.setItemWidget(list_item, widget)
-        if getattr(self._parent, "timeline_view", None) is not None:
-            self._parent.timeline_view.set_items(self._items)
-
     def prepend_item(self, item: ClipboardItem):
-        """在列表顶部插入单个新条目，避免全量重建。"""
-        list_widget = self._parent.list_widget
-        if item.id is not None:
-            for idx, existing in enumerate(self._items):
-                if existing.id == item.id:
-                    list_widget.takeItem(idx)
-                    self._items.pop(idx)
-                    break
-
-        list_item, widget = self.make_list_item(item)
-        list_widget.insertItem(0, list_item)
-        list_widget.setItemWidget(list_item, widget)
-        self._items.insert(0, item)
-
-        if list_widget.count() > self._page_size:
-            list_widget.takeItem(list_widget.count() - 1)
-            if len(self._items) > self._page_size:
-                self._items.pop()
+        """把单个新条目按时间插到列表和时间线里，不重建。"""
+        self._model.insert_item(item)
+        if self._timeline is not None:
+            self._timeline.upsert_item(item)
 
     def on_item_added(self, item: ClipboardItem):
-        if self._current_page == 0 and not self._search_query and not self._starred_only:
-            self.prepend_item(item)
+        self.invalidate_search()
+        if self._is_live_list():
+            if self._matches_filters(item):
+                self.prepend_item(item)
         elif self._current_page == 0 and not self._search_query:
             self.load_items()
         try:
@@ -246,59 +325,77 @@ class ClipboardListController(QObject):
             except Exception:
                 pass
 
+    def _is_live_list(self) -> bool:
+        """当前是无限滚动的列表模式（行集合由排序键决定，可就地增删）。"""
+        return not self._search_query and not self._current_tag_id
+
     def refresh_cloud_state(self):
         """上传完成后，把当前列表里 cloud_id=None 但 DB 已经写入 cloud_id 的条目
         刷新成"已同步"外观（出现 ☁ 按钮，图片条目出现 🔗）。
 
-        Why: ClipboardItemWidget 在构造时一次性根据 is_cloud_synced 决定按钮列；
-        云同步 worker 写 DB 后不会回写内存 item，也未触发任何 UI 刷新，导致
-        云图标永远不出现，除非整页重载。
+        Why: 云同步 worker 写 DB 后不会回写内存 item，也未触发任何 UI 刷新，导致
+        云图标永远不出现，除非整页重载。只看常驻条目：被淘汰的行再次可见时会从库里读回新值。
         """
-        if not self._items:
-            return
-        pending_ids = [it.id for it in self._items if it.id and it.cloud_id is None]
-        if not pending_ids:
+        pending = [it for it in self._model.resident_items() if it.id and it.cloud_id is None]
+        if not pending:
             return
         try:
-            mapping = self.repository.get_cloud_ids_for_ids(pending_ids)
+            mapping = self.repository.get_cloud_ids_for_ids([it.id for it in pending])
         except Exception as e:
             logger.debug(f"刷新云端标记失败: {e}")
             return
-
-        list_widget = self._parent.list_widget
-        changed_idx = []
-        for idx, item in enumerate(self._items):
-            if item.id is None or item.cloud_id is not None:
-                continue
+        for item in pending:
             new_cid = mapping.get(item.id)
             if new_cid:
                 item.cloud_id = new_cid
-                changed_idx.append(idx)
-        if not changed_idx:
+                self._model.update_item(item)
+
+    def on_new_items(self, items: List[ClipboardItem]):
+        # 来自其他设备的新记录：列表模式就地插入，不重置滚动位置
+        self.invalidate_search()
+        if self._is_live_list():
+            for item in items:
+                if self._matches_filters(item):
+                    self.prepend_item(item)
+        elif self._current_page == 0 and not self._search_query:
+            self.load_items()
+
+    def on_changes(self, changes: List[ItemChange]):
+        """共享库上其他设备的增 / 改 / 删：列表模式就地增量更新，不整页重载。
+
+        搜索 / 标签视图的结果集由查询决定，无法就地判断归属：
+        只有变更碰到当前可见条目（或标签视图首页）时才刷新。
+        """
+        if not changes:
+            return
+        self.invalidate_search()
+        if not self._is_live_list():
+            visible = set(self._model.ids())
+            if any(c.item_id in visible for c in changes) or (
+                self._current_page == 0 and not self._search_query
+            ):
+                self.load_items()
             return
 
-        for idx in changed_idx:
-            li = list_widget.item(idx)
-            if li is None:
+        timeline = self._timeline
+        for change in changes:
+            if change.op is ChangeOp.DELETE or not self._matches_filters(change.item):
+                self._model.remove_id(change.item_id)
+                if timeline is not None:
+                    timeline.remove_item(change.item_id)
                 continue
-            new_widget = ClipboardItemWidget(self._items[idx])
-            new_widget.clicked.connect(self.item_clicked)
-            new_widget.delete_clicked.connect(self.item_delete_requested)
-            new_widget.star_clicked.connect(self.item_star_requested)
-            new_widget.save_clicked.connect(self.item_save_requested)
-            new_widget.cloud_delete_clicked.connect(self.cloud_delete_requested)
-            new_widget.image_url_clicked.connect(self.image_url_copy_requested)
-            list_widget.setItemWidget(li, new_widget)
-            if new_widget.hasHeightForWidth():
-                target_w = self._target_row_width(li.sizeHint().width())
-                h = new_widget.heightForWidth(target_w) + 8
-                min_h = 92 if self._items[idx].is_image else 76
-                li.setSizeHint(QSize(li.sizeHint().width(), max(h, min_h)))
+            if self._model.row_of(change.item_id) >= 0:
+                self._model.update_item(change.item)
+            else:
+                # 比已加载范围更旧的插入不放进来，滚到那里时 fetchMore 自然会取到
+                self._model.insert_item(change.item)
+            if timeline is not None:
+                timeline.upsert_item(change.item, is_new=change.op is ChangeOp.INSERT)
 
-    def on_new_items(self, items: List[ClipboardItem]):
-        # 来自其他设备的新记录
-        if self._current_page == 0 and not self._search_query:
-            self.load_items()
+    def _matches_filters(self, item: ClipboardItem) -> bool:
+        if self._starred_only and not item.is_starred:
+            return False
+        return self._current_space_id is None or item.space_id == self._current_space_id
 
     # ========== 搜索 ==========
 
@@ -314,7 +411,13 @@ class ClipboardListController(QObject):
     def do_search(self):
         self._search_query = self._parent.search_input.text().strip()
         self._current_page = 0
-        self.load_items()
+        if self._search_query:
+            # 打字路径：命中缓存 / 细化过滤时不查库，查库也在后台线程
+            self._submit_search()
+        else:
+            if self._search_service is not None:
+                self._search_service.cancel_pending()
+            self.load_items()
 
     def show_search_help(self):
         QMessageBox.information(
@@ -336,6 +439,10 @@ class ClipboardListController(QObject):
     # ========== 分页 ==========
 
     def update_pagination(self):
+        # 列表模式是无限滚动，分页条只在搜索 / 标签结果里出现
+        paged = not self._is_live_list()
+        for w in (self._parent.page_label, self._parent.prev_btn, self._parent.next_btn):
+            w.setVisible(paged)
         self._parent.page_label.setText(f"{self._current_page + 1} / {self._total_pages}")
         self._parent.prev_btn.setEnabled(self._current_page > 0)
         self._parent.next_btn.setEnabled(self._current_page < self._total_pages - 1)
@@ -363,17 +470,22 @@ class ClipboardListController(QObject):
             self._view_mode = "timeline"
             timeline_view = getattr(self._parent, "timeline_view", None)
             if timeline_view is not None:
+                # 数据源已由 load_items 设好，显示时才查询
                 self._parent._view_stack.setCurrentWidget(timeline_view)
-                timeline_view.set_items(self._items)
         else:
             self._view_mode = "list"
-            self._parent._view_stack.setCurrentWidget(self._parent.list_widget)
+            self._parent._view_stack.setCurrentWidget(self._parent.list_view)
 
     def on_timeline_item_clicked(self, item_id: int):
-        for it in self._items:
-            if it.id == item_id:
-                self.item_clicked.emit(it)
-                return
+        # 时间线可能展示列表尚未拉取到的更早日期，不在模型里时按 id 读库
+        item = self._model.find_item(item_id)
+        if item is None:
+            try:
+                item = self.repository.get_item_by_id(item_id)
+            except Exception as e:
+                logger.debug(f"读取时间线条目失败: {e}")
+        if item is not None:
+            self.item_clicked.emit(item)
 
     def on_sidebar_space_changed(self, space_id):
         self._current_space_id = space_id
@@ -414,11 +526,21 @@ class ClipboardListController(QObject):
             if ent:
                 ent.refresh_async()
 
+    def shutdown(self):
+        """退出时中断进行中的搜索并停掉搜索线程 / 缩略图与图标的后台池。"""
+        if self._search_service is not None:
+            self._search_service.shutdown()
+        ThumbnailCache.shutdown_instance()
+        SourceAppIconCache.shutdown_instance()
+
     # ========== 提供给其它控制器/shell 的只读访问 ==========
 
     @property
-    def items(self) -> List[ClipboardItem]:
-        return self._items
+    def model(self) -> ClipboardListModel:
+        return self._model
+
+    def item_at(self, row: int) -> Optional[ClipboardItem]:
+        return self._model.item_at(row)
 
     @property
     def current_space_id(self) -> Optional[str]:
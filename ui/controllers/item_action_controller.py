@@ -140,7 +140,7 @@ class ItemActionController(QObject):
         )
         if reply == QMessageBox.Yes:
             self.repository.delete_item(item.id)
-            self._parent.list_controller.load_items()
+            self._parent.list_controller.refresh_items()
 
     def on_cloud_delete(self, item: ClipboardItem):
         if not item.cloud_id or not self.cloud_api:
@@ -172,7 +172,7 @@ class ItemActionController(QObject):
     def handle_cloud_delete_done(self, success: bool, item_id: int, error: str):
         if success:
             self.repository.clear_cloud_id(item_id)
-            self._parent.list_controller.load_items()
+            self._parent.list_controller.refresh_items()
         else:
             logger.warning(f"删除云端副本失败: {error}")
 
@@ -196,7 +196,7 @@ class ItemActionController(QObject):
                 full_item.is_starred = True
                 self.cloud_sync_service.enqueue_upload(full_item)
 
-        self._parent.list_controller.load_items()
+        self._parent.list_controller.refresh_items()
 
     # ========== 保存图片 ==========
 
@@ -67,16 +67,14 @@ class PluginActionController(QObject):
     # ========== 右键菜单 ==========
 
     def show_context_menu(self, pos):
-        list_widget = self._parent.list_widget
-        list_item = list_widget.itemAt(pos)
-        if not list_item:
+        list_view = self._parent.list_view
+        index = list_view.indexAt(pos)
+        if not index.isValid():
             return
-        row = list_widget.row(list_item)
-        items = self._parent.list_controller.items
-        if row < 0 or row >= len(items):
+        item = self._parent.list_controller.item_at(index.row())
+        if item is None:
             return
 
-        item = items[row]
         menu = QMenu(self._parent)
         item_ctrl = self._parent.item_controller
 
@@ -133,7 +131,7 @@ class PluginActionController(QObject):
                                     self.run_plugin_action(pid, aid, item)
                             )
 
-        menu.exec(list_widget.mapToGlobal(pos))
+        menu.exec(list_view.mapToGlobal(pos))
 
     # ========== 插件执行 ==========
 
@@ -240,7 +238,7 @@ class PluginActionController(QObject):
                     image_thumbnail=None,
                 )
             self.repository.add_item(new_item)
-            self._parent.list_controller.load_items()
+            self._parent.list_controller.refresh_items()
             self.show_plugin_feedback(t("plugin_saved_entry"), "copyFeedbackSuccess")
 
         elif result.action == PluginResultAction.REPLACE:
@@ -252,7 +250,7 @@ class PluginActionController(QObject):
                     content_type=result.content_type.value if result.content_type else None,
                 )
                 if success:
-                    self._parent.list_controller.load_items()
+                    self._parent.list_controller.refresh_items()
                     self.show_plugin_feedback(t("plugin_replaced_entry"), "copyFeedbackSuccess")
                 else:
                     self.show_plugin_feedback("❌ " + t("plugin_error"), "copyFeedbackError")
@@ -0,0 +1,136 @@
+"""事件驱动的边缘唤出：沿停靠边给每块屏幕放一条 1px 的置顶窗口，鼠标进入即触发。
+
+窗口收起时不再需要 100–200ms 的 QCursor.pos() 轮询（调用方只留一个 1s 的看门狗轮询，
+防止条带被系统藏掉后唤不出来）；平台不支持自由摆放顶层窗口（offscreen / minimal / Wayland）
+时 EdgeTriggerStrips.supported 为 False，调用方退回按距离退避的轮询。
+
+Why 1px 而不是 TRIGGER_ZONE：条带是置顶窗口，会吃掉落在上面的点击（比如最大化窗口的滚动条），
+而把鼠标推到屏幕边缘时光标本来就停在最外一列像素上。
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, QRect, Qt, Signal
+from PySide6.QtGui import QGuiApplication, QScreen
+from PySide6.QtWidgets import QWidget
+
+logger = logging.getLogger(__name__)
+
+
+STRIP_PX = 1
+# 这些平台插件下顶层窗口无法按坐标摆放 / 收不到 enter 事件
+_UNSUPPORTED_PLATFORMS = {"offscreen", "minimal", "wayland"}
+
+
+def strip_rect(screen_rect: QRect, edge: str, thickness: int = STRIP_PX) -> QRect:
+    """屏幕可用区域沿 edge 的最外 thickness 像素。"""
+    if edge == "right":
+        return QRect(screen_rect.right() - thickness + 1, screen_rect.top(), thickness, screen_rect.height())
+    if edge == "left":
+        return QRect(screen_rect.left(), screen_rect.top(), thickness, screen_rect.height())
+    if edge == "top":
+        return QRect(screen_rect.left(), screen_rect.top(), screen_rect.width(), thickness)
+    return QRect(screen_rect.left(), screen_rect.bottom() - thickness + 1, screen_rect.width(), thickness)
+
+
+class _EdgeStrip(QWidget):
+    entered = Signal()
+
+    def __init__(self):
+        super().__init__(None)
+        self.setWindowFlags(
+            Qt.FramelessWindowHint
+            | Qt.WindowStaysOnTopHint
+            | Qt.Tool
+            | Qt.WindowDoesNotAcceptFocus
+            | Qt.NoDropShadowWindowHint
+        )
+        self.setAttribute(Qt.WA_ShowWithoutActivating, True)
+        # Why: macOS 上 Qt.Tool 窗口在应用非激活时自动隐藏，而常驻后台的剪贴板工具几乎总是非激活
+        self.setAttribute(Qt.WA_MacAlwaysShowToolWindow, True)
+        self.setFocusPolicy(Qt.NoFocus)
+        # Why: 完全透明（opacity 0 / WA_TranslucentBackground）的窗口在 macOS、Windows 上收不到鼠标事件
+        self.setWindowOpacity(0.01)
+
+    def enterEvent(self, event):
+        self.entered.emit()
+        super().enterEvent(event)
+
+
+class EdgeTriggerStrips(QObject):
+    """每块屏幕一条边缘条带；鼠标进入时发 triggered(该屏可用区域)。"""
+
+    triggered = Signal(QRect)
+
+    def __init__(self, edge: str = "right", parent=None):
+        super().__init__(parent)
+        self._edge = edge
+        self._active = False
+        self._strips: Dict[QScreen, _EdgeStrip] = {}
+        self.supported = QGuiApplication.platformName().lower() not in _UNSUPPORTED_PLATFORMS
+        if self.supported:
+            app = QGuiApplication.instance()
+            app.screenAdded.connect(self._on_screens_changed)
+            app.screenRemoved.connect(self._on_screens_changed)
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def set_edge(self, edge: str) -> None:
+        if edge != self._edge:
+            self._edge = edge
+            self._relayout()
+
+    def set_active(self, active: bool) -> None:
+        """收起时打开、滑入 / 悬浮时关闭；不支持的平台恒为关闭。"""
+        active = active and self.supported
+        if active == self._active:
+            return
+        self._active = active
+        if active:
+            self._relayout()
+        for strip in self._strips.values():
+            strip.setVisible(active)
+
+    def geometries(self) -> list[QRect]:
+        return [strip.geometry() for strip in self._strips.values()]
+
+    def close(self) -> None:
+        self._active = False
+        for strip in self._strips.values():
+            strip.close()
+            strip.deleteLater()
+        self._strips.clear()
+
+    # ----- internal -----
+
+    def _on_screens_changed(self, *_args) -> None:
+        if self._active:
+            self._relayout()
+
+    def _relayout(self) -> None:
+        screens = QGuiApplication.screens()
+        for screen in list(self._strips):
+            if screen not in screens:
+                strip = self._strips.pop(screen)
+                strip.close()
+                strip.deleteLater()
+        for screen in screens:
+            strip = self._strips.get(screen)
+            if strip is None:
+                strip = self._strips[screen] = _EdgeStrip()
+                strip.entered.connect(lambda s=screen: self._on_entered(s))
+                screen.availableGeometryChanged.connect(self._on_screens_changed)
+            strip.setGeometry(strip_rect(screen.availableGeometry(), self._edge))
+            strip.setVisible(self._active)
+
+    def _on_entered(self, screen: QScreen) -> None:
+        try:
+            rect = screen.availableGeometry()
+        except RuntimeError:
+            return  # 屏幕刚被拔掉
+        self.triggered.emit(rect)
@@ -1,7 +1,7 @@
 import platform
 from typing import Optional
 
-from PySide6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, QTimer, QPoint, Slot
+from PySide6.QtCore import Qt, QRect, QPropertyAnimation, QEasingCurve, QTimer, QPoint, Signal, Slot
 from PySide6.QtGui import QCursor, QScreen, QMouseEvent
 from PySide6.QtWidgets import QWidget, QApplication
 
@@ -15,9 +15,24 @@ from config import (
     TRIGGER_ZONE,
     ANIMATION_DURATION,
 )
+from .edge_trigger import EdgeTriggerStrips
+
+# 鼠标位置轮询：可见时要及时收起；收起且没有边缘条带（平台不支持）时按离边距离退避
+POLL_VISIBLE_MS = 100
+POLL_NEAR_MS = 100
+POLL_MID_MS = 250
+POLL_FAR_MS = 600
+POLL_IDLE_MAX_MS = 1000
+# 条带生效时的看门狗轮询：条带被系统藏掉 / 没收到 enter 时仍能在 1s 内唤出
+POLL_WATCHDOG_MS = 1000
+POLL_NEAR_PX = 60
+POLL_MID_PX = 300
 
 
 class EdgeHiddenWindow(QWidget):
+    # 滑入 / 滑出（True = 可见）；窗口本身始终 show 着，isVisible() 不反映停靠状态
+    visibility_changed = Signal(bool)
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -72,10 +87,11 @@ class EdgeHiddenWindow(QWidget):
         self._drag_start_geometry = QRect()
         self._last_cursor_pos = QPoint(-1, -1)
 
-        # 鼠标位置检测定时器
+        # 鼠标位置检测定时器（收起时优先由边缘条带事件触发，见 _update_trigger_mode）
         self._mouse_check_timer = QTimer(self)
         self._mouse_check_timer.timeout.connect(self._check_mouse_position)
-        self._mouse_check_timer.start(200)  # 初始隐藏状态，低频检测
+        self._edge_strips = EdgeTriggerStrips(self._dock_edge, self)
+        self._edge_strips.triggered.connect(self._on_edge_triggered)
 
         # 显示保护定时器
         self._protection_timer = QTimer(self)
@@ -84,6 +100,7 @@ class EdgeHiddenWindow(QWidget):
 
         # 初始化位置
         self._init_position()
+        self._update_trigger_mode()
 
     def _init_position(self):
         screen_rect = self._get_screen_rect()
@@ -154,6 +171,7 @@ class EdgeHiddenWindow(QWidget):
             self._is_floating = False
             update_settings(is_floating=False)
             set_dock_edge_config(edge)
+            self._edge_strips.set_edge(edge)
             # 重新定位
             screen_rect = self._get_screen_rect()
             if not screen_rect.isEmpty():
@@ -161,6 +179,7 @@ class EdgeHiddenWindow(QWidget):
                     self._move_to_visible_position(screen_rect)
                 else:
                     self._move_to_hidden_position(screen_rect)
+            self._update_trigger_mode()
 
     def toggle_pin(self):
         self._is_pinned = not self._is_pinned
@@ -276,13 +295,50 @@ class EdgeHiddenWindow(QWidget):
     def _move_to_visible_position(self, screen_rect: QRect):
         self.setGeometry(self._get_visible_geometry(screen_rect))
 
+    def _update_trigger_mode(self):
+        """收起且吸附时靠边缘条带的 enter 事件唤出，轮询降为看门狗；可见或平台不支持条带时正常轮询。"""
+        parked = not self._is_visible and not self._is_floating
+        self._edge_strips.set_active(parked)
+        if self._is_floating:
+            # 悬浮态不做边缘检测（_check_mouse_position 也会直接返回）
+            self._mouse_check_timer.stop()
+        elif self._edge_strips.active:
+            self._mouse_check_timer.start(POLL_WATCHDOG_MS)
+        elif self._is_visible:
+            self._mouse_check_timer.start(POLL_VISIBLE_MS)
+        else:
+            self._mouse_check_timer.start(POLL_NEAR_MS)
+
+    def _on_edge_triggered(self, screen_rect: QRect):
+        if self._dragging or self._is_floating or self._is_visible:
+            return
+        self._slide_in(screen_rect)
+
+    @staticmethod
+    def _fallback_interval(cursor_pos: QPoint, trigger_zone: QRect) -> int:
+        """轮询兜底时按光标到触发区的距离决定下一次检测间隔：离边越远越稀疏。"""
+        dx = max(trigger_zone.left() - cursor_pos.x(), 0, cursor_pos.x() - trigger_zone.right())
+        dy = max(trigger_zone.top() - cursor_pos.y(), 0, cursor_pos.y() - trigger_zone.bottom())
+        distance = max(dx, dy)
+        if distance <= POLL_NEAR_PX:
+            return POLL_NEAR_MS
+        if distance <= POLL_MID_PX:
+            return POLL_MID_MS
+        return POLL_FAR_MS
+
     def _check_mouse_position(self):
         # 拖动中不做边缘检测，否则会被定时器拉回停靠位置
         if self._dragging or self._is_floating or self._show_protection:
             return
 
         cursor_pos = QCursor.pos()
+        # 条带生效时是固定间隔的看门狗，不做退避
+        backoff = not self._is_visible and not self._edge_strips.active
         if cursor_pos == self._last_cursor_pos:
+            if backoff:
+                # 光标不动：收起态逐步放慢，动起来后按距离重新算
+                interval = self._mouse_check_timer.interval()
+                self._mouse_check_timer.setInterval(min(interval * 2, POLL_IDLE_MAX_MS))
             return
         self._last_cursor_pos = cursor_pos
 
@@ -292,6 +348,8 @@ class EdgeHiddenWindow(QWidget):
         cursor_screen_rect = cursor_screen.availableGeometry()
 
         trigger_zone = self._get_trigger_zone(cursor_screen_rect)
+        if backoff:
+            self._mouse_check_timer.setInterval(self._fallback_interval(cursor_pos, trigger_zone))
 
         if trigger_zone.contains(cursor_pos):
             if not self._is_visible or not self.geometry().intersects(cursor_screen_rect):
@@ -321,10 +379,13 @@ class EdgeHiddenWindow(QWidget):
         self._animation.setStartValue(current_geometry)
         self._animation.setEndValue(end_geometry)
         self._animation.start()
+        was_visible = self._is_visible
         self._is_visible = True
-        self._mouse_check_timer.setInterval(100)  # 窗口可见时快速检测
+        self._update_trigger_mode()
         self.raise_()
         self.activateWindow()
+        if not was_visible:
+            self.visibility_changed.emit(True)
 
     def _slide_out(self):
         if self._is_pinned or self._is_floating:
@@ -342,8 +403,11 @@ class EdgeHiddenWindow(QWidget):
         self._animation.setStartValue(self.geometry())
         self._animation.setEndValue(end_geometry)
         self._animation.start()
+        was_visible = self._is_visible
         self._is_visible = False
-        self._mouse_check_timer.setInterval(200)  # 窗口隐藏时降低检测频率
+        self._update_trigger_mode()
+        if was_visible:
+            self.visibility_changed.emit(False)
 
     @Slot()
     def show_window(self):
@@ -456,6 +520,7 @@ class EdgeHiddenWindow(QWidget):
             self._is_pinned = True
             pos = self.geometry().topLeft()
             update_settings(is_floating=True, floating_position=(pos.x(), pos.y()))
+        self._update_trigger_mode()
 
     def _snap_to_nearest_edge(self):
         """吸附到最近的屏幕边缘（强制吸附，不进入悬浮）"""
@@ -471,3 +536,4 @@ class EdgeHiddenWindow(QWidget):
             self.set_dock_edge(nearest_edge)
         else:
             self._move_to_visible_position(screen_rect)
+        self._update_trigger_mode()
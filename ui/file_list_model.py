@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import List, Optional
 
 from PySide6.QtCore import (
-    QAbstractTableModel, QModelIndex, QRect, Qt, QSize,
+    QAbstractTableModel, QModelIndex, QRect, Qt, QSize, QTimer,
 )
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
@@ -47,7 +47,12 @@ def _fmt_ts(ms: int) -> str:
 
 
 class FileListModel(QAbstractTableModel):
-    """表格数据源。进度以 `progress` dict 按 local id 存 (done, total)。"""
+    """表格数据源。进度以 `progress` dict 按 local id 存 (done, total)。
+
+    `_row_of` 维护 local id → 行号，查找不再线性扫描。进度和已有行的状态变化先记脏，
+    由 FLUSH_INTERVAL_MS 定时器每帧合并成一次 dataChanged（覆盖所有脏行的最小区间）：
+    多个并发传输每秒数十次进度信号时，视图每帧只重绘一次。
+    """
 
     COL_NAME = 0
     COL_SIZE = 1
@@ -55,38 +60,62 @@ class FileListModel(QAbstractTableModel):
     COL_STATE = 3
     COL_DEVICE = 4
 
+    FLUSH_INTERVAL_MS = 33
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._files: List[CloudFile] = []
+        self._row_of: dict[int, int] = {}
         self._progress: dict[int, tuple[int, int]] = {}
+        # 待合并的变化：整行（状态 / 元数据）与仅进度列
+        self._dirty_rows: set[int] = set()
+        self._dirty_progress: set[int] = set()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
 
     # ---- data ----
     def load(self, files: list) -> None:
         self.beginResetModel()
         self._files = list(files)
         self._progress.clear()
+        self._dirty_rows.clear()
+        self._dirty_progress.clear()
+        self._reindex(0)
         self.endResetModel()
 
+    def _reindex(self, start: int) -> None:
+        """行号从 start 起整体平移后重建索引（插入 / 删除行时）。"""
+        if start == 0:
+            self._row_of = {}
+        for i in range(start, len(self._files)):
+            fid = self._files[i].id
+            if fid is not None:
+                self._row_of[fid] = i
+
     def upsert(self, f: CloudFile) -> None:
-        for i, existing in enumerate(self._files):
-            if existing.id == f.id:
-                self._files[i] = f
-                top = self.index(i, 0)
-                bot = self.index(i, self.columnCount() - 1)
-                self.dataChanged.emit(top, bot)
-                return
+        row = self._row_of.get(f.id) if f.id is not None else None
+        if row is not None:
+            self._files[row] = f
+            self._mark_dirty(self._dirty_rows, f.id)
+            return
         self.beginInsertRows(QModelIndex(), 0, 0)
         self._files.insert(0, f)
+        self._reindex(0)
         self.endInsertRows()
 
     def remove_by_local_id(self, local_id: int) -> None:
-        for i, existing in enumerate(self._files):
-            if existing.id == local_id:
-                self.beginRemoveRows(QModelIndex(), i, i)
-                self._files.pop(i)
-                self.endRemoveRows()
-                self._progress.pop(local_id, None)
-                return
+        row = self._row_of.pop(local_id, None)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._files.pop(row)
+        self._reindex(row)
+        self.endRemoveRows()
+        self._progress.pop(local_id, None)
+        self._dirty_rows.discard(local_id)
+        self._dirty_progress.discard(local_id)
 
     def file_at(self, row: int) -> Optional[CloudFile]:
         if 0 <= row < len(self._files):
@@ -98,11 +127,26 @@ class FileListModel(QAbstractTableModel):
         if prev == (done, total):
             return
         self._progress[local_id] = (done, total)
-        for i, f in enumerate(self._files):
-            if f.id == local_id:
-                idx = self.index(i, self.COL_STATE)
-                self.dataChanged.emit(idx, idx, [Qt.DisplayRole, Qt.UserRole + 1])
-                return
+        if local_id in self._row_of:
+            self._mark_dirty(self._dirty_progress, local_id)
+
+    def _mark_dirty(self, bucket: set, local_id: int) -> None:
+        bucket.add(local_id)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self) -> None:
+        """把本帧积累的变化合并成一次 dataChanged。"""
+        full, progress = self._dirty_rows, self._dirty_progress
+        self._dirty_rows, self._dirty_progress = set(), set()
+        rows = [self._row_of[i] for i in full | progress if i in self._row_of]
+        if not rows:
+            return
+        if full:
+            left, right = 0, self.columnCount() - 1
+        else:
+            left = right = self.COL_STATE
+        self.dataChanged.emit(self.index(min(rows), left), self.index(max(rows), right))
 
     def progress_for(self, local_id: int) -> tuple[int, int]:
         return self._progress.get(local_id, (0, 0))
@@ -7,10 +7,11 @@
 - CloudLifecycleController:登录/登出 引发的 stack 切换 + 云同步启停
 """
 import logging
+import time
 from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
-from PySide6.QtCore import Signal, QTimer
+from PySide6.QtCore import Signal, Slot, QTimer
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -23,6 +24,7 @@ from PySide6.QtWidgets import (
 
 from core.models import ClipboardItem
 from config import (
+    ANIMATION_DURATION,
     IS_MACOS,
     settings,
     get_cloud_access_token,
@@ -30,9 +32,13 @@ from config import (
 from i18n import t
 from .edge_window import EdgeHiddenWindow
 from .styles import MAIN_STYLE
+from .wake_latency import WakeLatencyProbe
 
 logger = logging.getLogger(__name__)
 
+# 滑出动画结束后再预热，避免和动画抢帧
+PREWARM_DELAY_MS = ANIMATION_DURATION + 300
+
 
 def _restore_cloud_api_from_config():
     """返回全局 CloudAPIClient（仅在已登录时返回非 None，用于向后兼容旧调用点）。"""
@@ -109,10 +115,17 @@ class MainWindow(EdgeHiddenWindow):
         self.plugin_controller = PluginActionController(self, self.ctx)
         self.cloud_controller = CloudLifecycleController(self, self.ctx)
 
+        # 热键唤起延迟探针 + 收起后的首屏预热
+        self.wake_probe = WakeLatencyProbe(parent=self)
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.timeout.connect(self._prewarm)
+
         self.setStyleSheet(MAIN_STYLE)
         self._setup_ui()
         self._connect_signals()
         self.list_controller.load_items()
+        self._schedule_prewarm()
 
         # 首次启动 3 步引导(非阻塞,跳过即关闭)
         if not getattr(settings, "onboarding_done", False):
@@ -226,9 +239,11 @@ class MainWindow(EdgeHiddenWindow):
         # 剪贴板监控:新条目到 list_controller
         self.clipboard_monitor.item_added.connect(self.list_controller.on_item_added)
         self.clipboard_monitor.item_added.connect(self._advance_onboarding_after_copy)
+        self.clipboard_monitor.item_added.connect(self._schedule_prewarm)
+        self.visibility_changed.connect(self._on_visibility_changed)
 
-        # 同步服务:其它设备来的新条目
-        self.sync_service.new_items_available.connect(self.list_controller.on_new_items)
+        # 同步服务:其它设备的增 / 改 / 删,增量应用到列表
+        self.sync_service.changes_available.connect(self.list_controller.on_changes)
 
         # list_controller 单项点击/操作 → item_controller
         self.list_controller.item_clicked.connect(self.item_controller.on_item_clicked)
@@ -278,8 +293,22 @@ class MainWindow(EdgeHiddenWindow):
         """请求退出应用。"""
         self.quit_requested.emit()
 
+    @Slot()
     def show_window(self):
+        started = time.perf_counter()
+        timed = self.wake_probe.dispatched()
         super().show_window()
+        if timed:
+            self.wake_probe.shown(started)
+            list_view = getattr(self, "list_view", None)
+            if list_view is not None and list_view.isVisible():
+                model = self.list_controller.model
+                self.wake_probe.watch(
+                    list_view.viewport(),
+                    lambda: model.rowCount() > 0 or not model.canFetchMore(),
+                )
+            else:
+                self.wake_probe.watch(self)
         try:
             from core import analytics
             analytics.mark_first(analytics.FIRST_WAKE)
@@ -292,6 +321,28 @@ class MainWindow(EdgeHiddenWindow):
             except Exception:
                 pass
 
+    # ========== 预热 ==========
+
+    def _on_visibility_changed(self, visible: bool) -> None:
+        if visible:
+            self._prewarm_timer.stop()
+        else:
+            self._schedule_prewarm()
+
+    def _schedule_prewarm(self, *_args) -> None:
+        """收起状态下合并触发：等滑出动画结束、连续复制停下后再做一次。"""
+        if self._is_visible or not settings().prewarm_window:
+            return
+        self._prewarm_timer.start(PREWARM_DELAY_MS)
+
+    def _prewarm(self) -> None:
+        if self._is_visible:
+            return
+        try:
+            self.list_controller.prewarm()
+        except Exception:
+            logger.debug("首屏预热失败", exc_info=True)
+
     def _show_settings(self, initial_tab: str = ""):
         from .main_window_helpers import show_settings_dialog
         show_settings_dialog(self, initial_tab=initial_tab)
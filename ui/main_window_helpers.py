@@ -13,7 +13,7 @@ from PySide6.QtWidgets import (
     QButtonGroup,
     QDialog,
     QLabel,
-    QListWidget,
+    QListView,
     QMessageBox,
     QProgressDialog,
     QPushButton,
@@ -75,13 +75,21 @@ def build_clipboard_page(window) -> QWidget:
     clip_layout.addWidget(window._view_stack, 1)
 
     from PySide6.QtCore import Qt
-    window.list_widget = QListWidget()
-    window.list_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-    window.list_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-    window.list_widget.setSpacing(1)
-    window.list_widget.setContextMenuPolicy(Qt.CustomContextMenu)
-    window.list_widget.customContextMenuRequested.connect(window.plugin_controller.show_context_menu)
-    window._view_stack.addWidget(window.list_widget)
+    # 模型 + 自绘 delegate：只绘制可见行，滚到底部按 keyset 续取
+    window.list_view = QListView()
+    window.list_view.setObjectName("clipboardList")
+    window.list_view.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
+    window.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+    window.list_view.setVerticalScrollMode(QListView.ScrollPerPixel)
+    window.list_view.setSpacing(1)
+    window.list_view.setUniformItemSizes(False)
+    window.list_view.setLayoutMode(QListView.Batched)
+    window.list_view.setBatchSize(50)
+    window.list_view.setMouseTracking(True)
+    window.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
+    window.list_view.customContextMenuRequested.connect(window.plugin_controller.show_context_menu)
+    window.list_controller.attach_view(window.list_view)
+    window._view_stack.addWidget(window.list_view)
 
     # 时间线视图懒加载
     window.timeline_view = None
@@ -327,7 +335,7 @@ def show_settings_dialog(window, initial_tab: str = ""):
 
     for key in ("save_text", "save_images", "max_text_length",
                 "max_image_size_kb", "max_items", "retention_days",
-                "poll_interval_ms"):
+                "archive_after_days", "poll_interval_ms"):
         batch[key] = dlg_settings[key]
 
     if batch:
@@ -336,6 +344,14 @@ def show_settings_dialog(window, initial_tab: str = ""):
     if poll_changed:
         window.clipboard_monitor.update_poll_interval(new_poll_interval)
 
+    # 归档阈值热更新；首次开启归档（服务尚未装配）需重启后生效
+    ctx = getattr(window, "ctx", None)
+    archive_service = getattr(ctx, "archive_service", None) if ctx is not None else None
+    if archive_service is not None:
+        archive_service.set_archive_after_days(dlg_settings["archive_after_days"])
+    elif dlg_settings["archive_after_days"] > 0 and current_snapshot.archive_after_days == 0:
+        need_restart = True
+
     # Profile / 数据库变更检测
     new_profile = dlg_settings.get("active_profile", "")
     new_db_type = dlg_settings["db_type"]
@@ -68,6 +68,13 @@ class FilterTab(QWidget):
         self.retention_days_spin.setSuffix(f" {t('days')}")
         storage_group_layout.addRow(t("retention_days"), self.retention_days_spin)
 
+        self.archive_after_days_spin = QSpinBox()
+        self.archive_after_days_spin.setRange(0, 3650)
+        self.archive_after_days_spin.setValue(settings().archive_after_days)
+        self.archive_after_days_spin.setSpecialValueText(t("never_archive"))
+        self.archive_after_days_spin.setSuffix(f" {t('days')}")
+        storage_group_layout.addRow(t("archive_after_days"), self.archive_after_days_spin)
+
         self.poll_interval_spin = QSpinBox()
         self.poll_interval_spin.setRange(100, 5000)
         self.poll_interval_spin.setSingleStep(100)
@@ -86,5 +93,6 @@ class FilterTab(QWidget):
             "max_image_size_kb": self.max_image_size_spin.value(),
             "max_items": self.max_items_spin.value(),
             "retention_days": self.retention_days_spin.value(),
+            "archive_after_days": self.archive_after_days_spin.value(),
             "poll_interval_ms": self.poll_interval_spin.value(),
         }
@@ -0,0 +1,104 @@
+"""局域网同步 Tab：开关 + 配对密钥（生成 / 粘贴 / 复制）+ 手动对端列表。"""
+
+import logging
+
+from PySide6.QtWidgets import (
+    QApplication, QCheckBox, QFormLayout, QHBoxLayout, QLabel, QLineEdit,
+    QMessageBox, QPushButton, QWidget,
+)
+
+from config import get_lan_sync_key, set_lan_sync_key, settings, update_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LanTab(QWidget):
+    """同网段设备之间直接同步；密钥只在一台设备上生成，复制到其他设备粘贴。
+
+    改动在重启后生效（LanSyncService 启动时装配）。
+    """
+
+    def __init__(self, ctx=None, parent=None, **_legacy_kwargs):
+        super().__init__(parent)
+        self.ctx = ctx
+        self._saved_key = get_lan_sync_key()
+        self._build_ui()
+
+    def _build_ui(self):
+        layout = QFormLayout(self)
+        layout.setSpacing(12)
+        layout.setFieldGrowthPolicy(QFormLayout.AllNonFixedFieldsGrow)
+
+        desc = QLabel(
+            "同一局域网内、配对密钥相同的设备之间直接同步剪贴板，不经过云端。\n"
+            "在一台设备上生成密钥，复制到其他设备粘贴即可配对。修改后重启生效。"
+        )
+        desc.setWordWrap(True)
+        desc.setStyleSheet("color: #666;")
+        layout.addRow(desc)
+
+        self.enabled_check = QCheckBox("启用局域网同步")
+        self.enabled_check.setChecked(bool(settings().lan_sync_enabled))
+        layout.addRow("", self.enabled_check)
+
+        key_layout = QHBoxLayout()
+        self.key_edit = QLineEdit()
+        self.key_edit.setEchoMode(QLineEdit.Password)
+        self.key_edit.setPlaceholderText("粘贴另一台设备上的配对密钥")
+        self.key_edit.setText(self._saved_key)
+        key_layout.addWidget(self.key_edit)
+        self.generate_btn = QPushButton("生成")
+        self.generate_btn.clicked.connect(self._generate_key)
+        key_layout.addWidget(self.generate_btn)
+        self.copy_btn = QPushButton("复制")
+        self.copy_btn.clicked.connect(self._copy_key)
+        key_layout.addWidget(self.copy_btn)
+        layout.addRow("配对密钥", key_layout)
+
+        self.peers_edit = QLineEdit()
+        self.peers_edit.setPlaceholderText("组播不通时手动填写，如 192.168.1.20:47000，逗号分隔")
+        self.peers_edit.setText(", ".join(settings().lan_sync_peers))
+        layout.addRow("手动对端", self.peers_edit)
+
+    def _generate_key(self) -> None:
+        # 只生成不落盘：点 OK 才保存，取消时保留原密钥
+        from core.lan_sync import generate_pairing_key
+        self.key_edit.setText(generate_pairing_key())
+        self.key_edit.setEchoMode(QLineEdit.Normal)
+
+    def _copy_key(self) -> None:
+        key = self.key_edit.text().strip()
+        if key:
+            QApplication.clipboard().setText(key)
+
+    def _peers(self) -> tuple:
+        return tuple(p.strip() for p in self.peers_edit.text().split(",") if p.strip())
+
+    # ---- 对外接口（由 SettingsDialog 在 OK 时调用） ----
+
+    def validate_on_accept(self) -> bool:
+        """开启时必须有合法密钥；手填口令等无效值弹窗提示，不关闭对话框。"""
+        key = self.key_edit.text().strip()
+        if not key and not self.enabled_check.isChecked():
+            return True
+        from core.lan_sync import parse_pairing_key
+        try:
+            parse_pairing_key(key)
+        except ValueError:
+            QMessageBox.warning(self, "局域网同步", "配对密钥无效：请点「生成」或粘贴另一台设备上的密钥。")
+            return False
+        return True
+
+    def apply(self) -> None:
+        """OK 时持久化开关、对端列表和（有变化的）配对密钥。"""
+        try:
+            update_settings(
+                lan_sync_enabled=self.enabled_check.isChecked(),
+                lan_sync_peers=self._peers(),
+            )
+            key = self.key_edit.text().strip()
+            if key and key != self._saved_key:
+                set_lan_sync_key(key)
+                self._saved_key = key
+        except Exception as e:
+            logger.warning(f"保存局域网同步设置失败: {e}")
@@ -1,8 +1,8 @@
 """SettingsDialog 壳：QTabWidget 容器 + OK / Cancel 路由。
 
 业务在 ui/settings/<*>_tab.py，壳只负责：
-- 装配 7 个 Tab（通用 / 数据库 / 过滤 / 插件 / 云端 / 团队 / 关于）
-- OK 时按顺序：DatabaseTab 校验并写入 MySQL → 各 Tab.apply()
+- 装配 8 个 Tab（通用 / 数据库 / 过滤 / 插件 / 云端 / 局域网 / 团队 / 关于）
+- OK 时按顺序：DatabaseTab 校验并写入 MySQL → LanTab 校验密钥 → 各 Tab.apply()
 - get_settings() / get_cloud_api() 供 ui/main_window.py 在 exec() 后调用
 
 向后兼容：`SettingsDialog(parent, plugin_manager=..., cloud_api=..., space_service=...,
@@ -18,13 +18,14 @@ from ui.settings.cloud_tab import CloudTab
 from ui.settings.database_tab import DatabaseTab
 from ui.settings.filter_tab import FilterTab
 from ui.settings.general_tab import GeneralTab
+from ui.settings.lan_tab import LanTab
 from ui.settings.plugins_tab import PluginsTab
 from ui.settings.team_tab import TeamTab
 from ui.styles import MAIN_STYLE
 
 
 class SettingsDialog(QDialog):
-    """7 个 Tab 的容器（顺序与旧实现一致）。"""
+    """8 个 Tab 的容器（局域网之外的顺序与旧实现一致）。"""
 
     def __init__(
         self,
@@ -76,7 +77,7 @@ class SettingsDialog(QDialog):
         tab_widget = QTabWidget()
         layout.addWidget(tab_widget)
 
-        # 装配 7 个 Tab。顺序与旧实现一致。
+        # 装配 8 个 Tab。局域网紧跟云端，其余顺序与旧实现一致。
         self.general_tab = GeneralTab(ctx=self.ctx, parent=self)
         self._tab_name_to_index["general"] = tab_widget.addTab(self.general_tab, t("general"))
 
@@ -101,6 +102,9 @@ class SettingsDialog(QDialog):
         self.cloud_tab.cloud_api_changed.connect(self._on_cloud_api_changed)
         self._tab_name_to_index["cloud"] = tab_widget.addTab(self.cloud_tab, "云端同步")
 
+        self.lan_tab = LanTab(ctx=self.ctx, parent=self)
+        self._tab_name_to_index["lan"] = tab_widget.addTab(self.lan_tab, "局域网同步")
+
         # Why: 老调用方（main_window_helpers.show_settings_dialog）只传 cloud_api kwarg、
         # 没传 ctx，TeamTab 里既拿不到 ctx 又没收到 cloud_api，导致团队 tab 一直
         # 卡在"未登录或云端服务不可用"。这里把已经解析到的 _cloud_api 显式转发。
@@ -144,8 +148,10 @@ class SettingsDialog(QDialog):
         # 1) DatabaseTab 校验 MySQL（连通性 + api 公共库探测）+ 写入 keyring
         if not self.database_tab.validate_and_persist_on_accept():
             return
+        if not self.lan_tab.validate_on_accept():
+            return
         # 2) 各 Tab apply（仅做"本 Tab 独有"的持久化）
-        for tab in (self.general_tab, self.cloud_tab):
+        for tab in (self.general_tab, self.cloud_tab, self.lan_tab):
             if hasattr(tab, "apply"):
                 tab.apply()
         self.accept()
@@ -5,35 +5,90 @@
 - macOS：NSWorkspace（PyObjC 可用时）根据 bundle_id 定位 app 再取图标
 - Linux：QIcon.fromTheme(bundle_id)（简化；未找到就兜底）
 
-仅做内存 LRU 缓存（上限 128）。跨平台失败都不会抛。
+get() 从不在调用处解析：内存 LRU（上限 128）未命中时先返回兜底图标，
+后台线程读磁盘缓存（config 目录下按 key 哈希命名的 PNG），仍未命中才在事件循环空闲时
+逐个做平台解析（QFileIconProvider / 主题查找只能在 GUI 线程），结果写回磁盘并发
+icon_ready，列表据此重绘。解析失败记一个空标记文件，下次启动不再重试。跨平台失败都不会抛。
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import sys
 from collections import OrderedDict
+from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QFileInfo
-from PySide6.QtGui import QIcon
+from PySide6.QtCore import (
+    QBuffer, QByteArray, QFileInfo, QIODevice, QObject, QRunnable, QThreadPool, QTimer, Signal,
+)
+from PySide6.QtGui import QIcon, QPixmap
 from PySide6.QtWidgets import QApplication, QFileIconProvider, QStyle
 
 logger = logging.getLogger(__name__)
 
 
 _MAX_ENTRIES = 128
+# 磁盘缓存的图标边长：列表里画 16px，留足 HiDPI 余量
+_DISK_ICON_SIZE = 32
 
 
-class SourceAppIconCache:
-    """小型 LRU 缓存：(bundle_id, exe_path) -> QIcon。"""
+class _DiskReadTask(QRunnable):
+    def __init__(self, cache: "SourceAppIconCache", key: tuple):
+        super().__init__()
+        self._cache = cache
+        self._key = key
+
+    def run(self) -> None:
+        # None = 磁盘未命中；b"" = 已知解析不到（空标记文件）
+        data = None
+        try:
+            data = self._cache._icon_path(self._key).read_bytes()
+        except OSError:
+            pass
+        self._cache._disk_loaded.emit(self._key, data)
+
+
+class _DiskWriteTask(QRunnable):
+    def __init__(self, path: Path, data: bytes):
+        super().__init__()
+        self._path = path
+        self._data = data
+
+    def run(self) -> None:
+        try:
+            tmp = self._path.with_suffix(".tmp")
+            tmp.write_bytes(self._data)
+            os.replace(tmp, self._path)
+        except OSError as exc:
+            logger.debug(f"写入来源 App 图标缓存失败: {exc}")
+
+
+class SourceAppIconCache(QObject):
+    """小型 LRU 缓存：(bundle_id, exe_path) -> QIcon；未就绪时返回兜底并在就绪后发信号。"""
+
+    icon_ready = Signal(str, str)        # bundle_id, exe_path
+    _disk_loaded = Signal(object, object)
 
     _instance: Optional["SourceAppIconCache"] = None
 
-    def __init__(self) -> None:
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        super().__init__()
         self._cache: "OrderedDict[tuple, QIcon]" = OrderedDict()
         self._provider: Optional[QFileIconProvider] = None
         self._fallback: Optional[QIcon] = None
+        self._dir = cache_dir
+        self._pending: set[tuple] = set()
+        self._resolve_queue: list[tuple] = []
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._resolve_timer = QTimer(self)
+        self._resolve_timer.setSingleShot(True)
+        self._resolve_timer.setInterval(0)
+        self._resolve_timer.timeout.connect(self._resolve_next)
+        self._disk_loaded.connect(self._on_disk_loaded)
 
     @classmethod
     def instance(cls) -> "SourceAppIconCache":
@@ -41,11 +96,18 @@ class SourceAppIconCache:
             cls._instance = cls()
         return cls._instance
 
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """退出时丢掉排队的磁盘读，等进行中的读写结束。"""
+        if cls._instance is not None:
+            cls._instance._pool.clear()
+            cls._instance._pool.waitForDone(1000)
+
     def clear(self) -> None:
         self._cache.clear()
 
     def get(self, bundle_id: str = "", exe_path: str = "") -> QIcon:
-        """返回对应 App 的图标。都为空时返回兜底图标。"""
+        """返回对应 App 的图标。都为空或尚未就绪时返回兜底图标。"""
         bundle_id = bundle_id or ""
         exe_path = exe_path or ""
         key = (bundle_id, exe_path)
@@ -59,18 +121,72 @@ class SourceAppIconCache:
             self._cache.move_to_end(key)
             return cached
 
-        icon = self._resolve(bundle_id, exe_path)
-        if icon is None or icon.isNull():
-            icon = self._get_fallback()
+        if key not in self._pending:
+            self._pending.add(key)
+            self._pool.start(_DiskReadTask(self, key))
+        return self._get_fallback()
+
+    def is_resolved(self, bundle_id: str = "", exe_path: str = "") -> bool:
+        return (bundle_id or "", exe_path or "") in self._cache
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    # ----- internal -----
 
+    def _store(self, key: tuple, icon: QIcon) -> None:
         self._cache[key] = icon
         self._cache.move_to_end(key)
         # LRU evict
         while len(self._cache) > _MAX_ENTRIES:
             self._cache.popitem(last=False)
-        return icon
 
-    # ----- internal -----
+    def _cache_dir(self) -> Path:
+        if self._dir is None:
+            from config import get_app_icon_cache_dir
+            self._dir = get_app_icon_cache_dir()
+        return self._dir
+
+    def _icon_path(self, key: tuple) -> Path:
+        digest = hashlib.sha1("\0".join(key).encode("utf-8")).hexdigest()
+        return self._cache_dir() / f"{digest}.png"
+
+    def _on_disk_loaded(self, key: tuple, data: Optional[bytes]) -> None:
+        if data is None:
+            # 磁盘未命中：排队到 UI 线程空闲时逐个解析
+            self._resolve_queue.append(key)
+            if not self._resolve_timer.isActive():
+                self._resolve_timer.start()
+            return
+        self._pending.discard(key)
+        pix = QPixmap()
+        if data and pix.loadFromData(data):
+            self._store(key, QIcon(pix))
+            self.icon_ready.emit(*key)
+        else:
+            self._store(key, self._get_fallback())
+
+    def _resolve_next(self) -> None:
+        if not self._resolve_queue:
+            return
+        key = self._resolve_queue.pop(0)
+        self._pending.discard(key)
+        icon = self._resolve(*key)
+        data = b""
+        if icon is not None and not icon.isNull():
+            pix = icon.pixmap(_DISK_ICON_SIZE, _DISK_ICON_SIZE)
+            buf = QByteArray()
+            device = QBuffer(buf)
+            device.open(QIODevice.WriteOnly)
+            if not pix.isNull() and pix.save(device, "PNG"):
+                data = bytes(buf)
+            self._store(key, icon)
+            self.icon_ready.emit(*key)
+        else:
+            self._store(key, self._get_fallback())
+        self._pool.start(_DiskWriteTask(self._icon_path(key), data))
+        if self._resolve_queue:
+            self._resolve_timer.start()
 
     def _get_fallback(self) -> QIcon:
         if self._fallback is None:
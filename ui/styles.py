@@ -10,6 +10,9 @@ else:
     _FONT_SIZE = "13px"
     _SCROLLBAR_WIDTH = "8px"
 
+# 列表 delegate 自绘预览文字用的像素字号，与 previewLabel 保持一致
+LIST_PREVIEW_PX = int(_FONT_SIZE.rstrip("px"))
+
 MAIN_STYLE = """
 * { outline: 0; }
 
@@ -115,6 +118,12 @@ QPushButton#tabBtn:checked {
     border-bottom: 2px solid #4fc3f7;
 }
 
+QListView#clipboardList {
+    background-color: #2b2b2b;
+    border: none;
+    outline: none;
+}
+
 QListWidget {
     background-color: #2b2b2b;
     border: none;
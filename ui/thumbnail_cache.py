@@ -0,0 +1,213 @@
+"""缩略图解码池 + 磁盘瓦片缓存。
+
+列表 / 时间线的 56×56 缩略图不在 UI 线程 loadFromData：
+- 内存：QPixmapCache（进程内，按 content_hash）；
+- 磁盘：预缩放好的 ARGB32 原始像素按 content_hash 存一份，冷启动后首帧只是读文件 + 拷贝；
+- 都未命中时投递到 QThreadPool 后台解码出 QImage，回到 UI 线程转成 QPixmap 后发 ready。
+
+QPixmap 只能在 GUI 线程创建，工作线程只产出 QImage。
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+import struct
+from pathlib import Path
+from typing import Iterable, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal
+from PySide6.QtGui import QImage, QPixmap, QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+
+TILE = 56
+# 瓦片文件：魔数 + 宽 + 高 + 每行字节数，后接原始像素
+_MAGIC = b"CPT1"
+_HEADER = struct.Struct("<4sHHI")
+_TILE_FORMAT = QImage.Format_ARGB32_Premultiplied
+_POOL_THREADS = 2
+# 超过上限时按 mtime 删掉最旧的一批（每张约 12KB）
+_DISK_MAX_FILES = 20000
+_SAFE_KEY = re.compile(r"[0-9A-Za-z_-]{8,128}")
+
+
+def decode_tile(data: bytes) -> QImage:
+    """把缩略图字节解码并缩放到 TILE 以内；失败返回 null QImage。线程安全。"""
+    image = QImage()
+    if not image.loadFromData(data):
+        return QImage()
+    if image.width() > TILE or image.height() > TILE:
+        image = image.scaled(TILE, TILE, Qt.KeepAspectRatio, Qt.FastTransformation)
+    return image.convertToFormat(_TILE_FORMAT)
+
+
+def _pixmap_key(content_hash: str) -> str:
+    return f"thumb{TILE}:{content_hash}"
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, cache: "ThumbnailCache", content_hash: str, data: bytes):
+        super().__init__()
+        self._cache = cache
+        self._hash = content_hash
+        self._data = data
+
+    def run(self) -> None:
+        image = QImage()
+        try:
+            image = self._cache._load_tile(self._hash)
+            if image is None:
+                image = decode_tile(self._data)
+                if not image.isNull():
+                    self._cache._store_tile(self._hash, image)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"缩略图解码失败 {self._hash}: {exc}")
+            image = QImage()
+        # 跨线程 emit：接收方在 UI 线程，自动排队
+        self._cache._decoded.emit(self._hash, image)
+
+
+class _TrimTask(QRunnable):
+    def __init__(self, cache: "ThumbnailCache"):
+        super().__init__()
+        self._cache = cache
+
+    def run(self) -> None:
+        self._cache._trim_disk()
+
+
+class ThumbnailCache(QObject):
+    """按 content_hash 提供 TILE×TILE 缩略图 QPixmap；未就绪时后台准备好再发 ready。"""
+
+    ready = Signal(str)
+    _decoded = Signal(str, QImage)
+
+    _instance: Optional["ThumbnailCache"] = None
+
+    def __init__(self, cache_dir: Optional[Path] = None, parent=None):
+        super().__init__(parent)
+        self._dir = cache_dir
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(_POOL_THREADS)
+        self._pending: set[str] = set()
+        self._decoded.connect(self._on_decoded)
+        self._pool.start(_TrimTask(self))
+
+    @classmethod
+    def instance(cls) -> "ThumbnailCache":
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def shutdown_instance(cls) -> None:
+        """退出时丢掉排队任务并等进行中的解码结束，避免工作线程晚于解释器退出。"""
+        if cls._instance is not None:
+            cls._instance._pool.clear()
+            cls._instance._pool.waitForDone(1000)
+
+    # ----- public -----
+
+    def get(self, content_hash: str, data: Optional[bytes]) -> Optional[QPixmap]:
+        """命中内存或磁盘时直接返回；否则投递后台解码并返回 None（就绪后发 ready）。"""
+        if not data:
+            return None
+        if not content_hash:
+            # 没有 hash 就无处缓存：极少见，直接同步解码
+            image = decode_tile(data)
+            return None if image.isNull() else QPixmap.fromImage(image)
+        pixmap = QPixmapCache.find(_pixmap_key(content_hash))
+        if pixmap is not None:
+            return pixmap
+        image = self._load_tile(content_hash)
+        if image is not None:
+            return self._insert(content_hash, image)
+        self.request(content_hash, data)
+        return None
+
+    def request(self, content_hash: str, data: Optional[bytes]) -> None:
+        if not content_hash or not data or content_hash in self._pending:
+            return
+        if QPixmapCache.find(_pixmap_key(content_hash)) is not None:
+            return
+        self._pending.add(content_hash)
+        self._pool.start(_DecodeTask(self, content_hash, data))
+
+    def prefetch(self, items: Iterable) -> None:
+        """为即将滚入视口的条目预先准备缩略图（磁盘读取也在后台）。"""
+        for item in items:
+            data = getattr(item, "image_thumbnail", None)
+            if item is not None and item.is_image and data:
+                self.request(item.content_hash, data)
+
+    def wait(self, msecs: int = -1) -> bool:
+        return self._pool.waitForDone(msecs)
+
+    # ----- internal -----
+
+    def _on_decoded(self, content_hash: str, image: QImage) -> None:
+        self._pending.discard(content_hash)
+        if image.isNull():
+            return
+        self._insert(content_hash, image)
+        self.ready.emit(content_hash)
+
+    @staticmethod
+    def _insert(content_hash: str, image: QImage) -> QPixmap:
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(_pixmap_key(content_hash), pixmap)
+        return pixmap
+
+    def _cache_dir(self) -> Path:
+        if self._dir is None:
+            from config import get_thumbnail_cache_dir
+            self._dir = get_thumbnail_cache_dir()
+        return self._dir
+
+    def _tile_path(self, content_hash: str) -> Optional[Path]:
+        if not _SAFE_KEY.fullmatch(content_hash):
+            return None
+        return self._cache_dir() / content_hash[:2] / f"{content_hash}.tile"
+
+    def _load_tile(self, content_hash: str) -> Optional[QImage]:
+        path = self._tile_path(content_hash)
+        if path is None:
+            return None
+        try:
+            raw = path.read_bytes()
+        except OSError:
+            return None
+        if len(raw) < _HEADER.size:
+            return None
+        magic, width, height, stride = _HEADER.unpack_from(raw)
+        if magic != _MAGIC or len(raw) != _HEADER.size + stride * height:
+            return None
+        # copy() 让 QImage 拥有自己的像素缓冲，不再引用 raw
+        return QImage(raw[_HEADER.size:], width, height, stride, _TILE_FORMAT).copy()
+
+    def _store_tile(self, content_hash: str, image: QImage) -> None:
+        path = self._tile_path(content_hash)
+        if path is None:
+            return
+        header = _HEADER.pack(_MAGIC, image.width(), image.height(), image.bytesPerLine())
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(header + bytes(image.constBits()))
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug(f"写入缩略图缓存失败 {content_hash}: {exc}")
+
+    def _trim_disk(self) -> None:
+        try:
+            files = [p for p in self._cache_dir().glob("*/*.tile")]
+            if len(files) <= _DISK_MAX_FILES:
+                return
+            files.sort(key=lambda p: p.stat().st_mtime)
+            for p in files[:len(files) - _DISK_MAX_FILES]:
+                p.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.debug(f"清理缩略图缓存失败: {exc}")
@@ -1,9 +1,10 @@
 """时间线视图：按日期分组展示剪贴板条目。
 
 特点：
-- 按 created_at 的日期分组（Header 显示"YYYY-MM-DD (N)"）
-- 每组内部复用 ClipboardItemWidget 渲染单条目
-- 条目 > 500 条时，只展开最近 7 天的详情，其余日期只显示计数
+- 分组来自按小时聚合的桶（repository.get_timeline）在本地合并成自然日，每组 Header 显示"YYYY-MM-DD (N)"
+- 分组内容懒加载：只有滚入视口附近的日期才查库并创建 ClipboardItemWidget，
+  远离视口的分组卸载成等高占位，控件数量不随历史长度增长
+- 新条目 / 变更按条增量应用（upsert_item / remove_item），不整体重建
 
 信号：
 - item_clicked(int)：单击一个条目，参数是 item_id
@@ -15,9 +16,9 @@ from __future__ import annotations
 import datetime as _dt
 import logging
 from collections import OrderedDict
-from typing import Iterable, List, Optional
+from typing import Callable, Iterable, List, NamedTuple, Optional
 
-from PySide6.QtCore import Qt, QPoint, Signal
+from PySide6.QtCore import Qt, QPoint, QTimer, Signal
 from PySide6.QtWidgets import (
     QFrame,
     QLabel,
@@ -32,8 +33,163 @@ from .clipboard_item import ClipboardItemWidget
 logger = logging.getLogger(__name__)
 
 
-_DETAIL_WINDOW_DAYS = 7
-_LARGE_DATASET_THRESHOLD = 500
+# 单个日期最多展开的条目数，超出部分只显示计数
+_DAY_ITEM_LIMIT = 200
+# 未加载分组按每条约 84px 估高，保证滚动条长度大致正确
+_ROW_ESTIMATE = 84
+# 以视口高度为单位：上 1 屏 / 下 2 屏内加载，超出上 3 屏 / 下 4 屏卸载
+_LOAD_ABOVE, _LOAD_BELOW = 1, 2
+_UNLOAD_ABOVE, _UNLOAD_BELOW = 3, 4
+
+
+class TimelineBucket(NamedTuple):
+    day: _dt.date
+    start_ts: int   # 含
+    end_ts: int     # 不含
+    count: int
+
+
+BucketSource = Callable[[], List[TimelineBucket]]
+# (start_ts, end_ts, limit) -> 该时间段内按 created_at 倒序的条目
+ItemSource = Callable[[int, int, int], List[ClipboardItem]]
+
+
+def local_offset_ms() -> int:
+    """当前本地时区相对 UTC 的偏移（毫秒），用于 get_timeline 按本地整点分桶。"""
+    offset = _dt.datetime.now().astimezone().utcoffset()
+    return int(offset.total_seconds() * 1000) if offset else 0
+
+
+def buckets_from_timeline(rows: Iterable[dict]) -> List[TimelineBucket]:
+    """get_timeline(granularity="hour", tz_offset_ms=local_offset_ms()) 的结果 → 新日期在前的桶。
+
+    Why hour: 库里只能按一个固定偏移分桶，而夏令时两侧的偏移差一小时——按天分桶时
+    另一侧的日界线整体错一小时，与 _day_of 按真实本地日期归组对不上。整点桶不受影响，
+    这里逐个按本地日期合并，日界线用 _day_start_ms（23 / 25 小时的日子也对）。
+    """
+    counts: "OrderedDict[_dt.date, int]" = OrderedDict()
+    for row in rows:
+        if row.get("count"):
+            day = _local_date(row["bucket_start_ts"])
+            counts[day] = counts.get(day, 0) + row["count"]
+    return [_day_bucket(day, count) for day, count in sorted(counts.items(), reverse=True)]
+
+
+def _local_date(ts_ms: int) -> _dt.date:
+    try:
+        return _dt.datetime.fromtimestamp(ts_ms / 1000).date()
+    except (OSError, ValueError, OverflowError):
+        return _dt.date.today()
+
+
+def _day_of(item: ClipboardItem) -> _dt.date:
+    return _local_date(item.created_at or 0)
+
+
+def _day_start_ms(day: _dt.date) -> int:
+    return int(_dt.datetime.combine(day, _dt.time()).timestamp() * 1000)
+
+
+def _day_bucket(day: _dt.date, count: int) -> TimelineBucket:
+    return TimelineBucket(day, _day_start_ms(day), _day_start_ms(day + _dt.timedelta(days=1)), count)
+
+
+class _DayGroup(QFrame):
+    """一个日期分组：Header 常驻，条目区按需加载 / 卸载。"""
+
+    def __init__(self, bucket: TimelineBucket, parent=None):
+        super().__init__(parent)
+        self.bucket = bucket
+        self.count = bucket.count
+        self.loaded = False
+        self.widgets: "OrderedDict[int, ClipboardItemWidget]" = OrderedDict()
+        self.setObjectName("timelineGroup")
+        self.setStyleSheet(
+            "QFrame#timelineGroup { background:#2a2a2a; border:1px solid #3c3c3c; "
+            "border-radius:6px; }"
+        )
+        v = QVBoxLayout(self)
+        v.setContentsMargins(8, 6, 8, 6)
+        v.setSpacing(4)
+
+        self._header = QLabel()
+        self._header.setStyleSheet("color:#e8e8e8;font-weight:600;font-size:12px;")
+        v.addWidget(self._header)
+
+        self.body = QWidget()
+        self.body_layout = QVBoxLayout(self.body)
+        self.body_layout.setContentsMargins(0, 0, 0, 0)
+        self.body_layout.setSpacing(4)
+        v.addWidget(self.body)
+
+        self._more = QLabel()
+        self._more.setStyleSheet("color:#888;font-size:11px;")
+        self._more.hide()
+        v.addWidget(self._more)
+        self._placeholder_h = min(self.count, _DAY_ITEM_LIMIT) * _ROW_ESTIMATE
+        self._refresh_header()
+        self.body.setMinimumHeight(self._placeholder_h)
+
+    def _refresh_header(self) -> None:
+        self._header.setText(f"{self.bucket.day.isoformat()}  ({self.count})")
+        hidden = self.count - len(self.widgets)
+        if self.loaded and hidden > 0:
+            self._more.setText(f"另有 {hidden} 条未展开，可在列表视图中查看")
+            self._more.show()
+        else:
+            self._more.hide()
+
+    def set_count(self, count: int) -> None:
+        self.count = max(count, 0)
+        self._refresh_header()
+
+    def fill(self, items: List[ClipboardItem], make_row: Callable[[ClipboardItem], QWidget]) -> None:
+        self.body.setMinimumHeight(0)
+        for item in items:
+            row = make_row(item)
+            if row is None:
+                continue
+            self.body_layout.addWidget(row)
+            self.widgets[item.id] = row
+        self.loaded = True
+        self._refresh_header()
+
+    def unload(self) -> None:
+        # 卸载后保持原高度，滚动位置不跳
+        self._placeholder_h = self.body.height()
+        for widget in self.widgets.values():
+            widget.setParent(None)
+            widget.deleteLater()
+        self.widgets.clear()
+        self.loaded = False
+        self.body.setMinimumHeight(self._placeholder_h)
+        self._refresh_header()
+
+    def insert_row(self, item: ClipboardItem, row: QWidget) -> None:
+        """按 created_at 倒序插入已加载分组。"""
+        pos = 0
+        while pos < self.body_layout.count():
+            existing = self.body_layout.itemAt(pos).widget()
+            if (existing.item.created_at or 0) <= (item.created_at or 0):
+                break
+            pos += 1
+        self.body_layout.insertWidget(pos, row)
+        self.widgets[item.id] = row
+
+    def replace_row(self, item: ClipboardItem, row: QWidget) -> None:
+        old = self.widgets[item.id]
+        self.body_layout.replaceWidget(old, row)
+        old.setParent(None)
+        old.deleteLater()
+        self.widgets[item.id] = row
+
+    def remove_row(self, item_id: int) -> bool:
+        row = self.widgets.pop(item_id, None)
+        if row is None:
+            return False
+        row.setParent(None)
+        row.deleteLater()
+        return True
 
 
 class TimelineView(QWidget):
@@ -44,7 +200,11 @@ class TimelineView(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self._items: List[ClipboardItem] = []
+        self._bucket_source: Optional[BucketSource] = None
+        self._item_source: Optional[ItemSource] = None
+        self._dirty = False
+        self._groups: "OrderedDict[_dt.date, _DayGroup]" = OrderedDict()
+        self._empty_label: Optional[QLabel] = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -64,113 +224,193 @@ class TimelineView(QWidget):
         self._content_layout.addStretch(1)  # 底部 stretch，使 group 向上堆积
 
         self._scroll.setWidget(self._content)
-        # 记录日期 -> group widget（便于 scroll_to_date）
-        self._group_widgets: "OrderedDict[_dt.date, QWidget]" = OrderedDict()
+
+        # 滚动 / 尺寸变化合并成一次可见性检查
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(30)
+        self._visibility_timer.timeout.connect(self._update_visible)
+        self._scroll.verticalScrollBar().valueChanged.connect(self._schedule_visibility)
 
     # ------------------------------------------------------------------
     # 对外 API
     # ------------------------------------------------------------------
 
+    def set_source(self, buckets: BucketSource, items: ItemSource) -> None:
+        """切换数据源。隐藏时只标脏，切到时间线时才查桶。"""
+        self._bucket_source = buckets
+        self._item_source = items
+        self._dirty = True
+        if self.isVisible():
+            self._reload()
+
     def set_items(self, items: Iterable[ClipboardItem]) -> None:
-        """替换当前展示的条目列表。"""
-        self._items = list(items or [])
-        self._rebuild()
+        """用一组现成条目（搜索 / 标签结果）作为数据源。"""
+        by_day: "OrderedDict[_dt.date, List[ClipboardItem]]" = OrderedDict()
+        for item in sorted(items or [], key=lambda it: it.created_at or 0, reverse=True):
+            by_day.setdefault(_day_of(item), []).append(item)
+        buckets = [_day_bucket(day, len(day_items)) for day, day_items in by_day.items()]
+        self.set_source(
+            lambda: buckets,
+            lambda start, end, limit: by_day.get(_dt.datetime.fromtimestamp(start / 1000).date(), [])[:limit],
+        )
 
     def clear(self) -> None:
-        self._items = []
-        self._rebuild()
+        self.set_items([])
 
     def scroll_to_date(self, date: _dt.date) -> None:
-        widget = self._group_widgets.get(date)
+        widget = self._groups.get(date)
         if widget is None:
             return
         self._scroll.ensureWidgetVisible(widget)
+        self._schedule_visibility()
 
-    # ------------------------------------------------------------------
-    # 内部：重建布局
-    # ------------------------------------------------------------------
+    def upsert_item(self, item: ClipboardItem, is_new: bool = True) -> None:
+        """新条目（is_new）或已有条目的元数据变化：只动所属分组。
 
-    def _rebuild(self) -> None:
-        # 清空现有 group widgets（保留末尾 stretch）
-        layout = self._content_layout
-        # 倒着移除：最后一项是 stretch，跳过
-        while layout.count() > 1:
-            item = layout.takeAt(0)
-            widget = item.widget() if item is not None else None
-            if widget is not None:
-                widget.setParent(None)
-                widget.deleteLater()
-        self._group_widgets.clear()
-
-        if not self._items:
-            empty = QLabel("暂无条目")
-            empty.setAlignment(Qt.AlignCenter)
-            empty.setStyleSheet("color:#888;padding:24px;")
-            layout.insertWidget(layout.count() - 1, empty)
-            self._group_widgets[_dt.date.today()] = empty  # 占位避免后续 None
+        已有条目只在展开的分组里能找到；在未展开分组 / 超出 _DAY_ITEM_LIMIT 时不动计数，
+        与 remove_item 一样等下次刷新校正——否则每次收藏都会把计数 +1。
+        """
+        if self._dirty or item.id is None:
             return
+        day = _day_of(item)
+        if not is_new:
+            old_day = next((d for d, g in self._groups.items() if item.id in g.widgets), None)
+            if old_day is None:
+                return
+            if old_day == day:
+                row = self._make_row(item)
+                if row is not None:
+                    self._groups[day].replace_row(item, row)
+                return
+            # created_at 变了（重新复制置顶）：从旧日期挪到新日期
+            self.remove_item(item.id)
+        group = self._groups.get(day)
+        if group is None:
+            self._insert_group(_day_bucket(day, 1))
+            self._schedule_visibility()
+            return
+        if item.id in group.widgets:
+            row = self._make_row(item)
+            if row is not None:
+                group.replace_row(item, row)
+            return
+        group.set_count(group.count + 1)
+        if group.loaded:
+            row = self._make_row(item)
+            if row is not None:
+                group.insert_row(item, row)
+
+    def remove_item(self, item_id: int) -> None:
+        """删除：只处理已展开分组里的条目；未展开分组的计数在下次刷新时校正。"""
+        if self._dirty:
+            return
+        for day, group in list(self._groups.items()):
+            if group.remove_row(item_id):
+                group.set_count(group.count - 1)
+                if group.count == 0:
+                    self._remove_group(day)
+                return
 
-        # 按日期分组（新日期在上）
-        groups: "OrderedDict[_dt.date, List[ClipboardItem]]" = OrderedDict()
-        for item in self._items:
-            try:
-                d = _dt.datetime.fromtimestamp((item.created_at or 0) / 1000).date()
-            except (OSError, ValueError, OverflowError):
-                d = _dt.date.today()
-            groups.setdefault(d, []).append(item)
-
-        # 大数据集模式：仅渲染最近 N 天详情
-        large_dataset = len(self._items) > _LARGE_DATASET_THRESHOLD
-        today = _dt.date.today()
-        cutoff = today - _dt.timedelta(days=_DETAIL_WINDOW_DAYS)
-
-        # 日期倒序插入
-        for day, day_items in sorted(groups.items(), key=lambda kv: kv[0], reverse=True):
-            show_details = (not large_dataset) or (day >= cutoff)
-            group_widget = self._build_group(day, day_items, show_details)
-            layout.insertWidget(layout.count() - 1, group_widget)
-            self._group_widgets[day] = group_widget
-
-    def _build_group(
-        self, day: _dt.date, items: List[ClipboardItem], show_details: bool,
-    ) -> QWidget:
-        frame = QFrame()
-        frame.setObjectName("timelineGroup")
-        frame.setStyleSheet(
-            "QFrame#timelineGroup { background:#2a2a2a; border:1px solid #3c3c3c; "
-            "border-radius:6px; }"
-        )
-        v = QVBoxLayout(frame)
-        v.setContentsMargins(8, 6, 8, 6)
-        v.setSpacing(4)
-
-        header = QLabel(f"{day.isoformat()}  ({len(items)})")
-        header.setStyleSheet("color:#e8e8e8;font-weight:600;font-size:12px;")
-        v.addWidget(header)
-
-        if not show_details:
-            # 仅显示计数，不渲染每个条目
-            hint = QLabel(f"共 {len(items)} 条（大数据集折叠）")
-            hint.setStyleSheet("color:#888;font-size:11px;")
-            v.addWidget(hint)
-            return frame
-
-        for item in items:
-            try:
-                row = ClipboardItemWidget(item)
-            except Exception as exc:  # noqa: BLE001
-                logger.debug(f"创建时间线条目 widget 失败: {exc}")
-                continue
-            # 点击 → emit item_id（复用同一信号）
-            item_id = item.id
-            if item_id is not None:
-                row.clicked.connect(lambda it, iid=item_id: self.item_clicked.emit(iid))
-            # 右键菜单：用 row 的 customContextMenu 复用起来比较重，直接
-            # 借用 contextMenuEvent 不太好；这里只用 item_clicked 即可，
-            # 右键菜单由上层 MainWindow 的列表视图提供。
-            v.addWidget(row)
-
-        return frame
-
+    # ------------------------------------------------------------------
+    # 内部：分组管理
+    # ------------------------------------------------------------------
 
-__all__ = ["TimelineView"]
+    def showEvent(self, event) -> None:
+        super().showEvent(event)
+        if self._dirty:
+            self._reload()
+
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self._schedule_visibility()
+
+    def _schedule_visibility(self, *_args) -> None:
+        self._visibility_timer.start()
+
+    def _reload(self) -> None:
+        self._dirty = False
+        for day in list(self._groups):
+            self._remove_group(day)
+        if self._empty_label is not None:
+            self._empty_label.setParent(None)
+            self._empty_label.deleteLater()
+            self._empty_label = None
+        try:
+            buckets = self._bucket_source() if self._bucket_source is not None else []
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"加载时间线分组失败: {exc}")
+            buckets = []
+        if not buckets:
+            self._empty_label = QLabel("暂无条目")
+            self._empty_label.setAlignment(Qt.AlignCenter)
+            self._empty_label.setStyleSheet("color:#888;padding:24px;")
+            self._content_layout.insertWidget(0, self._empty_label)
+            return
+        for bucket in buckets:
+            self._insert_group(bucket)
+        self._scroll.verticalScrollBar().setValue(0)
+        self._schedule_visibility()
+
+    def _insert_group(self, bucket: TimelineBucket) -> _DayGroup:
+        if self._empty_label is not None:
+            self._empty_label.setParent(None)
+            self._empty_label.deleteLater()
+            self._empty_label = None
+        group = _DayGroup(bucket)
+        days = list(self._groups)
+        pos = next((i for i, d in enumerate(days) if d < bucket.day), len(days))
+        self._content_layout.insertWidget(pos, group)
+        self._groups[bucket.day] = group
+        # 保持 OrderedDict 与布局顺序一致（新日期在前）
+        for d in days[pos:]:
+            self._groups.move_to_end(d)
+        return group
+
+    def _remove_group(self, day: _dt.date) -> None:
+        group = self._groups.pop(day, None)
+        if group is not None:
+            group.setParent(None)
+            group.deleteLater()
+
+    def _update_visible(self) -> None:
+        if not self._groups or self._item_source is None or not self.isVisible():
+            return
+        if self._content.height() < self._content_layout.minimumSize().height():
+            # 滚动区还没按新内容调整尺寸，分组几何不可信：下一轮再看
+            self._schedule_visibility()
+            return
+        top = self._scroll.verticalScrollBar().value()
+        height = max(self._scroll.viewport().height(), 1)
+        load_lo, load_hi = top - _LOAD_ABOVE * height, top + (1 + _LOAD_BELOW) * height
+        keep_lo, keep_hi = top - _UNLOAD_ABOVE * height, top + (1 + _UNLOAD_BELOW) * height
+        for group in self._groups.values():
+            geo = group.geometry()
+            if not group.loaded and geo.bottom() >= load_lo and geo.top() <= load_hi:
+                self._load_group(group)
+            elif group.loaded and (geo.bottom() < keep_lo or geo.top() > keep_hi):
+                group.unload()
+
+    def _load_group(self, group: _DayGroup) -> None:
+        bucket = group.bucket
+        try:
+            items = self._item_source(bucket.start_ts, bucket.end_ts, _DAY_ITEM_LIMIT)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning(f"加载 {bucket.day} 的时间线条目失败: {exc}")
+            return
+        group.fill(items, self._make_row)
+
+    def _make_row(self, item: ClipboardItem) -> Optional[QWidget]:
+        try:
+            row = ClipboardItemWidget(item)
+        except Exception as exc:  # noqa: BLE001
+            logger.debug(f"创建时间线条目 widget 失败: {exc}")
+            return None
+        # 点击 → emit item_id（复用同一信号）；右键菜单由上层列表视图提供
+        item_id = item.id
+        if item_id is not None:
+            row.clicked.connect(lambda it, iid=item_id: self.item_clicked.emit(iid))
+        return row
+
+
+__all__ = ["TimelineBucket", "TimelineView", "buckets_from_timeline", "local_offset_ms"]
@@ -0,0 +1,123 @@
+"""热键唤起的端到端延迟探针：热键事件 → 列表已有内容的首帧绘制完成。
+
+三段分别进直方图：
+- wake.dispatch：热键线程记下时间 → UI 线程开始执行 show_window（排队延迟）；
+- wake.show_call：show_window 本身的同步耗时；
+- wake.first_paint：热键 → 可见视图（列表有行）的首次绘制结束，目标 < 50ms。
+
+begin() 在热键线程调用，只写一个 float；其余都在 UI 线程。
+FirstPaintWatcher 也供启动期记录"首屏列表绘制"打点复用。
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import Callable, Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+
+from core.startup_metrics import LatencyMetrics
+
+logger = logging.getLogger(__name__)
+
+
+WAKE_BUDGET_MS = 50.0
+# 超时仍没等到带内容的绘制就放弃本次样本（窗口被立即收起 / 视图不可见）
+_GIVE_UP_MS = 2000
+
+
+class FirstPaintWatcher(QObject):
+    """等 widget 下一次"有内容"的绘制画完后回调一次；超时未等到则放弃，不回调。"""
+
+    def __init__(self, widget, on_painted: Callable[[], None],
+                 populated: Optional[Callable[[], bool]] = None,
+                 timeout_ms: int = _GIVE_UP_MS, parent=None):
+        super().__init__(parent)
+        self._target = widget
+        self._on_painted = on_painted
+        self._populated = populated or (lambda: True)
+        self._finishing = False
+        self._give_up = QTimer(self)
+        self._give_up.setSingleShot(True)
+        self._give_up.timeout.connect(self.cancel)
+        widget.installEventFilter(self)
+        self._give_up.start(timeout_ms)
+
+    @property
+    def active(self) -> bool:
+        return self._target is not None
+
+    def eventFilter(self, obj, event):
+        if obj is self._target and event.type() == QEvent.Paint and not self._finishing:
+            if self._populated():
+                # Why: 过滤器在 paintEvent 之前被调用；排到下一轮事件循环时这一帧已画完并 flush
+                self._finishing = True
+                QTimer.singleShot(0, self._finish)
+        return False
+
+    def _finish(self) -> None:
+        if self._target is None:
+            return
+        self.cancel()
+        self._on_painted()
+
+    def cancel(self) -> None:
+        self._give_up.stop()
+        if self._target is not None:
+            try:
+                self._target.removeEventFilter(self)
+            except RuntimeError:
+                pass
+        self._target = None
+
+
+class WakeLatencyProbe(QObject):
+    def __init__(self, metrics: Optional[LatencyMetrics] = None, parent=None):
+        super().__init__(parent)
+        self.metrics = metrics or LatencyMetrics()
+        self._pending_t0: Optional[float] = None
+        self._t0: Optional[float] = None
+        self._watcher: Optional[FirstPaintWatcher] = None
+
+    def begin(self, t0: Optional[float] = None) -> None:
+        """热键回调里调用（任意线程）。"""
+        self._pending_t0 = time.perf_counter() if t0 is None else t0
+
+    def dispatched(self) -> bool:
+        """show_window 开头调用；本次唤起不是热键触发的返回 False。"""
+        t0, self._pending_t0 = self._pending_t0, None
+        if t0 is None:
+            return False
+        self._detach()
+        self._t0 = t0
+        self.metrics.record("wake.dispatch", (time.perf_counter() - t0) * 1000)
+        return True
+
+    def shown(self, started: float) -> None:
+        if self._t0 is not None:
+            self.metrics.record("wake.show_call", (time.perf_counter() - started) * 1000)
+
+    def watch(self, widget, populated: Optional[Callable[[], bool]] = None) -> None:
+        """等 widget 下一次"有内容"的绘制；不主动 update 时挪动窗口未必会重绘。"""
+        if self._t0 is None or widget is None:
+            return
+        self._watcher = FirstPaintWatcher(widget, self._finish, populated, parent=self)
+        widget.update()
+
+    def _finish(self) -> None:
+        if self._t0 is None:
+            return
+        elapsed = (time.perf_counter() - self._t0) * 1000
+        self.metrics.record("wake.first_paint", elapsed, WAKE_BUDGET_MS)
+        if elapsed > WAKE_BUDGET_MS:
+            logger.debug(f"[wake] 热键到首帧 {elapsed:.1f}ms，超出 {WAKE_BUDGET_MS:.0f}ms 预算")
+        self._detach()
+
+    def _detach(self) -> None:
+        # 超时放弃时 watcher 已自行摘掉过滤器，本次样本直接丢弃
+        if self._watcher is not None:
+            self._watcher.cancel()
+            self._watcher.deleteLater()
+            self._watcher = None
+        self._t0 = None
@@ -0,0 +1,78 @@
+"""首次访问属性时才真正 import 的模块代理。
+
+用法::
+
+    httpx = lazy_module("httpx")
+    ...
+    except httpx.HTTPError:   # 到这里才加载 httpx
+
+Why: 启动路径上 import 的模块只要在顶层引用了 httpx / pymysql / PIL，
+冷启动就要先付几十毫秒的导入，哪怕这次运行根本不联网、不连 MySQL。
+函数内局部 import 能解决单个调用点，但 except 子句、多处方法共用的模块级名字需要一个
+模块级的替身。
+
+线程安全：加载走 importlib.import_module，同名模块的并发导入由 import 系统的模块锁串行化。
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+from types import ModuleType
+
+# 冷启动（import main）后不应出现在 sys.modules 里的模块；tests/test_startup_budget.py 据此把关
+DEFERRED_MODULES = (
+    "httpx",
+    "pymysql",
+    "PIL",
+    "cryptography",
+    "core.cloud_api",
+    "core.cloud_sync_service",
+    "core.file_sync_service",
+    "core.entitlement_service",
+    "core.mysql_database",
+    "core.lan_sync",
+    "core.archive_service",
+    "ui.settings_dialog",
+    "ui.file_list_widget",
+    "ui.cloud_auth_dialog",
+    "utils.image_utils",
+)
+
+
+class LazyModule:
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: ModuleType | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self) -> ModuleType:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self.load(), attr)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "deferred"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """返回 name 的延迟代理；模块不存在时在首次属性访问处抛 ImportError。"""
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """不执行模块代码，只判断顶层包是否可导入（可选依赖探测用）。"""
+    try:
+        return importlib.util.find_spec(name.partition(".")[0]) is not None
+    except (ImportError, ValueError):
+        return False